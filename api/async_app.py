@@ -0,0 +1,10 @@
+###
+# Async read-only interface (optional)
+###
+
+# Serves the hot player/annotation GET routes on an asyncio event loop:
+#   uvicorn async_app:app --host 0.0.0.0 --port 4001
+# See backend/async_reads/read_app.py for the routes it covers.
+from backend.async_reads.read_app import create_async_app
+
+app = create_async_app()
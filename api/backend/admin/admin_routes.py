@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from backend.db_connection import db
+from backend.queries import queries
 import logging
 
 logger = logging.getLogger(__name__)
@@ -369,4 +370,23 @@ def get_system_statistics():
     cursor.execute("SELECT COUNT(*) as count FROM UserReported WHERE status IN ('pending', 'under_review')")
     stats['flagged_accounts'] = cursor.fetchone()['count']
 
-    return jsonify(stats), 200
\ No newline at end of file
+    return jsonify(stats), 200
+
+# ------------------------------------------------------------
+# GET /admin/db-pool - Get database connection pool counters
+@admin.route('/admin/db-pool', methods=['GET'])
+def get_db_pool_stats():
+    """Return connection pool sizes and borrowed/waiting/created/recycled counters"""
+    logger.info('GET /admin/db-pool route')
+
+    return jsonify(db.pool_stats()), 200
+
+
+# ------------------------------------------------------------
+# GET /admin/query-stats - Get per-query timings from the query registry
+@admin.route('/admin/query-stats', methods=['GET'])
+def get_query_stats():
+    """Return calls, errors, prepares and total/avg/max milliseconds for each registered query"""
+    logger.info('GET /admin/query-stats route')
+
+    return jsonify(queries.stats()), 200
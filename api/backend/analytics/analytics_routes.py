@@ -1,6 +1,23 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, current_app, stream_with_context, send_file
+from pymysql import cursors
 from backend.db_connection import db
+from backend.stats_cache import cached_json_response
+from backend.columnar import (ColumnarError, columnar_response, require_pyarrow, requested_format,
+                              rows_response, stream_batches)
+from backend.exports.export_worker import export_worker
+from backend.analytics.formula_engine import FormulaError, compile_formula, formula_cache, stat_columns
+from backend.analytics.metric_jobs import metric_job_runner, upsert_metric_values
+from backend.analytics.dashboard_snapshots import REFRESH_RETRY_AFTER, load_snapshot, snapshot_refresher
+from backend.analytics.dashboard_summary import SUMMARY_FILTERS, SUMMARY_QUERY, summarize
+import base64
+import gzip
+import json
 import logging
+import os
+import time
+from datetime import date
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 analytics = Blueprint('analytics', __name__)
@@ -9,11 +26,47 @@ analytics = Blueprint('analytics', __name__)
 # ------------------------------------------------------------
 # GET /analytics/datasets - Get clean standardized datasets
 # [Tukey-1]
+DATASET_PAGE_MAX = 1000
+DATASET_STREAM_BATCH = 500
+
+
+def encode_dataset_cursor(row):
+    """Opaque keyset token for the (date, gameID, playerID) of the last row sent"""
+    key = [row['date'].isoformat(), row['gameID'], row['playerID']]
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+
+
+def decode_dataset_cursor(token):
+    game_date, game_id, player_id = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    return date.fromisoformat(game_date), int(game_id), int(player_id)
+
+
 @analytics.route('/analytics/datasets', methods=['GET'])
 def get_clean_datasets():
-    """Return clean, standardized game and player statistics with validation status filters"""
+    """
+    Return clean, standardized game and player statistics with validation status filters.
+
+    Rows are ordered newest first and can be fetched in keyset pages with
+    ?limit=N (plus ?cursor=<next_cursor> for the following page), or
+    streamed as NDJSON with ?stream=ndjson. Without either, the full
+    dataset is streamed as a JSON array. ?format=arrow|parquet (or the
+    matching Accept type) streams it as typed Arrow IPC or Parquet instead.
+    """
     logger.info('GET /analytics/datasets route')
 
+    limit = request.args.get('limit', type=int)
+    cursor_token = request.args.get('cursor')
+    stream = request.args.get('stream', '').lower()
+    if not stream and request.accept_mimetypes.best == 'application/x-ndjson':
+        stream = 'ndjson'
+
+    try:
+        fmt = requested_format()
+        if fmt is not None:
+            require_pyarrow()
+    except ColumnarError as e:
+        return e.response()
+
     query = '''
         SELECT gs.gameID, gs.playerID, g.date, g.opponent,
                p.firstName, p.lastName,
@@ -22,14 +75,91 @@ def get_clean_datasets():
         FROM Game_Stats gs
         JOIN Game g ON gs.gameID = g.gameID
         JOIN Players p ON gs.playerID = p.playerID
-        ORDER BY g.date DESC
     '''
+    params = []
+
+    if cursor_token:
+        try:
+            params.extend(decode_dataset_cursor(cursor_token))
+        except (ValueError, TypeError):
+            return jsonify({'error': 'Invalid cursor'}), 400
+        query += ' WHERE (g.date, gs.gameID, gs.playerID) < (%s, %s, %s)'
+
+    query += ' ORDER BY g.date DESC, gs.gameID DESC, gs.playerID DESC'
+
+    if limit is not None:
+        limit = max(1, min(limit, DATASET_PAGE_MAX))
+
+    if fmt is not None:
+        if limit is not None:
+            query += f' LIMIT {limit}'
+        return columnar_response(fmt, stream_with_context(stream_dataset_columnar(query, params, fmt)))
+
+    if stream in ('1', 'true', 'ndjson'):
+        if limit is not None:
+            query += f' LIMIT {limit}'
+        return Response(stream_with_context(stream_dataset_rows(query, params, ndjson=True)),
+                        mimetype='application/x-ndjson')
+
+    if limit is None and not cursor_token:
+        return Response(stream_with_context(stream_dataset_rows(query, params, ndjson=False)),
+                        mimetype='application/json')
+
+    # Fetch one extra row to know whether another page exists
+    query += f' LIMIT {(limit or DATASET_PAGE_MAX) + 1}'
 
     cursor = db.get_db().cursor()
-    cursor.execute(query)
-    datasets = cursor.fetchall()
+    cursor.execute(query, tuple(params))
+    rows = cursor.fetchall()
+
+    page_size = limit or DATASET_PAGE_MAX
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_dataset_cursor(rows[-1])
+
+    return jsonify({'data': rows, 'next_cursor': next_cursor}), 200
+
+
+def stream_dataset_rows(query, params, ndjson):
+    """
+    Yield rows from an unbuffered (server-side) cursor in small batches, so
+    neither the worker nor MySQL client buffers hold the whole result.
+    """
+    with db.connection() as conn:
+        cursor = conn.cursor(cursors.SSDictCursor)
+        cursor.execute(query, tuple(params))
+
+        first = True
+        if not ndjson:
+            yield '['
+
+        while True:
+            rows = cursor.fetchmany(DATASET_STREAM_BATCH)
+            if not rows:
+                break
 
-    return jsonify(datasets), 200
+            if ndjson:
+                yield ''.join(current_app.json.dumps(row) + '\n' for row in rows)
+            else:
+                chunk = ','.join(current_app.json.dumps(row) for row in rows)
+                yield chunk if first else ',' + chunk
+            first = False
+
+        if not ndjson:
+            yield ']'
+
+        cursor.close()
+
+
+def stream_dataset_columnar(query, params, fmt):
+    """Same unbuffered read as stream_dataset_rows, written as Arrow IPC / Parquet batches"""
+    with db.connection() as conn:
+        cursor = conn.cursor(cursors.SSCursor)
+        cursor.execute(query, tuple(params))
+        batches = iter(lambda: cursor.fetchmany(DATASET_STREAM_BATCH), [])
+        yield from stream_batches(fmt, batches, cursor.description)
+        cursor.close()
 
 
 # ------------------------------------------------------------
@@ -37,7 +167,10 @@ def get_clean_datasets():
 # [Tukey-5]
 @analytics.route('/analytics/datasets/export', methods=['POST'])
 def export_datasets():
-    """Request data export in specified format (CSV, JSON, Excel)"""
+    """
+    Request data export in specified format (CSV, JSON, Parquet).
+    The file is produced in the background; poll the export request for its status.
+    """
     logger.info('POST /analytics/datasets/export route')
 
     data = request.json
@@ -57,10 +190,12 @@ def export_datasets():
     db.get_db().commit()
 
     export_id = cursor.lastrowid
+    export_worker.notify()
 
     return jsonify({
         'message': 'Export request created successfully',
-        'exportID': export_id
+        'exportID': export_id,
+        'status': 'pending'
     }), 201
 
 
@@ -73,7 +208,7 @@ def get_all_metrics():
     logger.info('GET /analytics/metrics route')
 
     query = '''
-        SELECT formulaID, formulaName, createdBy, dateCreated
+        SELECT formulaID, formulaName, expression, createdBy, dateCreated
         FROM MetricsFormulas
         ORDER BY dateCreated DESC
     '''
@@ -95,14 +230,21 @@ def create_custom_metric():
 
     data = request.json
 
+    if data.get('expression') is not None:
+        try:
+            compile_formula(data['expression'])
+        except FormulaError as e:
+            return jsonify({'error': str(e)}), 400
+
     query = '''
-        INSERT INTO MetricsFormulas (formulaName, createdBy)
-        VALUES (%s, %s)
+        INSERT INTO MetricsFormulas (formulaName, expression, createdBy)
+        VALUES (%s, %s, %s)
     '''
 
     cursor = db.get_db().cursor()
     cursor.execute(query, (
         data.get('formulaName'),
+        data.get('expression'),
         data.get('createdBy')
     ))
     db.get_db().commit()
@@ -115,6 +257,58 @@ def create_custom_metric():
     }), 201
 
 
+# ------------------------------------------------------------
+# POST /analytics/metrics/test - Try a formula on sample stats
+# [Tukey-2]
+FORMULA_TEST_ROWS = 50
+
+
+@analytics.route('/analytics/metrics/test', methods=['POST'])
+def test_metric_formula():
+    """Compile a formula and evaluate it on recent game stats without saving"""
+    logger.info('POST /analytics/metrics/test route')
+
+    data = request.json
+
+    try:
+        compiled = compile_formula(data.get('expression'))
+    except FormulaError as e:
+        return jsonify({'valid': False, 'error': str(e)}), 400
+
+    query = f'''
+        SELECT gs.gameID, gs.playerID, p.firstName, p.lastName,
+               {', '.join(f'gs.{c}' for c in compiled.columns)}
+        FROM Game_Stats gs
+        JOIN Players p ON gs.playerID = p.playerID
+        JOIN Game g ON gs.gameID = g.gameID
+        ORDER BY g.date DESC
+        LIMIT %s
+    '''
+
+    cursor = db.get_db().cursor()
+    cursor.execute(query, (FORMULA_TEST_ROWS,))
+    rows = cursor.fetchall()
+
+    try:
+        values = compiled.evaluate(stat_columns(rows, compiled.columns))
+    except FormulaError as e:
+        return jsonify({'valid': False, 'error': str(e)}), 400
+
+    samples = [{
+        'gameID': row['gameID'],
+        'playerID': row['playerID'],
+        'firstName': row['firstName'],
+        'lastName': row['lastName'],
+        'value': None if np.isnan(value) else round(float(value), 4)
+    } for row, value in zip(rows, values)]
+
+    return jsonify({
+        'valid': True,
+        'variables': compiled.variables,
+        'samples': samples
+    }), 200
+
+
 # ------------------------------------------------------------
 # PUT /analytics/metrics/<formula_id> - Update metric formula
 # [Tukey-2]
@@ -123,17 +317,29 @@ def update_metric_formula(formula_id):
     """Update existing metric formula definition"""
     logger.info(f'PUT /analytics/metrics/{formula_id} route')
 
-    data = request.json
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    if 'expression' in data:
+        if not isinstance(data['expression'], str):
+            return jsonify({'error': 'expression must be a string'}), 400
+        try:
+            compile_formula(data['expression'])
+        except FormulaError as e:
+            return jsonify({'error': str(e)}), 400
 
     query = '''
         UPDATE MetricsFormulas
-        SET formulaName = %s
+        SET formulaName = COALESCE(%s, formulaName),
+            expression = COALESCE(%s, expression)
         WHERE formulaID = %s
     '''
 
     cursor = db.get_db().cursor()
     cursor.execute(query, (
         data.get('formulaName'),
+        data.get('expression'),
         formula_id
     ))
     db.get_db().commit()
@@ -154,34 +360,188 @@ def delete_metric_formula(formula_id):
     cursor.execute(query, (formula_id,))
     db.get_db().commit()
 
+    formula_cache.discard(formula_id)
+
     return jsonify({'message': 'Metric formula deleted successfully'}), 200
 
 
 # ------------------------------------------------------------
 # POST /analytics/metrics/<formula_id>/calculate - Calculate metric
 # [Tukey-2]
+CALCULATE_WRITE_BATCH = 1000
+
+
 @analytics.route('/analytics/metrics/<int:formula_id>/calculate', methods=['POST'])
 def calculate_metric(formula_id):
-    """Execute metric calculation on specified player/game data"""
+    """
+    Score the formula over Game_Stats and store the results in CalculatedMetrics.
+    gameID / playerID in the body narrow the batch; without them every
+    player-game is scored in one pass.
+    """
     logger.info(f'POST /analytics/metrics/{formula_id}/calculate route')
 
-    data = request.json
+    data = request.json or {}
+    started = time.perf_counter()
+
+    cursor = db.get_db().cursor()
+    cursor.execute('SELECT formulaName, expression FROM MetricsFormulas WHERE formulaID = %s',
+                   (formula_id,))
+    formula = cursor.fetchone()
+
+    if not formula:
+        return jsonify({'error': 'Metric formula not found'}), 404
+
+    try:
+        compiled = formula_cache.get(formula_id, formula['expression'])
+    except FormulaError as e:
+        return jsonify({'error': f'Formula cannot be evaluated: {str(e)}'}), 400
+
+    filters = []
+    params = []
+    if data.get('gameID') is not None:
+        filters.append('gameID = %s')
+        params.append(data['gameID'])
+    if data.get('playerID') is not None:
+        filters.append('playerID = %s')
+        params.append(data['playerID'])
+    conditions = ' AND '.join(filters) or 'TRUE'
+
+    cursor.execute(f'''
+        SELECT gameID, playerID, {', '.join(compiled.columns)}
+        FROM Game_Stats
+        WHERE {conditions}
+    ''', params)
+    rows = cursor.fetchall()
+
+    try:
+        values = compiled.evaluate(stat_columns(rows, compiled.columns))
+    except FormulaError as e:
+        return jsonify({'error': f'Formula cannot be evaluated: {str(e)}'}), 400
+    metric_name = data.get('metricName') or formula['formulaName']
+
+    for offset in range(0, len(rows), CALCULATE_WRITE_BATCH):
+        upsert_metric_values(cursor, formula_id, metric_name,
+                             rows[offset:offset + CALCULATE_WRITE_BATCH],
+                             values[offset:offset + CALCULATE_WRITE_BATCH])
+    db.get_db().commit()
+
+    scored = values[~np.isnan(values)]
+
+    return jsonify({
+        'message': 'Metric calculated successfully',
+        'rowsScored': len(rows),
+        'undefinedRows': len(rows) - len(scored),
+        'summary': {
+            'min': float(scored.min()),
+            'mean': float(scored.mean()),
+            'max': float(scored.max())
+        } if len(scored) else None,
+        'elapsedMs': round((time.perf_counter() - started) * 1000, 1)
+    }), 201
+
+
+# ------------------------------------------------------------
+# POST /analytics/metrics/<formula_id>/materialize - Bulk calculate metric
+# [Tukey-2]
+@analytics.route('/analytics/metrics/<int:formula_id>/materialize', methods=['POST'])
+def materialize_metric(formula_id):
+    """
+    Start a background job that scores the formula for every game in a
+    date range and/or set of players, skipping values that are up to date.
+    Poll GET /analytics/metric-jobs/<job_id> for progress.
+    """
+    logger.info(f'POST /analytics/metrics/{formula_id}/materialize route')
+
+    data = request.json or {}
+
+    cursor = db.get_db().cursor()
+    cursor.execute('SELECT expression FROM MetricsFormulas WHERE formulaID = %s', (formula_id,))
+    formula = cursor.fetchone()
+
+    if not formula:
+        return jsonify({'error': 'Metric formula not found'}), 404
+
+    try:
+        formula_cache.get(formula_id, formula['expression'])
+    except FormulaError as e:
+        return jsonify({'error': f'Formula cannot be evaluated: {str(e)}'}), 400
+
+    player_ids = data.get('playerIDs')
+    if player_ids is not None:
+        if (not isinstance(player_ids, list) or not player_ids
+                or not all(isinstance(p, int) and not isinstance(p, bool) for p in player_ids)):
+            return jsonify({'error': 'playerIDs must be a non-empty list of integers (omit it for every player)'}), 400
+
+    dates = {}
+    for name in ('startDate', 'endDate'):
+        value = data.get(name)
+        if value is None:
+            dates[name] = None
+            continue
+        try:
+            dates[name] = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            return jsonify({'error': f'{name} must be a YYYY-MM-DD date'}), 400
+    if dates['startDate'] and dates['endDate'] and dates['startDate'] > dates['endDate']:
+        return jsonify({'error': 'startDate must not be after endDate'}), 400
 
     query = '''
-        INSERT INTO CalculatedMetrics (gameID, playerID, formulaID, metricName)
-        VALUES (%s, %s, %s, %s)
+        INSERT INTO MetricJobs (formulaID, requestedBy, startDate, endDate, playerIDs, status)
+        VALUES (%s, %s, %s, %s, %s, 'pending')
     '''
 
-    cursor = db.get_db().cursor()
     cursor.execute(query, (
-        data.get('gameID'),
-        data.get('playerID'),
         formula_id,
-        data.get('metricName')
+        data.get('requestedBy'),
+        dates['startDate'],
+        dates['endDate'],
+        json.dumps(player_ids) if player_ids is not None else None
     ))
     db.get_db().commit()
 
-    return jsonify({'message': 'Metric calculated successfully'}), 201
+    job_id = cursor.lastrowid
+    metric_job_runner.submit(job_id)
+
+    return jsonify({
+        'message': 'Metric materialization started',
+        'jobID': job_id,
+        'status': 'pending'
+    }), 202
+
+
+# ------------------------------------------------------------
+# GET /analytics/metric-jobs/<job_id> - Materialization job progress
+# [Tukey-2]
+@analytics.route('/analytics/metric-jobs/<int:job_id>', methods=['GET'])
+def get_metric_job(job_id):
+    """Return status and progress of a metric materialization job"""
+    logger.info(f'GET /analytics/metric-jobs/{job_id} route')
+
+    query = '''
+        SELECT j.jobID, j.formulaID, mf.formulaName, j.startDate, j.endDate,
+               j.playerIDs, j.status, j.rowsTotal, j.rowsDone, j.rowsSkipped,
+               j.errorMessage, j.createdAt, j.startedAt, j.completedAt
+        FROM MetricJobs j
+        JOIN MetricsFormulas mf ON j.formulaID = mf.formulaID
+        WHERE j.jobID = %s
+    '''
+
+    cursor = db.get_db().cursor()
+    cursor.execute(query, (job_id,))
+    job = cursor.fetchone()
+
+    if not job:
+        return jsonify({'error': 'Metric job not found'}), 404
+
+    job['playerIDs'] = json.loads(job['playerIDs']) if job['playerIDs'] else None
+    if job['status'] == 'completed':
+        job['percentComplete'] = 100.0
+    elif job['rowsTotal']:
+        job['percentComplete'] = round(100.0 * job['rowsDone'] / job['rowsTotal'], 1)
+    else:
+        job['percentComplete'] = 0.0
+
+    return jsonify(job), 200
 
 
 # ------------------------------------------------------------
@@ -263,6 +623,8 @@ def update_dashboard(dashboard_id):
         data.get('filterCriteria'),
         dashboard_id
     ))
+    # the stored payload reflects the old config; rebuild on next read
+    cursor.execute('DELETE FROM DashboardSnapshots WHERE dashboardID = %s', (dashboard_id,))
     db.get_db().commit()
 
     return jsonify({'message': 'Dashboard updated successfully'}), 200
@@ -284,29 +646,57 @@ def delete_dashboard(dashboard_id):
     return jsonify({'message': 'Dashboard deleted successfully'}), 200
 
 
+def refresh_busy_response(dashboard_id):
+    """503 for a refresh that timed out waiting on another process's refresh"""
+    response = jsonify({'error': f'Dashboard {dashboard_id} is being refreshed, try again shortly'})
+    response.headers['Retry-After'] = str(REFRESH_RETRY_AFTER)
+    return response, 503
+
+
 # ------------------------------------------------------------
 # GET /analytics/dashboards/<dashboard_id> - Get dashboard data
 # [Tukey-3]
 @analytics.route('/analytics/dashboards/<int:dashboard_id>', methods=['GET'])
 def get_dashboard_data(dashboard_id):
-    """Return complete dashboard data including all calculated metrics"""
+    """
+    Return the precomputed dashboard payload with all calculated metrics.
+    The snapshot is built on first access; ?max_age=<seconds> refreshes
+    it first if it is older than that. Its age is sent in X-Snapshot-Age.
+    If another process holds the refresh too long, the stale snapshot is
+    served (503 when there is none yet).
+    """
     logger.info(f'GET /analytics/dashboards/{dashboard_id} route')
 
-    query = '''
-        SELECT d.dashboardID, d.dashboardName, d.metricDisplayed,
-               d.chartType, d.lastUpdated, d.filterCriteria
-        FROM Dashboard d
-        WHERE d.dashboardID = %s
-    '''
+    max_age = request.args.get('max_age', type=float)
 
     cursor = db.get_db().cursor()
-    cursor.execute(query, (dashboard_id,))
-    dashboard = cursor.fetchone()
-
-    if not dashboard:
-        return jsonify({'error': 'Dashboard not found'}), 404
-
-    return jsonify(dashboard), 200
+    snapshot = load_snapshot(cursor, dashboard_id)
+
+    if snapshot is None or (max_age is not None and snapshot['ageSeconds'] > max_age):
+        try:
+            info, _ = snapshot_refresher.refresh(dashboard_id)
+        except TimeoutError:
+            if snapshot is None:
+                return refresh_busy_response(dashboard_id)
+            logger.warning(f'Serving a stale snapshot of dashboard {dashboard_id}: refresh timed out')
+        else:
+            if info is None:
+                return jsonify({'error': 'Dashboard not found'}), 404
+            # end the request's snapshot so the new row is visible
+            db.get_db().commit()
+            snapshot = load_snapshot(cursor, dashboard_id)
+
+    if 'gzip' in request.accept_encodings:
+        response = current_app.response_class(snapshot['payload'], mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = current_app.response_class(gzip.decompress(snapshot['payload']),
+                                              mimetype='application/json')
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['X-Snapshot-Computed-At'] = snapshot['computedAt'].isoformat()
+    response.headers['X-Snapshot-Age'] = f"{float(snapshot['ageSeconds']):.1f}"
+
+    return response, 200
 
 
 # ------------------------------------------------------------
@@ -314,20 +704,25 @@ def get_dashboard_data(dashboard_id):
 # [Tukey-3]
 @analytics.route('/analytics/dashboards/<int:dashboard_id>/refresh', methods=['POST'])
 def refresh_dashboard(dashboard_id):
-    """Trigger recalculation of all metrics in dashboard"""
+    """
+    Recompute all metrics in the dashboard and store the snapshot.
+    Concurrent refreshes of the same dashboard share one computation.
+    """
     logger.info(f'POST /analytics/dashboards/{dashboard_id}/refresh route')
 
-    query = '''
-        UPDATE Dashboard
-        SET lastUpdated = CURRENT_TIMESTAMP
-        WHERE dashboardID = %s
-    '''
+    try:
+        info, coalesced = snapshot_refresher.refresh(dashboard_id)
+    except TimeoutError:
+        return refresh_busy_response(dashboard_id)
 
-    cursor = db.get_db().cursor()
-    cursor.execute(query, (dashboard_id,))
-    db.get_db().commit()
+    if info is None:
+        return jsonify({'error': 'Dashboard not found'}), 404
 
-    return jsonify({'message': 'Dashboard refreshed successfully'}), 200
+    return jsonify({
+        'message': 'Dashboard refreshed successfully',
+        'coalesced': coalesced,
+        **info
+    }), 200
 
 
 # ------------------------------------------------------------
@@ -340,16 +735,14 @@ def get_competition_context():
 
     query = '''
         SELECT p.playerID, p.firstName, p.lastName,
-               t.tier as competition_level,
-               AVG(gs.points) as avg_points,
-               AVG(gs.rebounds) as avg_rebounds,
-               AVG(gs.assists) as avg_assists
-        FROM Players p
-        JOIN Playsin pin ON p.playerID = pin.playerID
-        JOIN Team t ON pin.team_id = t.team_id
-        JOIN Game_Stats gs ON p.playerID = gs.playerID
-        GROUP BY p.playerID, p.firstName, p.lastName, t.tier
-        ORDER BY t.tier DESC, avg_points DESC
+               lt.competitionLevel as competition_level,
+               lt.points / lt.gamesPlayed as avg_points,
+               lt.rebounds / lt.gamesPlayed as avg_rebounds,
+               lt.assists / lt.gamesPlayed as avg_assists
+        FROM Player_Level_Totals lt
+        JOIN Players p ON lt.playerID = p.playerID
+        WHERE lt.gamesPlayed > 0
+        ORDER BY competition_level DESC, avg_points DESC
     '''
 
     cursor = db.get_db().cursor()
@@ -368,19 +761,15 @@ def get_player_competition_context(player_id):
     logger.info(f'GET /analytics/competition-context/{player_id} route')
 
     query = '''
-        SELECT t.tier as competition_level,
-               COUNT(gs.gameID) as games_played,
-               AVG(gs.points) as avg_points,
-               AVG(gs.rebounds) as avg_rebounds,
-               AVG(gs.assists) as avg_assists,
-               AVG(gs.steals) as avg_steals
-        FROM Game_Stats gs
-        JOIN Game g ON gs.gameID = g.gameID
-        JOIN Players p ON gs.playerID = p.playerID
-        JOIN Playsin pin ON p.playerID = pin.playerID
-        JOIN Team t ON pin.team_id = t.team_id
-        WHERE p.playerID = %s
-        GROUP BY t.tier
+        SELECT lt.competitionLevel as competition_level,
+               lt.gamesPlayed as games_played,
+               lt.points / lt.gamesPlayed as avg_points,
+               lt.rebounds / lt.gamesPlayed as avg_rebounds,
+               lt.assists / lt.gamesPlayed as avg_assists,
+               lt.steals / lt.gamesPlayed as avg_steals
+        FROM Player_Level_Totals lt
+        WHERE lt.playerID = %s
+          AND lt.gamesPlayed > 0
     '''
 
     cursor = db.get_db().cursor()
@@ -413,6 +802,47 @@ def get_flagged_data():
     return jsonify(flagged), 200
 
 
+# ------------------------------------------------------------
+# GET /analytics/dashboard-summary - Everything the analytics dashboard shows
+# [Tukey-1], [Tukey-4]
+@analytics.route('/analytics/dashboard-summary', methods=['GET'])
+def get_dashboard_summary():
+    """
+    League averages, per-stat histograms, top-N leaderboards and per-position
+    breakdowns in one payload. Filters: position, league, min_points;
+    top (default 5) and bins (default 15) size the leaderboards and histograms.
+    """
+    logger.info('GET /analytics/dashboard-summary route')
+
+    top_n = request.args.get('top', default=5, type=int)
+    bins = request.args.get('bins', default=15, type=int)
+    if not 1 <= top_n <= 50 or not 1 <= bins <= 100:
+        return jsonify({'error': 'top must be 1-50 and bins 1-100'}), 400
+
+    conditions = []
+    params = []
+    filters = []
+    for name, (condition, convert) in SUMMARY_FILTERS.items():
+        value = request.args.get(name)
+        if value in (None, '', 'All'):
+            continue
+        try:
+            params.append(convert(value))
+        except ValueError:
+            return jsonify({'error': f'Invalid {name}'}), 400
+        conditions.append(condition)
+        filters.append((name, value))
+
+    query = SUMMARY_QUERY + ''.join(f' AND {condition}' for condition in conditions)
+
+    def compute():
+        cursor = db.get_db().cursor()
+        cursor.execute(query, params)
+        return summarize(cursor.fetchall(), top_n, bins)
+
+    return cached_json_response(('analytics.dashboard_summary', top_n, bins, tuple(filters)), compute)
+
+
 # ------------------------------------------------------------
 # GET /players/stats/aggregate - Get aggregated player stats
 # [Tukey-1], [Tukey-4]
@@ -426,17 +856,17 @@ def get_aggregate_player_stats():
     min_points = request.args.get('min_points', 0)
 
     query = '''
-        SELECT p.playerID, p.firstName, p.lastName,
+        SELECT DISTINCT p.playerID, p.firstName, p.lastName,
                pin.position, t.team_name,
-               AVG(gs.points) as avg_points,
-               AVG(gs.rebounds) as avg_rebounds,
-               AVG(gs.assists) as avg_assists,
-               COUNT(gs.gameID) as games_played
+               pt.points / pt.gamesPlayed as avg_points,
+               pt.rebounds / pt.gamesPlayed as avg_rebounds,
+               pt.assists / pt.gamesPlayed as avg_assists,
+               pt.gamesPlayed as games_played
         FROM Players p
         JOIN Playsin pin ON p.playerID = pin.playerID
         JOIN Team t ON pin.team_id = t.team_id
-        JOIN Game_Stats gs ON p.playerID = gs.playerID
-        WHERE 1=1
+        JOIN Player_Totals pt ON p.playerID = pt.playerID
+        WHERE pt.gamesPlayed > 0
     '''
 
     params = []
@@ -446,17 +876,17 @@ def get_aggregate_player_stats():
         params.append(position)
 
     query += '''
-        GROUP BY p.playerID, p.firstName, p.lastName, pin.position, t.team_name
-        HAVING AVG(gs.points) >= %s
+          AND pt.points >= %s * pt.gamesPlayed
         ORDER BY avg_points DESC
     '''
     params.append(min_points)
 
-    cursor = db.get_db().cursor()
-    cursor.execute(query, tuple(params))
-    stats = cursor.fetchall()
+    def compute():
+        cursor = db.get_db().cursor()
+        cursor.execute(query, tuple(params))
+        return cursor.fetchall()
 
-    return jsonify(stats), 200
+    return cached_json_response(('analytics.aggregate', position, str(min_points)), compute)
 
 
 # ------------------------------------------------------------
@@ -464,12 +894,20 @@ def get_aggregate_player_stats():
 # [Tukey-1], [Tukey-3]
 @analytics.route('/analytics/calculated-metrics', methods=['GET'])
 def get_calculated_metrics():
-    """Return all calculated metric results with timestamps and associated games/players"""
+    """
+    Return all calculated metric results with timestamps and associated games/players.
+    Send ?format=arrow|parquet (or the matching Accept type) for typed columns.
+    """
     logger.info('GET /analytics/calculated-metrics route')
 
+    try:
+        fmt = requested_format()
+    except ColumnarError as e:
+        return e.response()
+
     query = '''
         SELECT cm.metricID, cm.gameID, cm.playerID, cm.formulaID,
-               cm.metricName, cm.calcTimestamp,
+               cm.metricName, cm.metricValue, cm.calcTimestamp,
                p.firstName, p.lastName,
                mf.formulaName
         FROM CalculatedMetrics cm
@@ -482,7 +920,10 @@ def get_calculated_metrics():
     cursor.execute(query)
     metrics = cursor.fetchall()
 
-    return jsonify(metrics), 200
+    try:
+        return rows_response(fmt, metrics, cursor.description), 200
+    except ColumnarError as e:
+        return e.response()
 
 
 # ------------------------------------------------------------
@@ -530,16 +971,21 @@ def get_export_requests():
 # [Tukey-5]
 @analytics.route('/analytics/export-requests/<int:export_id>', methods=['GET'])
 def get_export_request_detail(export_id):
-    """Return specific export file details and download link"""
+    """
+    Return specific export file details and download link.
+    With ?download=1 the finished file itself is served (Range requests supported).
+    """
     logger.info(f'GET /analytics/export-requests/{export_id} route')
 
     query = '''
         SELECT er.exportID, er.requestedBy, er.requestedUserType,
                er.format, er.dataType, er.timestamp, er.status, er.completedAt,
-               e.fileName, e.filePath, e.fileSize, e.downloadCount
+               e.exportID as fileID, e.fileName, e.filePath, e.fileSize, e.downloadCount
         FROM ExportRequest er
         LEFT JOIN Exports e ON er.exportID = e.exportRequestID
         WHERE er.exportID = %s
+        ORDER BY e.generatedDate DESC
+        LIMIT 1
     '''
 
     cursor = db.get_db().cursor()
@@ -549,4 +995,25 @@ def get_export_request_detail(export_id):
     if not export_detail:
         return jsonify({'error': 'Export request not found'}), 404
 
+    file_path = export_detail['filePath']
+    file_ready = (export_detail['status'] == 'completed' and file_path
+                  and export_worker.owns_file(file_path) and os.path.isfile(file_path))
+
+    if request.args.get('download'):
+        if not file_ready:
+            return jsonify({'error': 'Export file is not available',
+                            'status': export_detail['status']}), 404
+
+        # count whole downloads, not every resumed range
+        if 'Range' not in request.headers:
+            cursor.execute('UPDATE Exports SET downloadCount = downloadCount + 1 WHERE exportID = %s',
+                           (export_detail['fileID'],))
+            db.get_db().commit()
+
+        return send_file(file_path, as_attachment=True,
+                         download_name=export_detail['fileName'], conditional=True)
+
+    export_detail['downloadURL'] = (f'/analytics/export-requests/{export_id}?download=1'
+                                    if file_ready else None)
+
     return jsonify(export_detail), 200
\ No newline at end of file
@@ -0,0 +1,296 @@
+#------------------------------------------------------------
+# Precomputed dashboard payloads
+#------------------------------------------------------------
+# Refreshing a dashboard aggregates the CalculatedMetrics behind every
+# metric linked through DashboardMetrics, applies the dashboard's
+# filterCriteria and stores the result as one gzip-compressed JSON blob
+# in DashboardSnapshots. Reads are a primary-key lookup of that blob.
+import gzip
+import logging
+import threading
+import time
+
+from flask import current_app
+
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+# seconds a refresh waits for another process refreshing the same dashboard
+REFRESH_LOCK_TIMEOUT = 30
+
+# Retry-After (seconds) sent when that wait runs out
+REFRESH_RETRY_AFTER = 5
+
+# filterCriteria key -> (SQL condition, value converter)
+FILTERS = {
+    'season': ('YEAR(g.date) = %s', int),
+    'startDate': ('g.date >= %s', str),
+    'endDate': ('g.date <= %s', str),
+    'playerID': ('cm.playerID = %s', int),
+    'league': ('''EXISTS (
+        SELECT 1 FROM Playsin pin JOIN Team t ON pin.team_id = t.team_id
+        WHERE pin.playerID = cm.playerID AND t.league = %s
+    )''', str),
+    'position': ('''EXISTS (
+        SELECT 1 FROM Playsin pin
+        WHERE pin.playerID = cm.playerID AND pin.position = %s
+    )''', str),
+}
+
+
+def parse_filter_criteria(criteria):
+    """
+    Turn "season=2024&league=AAU" (',' also separates) into SQL conditions.
+    Returns (conditions, params, ignored) where ignored lists the pairs
+    that are unknown or malformed.
+    """
+    conditions = []
+    params = []
+    ignored = []
+
+    for pair in (criteria or '').replace(',', '&').split('&'):
+        pair = pair.strip()
+        if not pair:
+            continue
+        key, _, value = pair.partition('=')
+        key, value = key.strip(), value.strip()
+        if key not in FILTERS or not value:
+            ignored.append(pair)
+            continue
+        condition, convert = FILTERS[key]
+        try:
+            params.append(convert(value))
+        except ValueError:
+            ignored.append(pair)
+            continue
+        conditions.append(condition)
+
+    return conditions, params, ignored
+
+
+def compute_dashboard_payload(cursor, dashboard):
+    """Aggregate the dashboard's linked metrics into a JSON-ready dict"""
+    cursor.execute('''
+        SELECT cm.formulaID, mf.formulaName, cm.metricID
+        FROM DashboardMetrics dm
+        JOIN CalculatedMetrics cm ON dm.metricID = cm.metricID
+        JOIN MetricsFormulas mf ON cm.formulaID = mf.formulaID
+        WHERE dm.dashboardID = %s
+        ORDER BY cm.formulaID, cm.metricID
+    ''', (dashboard['dashboardID'],))
+
+    metrics = {}
+    for row in cursor.fetchall():
+        metric = metrics.setdefault(row['formulaID'], {
+            'formulaID': row['formulaID'],
+            'formulaName': row['formulaName'],
+            'linkedMetricIDs': [],
+            'summary': None,
+            'players': [],
+        })
+        metric['linkedMetricIDs'].append(row['metricID'])
+
+    conditions, params, ignored = parse_filter_criteria(dashboard['filterCriteria'])
+
+    if metrics:
+        formula_ids = list(metrics)
+        where = ' AND '.join(
+            [f"cm.formulaID IN ({', '.join(['%s'] * len(formula_ids))})",
+             'cm.metricValue IS NOT NULL'] + conditions
+        )
+        cursor.execute(f'''
+            SELECT cm.formulaID, cm.playerID, p.firstName, p.lastName,
+                   COUNT(*) AS games,
+                   AVG(cm.metricValue) AS avgValue,
+                   MIN(cm.metricValue) AS minValue,
+                   MAX(cm.metricValue) AS maxValue
+            FROM CalculatedMetrics cm
+            JOIN Game g ON cm.gameID = g.gameID
+            JOIN Players p ON cm.playerID = p.playerID
+            WHERE {where}
+            GROUP BY cm.formulaID, cm.playerID, p.firstName, p.lastName
+            ORDER BY cm.formulaID, avgValue DESC
+        ''', formula_ids + params)
+
+        for row in cursor.fetchall():
+            metrics[row['formulaID']]['players'].append({
+                'playerID': row['playerID'],
+                'firstName': row['firstName'],
+                'lastName': row['lastName'],
+                'games': row['games'],
+                'avgValue': float(row['avgValue']),
+                'minValue': float(row['minValue']),
+                'maxValue': float(row['maxValue']),
+            })
+
+        for metric in metrics.values():
+            players = metric['players']
+            if players:
+                games = sum(p['games'] for p in players)
+                metric['summary'] = {
+                    'players': len(players),
+                    'games': games,
+                    'mean': sum(p['avgValue'] * p['games'] for p in players) / games,
+                    'min': min(p['minValue'] for p in players),
+                    'max': max(p['maxValue'] for p in players),
+                }
+
+    return {
+        'dashboardID': dashboard['dashboardID'],
+        'dashboardName': dashboard['dashboardName'],
+        'metricDisplayed': dashboard['metricDisplayed'],
+        'chartType': dashboard['chartType'],
+        'filterCriteria': dashboard['filterCriteria'],
+        'ignoredFilters': ignored,
+        'metrics': list(metrics.values()),
+    }
+
+
+def load_snapshot(cursor, dashboard_id):
+    """The stored snapshot row (payload still compressed), or None"""
+    cursor.execute('''
+        SELECT dashboardID, payload, payloadBytes, rawBytes, computeMs, computedAt,
+               TIMESTAMPDIFF(MICROSECOND, computedAt, NOW(6)) / 1000000 AS ageSeconds
+        FROM DashboardSnapshots
+        WHERE dashboardID = %s
+    ''', (dashboard_id,))
+    return cursor.fetchone()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SnapshotRefresher:
+    """
+    Recomputes dashboard snapshots. Concurrent refreshes of one dashboard
+    in this process share a single computation; across processes a MySQL
+    named lock serializes them, and a process that waited on the lock
+    reuses the snapshot written while it waited.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.counters = {'computed': 0, 'coalesced': 0}
+
+    def refresh(self, dashboard_id):
+        """
+        Recompute and store the snapshot. Returns (info, coalesced), or
+        (None, False) when the dashboard does not exist.
+        """
+        with self._lock:
+            flight = self._inflight.get(dashboard_id)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[dashboard_id] = flight
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            with self._lock:
+                self.counters['coalesced'] += 1
+            return flight.result, flight.result is not None
+
+        try:
+            flight.result, coalesced = self._compute_and_store(dashboard_id)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[dashboard_id]
+            flight.done.set()
+
+        return flight.result, coalesced
+
+    def _compute_and_store(self, dashboard_id):
+        lock_name = f'courtvision.dashboard_refresh.{dashboard_id}'
+
+        with db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT NOW(6) AS now')
+            requested_at = cursor.fetchone()['now']
+
+            cursor.execute('SELECT GET_LOCK(%s, %s) AS acquired', (lock_name, REFRESH_LOCK_TIMEOUT))
+            if not cursor.fetchone()['acquired']:
+                raise TimeoutError(f'Dashboard {dashboard_id} is being refreshed elsewhere')
+
+            try:
+                snapshot = load_snapshot(cursor, dashboard_id)
+                if snapshot and snapshot['computedAt'] >= requested_at:
+                    # another process finished a refresh while we waited
+                    with self._lock:
+                        self.counters['coalesced'] += 1
+                    return self._info(snapshot), True
+
+                cursor.execute('''
+                    SELECT dashboardID, dashboardName, metricDisplayed,
+                           chartType, filterCriteria
+                    FROM Dashboard
+                    WHERE dashboardID = %s
+                ''', (dashboard_id,))
+                dashboard = cursor.fetchone()
+                if not dashboard:
+                    return None, False
+
+                started = time.perf_counter()
+                payload = compute_dashboard_payload(cursor, dashboard)
+                cursor.execute('SELECT NOW(6) AS now')
+                computed_at = cursor.fetchone()['now']
+                payload['generatedAt'] = computed_at
+
+                raw = current_app.json.dumps(payload).encode('utf-8')
+                compressed = gzip.compress(raw)
+                compute_ms = int((time.perf_counter() - started) * 1000)
+
+                cursor.execute('''
+                    INSERT INTO DashboardSnapshots
+                        (dashboardID, payload, payloadBytes, rawBytes, computeMs, computedAt)
+                    VALUES (%s, %s, %s, %s, %s, %s) AS d
+                    ON DUPLICATE KEY UPDATE
+                        payload = d.payload,
+                        payloadBytes = d.payloadBytes,
+                        rawBytes = d.rawBytes,
+                        computeMs = d.computeMs,
+                        computedAt = d.computedAt
+                ''', (dashboard_id, compressed, len(compressed), len(raw), compute_ms, computed_at))
+                cursor.execute('''
+                    UPDATE Dashboard
+                    SET lastUpdated = CURRENT_TIMESTAMP
+                    WHERE dashboardID = %s
+                ''', (dashboard_id,))
+                conn.commit()
+
+                with self._lock:
+                    self.counters['computed'] += 1
+                logger.info(f'Dashboard {dashboard_id} snapshot: {len(raw)} bytes '
+                            f'({len(compressed)} compressed) in {compute_ms} ms')
+
+                return {
+                    'computedAt': computed_at,
+                    'computeMs': compute_ms,
+                    'payloadBytes': len(compressed),
+                    'rawBytes': len(raw),
+                }, False
+
+            finally:
+                cursor.execute('SELECT RELEASE_LOCK(%s)', (lock_name,))
+
+    @staticmethod
+    def _info(snapshot):
+        return {
+            'computedAt': snapshot['computedAt'],
+            'computeMs': snapshot['computeMs'],
+            'payloadBytes': snapshot['payloadBytes'],
+            'rawBytes': snapshot['rawBytes'],
+        }
+
+
+snapshot_refresher = SnapshotRefresher()
@@ -0,0 +1,96 @@
+#------------------------------------------------------------
+# Everything the analytics dashboard page shows, in one payload
+#------------------------------------------------------------
+# One read of the Player_Totals rollup (a row per player and position),
+# then NumPy does the league averages, histograms, leaderboards and the
+# per-position breakdown over those columns. Player lists are columnar
+# (column names once, then value rows) to keep the payload small.
+import numpy as np
+
+# Per-game stat -> Player_Totals column
+SUMMARY_STATS = {
+    'points': 'points',
+    'rebounds': 'rebounds',
+    'assists': 'assists',
+    'steals': 'steals',
+    'blocks': 'blocks',
+}
+
+SUMMARY_QUERY = f'''
+    SELECT p.playerID, p.firstName, p.lastName, ps.position,
+           pt.gamesPlayed,
+           {', '.join(f'pt.{column}' for column in SUMMARY_STATS.values())}
+    FROM Players p
+    JOIN Player_Totals pt ON p.playerID = pt.playerID
+    LEFT JOIN Playsin ps ON p.playerID = ps.playerID
+    LEFT JOIN Team t ON ps.team_id = t.team_id
+    WHERE pt.gamesPlayed > 0
+'''
+
+# query parameter -> (SQL condition, value converter)
+SUMMARY_FILTERS = {
+    'position': ('ps.position = %s', str),
+    'league': ('t.league = %s', str),
+    'min_points': ('pt.points >= %s * pt.gamesPlayed', float),
+}
+
+
+def _round(values, digits=2):
+    return [None if np.isnan(v) else round(float(v), digits) for v in values]
+
+
+def summarize(rows, top_n=5, bins=15):
+    """Build the dashboard payload from SUMMARY_QUERY rows"""
+    stats = list(SUMMARY_STATS)
+    totals = np.array([[float(row[column] or 0) for column in SUMMARY_STATS.values()] for row in rows],
+                      dtype=float).reshape(len(rows), len(stats))
+    row_games = np.array([row['gamesPlayed'] for row in rows], dtype=float)
+    row_per_game = totals / row_games[:, None] if len(rows) else totals
+
+    # a player on several teams/positions counts once in the league figures
+    first_row = {}
+    for i, row in enumerate(rows):
+        first_row.setdefault(row['playerID'], i)
+    players = np.array(list(first_row.values()), dtype=np.int64)
+    per_game = row_per_game[players]
+    games = row_games[players]
+    ids = list(first_row)
+    names = [f"{rows[i]['firstName']} {rows[i]['lastName']}" for i in players]
+
+    league = {'players': len(players), 'games': int(games.sum())}
+    league.update(zip(stats, _round(per_game.mean(axis=0)) if len(players) else [None] * len(stats)))
+
+    distributions = {}
+    leaderboards = {'columns': ['playerID', 'name', 'value', 'games']}
+    for j, stat in enumerate(stats):
+        values = per_game[:, j]
+        if len(values):
+            counts, edges = np.histogram(values, bins=bins)
+            distributions[stat] = {'edges': _round(edges), 'counts': counts.tolist()}
+        else:
+            distributions[stat] = {'edges': [], 'counts': []}
+
+        top = np.argsort(-values, kind='stable')[:top_n]
+        leaderboards[stat] = [[ids[i], names[i], round(float(values[i]), 2), int(games[i])] for i in top]
+
+    # per-position figures use every player-position row
+    positions, position_of_row = np.unique([row['position'] or 'Unknown' for row in rows],
+                                           return_inverse=True)
+    counts = np.bincount(position_of_row, minlength=len(positions))
+    sums = np.zeros((len(positions), len(stats)))
+    np.add.at(sums, position_of_row, row_per_game)
+    by_position = {
+        position: {'players': int(counts[k]), **dict(zip(stats, _round(sums[k] / counts[k])))}
+        for k, position in enumerate(positions.tolist())
+    }
+
+    return {
+        'league': league,
+        'distributions': distributions,
+        'leaderboards': leaderboards,
+        'byPosition': by_position,
+        'players': {
+            'columns': ['playerID', 'name', 'games'] + stats,
+            'rows': [[ids[k], names[k], int(games[k])] + _round(per_game[k]) for k in range(len(players))],
+        },
+    }
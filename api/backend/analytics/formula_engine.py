@@ -0,0 +1,198 @@
+#------------------------------------------------------------
+# Compiler and vectorized evaluator for custom metric formulas
+#------------------------------------------------------------
+# A formula such as "(PTS + AST + REB - TOV) / MIN" is parsed once,
+# checked against a whitelist of arithmetic nodes and variables, and
+# compiled to a code object. Evaluating it runs the arithmetic on whole
+# NumPy columns, so one call scores every Game_Stats row in a batch.
+import ast
+import logging
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Formula variable -> Game_Stats column
+VARIABLES = {
+    'PTS': 'points',
+    'AST': 'assists',
+    'REB': 'rebounds',
+    'STL': 'steals',
+    'BLK': 'blocks',
+    'TOV': 'turnovers',
+    'MIN': 'minutes',
+    'PF': 'fouls',
+    'TPM': 'three_pt',
+}
+
+# Variables analysts know from box scores that Game_Stats does not record
+UNTRACKED_VARIABLES = {'FGA', 'FGM', 'FTA', 'FTM', 'TPA', 'OREB', 'DREB'}
+
+FUNCTIONS = {
+    'abs': np.abs,
+    'sqrt': np.sqrt,
+    'min': np.minimum,
+    'max': np.maximum,
+}
+
+MAX_EXPRESSION_LENGTH = 500
+MAX_EXPONENT = 10
+
+_BINARY_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+_UNARY_OPERATORS = (ast.UAdd, ast.USub)
+
+
+class FormulaError(ValueError):
+    """Raised when a formula expression cannot be compiled"""
+    pass
+
+
+class CompiledFormula:
+    def __init__(self, expression, code, variables):
+        self.expression = expression
+        self.code = code
+        self.variables = variables  # formula variable names used, sorted
+
+    @property
+    def columns(self):
+        """Game_Stats columns the formula reads"""
+        return [VARIABLES[name] for name in self.variables]
+
+    def evaluate(self, columns):
+        """
+        Evaluate over a batch. columns maps Game_Stats column names to
+        equal-length float arrays (NULL stats as NaN). Rows where the
+        result is undefined, e.g. dividing by zero minutes, come back NaN.
+        Raises FormulaError if the arithmetic cannot be carried out at all.
+        """
+        namespace = dict(FUNCTIONS)
+        for name in self.variables:
+            namespace[name] = columns[VARIABLES[name]]
+
+        try:
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                values = eval(self.code, {'__builtins__': {}}, namespace)
+        except ArithmeticError as e:
+            raise FormulaError(f'Formula result is out of range: {str(e)}')
+
+        size = len(next(iter(columns.values()))) if columns else 1
+        values = np.broadcast_to(np.asarray(values, dtype=float), (size,)).copy()
+        values[~np.isfinite(values)] = np.nan
+        return values
+
+
+def _uses_variable(node):
+    return any(isinstance(child, ast.Name) and child.id in VARIABLES for child in ast.walk(node))
+
+
+def _is_small_exponent(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, _UNARY_OPERATORS):
+        node = node.operand
+    return (isinstance(node, ast.Constant) and not isinstance(node.value, bool)
+            and isinstance(node.value, (int, float)) and abs(node.value) <= MAX_EXPONENT)
+
+
+def _check_node(node, variables):
+    if isinstance(node, ast.Expression):
+        _check_node(node.body, variables)
+    elif isinstance(node, ast.BinOp):
+        if not isinstance(node.op, _BINARY_OPERATORS):
+            raise FormulaError(f'Operator {type(node.op).__name__} is not allowed')
+        if isinstance(node.op, ast.Pow):
+            if not _is_small_exponent(node.right):
+                raise FormulaError(f'Exponents must be numbers between -{MAX_EXPONENT} and {MAX_EXPONENT}')
+            # a constant base is evaluated with Python ints, so towers like
+            # (9 ** 9) ** 9 ... would hang the worker; stat columns are floats
+            if not _uses_variable(node.left):
+                raise FormulaError('Only expressions using a stat variable can be raised to a power')
+        _check_node(node.left, variables)
+        _check_node(node.right, variables)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _UNARY_OPERATORS):
+            raise FormulaError(f'Operator {type(node.op).__name__} is not allowed')
+        _check_node(node.operand, variables)
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise FormulaError(f'Only numeric constants are allowed, got {node.value!r}')
+    elif isinstance(node, ast.Name):
+        if node.id in VARIABLES:
+            variables.add(node.id)
+        elif node.id in UNTRACKED_VARIABLES:
+            raise FormulaError(f'{node.id} is not tracked in game stats')
+        else:
+            raise FormulaError(f'Unknown variable {node.id}')
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise FormulaError('Only abs(), sqrt(), min() and max() may be called')
+        if node.keywords:
+            raise FormulaError('Keyword arguments are not allowed')
+        expected = 1 if node.func.id in ('abs', 'sqrt') else 2
+        if len(node.args) != expected:
+            raise FormulaError(f'{node.func.id}() takes {expected} argument(s)')
+        for arg in node.args:
+            _check_node(arg, variables)
+    else:
+        raise FormulaError(f'{type(node).__name__} is not allowed in a formula')
+
+
+def compile_formula(expression):
+    """Parse and validate a formula expression, returning a CompiledFormula"""
+    if expression is not None and not isinstance(expression, str):
+        raise FormulaError('Formula expression must be a string')
+    if not expression or not expression.strip():
+        raise FormulaError('Formula expression is empty')
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise FormulaError(f'Formula expression is longer than {MAX_EXPRESSION_LENGTH} characters')
+
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise FormulaError(f'Invalid formula syntax: {e.msg}')
+
+    variables = set()
+    _check_node(tree, variables)
+    if not variables:
+        raise FormulaError('Formula must use at least one stat variable')
+
+    code = compile(tree, '<formula>', 'eval')
+    return CompiledFormula(expression, code, sorted(variables))
+
+
+def stat_columns(rows, columns):
+    """Turn fetched Game_Stats rows into one float array per column"""
+    return {
+        column: np.array([row[column] for row in rows], dtype=float)
+        for column in columns
+    }
+
+
+class FormulaCache:
+    """
+    Compiled formulas keyed by formulaID. An entry is recompiled when the
+    stored expression no longer matches, so edits take effect without an
+    explicit invalidation.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, formula_id, expression):
+        with self._lock:
+            compiled = self._entries.get(formula_id)
+        if compiled is not None and compiled.expression == expression:
+            return compiled
+
+        compiled = compile_formula(expression)
+        with self._lock:
+            self._entries[formula_id] = compiled
+        logger.info(f'Compiled metric formula {formula_id}: {expression}')
+        return compiled
+
+    def discard(self, formula_id):
+        with self._lock:
+            self._entries.pop(formula_id, None)
+
+
+formula_cache = FormulaCache()
@@ -0,0 +1,199 @@
+#------------------------------------------------------------
+# Bulk materialization of custom metric formulas
+#------------------------------------------------------------
+# A materialization job scores one formula over every Game_Stats row in
+# a date range and/or set of players. Rows whose stored value is newer
+# than both the stat line and the formula are skipped. Progress is kept
+# in the MetricJobs table so any API process can report it.
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from backend.db_connection import db
+from backend.analytics.formula_engine import formula_cache, stat_columns
+
+logger = logging.getLogger(__name__)
+
+# A stored value is stale if the stat line or the formula changed since it
+# was calculated (<= so a write in the same second is not missed)
+STALE_CONDITION = '''(
+    cm.metricID IS NULL
+    OR cm.calcTimestamp <= GREATEST(gs.lastUpdated, mf.lastModified)
+)'''
+
+
+def upsert_metric_values(cursor, formula_id, metric_name, rows, values):
+    """
+    Write one batch of results with a single multi-row INSERT. Existing
+    (formulaID, gameID, playerID) rows are updated in place, so their
+    metricID (and any dashboard linking to it) is kept.
+    """
+    if not rows:
+        return
+
+    params = []
+    for row, value in zip(rows, values):
+        params.extend((row['gameID'], row['playerID'], formula_id, metric_name,
+                       None if np.isnan(value) else float(value)))
+
+    cursor.execute(f'''
+        INSERT INTO CalculatedMetrics (gameID, playerID, formulaID, metricName, metricValue)
+        VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * len(rows))} AS d
+        ON DUPLICATE KEY UPDATE
+            metricName = d.metricName,
+            metricValue = d.metricValue,
+            calcTimestamp = NOW()
+    ''', params)
+
+
+def job_scope(job):
+    """SQL conditions (and their parameters) limiting a job's Game_Stats rows"""
+    conditions = []
+    params = []
+    if job['startDate']:
+        conditions.append('g.date >= %s')
+        params.append(job['startDate'])
+    if job['endDate']:
+        conditions.append('g.date <= %s')
+        params.append(job['endDate'])
+    if job['playerIDs']:
+        player_ids = json.loads(job['playerIDs'])
+        conditions.append(f"gs.playerID IN ({', '.join(['%s'] * len(player_ids))})")
+        params.extend(player_ids)
+    return ' AND '.join(conditions) or 'TRUE', params
+
+
+class MetricJobRunner:
+    """Thread pool that runs materialization jobs submitted by the API"""
+
+    def __init__(self, workers=2, batch_size=1000):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.app = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def init_app(self, app):
+        app.config.setdefault('METRIC_JOB_WORKERS', self.workers)
+        app.config.setdefault('METRIC_JOB_BATCH_SIZE', self.batch_size)
+        self.app = app
+        self.workers = app.config['METRIC_JOB_WORKERS']
+        self.batch_size = app.config['METRIC_JOB_BATCH_SIZE']
+
+    def submit(self, job_id):
+        """Queue a job that was just inserted as pending"""
+        if self.workers <= 0:
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # executor threads do not survive a fork
+                self._pid = os.getpid()
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix='metric-job')
+        self._executor.submit(self._run_job, job_id)
+
+    def _run_job(self, job_id):
+        with self.app.app_context():
+            self.run_job(job_id)
+
+    def run_job(self, job_id):
+        """Score every stale player-game in the job's scope, a batch at a time"""
+        with db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE MetricJobs SET status = 'running', startedAt = NOW()
+                WHERE jobID = %s AND status = 'pending'
+            ''', (job_id,))
+            conn.commit()
+            if cursor.rowcount != 1:
+                return
+
+            try:
+                cursor.execute('''
+                    SELECT j.formulaID, j.startDate, j.endDate, j.playerIDs,
+                           mf.formulaName, mf.expression
+                    FROM MetricJobs j
+                    JOIN MetricsFormulas mf ON j.formulaID = mf.formulaID
+                    WHERE j.jobID = %s
+                ''', (job_id,))
+                job = cursor.fetchone()
+
+                compiled = formula_cache.get(job['formulaID'], job['expression'])
+                scope, scope_params = job_scope(job)
+                joins = '''
+                    FROM Game_Stats gs
+                    JOIN Game g ON gs.gameID = g.gameID
+                    JOIN MetricsFormulas mf ON mf.formulaID = %s
+                    LEFT JOIN CalculatedMetrics cm
+                        ON cm.formulaID = mf.formulaID
+                        AND cm.gameID = gs.gameID
+                        AND cm.playerID = gs.playerID
+                '''
+
+                cursor.execute(f'''
+                    SELECT COUNT(*) AS total,
+                           COALESCE(SUM({STALE_CONDITION}), 0) AS stale
+                    {joins}
+                    WHERE {scope}
+                ''', [job['formulaID']] + scope_params)
+                counts = cursor.fetchone()
+                cursor.execute('''
+                    UPDATE MetricJobs SET rowsTotal = %s, rowsSkipped = %s
+                    WHERE jobID = %s
+                ''', (counts['stale'], counts['total'] - counts['stale'], job_id))
+                conn.commit()
+
+                batch_query = f'''
+                    SELECT gs.gameID, gs.playerID,
+                           {', '.join(f'gs.{c}' for c in compiled.columns)}
+                    {joins}
+                    WHERE {scope}
+                      AND {STALE_CONDITION}
+                      AND (gs.gameID, gs.playerID) > (%s, %s)
+                    ORDER BY gs.gameID, gs.playerID
+                    LIMIT %s
+                '''
+                last_key = (0, 0)
+                done = 0
+
+                while True:
+                    cursor.execute(batch_query, [job['formulaID']] + scope_params
+                                   + list(last_key) + [self.batch_size])
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+
+                    values = compiled.evaluate(stat_columns(rows, compiled.columns))
+                    upsert_metric_values(cursor, job['formulaID'], job['formulaName'], rows, values)
+
+                    done += len(rows)
+                    last_key = (rows[-1]['gameID'], rows[-1]['playerID'])
+                    cursor.execute('UPDATE MetricJobs SET rowsDone = %s WHERE jobID = %s',
+                                   (done, job_id))
+                    conn.commit()
+
+                cursor.execute('''
+                    UPDATE MetricJobs SET status = 'completed', completedAt = NOW()
+                    WHERE jobID = %s
+                ''', (job_id,))
+                conn.commit()
+
+                logger.info(f'Metric job {job_id} scored {done} player-games')
+
+            except Exception as e:
+                logger.error(f'Metric job {job_id} failed: {str(e)}')
+                conn.rollback()
+                cursor = conn.cursor()
+                cursor.execute('''
+                    UPDATE MetricJobs SET status = 'failed', errorMessage = %s, completedAt = NOW()
+                    WHERE jobID = %s
+                ''', (str(e), job_id))
+                conn.commit()
+
+
+metric_job_runner = MetricJobRunner()
@@ -0,0 +1,122 @@
+#------------------------------------------------------------
+# Async serving path for the hot read-only routes
+#------------------------------------------------------------
+# A Starlette app on an aiomysql connection pool. One event loop keeps
+# hundreds of page loads in flight at once, each waiting on MySQL
+# without holding a thread. It runs the exact SQL of the Flask routes
+# (imported from the players and scouts blueprints) and encodes JSON the
+# way Flask does, so a client can use either server for these routes:
+#
+#   GET /players/<id>                  profile
+#   GET /players/<id>/stats            game stats
+#   GET /players/<id>/schedule         upcoming games
+#   GET /games/<id>/annotations        annotations (?since=)
+#
+# Serve with `uvicorn async_app:app`; writes and every other route stay
+# on the Flask API.
+import contextlib
+import json
+import logging
+import os
+
+import aiomysql
+from dotenv import load_dotenv
+from flask.json.provider import DefaultJSONProvider
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+
+from backend.players.player_routes import (
+    PLAYER_PROFILE_QUERY, PLAYER_STATS_QUERY, PLAYER_SCHEDULE_QUERY,
+)
+from backend.scouts.scout_routes import GAME_ANNOTATIONS_QUERY
+
+logger = logging.getLogger(__name__)
+
+
+def json_response(data, status_code=200):
+    """Same body as Flask's jsonify (sorted keys, Flask's date/Decimal encoding)"""
+    body = json.dumps(data, default=DefaultJSONProvider.default, sort_keys=True,
+                      separators=(',', ':'), ensure_ascii=True)
+    return Response(body + '\n', status_code=status_code, media_type='application/json')
+
+
+async def fetch_all(request, query, params):
+    async with request.app.state.pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchall()
+
+
+# ------------------------------------------------------------
+# GET /players/<player_id> - Get player profile
+async def get_player_profile(request):
+    player_id = request.path_params['player_id']
+    rows = await fetch_all(request, PLAYER_PROFILE_QUERY, (player_id,))
+
+    if not rows:
+        return json_response({'error': 'Player not found'}, 404)
+
+    return json_response(rows[0])
+
+
+# ------------------------------------------------------------
+# GET /players/<player_id>/stats - Get player game stats
+async def get_player_stats(request):
+    player_id = request.path_params['player_id']
+    return json_response(await fetch_all(request, PLAYER_STATS_QUERY, (player_id,)))
+
+
+# ------------------------------------------------------------
+# GET /players/<player_id>/schedule - Get upcoming games
+async def get_player_schedule(request):
+    player_id = request.path_params['player_id']
+    return json_response(await fetch_all(request, PLAYER_SCHEDULE_QUERY, (player_id,)))
+
+
+# ------------------------------------------------------------
+# GET /games/<game_id>/annotations - Get annotations for a game
+async def get_game_annotations(request):
+    game_id = request.path_params['game_id']
+    try:
+        since = int(request.query_params.get('since', 0))
+    except ValueError:
+        since = 0  # Flask's type=int falls back to the default the same way
+
+    return json_response(await fetch_all(request, GAME_ANNOTATIONS_QUERY, (game_id, since)))
+
+
+def create_async_app():
+    load_dotenv()
+
+    pool_settings = dict(
+        host=os.getenv('DB_HOST').strip(),
+        port=int(os.getenv('DB_PORT').strip()),
+        user=os.getenv('DB_USER').strip(),
+        password=os.getenv('MYSQL_ROOT_PASSWORD').strip(),
+        db=os.getenv('DB_NAME').strip(),
+        minsize=int(os.getenv('ASYNC_DB_POOL_MIN_SIZE', '1')),
+        maxsize=int(os.getenv('ASYNC_DB_POOL_MAX_SIZE', '50')),
+        pool_recycle=int(os.getenv('DB_POOL_IDLE_TIMEOUT', '300')),
+        cursorclass=aiomysql.DictCursor,
+        autocommit=True,
+    )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        app.state.pool = await aiomysql.create_pool(**pool_settings)
+        logger.info(f'Created async MySQL pool (maxsize={pool_settings["maxsize"]})')
+        try:
+            yield
+        finally:
+            app.state.pool.close()
+            await app.state.pool.wait_closed()
+
+    routes = [
+        Route('/players/{player_id:int}', get_player_profile, methods=['GET']),
+        Route('/players/{player_id:int}/stats', get_player_stats, methods=['GET']),
+        Route('/players/{player_id:int}/schedule', get_player_schedule, methods=['GET']),
+        Route('/games/{game_id:int}/annotations', get_game_annotations, methods=['GET']),
+    ]
+
+    return Starlette(routes=routes, lifespan=lifespan)
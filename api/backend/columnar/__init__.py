@@ -0,0 +1,170 @@
+#------------------------------------------------------------
+# Arrow IPC / Parquet responses for the analyst endpoints
+#------------------------------------------------------------
+# Routes that return tables can also answer with Apache Arrow (IPC stream
+# format) or Parquet, picked by ?format=arrow|parquet or the Accept
+# header. Columns keep their SQL types: DECIMAL averages arrive as
+# float64 instead of strings, dates as dates. pyarrow is imported lazily;
+# without it those formats answer 406 and JSON keeps working.
+import io
+
+from flask import Response, jsonify, request
+
+ARROW_MIMETYPE = 'application/vnd.apache.arrow.stream'
+PARQUET_MIMETYPE = 'application/vnd.apache.parquet'
+
+COLUMNAR_MIMETYPES = {'arrow': ARROW_MIMETYPE, 'parquet': PARQUET_MIMETYPE}
+
+# ?format= aliases
+FORMAT_NAMES = {
+    'json': None,
+    'arrow': 'arrow',
+    'ipc': 'arrow',
+    'parquet': 'parquet',
+}
+
+
+class ColumnarError(Exception):
+    """Raised when a columnar format is requested but cannot be produced"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+    def response(self):
+        return jsonify({'error': str(self)}), self.status
+
+
+def requested_format():
+    """
+    'arrow', 'parquet' or None (JSON) for the current request.
+    An explicit ?format= wins over the Accept header; JSON is preferred
+    when the client accepts anything. Raises ColumnarError for an
+    unknown ?format=.
+    """
+    name = request.args.get('format', '').lower()
+    if name:
+        if name not in FORMAT_NAMES:
+            raise ColumnarError(f'Unknown format {name!r}; use json, arrow or parquet')
+        return FORMAT_NAMES[name]
+
+    best = request.accept_mimetypes.best_match(
+        ['application/json', ARROW_MIMETYPE, PARQUET_MIMETYPE], default='application/json')
+    return {ARROW_MIMETYPE: 'arrow', PARQUET_MIMETYPE: 'parquet'}.get(best)
+
+
+def require_pyarrow():
+    """The pyarrow module, or ColumnarError (406) when it is not installed"""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ColumnarError('Arrow and Parquet responses need pyarrow installed on the API server', 406)
+    return pa
+
+
+def arrow_schema(pa, description):
+    """Map PyMySQL column type codes onto Arrow types"""
+    from pymysql.constants import FIELD_TYPE
+
+    int_types = {FIELD_TYPE.TINY, FIELD_TYPE.SHORT, FIELD_TYPE.LONG,
+                 FIELD_TYPE.LONGLONG, FIELD_TYPE.INT24, FIELD_TYPE.YEAR}
+    float_types = {FIELD_TYPE.FLOAT, FIELD_TYPE.DOUBLE, FIELD_TYPE.DECIMAL, FIELD_TYPE.NEWDECIMAL}
+
+    fields = []
+    for column in description:
+        name, type_code = column[0], column[1]
+        if type_code in int_types:
+            arrow_type = pa.int64()
+        elif type_code in float_types:
+            arrow_type = pa.float64()
+        elif type_code == FIELD_TYPE.DATE:
+            arrow_type = pa.date32()
+        elif type_code in (FIELD_TYPE.DATETIME, FIELD_TYPE.TIMESTAMP):
+            arrow_type = pa.timestamp('us')
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def to_arrow_value(value, arrow_type, pa):
+    if value is None:
+        return None
+    if pa.types.is_floating(arrow_type):
+        return float(value)
+    if pa.types.is_string(arrow_type) and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def record_batch(pa, schema, rows):
+    """One RecordBatch from tuple rows or DictCursor rows"""
+    if rows and isinstance(rows[0], dict):
+        columns = [[row[field.name] for row in rows] for field in schema]
+    else:
+        columns = [[row[i] for row in rows] for i in range(len(schema))]
+    arrays = [pa.array([to_arrow_value(value, field.type, pa) for value in column], type=field.type)
+              for field, column in zip(schema, columns)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _open_writer(pa, fmt, sink, schema):
+    if fmt == 'arrow':
+        return pa.ipc.new_stream(sink, schema)
+    return pa.parquet.ParquetWriter(sink, schema)
+
+
+def encode_rows(fmt, rows, description):
+    """Serialize a fetched result to Arrow IPC or Parquet bytes"""
+    pa = require_pyarrow()
+    schema = arrow_schema(pa, description)
+    sink = io.BytesIO()
+    with _open_writer(pa, fmt, sink, schema) as writer:
+        if rows:
+            writer.write_batch(record_batch(pa, schema, rows))
+    return sink.getvalue()
+
+
+def stream_batches(fmt, batches, description):
+    """
+    Yield Arrow IPC / Parquet bytes as each batch of rows is written, so a
+    large result never sits in memory as one file. Parquet writes a row
+    group per batch and its footer at the end. Call require_pyarrow()
+    before starting the response.
+    """
+    pa = require_pyarrow()
+    schema = arrow_schema(pa, description)
+    sink = io.BytesIO()
+
+    def drain():
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    with _open_writer(pa, fmt, sink, schema) as writer:
+        for rows in batches:
+            writer.write_batch(record_batch(pa, schema, rows))
+            data = drain()
+            if data:
+                yield data
+    data = drain()
+    if data:
+        yield data
+
+
+def columnar_response(fmt, body):
+    response = Response(body, mimetype=COLUMNAR_MIMETYPES[fmt])
+    response.vary.add('Accept')
+    return response
+
+
+def rows_response(fmt, rows, description):
+    """Send a fetched result as JSON (fmt None) or in the requested columnar format"""
+    if fmt is None:
+        response = jsonify(rows)
+        response.vary.add('Accept')
+        return response
+    return columnar_response(fmt, encode_rows(fmt, rows, description))
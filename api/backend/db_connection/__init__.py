@@ -1,10 +1,274 @@
 #------------------------------------------------------------
 # This file creates a shared DB connection resource
 #------------------------------------------------------------
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from flask import g
 from flaskext.mysql import MySQL
 from pymysql import cursors
 
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no connection could be borrowed before the timeout"""
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of PyMySQL connections.
+
+    Keeps up to max_size connections open between requests and lets up to
+    max_overflow extra connections be opened under bursts (those are closed
+    instead of being returned). Idle connections older than idle_timeout are
+    recycled, and a connection can be pinged before it is handed out.
+    """
+
+    def __init__(self, factory, min_size=1, max_size=10, max_overflow=5,
+                 idle_timeout=300, borrow_timeout=10, health_check=True):
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_overflow = max_overflow
+        self.idle_timeout = idle_timeout
+        self.borrow_timeout = borrow_timeout
+        self.health_check = health_check
+
+        self._idle = deque()  # (connection, time it was returned)
+        self._lock = threading.Condition()
+        self._open = 0
+        self._in_use = 0
+
+        self.counters = {
+            'borrowed': 0,
+            'waiting': 0,
+            'created': 0,
+            'recycled': 0,
+            'overflow_closed': 0,
+            'timeouts': 0,
+        }
+
+    def fill(self):
+        """Open connections until min_size are available"""
+        while True:
+            with self._lock:
+                if self._open >= self.min_size:
+                    return
+                self._open += 1
+            try:
+                conn = self._create()
+            except Exception:
+                with self._lock:
+                    self._open -= 1
+                raise
+            with self._lock:
+                self._idle.append((conn, time.monotonic()))
+                self._lock.notify()
+
+    def borrow(self):
+        """Hand out a healthy connection, opening or waiting for one if needed"""
+        deadline = time.monotonic() + self.borrow_timeout
+
+        while True:
+            conn = None
+            create = False
+
+            with self._lock:
+                if self._idle:
+                    conn, returned_at = self._idle.pop()
+                elif self._open < self.max_size + self.max_overflow:
+                    self._open += 1
+                    create = True
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters['timeouts'] += 1
+                        raise PoolExhaustedError(
+                            f'No database connection available after {self.borrow_timeout}s'
+                        )
+                    self.counters['waiting'] += 1
+                    try:
+                        self._lock.wait(remaining)
+                    finally:
+                        self.counters['waiting'] -= 1
+                    continue
+
+            if create:
+                try:
+                    conn = self._create()
+                except Exception:
+                    with self._lock:
+                        self._open -= 1
+                        self._lock.notify()
+                    raise
+            elif not self._usable(conn, returned_at):
+                self._discard(conn)
+                continue
+
+            with self._lock:
+                self._in_use += 1
+                self.counters['borrowed'] += 1
+            return conn
+
+    def release(self, conn, discard=False):
+        """Return a connection to the pool, closing it if it is surplus or broken"""
+        if not discard:
+            try:
+                # end whatever transaction the request left open so the
+                # next borrower does not see a stale snapshot
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._lock:
+            self._in_use -= 1
+            keep = not discard and len(self._idle) + self._in_use < self.max_size
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+                self._lock.notify()
+                return
+            if not discard:
+                self.counters['overflow_closed'] += 1
+
+        self._discard(conn, recycled=discard)
+
+    def stats(self):
+        """Snapshot of pool sizes and counters"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._in_use
+            stats['min_size'] = self.min_size
+            stats['max_size'] = self.max_size
+            stats['max_overflow'] = self.max_overflow
+        return stats
+
+    def close(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def _create(self):
+        conn = self.factory()
+        with self._lock:
+            self.counters['created'] += 1
+        return conn
+
+    def _usable(self, conn, returned_at):
+        if self.idle_timeout and time.monotonic() - returned_at > self.idle_timeout:
+            return False
+        if self.health_check:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def _discard(self, conn, recycled=True):
+        with self._lock:
+            self._open -= 1
+            if recycled:
+                self.counters['recycled'] += 1
+            self._lock.notify()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class PooledMySQL(MySQL):
+    """
+    Drop-in replacement for flaskext.mysql.MySQL that borrows connections
+    from a ConnectionPool instead of opening one per request.
+
+    Routes keep calling db.get_db(); the connection is returned to the pool
+    when the request is torn down.
+    """
+
+    def __init__(self, app=None, prefix="mysql", **connect_args):
+        self.pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
+        super().__init__(app, prefix, **connect_args)
+
+    def init_app(self, app):
+        super().init_app(app)
+        app.config.setdefault('MYSQL_POOL_MIN_SIZE', 1)
+        app.config.setdefault('MYSQL_POOL_MAX_SIZE', 10)
+        app.config.setdefault('MYSQL_POOL_MAX_OVERFLOW', 5)
+        app.config.setdefault('MYSQL_POOL_IDLE_TIMEOUT', 300)
+        app.config.setdefault('MYSQL_POOL_BORROW_TIMEOUT', 10)
+        app.config.setdefault('MYSQL_POOL_HEALTH_CHECK', True)
+
+    def get_pool(self):
+        """Return this process's pool, creating it on first use (and after a fork)"""
+        pid = os.getpid()
+        if self.pool is not None and self._pool_pid == pid:
+            return self.pool
+
+        with self._pool_lock:
+            if self.pool is None or self._pool_pid != pid:
+                config = self.app.config
+                self.pool = ConnectionPool(
+                    self.connect,
+                    min_size=config['MYSQL_POOL_MIN_SIZE'],
+                    max_size=config['MYSQL_POOL_MAX_SIZE'],
+                    max_overflow=config['MYSQL_POOL_MAX_OVERFLOW'],
+                    idle_timeout=config['MYSQL_POOL_IDLE_TIMEOUT'],
+                    borrow_timeout=config['MYSQL_POOL_BORROW_TIMEOUT'],
+                    health_check=config['MYSQL_POOL_HEALTH_CHECK'],
+                )
+                self._pool_pid = pid
+                logger.info(f'Created MySQL connection pool (max_size={self.pool.max_size})')
+                try:
+                    self.pool.fill()
+                except Exception as e:
+                    logger.warning(f'Could not pre-open pool connections: {str(e)}')
+        return self.pool
+
+    def get_db(self):
+        if '_mysql_conn' not in g:
+            g._mysql_conn = self.get_pool().borrow()
+        return g._mysql_conn
+
+    def teardown_request(self, exception):
+        conn = g.pop('_mysql_conn', None)
+        if conn is not None:
+            self.get_pool().release(conn, discard=not conn.open)
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection outside the request-scoped one (background jobs,
+        streaming responses). It goes back to the pool when the block exits.
+        """
+        pool = self.get_pool()
+        conn = pool.borrow()
+        broken = False
+        try:
+            yield conn
+        except BaseException:
+            # includes GeneratorExit from an abandoned streaming response,
+            # which can leave an unread result set on the connection
+            broken = True
+            raise
+        finally:
+            pool.release(conn, discard=broken or not conn.open)
+
+    def pool_stats(self):
+        return self.get_pool().stats()
+
 
-# the parameter instructs the connection to return data 
-# as a dictionary object. 
-db = MySQL(cursorclass=cursors.DictCursor)
\ No newline at end of file
+# the parameter instructs the connection to return data
+# as a dictionary object.
+db = PooledMySQL(cursorclass=cursors.DictCursor)
@@ -0,0 +1,342 @@
+#------------------------------------------------------------
+# Background workers that turn pending ExportRequest rows into files
+#------------------------------------------------------------
+# POST /analytics/datasets/export only records the request. A dispatcher
+# thread claims pending rows (pending -> running, atomically, so several
+# API processes can share the queue) and hands them to a small thread
+# pool. Each job streams its query from an unbuffered cursor straight
+# into a CSV/JSON/Parquet file, records it in Exports and marks the
+# request completed (or failed).
+#
+# A running job holds a MySQL named lock (EXPORT_LOCK) on its connection.
+# The server drops the lock if the process dies. So when the dispatcher
+# starts, it returns every 'running' request whose lock is free to
+# 'pending', and jobs left behind by a crash run again.
+import csv
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pymysql import cursors
+
+from backend.columnar import ColumnarError, arrow_schema, record_batch, require_pyarrow
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+FETCH_BATCH = 1000
+
+# Named lock held by the process that is writing an export
+EXPORT_LOCK = 'courtvision_export_{}'
+
+EXPORT_QUERIES = {
+    'Player Stats': '''
+        SELECT DISTINCT p.playerID, p.firstName, p.lastName, pin.position, t.team_name,
+               pt.gamesPlayed as games_played,
+               pt.points / pt.gamesPlayed as avg_points,
+               pt.rebounds / pt.gamesPlayed as avg_rebounds,
+               pt.assists / pt.gamesPlayed as avg_assists,
+               pt.steals / pt.gamesPlayed as avg_steals
+        FROM Players p
+        JOIN Playsin pin ON p.playerID = pin.playerID
+        JOIN Team t ON pin.team_id = t.team_id
+        JOIN Player_Totals pt ON p.playerID = pt.playerID
+        WHERE pt.gamesPlayed > 0
+        ORDER BY avg_points DESC
+    ''',
+    'Game Data': '''
+        SELECT gs.gameID, gs.playerID, g.date, g.opponent,
+               p.firstName, p.lastName,
+               gs.minutes, gs.points, gs.rebounds, gs.assists,
+               gs.steals, gs.blocks, gs.turnovers, gs.fouls, gs.three_pt
+        FROM Game_Stats gs
+        JOIN Game g ON gs.gameID = g.gameID
+        JOIN Players p ON gs.playerID = p.playerID
+        ORDER BY g.date DESC, gs.gameID DESC, gs.playerID DESC
+    ''',
+    'Competition Context': '''
+        SELECT p.playerID, p.firstName, p.lastName,
+               lt.competitionLevel as competition_level,
+               lt.gamesPlayed as games_played,
+               lt.points / lt.gamesPlayed as avg_points,
+               lt.rebounds / lt.gamesPlayed as avg_rebounds,
+               lt.assists / lt.gamesPlayed as avg_assists
+        FROM Player_Level_Totals lt
+        JOIN Players p ON lt.playerID = p.playerID
+        WHERE lt.gamesPlayed > 0
+        ORDER BY competition_level, avg_points DESC
+    ''',
+    'Calculated Metrics': '''
+        SELECT cm.metricID, cm.gameID, cm.playerID, cm.formulaID,
+               cm.metricName, cm.metricValue, cm.calcTimestamp,
+               p.firstName, p.lastName, mf.formulaName
+        FROM CalculatedMetrics cm
+        LEFT JOIN Players p ON cm.playerID = p.playerID
+        JOIN MetricsFormulas mf ON cm.formulaID = mf.formulaID
+        ORDER BY cm.calcTimestamp DESC
+    ''',
+}
+
+# Names the Streamlit pages send for the same datasets
+DATA_TYPE_ALIASES = {
+    'Player Statistics': 'Player Stats',
+    'Game Statistics': 'Game Data',
+}
+
+FILE_EXTENSIONS = {'CSV': 'csv', 'JSON': 'json', 'PARQUET': 'parquet'}
+
+
+class ExportError(Exception):
+    """Raised when an export request cannot be fulfilled"""
+    pass
+
+
+def write_csv(path, columns, batches):
+    with open(path, 'w', newline='', encoding='utf-8') as fh:
+        writer = csv.writer(fh)
+        writer.writerow(columns)
+        for rows in batches:
+            writer.writerows(rows)
+
+
+def write_json(path, columns, batches):
+    with open(path, 'w', encoding='utf-8') as fh:
+        fh.write('[')
+        first = True
+        for rows in batches:
+            for row in rows:
+                if not first:
+                    fh.write(',\n')
+                fh.write(json.dumps(dict(zip(columns, row)), default=str))
+                first = False
+        fh.write(']\n')
+
+
+def write_parquet(path, columns, batches, description):
+    try:
+        pa = require_pyarrow()
+    except ColumnarError:
+        raise ExportError('Parquet exports need pyarrow installed on the API server')
+
+    schema = arrow_schema(pa, description)
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        for rows in batches:
+            writer.write_batch(record_batch(pa, schema, rows))
+
+
+class ExportWorker:
+    """Dispatcher thread plus a thread pool that runs export jobs"""
+
+    def __init__(self, workers=2, poll_interval=5):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.export_dir = 'exports'
+        self.app = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._slots = None
+        self._executor = None
+
+    def init_app(self, app):
+        app.config.setdefault('EXPORT_DIR', os.path.join(app.root_path, '..', 'exports'))
+        app.config.setdefault('EXPORT_WORKERS', self.workers)
+        app.config.setdefault('EXPORT_POLL_INTERVAL', self.poll_interval)
+        # off when a pre-forking server starts the threads in each worker instead
+        app.config.setdefault('EXPORT_AUTOSTART', True)
+        self.app = app
+        self.export_dir = os.path.abspath(app.config['EXPORT_DIR'])
+        self.workers = app.config['EXPORT_WORKERS']
+        self.poll_interval = app.config['EXPORT_POLL_INTERVAL']
+        if app.config['EXPORT_AUTOSTART']:
+            self.start()
+
+    def start(self):
+        """Start the threads for this process (again after a fork)"""
+        if self.workers <= 0:
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._slots = threading.Semaphore(self.workers)
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix='export-worker')
+            threading.Thread(target=self._dispatch_loop, name='export-dispatcher', daemon=True).start()
+            logger.info(f'Started {self.workers} export workers')
+
+    def notify(self):
+        """Wake the dispatcher after a new request was inserted"""
+        self.start()
+        self._wakeup.set()
+
+    def file_path(self, file_name):
+        return os.path.join(self.export_dir, file_name)
+
+    def owns_file(self, path):
+        """True if path points inside the export directory"""
+        path = os.path.realpath(path)
+        return os.path.commonpath([path, os.path.realpath(self.export_dir)]) == os.path.realpath(self.export_dir)
+
+    def _dispatch_loop(self):
+        try:
+            with self.app.app_context():
+                self.requeue_abandoned()
+        except Exception as e:
+            logger.error(f'Could not requeue abandoned exports: {str(e)}')
+
+        while True:
+            try:
+                with self.app.app_context():
+                    for export_id in self._claim_pending():
+                        self._executor.submit(self._run_job, export_id)
+            except Exception as e:
+                logger.error(f'Export dispatcher error: {str(e)}')
+
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def requeue_abandoned(self):
+        """Return running requests that no live process holds the lock for to pending"""
+        requeued = 0
+        with db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT exportID FROM ExportRequest WHERE status = 'running'")
+            for row in cursor.fetchall():
+                cursor.execute('SELECT IS_FREE_LOCK(%s) AS free', (EXPORT_LOCK.format(row['exportID']),))
+                if cursor.fetchone()['free']:
+                    cursor.execute('''
+                        UPDATE ExportRequest SET status = 'pending'
+                        WHERE exportID = %s AND status = 'running'
+                    ''', (row['exportID'],))
+                    requeued += cursor.rowcount
+            conn.commit()
+        if requeued:
+            logger.info(f'Requeued {requeued} export requests left running by a stopped process')
+        return requeued
+
+    def _claim_pending(self):
+        """Move pending requests to running while we have free workers"""
+        claimed = []
+        with db.connection() as conn:
+            cursor = conn.cursor()
+            while self._slots.acquire(blocking=False):
+                cursor.execute('''
+                    SELECT exportID FROM ExportRequest
+                    WHERE status = 'pending'
+                    ORDER BY timestamp ASC, exportID ASC
+                    LIMIT 1
+                ''')
+                row = cursor.fetchone()
+                if row:
+                    cursor.execute('''
+                        UPDATE ExportRequest SET status = 'running'
+                        WHERE exportID = %s AND status = 'pending'
+                    ''', (row['exportID'],))
+                conn.commit()
+
+                if not row:
+                    self._slots.release()
+                    break
+                if cursor.rowcount == 1:
+                    claimed.append(row['exportID'])
+                else:
+                    # another process got there first
+                    self._slots.release()
+        return claimed
+
+    def _run_job(self, export_id):
+        try:
+            with self.app.app_context():
+                self.run_export(export_id)
+        finally:
+            self._slots.release()
+            self._wakeup.set()
+
+    def run_export(self, export_id):
+        """Write the file for one claimed request, holding its export lock"""
+        with db.connection() as conn:
+            cursor = conn.cursor()
+            lock = EXPORT_LOCK.format(export_id)
+            cursor.execute('SELECT GET_LOCK(%s, 0) AS locked', (lock,))
+            if not cursor.fetchone()['locked']:
+                logger.info(f'Export {export_id} is already being written by another process')
+                return
+            try:
+                self._write_export(conn, export_id)
+            finally:
+                cursor.execute('SELECT RELEASE_LOCK(%s)', (lock,))
+
+    def _write_export(self, conn, export_id):
+        """Write the file and record the outcome (completed or failed)"""
+        cursor = conn.cursor()
+        cursor.execute('SELECT format, dataType, status FROM ExportRequest WHERE exportID = %s',
+                       (export_id,))
+        request_row = cursor.fetchone()
+        conn.commit()
+        if request_row is None or request_row['status'] != 'running':
+            # requeued (or removed) after this process claimed it
+            return
+        tmp_path = None
+
+        try:
+            data_type = DATA_TYPE_ALIASES.get(request_row['dataType'], request_row['dataType'])
+            file_format = (request_row['format'] or 'CSV').upper()
+
+            if data_type not in EXPORT_QUERIES:
+                raise ExportError(f'Unknown data type {request_row["dataType"]!r}')
+            if file_format not in FILE_EXTENSIONS:
+                raise ExportError(f'Unsupported export format {request_row["format"]!r}')
+
+            slug = re.sub(r'[^a-z0-9]+', '_', data_type.lower()).strip('_')
+            file_name = f'export_{export_id}_{slug}.{FILE_EXTENSIONS[file_format]}'
+            path = self.file_path(file_name)
+            tmp_path = path + '.part'
+            os.makedirs(self.export_dir, exist_ok=True)
+
+            stream = conn.cursor(cursors.SSCursor)
+            stream.execute(EXPORT_QUERIES[data_type])
+            columns = [column[0] for column in stream.description]
+            batches = iter(lambda: stream.fetchmany(FETCH_BATCH), [])
+
+            if file_format == 'CSV':
+                write_csv(tmp_path, columns, batches)
+            elif file_format == 'JSON':
+                write_json(tmp_path, columns, batches)
+            else:
+                write_parquet(tmp_path, columns, batches, stream.description)
+            stream.close()
+
+            os.replace(tmp_path, path)
+            file_size = os.path.getsize(path)
+
+            cursor.execute('''
+                INSERT INTO Exports (exportRequestID, fileName, filePath, fileSize,
+                                     exportType, expirationDate)
+                VALUES (%s, %s, %s, %s, %s, DATE_ADD(NOW(), INTERVAL 30 DAY))
+            ''', (export_id, file_name, path, file_size, file_format))
+            cursor.execute('''
+                UPDATE ExportRequest SET status = 'completed', completedAt = NOW()
+                WHERE exportID = %s
+            ''', (export_id,))
+            conn.commit()
+
+            logger.info(f'Export {export_id} written to {path} ({file_size} bytes)')
+
+        except Exception as e:
+            logger.error(f'Export {export_id} failed: {str(e)}')
+            conn.rollback()
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE ExportRequest SET status = 'failed', completedAt = NOW()
+                WHERE exportID = %s
+            ''', (export_id,))
+            conn.commit()
+
+
+export_worker = ExportWorker()
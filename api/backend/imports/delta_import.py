@@ -0,0 +1,291 @@
+#------------------------------------------------------------
+# Incremental import of new Game / Game_Stats CSV drops
+#------------------------------------------------------------
+# `flask --app backend_app import-delta --games games.csv --stats stats.csv`
+# matches each CSV row to what is already stored by its natural key
+# (Game: date + opponent + venue; Game_Stats: gameID + playerID), writes
+# only the new and changed rows, and folds the differences into
+# Player_Totals / Player_Level_Totals in the same transaction. The feed's
+# gameIDs in the stats CSV are mapped onto the matching stored games.
+#
+# The API processes notice the new stats once their caches expire
+# (STATS_CACHE_TTL, SIMILARITY_INDEX_MAX_AGE).
+import csv
+import logging
+import re
+from collections import defaultdict
+from datetime import datetime
+
+import click
+from flask.cli import with_appcontext
+from pymysql.err import IntegrityError
+
+from backend.db_connection import db
+from backend.rollups.rollup_engine import STAT_COLUMNS, apply_stat_deltas
+
+logger = logging.getLogger(__name__)
+
+GAME_COLUMNS = ['date', 'startTime', 'endTime', 'opponent', 'venue', 'tournament', 'score']
+GAME_NATURAL_KEY = ['date', 'opponent', 'venue']
+
+# Game_Stats rows written (and rolled up) per transaction
+DELTA_BATCH_SIZE = 1000
+
+# CSV header spellings used by older seed files and stat feeds
+COLUMN_ALIASES = {'threePts': 'three_pt', 'three_pts': 'three_pt', 'game_id': 'gameID', 'player_id': 'playerID'}
+
+SELECT_GAMES_ON_DATES = '''
+    SELECT gameID, date, CAST(startTime AS CHAR) AS startTime, CAST(endTime AS CHAR) AS endTime,
+           opponent, venue, tournament, score
+    FROM Game
+    WHERE date IN ({placeholders})
+'''
+
+INSERT_GAME = f'''
+    INSERT INTO Game ({', '.join(GAME_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(GAME_COLUMNS))})
+'''
+
+UPDATE_GAME = f'''
+    UPDATE Game SET {', '.join(f'{c} = %s' for c in GAME_COLUMNS)}
+    WHERE gameID = %s
+'''
+
+SELECT_STAT_ROWS = f'''
+    SELECT gameID, playerID, {', '.join(STAT_COLUMNS)}
+    FROM Game_Stats
+    WHERE (gameID, playerID) IN ({{placeholders}})
+    FOR UPDATE
+'''
+
+# {rows} is one '(%s, ...)' group per row: a single multi-row statement
+UPSERT_STAT_ROWS = f'''
+    INSERT INTO Game_Stats (gameID, playerID, {', '.join(STAT_COLUMNS)})
+    VALUES {{rows}} AS new
+    ON DUPLICATE KEY UPDATE
+        {', '.join(f'{c} = new.{c}' for c in STAT_COLUMNS)}
+'''
+STAT_ROW_PLACEHOLDERS = f"({', '.join(['%s'] * (len(STAT_COLUMNS) + 2))})"
+
+
+class DeltaImportError(Exception):
+    """Raised when a CSV drop cannot be imported"""
+    pass
+
+
+def read_csv(path):
+    """CSV rows as dicts, header aliases applied and empty / 'null' fields as None"""
+    with open(path, 'r', newline='', encoding='utf-8') as fh:
+        for row in csv.DictReader(fh):
+            yield {COLUMN_ALIASES.get(k, k): (None if v is None or v.strip() in ('', 'null', 'NULL') else v.strip())
+                   for k, v in row.items()}
+
+
+def parse_date(value):
+    """ISO (2025-02-02) or US (2/2/2025) dates"""
+    for fmt in ('%Y-%m-%d', '%m/%d/%Y'):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    raise DeltaImportError(f'Unrecognized date {value!r}')
+
+
+def parse_time(value):
+    """'HH:MM[:SS]' or '4:09 PM' as the 'HH:MM:SS' string MySQL returns for TIME"""
+    if value is None:
+        return None
+    for fmt in ('%H:%M:%S', '%H:%M', '%I:%M %p', '%I:%M:%S %p'):
+        try:
+            return datetime.strptime(value.upper(), fmt).strftime('%H:%M:%S')
+        except ValueError:
+            pass
+    raise DeltaImportError(f'Unrecognized time {value!r}')
+
+
+def parse_int(value, column):
+    if value is None:
+        return None
+    if not re.fullmatch(r'[+-]?\d+(\.0*)?', value):
+        raise DeltaImportError(f'{column} must be a whole number, got {value!r}')
+    return int(float(value))
+
+
+def game_record(row):
+    if not row.get('date'):
+        raise DeltaImportError('Every game needs a date')
+    record = {c: row.get(c) for c in GAME_COLUMNS}
+    record['date'] = parse_date(row['date'])
+    record['startTime'] = parse_time(row.get('startTime'))
+    record['endTime'] = parse_time(row.get('endTime'))
+    return record
+
+
+def natural_key(record):
+    return tuple(record[c] for c in GAME_NATURAL_KEY)
+
+
+def import_games(cursor, rows):
+    """
+    Insert or update the games in rows. Returns ({feed gameID: stored
+    gameID}, counts) so the stats CSV can refer to games by the feed's IDs.
+    """
+    records = [(row.get('gameID'), game_record(row)) for row in rows]
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    id_map = {}
+    if not records:
+        return id_map, counts
+
+    dates = sorted({record['date'] for _, record in records})
+    cursor.execute(SELECT_GAMES_ON_DATES.format(placeholders=', '.join(['%s'] * len(dates))), dates)
+    stored = {natural_key(row): row for row in cursor.fetchall()}
+
+    for feed_id, record in records:
+        existing = stored.get(natural_key(record))
+        if existing is None:
+            cursor.execute(INSERT_GAME, [record[c] for c in GAME_COLUMNS])
+            game_id = cursor.lastrowid
+            stored[natural_key(record)] = {**record, 'gameID': game_id}
+            counts['inserted'] += 1
+        else:
+            game_id = existing['gameID']
+            if any(existing[c] != record[c] for c in GAME_COLUMNS):
+                cursor.execute(UPDATE_GAME, [record[c] for c in GAME_COLUMNS] + [game_id])
+                existing.update(record)
+                counts['updated'] += 1
+            else:
+                counts['unchanged'] += 1
+        if feed_id is not None:
+            id_map[parse_int(feed_id, 'gameID')] = game_id
+
+    return id_map, counts
+
+
+def stat_record(row, id_map):
+    if row.get('gameID') is None or row.get('playerID') is None:
+        raise DeltaImportError('Every stat row needs a gameID and a playerID')
+    game_id = parse_int(row['gameID'], 'gameID')
+    return {
+        'gameID': id_map.get(game_id, game_id),
+        'playerID': parse_int(row['playerID'], 'playerID'),
+        **{c: parse_int(row.get(c), c) for c in STAT_COLUMNS},
+    }
+
+
+def import_stat_batch(cursor, records):
+    """
+    Upsert one batch of Game_Stats records, skipping rows that match what
+    is stored, and apply the summed differences to each player's rollups.
+    Returns counts plus the set of players whose rollups changed.
+    """
+    # the last row wins when a key repeats in the drop
+    by_key = {(r['gameID'], r['playerID']): r for r in records}
+    keys = list(by_key)
+
+    cursor.execute(SELECT_STAT_ROWS.format(placeholders=', '.join(['(%s, %s)'] * len(keys))),
+                   [value for key in keys for value in key])
+    stored = {(row['gameID'], row['playerID']): row for row in cursor.fetchall()}
+
+    changed = []
+    games_delta = defaultdict(int)
+    stat_deltas = defaultdict(lambda: [0] * len(STAT_COLUMNS))
+
+    for key, record in by_key.items():
+        old = stored.get(key)
+        if old is not None and all(old[c] == record[c] for c in STAT_COLUMNS):
+            continue
+        changed.append(record)
+
+        player_id = record['playerID']
+        if old is None:
+            games_delta[player_id] += 1
+        for i, c in enumerate(STAT_COLUMNS):
+            stat_deltas[player_id][i] += (record[c] or 0) - ((old or {}).get(c) or 0)
+
+    if changed:
+        cursor.execute(UPSERT_STAT_ROWS.format(rows=', '.join([STAT_ROW_PLACEHOLDERS] * len(changed))),
+                       [value for r in changed
+                        for value in [r['gameID'], r['playerID']] + [r[c] for c in STAT_COLUMNS]])
+        for player_id in stat_deltas:
+            apply_stat_deltas(cursor, player_id, games_delta[player_id], stat_deltas[player_id])
+
+    inserted = sum(1 for r in changed if (r['gameID'], r['playerID']) not in stored)
+    return {'inserted': inserted, 'updated': len(changed) - inserted,
+            'unchanged': len(by_key) - len(changed), 'players': set(stat_deltas)}
+
+
+def batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_delta(conn, games_path=None, stats_path=None, batch_size=DELTA_BATCH_SIZE, dry_run=False):
+    """
+    Import a CSV drop through conn. Games go in one transaction, stats in
+    one transaction per batch (a failing batch is rolled back and stops
+    the import). With dry_run everything is rolled back at the end.
+    """
+    cursor = conn.cursor()
+    results = {}
+
+    def commit():
+        if not dry_run:
+            conn.commit()
+
+    try:
+        id_map = {}
+        if games_path:
+            id_map, results['games'] = import_games(cursor, read_csv(games_path))
+            commit()
+
+        if stats_path:
+            totals = defaultdict(int)
+            players = set()
+            for rows in batches(read_csv(stats_path), batch_size):
+                records = [stat_record(row, id_map) for row in rows]
+                counts = import_stat_batch(cursor, records)
+                commit()
+                players |= counts['players']
+                for name in ('inserted', 'updated', 'unchanged'):
+                    totals[name] += counts[name]
+            results['stats'] = dict(totals, **{'players rolled up': len(players)})
+    except Exception:
+        conn.rollback()
+        raise
+
+    if dry_run:
+        conn.rollback()
+
+    return results
+
+
+@click.command('import-delta')
+@click.option('--games', 'games_path', type=click.Path(exists=True, dir_okay=False),
+              help='CSV of games (Game columns, optionally the feed\'s gameID).')
+@click.option('--stats', 'stats_path', type=click.Path(exists=True, dir_okay=False),
+              help='CSV of Game_Stats rows; gameIDs may be the feed\'s IDs from --games.')
+@click.option('--batch-size', default=DELTA_BATCH_SIZE, show_default=True,
+              help='Stat rows per transaction.')
+@click.option('--dry-run', is_flag=True, help='Report what would change, then roll everything back.')
+@with_appcontext
+def import_delta_command(games_path, stats_path, batch_size, dry_run):
+    """Upsert new and changed games / game stats from a CSV drop and update the rollups"""
+    if not games_path and not stats_path:
+        raise click.UsageError('Pass --games and/or --stats')
+
+    with db.connection() as conn:
+        try:
+            results = import_delta(conn, games_path, stats_path, max(1, batch_size), dry_run)
+        except (DeltaImportError, IntegrityError) as e:
+            raise click.ClickException(str(e))
+
+    for table, counts in results.items():
+        click.echo(f'{table}: ' + ', '.join(f'{n} {name}' for name, n in counts.items()))
+    if dry_run:
+        click.echo('Dry run: nothing was written')
@@ -0,0 +1,107 @@
+#------------------------------------------------------------
+# Versioned schema migrations
+#------------------------------------------------------------
+# database-files/00_courtvision_schema.sql builds a fresh database with
+# every migration already included (and recorded in SchemaMigrations).
+# Databases created before a migration existed catch up with
+# `flask --app backend_app migrate`, which runs the versions/NNNN_name.sql
+# files that are not yet recorded, in order. A migration that also has
+# to fill tables from existing data names a backend function in
+# DATA_STEPS, so the migration runs the same SQL as the app.
+import logging
+import os
+import re
+
+import click
+from flask.cli import with_appcontext
+
+from backend.db_connection import db
+from backend.rollups.rollup_engine import rebuild_rollups
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIR = os.path.join(os.path.dirname(__file__), 'versions')
+VERSION_FILE = re.compile(r'^(\d{4})_(\w+)\.sql$')
+
+# version -> function(cursor) run after that version's SQL, before it is recorded
+DATA_STEPS = {
+    '0003': rebuild_rollups,
+}
+
+CREATE_SCHEMA_MIGRATIONS = '''
+    CREATE TABLE IF NOT EXISTS SchemaMigrations (
+        version VARCHAR(20) PRIMARY KEY,
+        name VARCHAR(100),
+        appliedAt DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def available_migrations():
+    """(version, name, path) for every migration file, oldest first"""
+    migrations = []
+    for file_name in sorted(os.listdir(VERSIONS_DIR)):
+        match = VERSION_FILE.match(file_name)
+        if match:
+            migrations.append((match.group(1), match.group(2), os.path.join(VERSIONS_DIR, file_name)))
+    return migrations
+
+
+def split_statements(sql):
+    """Split a migration file into statements (comment lines dropped)"""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith('--')]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+
+def applied_versions(cursor):
+    cursor.execute(CREATE_SCHEMA_MIGRATIONS)
+    cursor.execute('SELECT version FROM SchemaMigrations')
+    return {row['version'] for row in cursor.fetchall()}
+
+
+def pending_migrations(cursor):
+    applied = applied_versions(cursor)
+    return [m for m in available_migrations() if m[0] not in applied]
+
+
+def apply_migration(conn, version, name, path):
+    """
+    Run one migration and record it. MySQL commits DDL implicitly, so a
+    migration that fails part way has to be finished by hand before it
+    can be recorded.
+    """
+    with open(path) as f:
+        statements = split_statements(f.read())
+
+    cursor = conn.cursor()
+    for statement in statements:
+        cursor.execute(statement)
+    if version in DATA_STEPS:
+        DATA_STEPS[version](cursor)
+    cursor.execute('INSERT INTO SchemaMigrations (version, name) VALUES (%s, %s)', (version, name))
+    conn.commit()
+    logger.info(f'Applied migration {version}_{name} ({len(statements)} statements)')
+
+
+@click.command('migrate')
+@click.option('--status', is_flag=True, help='Only list migrations that have not been applied.')
+@with_appcontext
+def migrate_command(status):
+    """Apply pending schema migrations from backend/migrations/versions"""
+    with db.connection() as conn:
+        pending = pending_migrations(conn.cursor())
+        conn.commit()
+
+        if not pending:
+            click.echo('Database schema is up to date')
+            return
+
+        for version, name, path in pending:
+            if status:
+                click.echo(f'pending  {version}_{name}')
+                continue
+            click.echo(f'applying {version}_{name}')
+            apply_migration(conn, version, name, path)
+
+        if not status:
+            click.echo(f'Applied {len(pending)} migration(s)')
@@ -0,0 +1,181 @@
+#------------------------------------------------------------
+# Query-plan regression check for the route SQL
+#------------------------------------------------------------
+# `flask --app backend_app check-query-plans` (and tests/test_query_plans.py
+# under pytest) calls every GET route against a seeded database, records
+# the SELECT statements the routes run and EXPLAINs each one. Every table
+# read with a full scan (type ALL) fails the check, unless that statement
+# is listed in FULL_SCANS_ALLOWED as one that reads the whole table.
+#
+# Run it against a disposable copy of the database: a few GET routes
+# write (dashboard snapshots, for one). Write routes are not exercised.
+import logging
+from contextlib import contextmanager
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from pymysql import cursors
+
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+# Value used for every <int:...> URL argument; the seed data has ID 1 everywhere
+SAMPLE_ID = 1
+
+# Routes that never finish on their own (event streams)
+SKIPPED_ROUTES = {'/games/<int:game_id>/annotations/stream'}
+
+# Query strings to call a route with (default: one call without any)
+ROUTE_QUERY_STRINGS = {
+    '/players': ['ids=1,2,3'],
+    '/players/stats/aggregate': ['', 'position=PG&min_height=70&max_weight=250'],
+    '/analytics/dashboard-summary': ['', 'position=PG&league=AAU&min_points=5'],
+    '/players/<int:player_id>/stats/filtered': ['min_points=10&min_assists=2'],
+    '/analytics/datasets': ['limit=50'],
+    '/games/<int:game_id>/annotations': ['', 'since=1'],
+}
+
+# Statements that read a whole table on purpose, as (route, text the
+# statement contains, tables as EXPLAIN names them, i.e. the alias when
+# the query uses one). Any other type ALL fails the check, even when the
+# table had an index the optimizer chose not to use.
+FULL_SCANS_ALLOWED = [
+    # the similar-player index and the recruiting profiles load everything once
+    ('/players/<int:player_id>/comparisons', 'FROM Players p LEFT JOIN Player_Totals pt', {'p'}),
+    ('/players/<int:player_id>/recruiting', 'FROM Offers o', {'o'}),
+    ('/players/<int:player_id>/recruiting', 'FROM RecruitingInterest ri', {'ri'}),
+    ('/players/<int:player_id>/recruiting', 'FROM School ORDER BY schoolID', {'School'}),
+    # the rollups hold one row per player (and level); every one is read
+    ('/players/stats/aggregate', 'JOIN Player_Totals pt ON p.playerID = pt.playerID WHERE pt.gamesPlayed > 0',
+     {'pt'}),
+    ('/analytics/dashboard-summary', 'FROM Players p JOIN Player_Totals pt', {'pt'}),
+    ('/analytics/competition-context', 'FROM Player_Level_Totals lt JOIN Players p', {'lt'}),
+    ('/analytics/datasets', 'FROM Game_Stats gs JOIN Game g ON gs.gameID = g.gameID', {'gs', 'g'}),
+    # unfiltered listings and counts
+    ('/analytics/metrics', 'FROM MetricsFormulas ORDER BY dateCreated DESC', {'MetricsFormulas'}),
+    ('/analytics/dashboards', 'FROM Dashboard ORDER BY lastUpdated DESC', {'Dashboard'}),
+    ('/analytics/calculated-metrics', 'FROM CalculatedMetrics cm', {'cm'}),
+    ('/analytics/export-requests', 'FROM ExportRequest er', {'er'}),
+    ('/reports', 'FROM Reports ORDER BY createdDate DESC', {'Reports'}),
+    ('/admin/users', 'FROM Players ORDER BY lastName', {'Players'}),
+    ('/admin/users', 'FROM Scout ORDER BY lastName', {'Scout'}),
+    ('/admin/statistics', 'SELECT COUNT(*) as count FROM Players', {'Players'}),
+    ('/admin/statistics', 'SELECT COUNT(*) as count FROM Scout', {'Scout'}),
+    ('/admin/statistics', 'SELECT COUNT(*) as count FROM Game', {'Game'}),
+]
+
+
+def normalized(statement):
+    return ' '.join(statement.split())
+
+
+def scan_allowed(rule, table, statement):
+    statement = normalized(statement)
+    return any(rule == allowed_rule and table in tables and text in statement
+               for allowed_rule, text, tables in FULL_SCANS_ALLOWED)
+
+
+@contextmanager
+def record_selects():
+    """Collect every SELECT executed through a PyMySQL cursor, parameters inlined"""
+    recorded = []
+    original_execute = cursors.Cursor.execute
+
+    def execute(cursor, query, args=None):
+        statement = cursor.mogrify(query, args)
+        if statement.lstrip().upper().startswith('SELECT'):
+            recorded.append(statement)
+        return original_execute(cursor, query, args)
+
+    cursors.Cursor.execute = execute
+    try:
+        yield recorded
+    finally:
+        cursors.Cursor.execute = original_execute
+
+
+def route_urls(app):
+    """(rule, url) for each GET route, with SAMPLE_ID filled into its arguments"""
+    adapter = app.url_map.bind('localhost')
+    seen = set()
+    for rule in app.url_map.iter_rules():
+        if ('GET' not in rule.methods or rule.endpoint == 'static'
+                or rule.rule in seen or rule.rule in SKIPPED_ROUTES):
+            continue
+        seen.add(rule.rule)
+        yield rule.rule, adapter.build(rule.endpoint, {arg: SAMPLE_ID for arg in rule.arguments})
+
+
+def collect_route_queries(app):
+    """Call every GET route and return (rule, statement) for the SELECTs it ran"""
+    client = app.test_client()
+    queries = []
+    errors = []
+
+    with record_selects() as recorded:
+        for rule, url in route_urls(app):
+            for query_string in ROUTE_QUERY_STRINGS.get(rule, ['']):
+                start = len(recorded)
+                response = client.get(f'{url}?{query_string}' if query_string else url)
+                response.get_data()  # drain streamed responses
+                response.close()
+                if response.status_code >= 500:
+                    errors.append((rule, response.status_code))
+                queries.extend((rule, statement) for statement in recorded[start:])
+
+    return queries, errors
+
+
+def full_scans(cursor, statement):
+    """EXPLAIN rows for tables read in full (derived tables excepted)"""
+    cursor.execute(f'EXPLAIN {statement}')
+    return [
+        row for row in cursor.fetchall()
+        if row['type'] == 'ALL' and row['table'] and not row['table'].startswith('<')
+    ]
+
+
+def check_query_plans(app):
+    """
+    EXPLAIN the SELECTs of every GET route. Returns the (rule, statement)
+    pairs checked, the (rule, table, statement) full scans that are not
+    allowed and the (rule, status) routes that failed.
+    """
+    queries, errors = collect_route_queries(app)
+    failures = []
+    checked = list(dict.fromkeys(queries))
+
+    with app.app_context(), db.connection() as conn:
+        cursor = conn.cursor()
+        for rule, statement in checked:
+            for row in full_scans(cursor, statement):
+                if not scan_allowed(rule, row['table'], statement):
+                    failures.append((rule, row['table'], statement))
+
+    return checked, failures, errors
+
+
+@click.command('check-query-plans')
+@click.option('--verbose', is_flag=True, help='Print every statement that was checked.')
+@with_appcontext
+def check_query_plans_command(verbose):
+    """EXPLAIN the SELECTs of every GET route and fail on full table scans"""
+    checked, failures, errors = check_query_plans(current_app._get_current_object())
+
+    for rule, status in errors:
+        click.echo(f'ERROR {rule}: returned {status}')
+
+    if verbose:
+        for rule, statement in checked:
+            click.echo(f'{rule}: {normalized(statement)}')
+
+    for rule, table, statement in failures:
+        click.echo(f'FULL SCAN {rule}: table {table} in\n    {normalized(statement)}')
+
+    click.echo(f'Checked {len(checked)} statements from {len({r for r, _ in checked})} routes, '
+               f'{len(failures)} full scans not allowed, {len(errors)} route errors')
+
+    if failures or errors:
+        raise SystemExit(1)
@@ -0,0 +1,39 @@
+-- 0001: indexes for the filters, joins and sort orders in the route SQL.
+-- Scout_Activity needs nothing: its (scoutID, gameID) primary key already
+-- serves the per-scout lookup, and Game is then read by primary key.
+
+-- comparisons and aggregate: Playsin filtered by position, joined on playerID
+CREATE INDEX idx_playsin_position_player ON Playsin (position, playerID);
+
+-- scout player history and live annotations: reports by scout (and player)
+CREATE INDEX idx_report_scout_player ON PlayerReports (scoutID, playerID);
+
+-- annotations of a report in time order
+CREATE INDEX idx_annotation_report_time ON Annotations (reportID, timestamp);
+
+-- flagged validations, newest first
+CREATE INDEX idx_validation_valid_date ON Validation (isValid, validatedDate);
+
+-- export request listing and the export worker's oldest-pending claim
+CREATE INDEX idx_exportrequest_status_time ON ExportRequest (status, timestamp);
+CREATE INDEX idx_exportrequest_time ON ExportRequest (timestamp);
+DROP INDEX idx_export_status ON ExportRequest;
+
+-- verifications per player and the pending queue, both by submittedDate
+CREATE INDEX idx_verification_player_date ON Verification (playerID, submittedDate);
+CREATE INDEX idx_verification_status_date ON Verification (status, submittedDate);
+DROP INDEX idx_verification_status ON Verification;
+
+-- flagged accounts: open reports by severity, oldest first
+CREATE INDEX idx_userreported_status_severity ON UserReported (status, severity, reportDate);
+DROP INDEX idx_report_status ON UserReported;
+
+-- recruiting: active offers grouped by school
+CREATE INDEX idx_offer_status_school ON Offers (status, schoolID);
+DROP INDEX idx_offer_status ON Offers;
+
+-- sort orders of the listing routes
+CREATE INDEX idx_reports_created ON Reports (createdDate);
+CREATE INDEX idx_formula_created ON MetricsFormulas (dateCreated);
+CREATE INDEX idx_dashboard_updated ON Dashboard (lastUpdated);
+CREATE INDEX idx_metric_calc_time ON CalculatedMetrics (calcTimestamp);
@@ -0,0 +1,18 @@
+-- 0002: annotations belong to a game (and optionally a piece of footage),
+-- so a live page can read one game's tags in time order and fetch only
+-- the ones added since its last poll.
+-- Annotations written before this migration recorded no game at all, so
+-- they keep a NULL gameID and do not show up in any game's listing.
+
+ALTER TABLE Annotations
+    ADD COLUMN gameID INT AFTER reportID,
+    ADD COLUMN footageID INT AFTER gameID,
+    ADD CONSTRAINT fk_annotations_game
+        FOREIGN KEY (gameID) REFERENCES Game(gameID)
+        ON UPDATE CASCADE
+        ON DELETE SET NULL,
+    ADD CONSTRAINT fk_annotations_footage
+        FOREIGN KEY (footageID) REFERENCES Footage(footageID)
+        ON UPDATE CASCADE
+        ON DELETE SET NULL,
+    ADD INDEX idx_annotation_game_time (gameID, timestamp);
@@ -0,0 +1,159 @@
+-- 0003: tables and columns added to 00_courtvision_schema.sql before
+-- migrations existed (stat rollups, formula expressions, calculated
+-- metric values, dashboard snapshots, metric jobs). Every step checks
+-- first, so databases that already have some of them are left as they
+-- are. MySQL 8 has no ADD COLUMN IF NOT EXISTS, hence the information_schema
+-- checks run through PREPARE.
+
+
+-- Player_Totals - Running per-player sums of Game_Stats, kept in step
+-- by the API on every stat insert/update/delete
+CREATE TABLE IF NOT EXISTS Player_Totals (
+   playerID INT PRIMARY KEY,
+   gamesPlayed INT NOT NULL DEFAULT 0,
+   minutes INT NOT NULL DEFAULT 0,
+   points INT NOT NULL DEFAULT 0,
+   rebounds INT NOT NULL DEFAULT 0,
+   assists INT NOT NULL DEFAULT 0,
+   steals INT NOT NULL DEFAULT 0,
+   blocks INT NOT NULL DEFAULT 0,
+   turnovers INT NOT NULL DEFAULT 0,
+   fouls INT NOT NULL DEFAULT 0,
+   three_pt INT NOT NULL DEFAULT 0,
+   lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+   CONSTRAINT fk_playertotals_player
+       FOREIGN KEY (playerID) REFERENCES Players(playerID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE
+);
+
+
+-- Player_Level_Totals - Same sums split by competition level (team league)
+CREATE TABLE IF NOT EXISTS Player_Level_Totals (
+   playerID INT NOT NULL,
+   competitionLevel VARCHAR(50) NOT NULL,
+   gamesPlayed INT NOT NULL DEFAULT 0,
+   minutes INT NOT NULL DEFAULT 0,
+   points INT NOT NULL DEFAULT 0,
+   rebounds INT NOT NULL DEFAULT 0,
+   assists INT NOT NULL DEFAULT 0,
+   steals INT NOT NULL DEFAULT 0,
+   blocks INT NOT NULL DEFAULT 0,
+   turnovers INT NOT NULL DEFAULT 0,
+   fouls INT NOT NULL DEFAULT 0,
+   three_pt INT NOT NULL DEFAULT 0,
+   lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+   PRIMARY KEY (playerID, competitionLevel),
+   CONSTRAINT fk_leveltotals_player
+       FOREIGN KEY (playerID) REFERENCES Players(playerID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE,
+   INDEX idx_leveltotals_level (competitionLevel)
+);
+
+
+-- DashboardSnapshots - Precomputed, gzip-compressed dashboard payloads
+CREATE TABLE IF NOT EXISTS DashboardSnapshots (
+   dashboardID INT PRIMARY KEY,
+   payload MEDIUMBLOB NOT NULL,
+   payloadBytes INT,
+   rawBytes INT,
+   computeMs INT,
+   computedAt DATETIME(6) NOT NULL,
+   CONSTRAINT fk_snapshots_dashboard
+       FOREIGN KEY (dashboardID) REFERENCES Dashboard(dashboardID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE
+);
+
+
+-- MetricJobs - Background jobs that materialize a formula over many games
+CREATE TABLE IF NOT EXISTS MetricJobs (
+   jobID INT AUTO_INCREMENT PRIMARY KEY,
+   formulaID INT NOT NULL,
+   requestedBy INT,
+   startDate DATE,
+   endDate DATE,
+   playerIDs TEXT,
+   status VARCHAR(20) DEFAULT 'pending',
+   rowsTotal INT DEFAULT 0,
+   rowsDone INT DEFAULT 0,
+   rowsSkipped INT DEFAULT 0,
+   errorMessage TEXT,
+   createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+   startedAt DATETIME,
+   completedAt DATETIME,
+   CONSTRAINT fk_metricjobs_formula
+       FOREIGN KEY (formulaID) REFERENCES MetricsFormulas(formulaID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE,
+   INDEX idx_metricjobs_status (status)
+);
+
+
+-- formula text and edit time
+SET @ddl = IF((SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'MetricsFormulas' AND COLUMN_NAME = 'expression') = 0,
+    'ALTER TABLE MetricsFormulas ADD COLUMN expression TEXT AFTER formulaName',
+    'DO 0');
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+
+SET @ddl = IF((SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'MetricsFormulas' AND COLUMN_NAME = 'lastModified') = 0,
+    'ALTER TABLE MetricsFormulas ADD COLUMN lastModified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP AFTER dateCreated',
+    'DO 0');
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+
+-- stat row edit time (metric jobs skip values newer than the stats)
+SET @ddl = IF((SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Game_Stats' AND COLUMN_NAME = 'lastUpdated') = 0,
+    'ALTER TABLE Game_Stats ADD COLUMN lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP AFTER three_pt',
+    'DO 0');
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+
+-- calculated values, one row per formula / game / player
+SET @ddl = IF((SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'CalculatedMetrics' AND COLUMN_NAME = 'metricValue') = 0,
+    'ALTER TABLE CalculatedMetrics ADD COLUMN metricValue DOUBLE AFTER metricName',
+    'DO 0');
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+
+-- keep the newest row of any duplicates so the unique key can be added
+DELETE cm FROM CalculatedMetrics cm
+JOIN CalculatedMetrics newer
+  ON newer.formulaID = cm.formulaID AND newer.gameID = cm.gameID
+ AND newer.playerID = cm.playerID AND newer.metricID > cm.metricID;
+
+
+SET @ddl = IF((SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'CalculatedMetrics' AND INDEX_NAME = 'uq_metric_formula_game_player') = 0,
+    'ALTER TABLE CalculatedMetrics ADD UNIQUE KEY uq_metric_formula_game_player (formulaID, gameID, playerID)',
+    'DO 0');
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+
+-- aggregate height / weight filters
+SET @ddl = IF((SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Players' AND INDEX_NAME = 'idx_player_height_weight') = 0,
+    'CREATE INDEX idx_player_height_weight ON Players (height, weight)',
+    'DO 0');
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+-- the rollups are filled from Game_Stats after this file runs, by
+-- rollup_engine.rebuild_rollups (DATA_STEPS in migrate.py)
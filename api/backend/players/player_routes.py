@@ -1,11 +1,55 @@
 from flask import Blueprint, request, jsonify, make_response
 from backend.db_connection import db
+from backend.queries import queries
+from backend.stats_cache import stats_cache, cached_json_response, cached_response
+from backend.columnar import COLUMNAR_MIMETYPES, ColumnarError, encode_rows, requested_format
+from backend.rollups.rollup_engine import STAT_COLUMNS, apply_stat_change, fetch_stat_row
+from backend.players.similarity_index import similarity_index
+from backend.players.recruiting_matcher import recruiting_matcher
 import logging
 
 logger = logging.getLogger(__name__)
 players = Blueprint('players', __name__)
 
 
+PLAYER_PROFILE_SELECT = '''
+    SELECT p.playerID, p.firstName, p.lastName, p.email, p.phone_Number,
+           p.UserBio, p.DateofBirth, p.height, p.weight, p.AcctStatus,
+           t.team_name, t.city as team_city, ps.position, ps.jerseyNumber
+    FROM Players p
+    LEFT JOIN Playsin ps ON p.playerID = ps.playerID
+    LEFT JOIN Team t ON ps.team_id = t.team_id
+'''
+PLAYER_PROFILE_QUERY = PLAYER_PROFILE_SELECT + ' WHERE p.playerID = %s'
+
+# The read queries below are shared with the async read app
+# (backend/async_reads), so both serve identical results
+PLAYER_STATS_QUERY = '''
+    SELECT gs.gameID, g.date, g.opponent, g.venue,
+           gs.minutes, gs.points, gs.rebounds, gs.assists,
+           gs.steals, gs.blocks, gs.turnovers, gs.fouls, gs.three_pt
+    FROM Game_Stats gs
+    JOIN Game g ON gs.gameID = g.gameID
+    WHERE gs.playerID = %s
+    ORDER BY g.date DESC
+'''
+
+PLAYER_SCHEDULE_QUERY = '''
+    SELECT g.gameID, g.date, CAST(g.startTime AS CHAR) AS startTime,
+           g.opponent, g.venue, g.tournament
+    FROM Game g
+    JOIN PlayerSchedule ps ON g.gameID = ps.gameID
+    WHERE ps.playerID = %s AND g.date >= CURDATE()
+    ORDER BY g.date ASC
+'''
+
+queries.register('player_profile', PLAYER_PROFILE_QUERY)
+queries.register('player_stats', PLAYER_STATS_QUERY)
+
+# Most profiles one batch request may ask for
+PLAYER_BATCH_MAX = 1000
+
+
 # ------------------------------------------------------------
 # GET /players/<player_id> - Get player profile
 # [Sean-4]
@@ -14,18 +58,8 @@ def get_player_profile(player_id):
     """Return full profile info for this player (bio, height, position, team)"""
     logger.info(f'GET /players/{player_id} route')
 
-    query = '''
-        SELECT p.playerID, p.firstName, p.lastName, p.email, p.phone_Number,
-               p.UserBio, p.DateofBirth, p.height, p.weight, p.AcctStatus,
-               t.team_name, t.city as team_city, ps.position, ps.jerseyNumber
-        FROM Players p
-        LEFT JOIN Playsin ps ON p.playerID = ps.playerID
-        LEFT JOIN Team t ON ps.team_id = t.team_id
-        WHERE p.playerID = %s
-    '''
-
     cursor = db.get_db().cursor()
-    cursor.execute(query, (player_id,))
+    queries.execute(cursor, 'player_profile', (player_id,))
     result = cursor.fetchone()
 
     if not result:
@@ -34,6 +68,65 @@ def get_player_profile(player_id):
     return jsonify(result), 200
 
 
+def fetch_player_profiles(player_ids):
+    """Profiles for many players in one query, in the order the IDs were given"""
+    player_ids = list(dict.fromkeys(player_ids))
+    if not player_ids:
+        return []
+
+    query = (PLAYER_PROFILE_SELECT
+             + f" WHERE p.playerID IN ({', '.join(['%s'] * len(player_ids))})"
+             + ' ORDER BY p.playerID')
+
+    cursor = db.get_db().cursor()
+    cursor.execute(query, player_ids)
+
+    # like GET /players/<id>, keep the first team row for each player
+    profiles = {}
+    for row in cursor.fetchall():
+        profiles.setdefault(row['playerID'], row)
+
+    return [profiles[player_id] for player_id in player_ids if player_id in profiles]
+
+
+# ------------------------------------------------------------
+# GET /players?ids=1,2,3 - Get many player profiles
+# [Sean-4]
+@players.route('/players', methods=['GET'])
+def get_player_profiles():
+    """Return full profiles for a comma-separated list of player IDs"""
+    logger.info('GET /players route')
+
+    try:
+        player_ids = [int(i) for i in request.args.get('ids', '').split(',') if i.strip()]
+    except ValueError:
+        return jsonify({'error': 'ids must be comma-separated integers'}), 400
+
+    if len(player_ids) > PLAYER_BATCH_MAX:
+        return jsonify({'error': f'At most {PLAYER_BATCH_MAX} ids per request'}), 400
+
+    return jsonify(fetch_player_profiles(player_ids)), 200
+
+
+# ------------------------------------------------------------
+# POST /players/batch - Get many player profiles (large ID lists)
+# [Sean-4]
+@players.route('/players/batch', methods=['POST'])
+def get_player_profiles_batch():
+    """Return full profiles for the player IDs in the request body"""
+    logger.info('POST /players/batch route')
+
+    player_ids = (request.json or {}).get('ids')
+
+    if not isinstance(player_ids, list) or not all(isinstance(i, int) for i in player_ids):
+        return jsonify({'error': 'ids must be a list of integers'}), 400
+
+    if len(player_ids) > PLAYER_BATCH_MAX:
+        return jsonify({'error': f'At most {PLAYER_BATCH_MAX} ids per request'}), 400
+
+    return jsonify(fetch_player_profiles(player_ids)), 200
+
+
 # ------------------------------------------------------------
 # PUT /players/<player_id> - Update player profile
 # [Sean-4]
@@ -63,6 +156,8 @@ def update_player_profile(player_id):
         player_id
     ))
     db.get_db().commit()
+    stats_cache.bump()
+    similarity_index.mark_dirty(player_id)
 
     return jsonify({'message': 'Player profile updated successfully'}), 200
 
@@ -81,6 +176,8 @@ def delete_player(player_id):
     query = 'DELETE FROM Players WHERE playerID = %s'
     cursor.execute(query, (player_id,))
     db.get_db().commit()
+    stats_cache.bump()
+    similarity_index.mark_dirty(player_id)
 
     return jsonify({'message': 'Player removed successfully'}), 200
 
@@ -93,23 +190,32 @@ def get_player_stats(player_id):
     """Return all game stats for this player across the season"""
     logger.info(f'GET /players/{player_id}/stats route')
 
-    query = '''
-        SELECT gs.gameID, g.date, g.opponent, g.venue,
-               gs.minutes, gs.points, gs.rebounds, gs.assists,
-               gs.steals, gs.blocks, gs.turnovers, gs.fouls, gs.three_pt
-        FROM Game_Stats gs
-        JOIN Game g ON gs.gameID = g.gameID
-        WHERE gs.playerID = %s
-        ORDER BY g.date DESC
-    '''
-
     cursor = db.get_db().cursor()
-    cursor.execute(query, (player_id,))
+    queries.execute(cursor, 'player_stats', (player_id,))
     stats = cursor.fetchall()
 
     return jsonify(stats), 200
 
 
+def is_stat_count(value):
+    """True for a whole number >= 0 (int, integral float or digit string)"""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return value >= 0 and float(value).is_integer()
+    return isinstance(value, str) and value.strip().lstrip('+').isdigit()
+
+
+def stat_body_error(data):
+    """Why a stats request body cannot be written (None if it can); missing stats count as 0"""
+    if not isinstance(data, dict):
+        return 'Request body must be a JSON object'
+    bad = [c for c in STAT_COLUMNS if data.get(c) is not None and not is_stat_count(data[c])]
+    if bad:
+        return f"Stats must be whole numbers of 0 or more: {', '.join(bad)}"
+    return None
+
+
 # ------------------------------------------------------------
 # POST /players/<player_id>/stats - Add game statistics
 # [Sean-1]
@@ -119,6 +225,9 @@ def add_player_stats(player_id):
     logger.info(f'POST /players/{player_id}/stats route')
 
     data = request.json
+    error = stat_body_error(data)
+    if error:
+        return jsonify({'error': error}), 400
 
     query = '''
         INSERT INTO Game_Stats (gameID, playerID, minutes, points, rebounds, 
@@ -140,7 +249,10 @@ def add_player_stats(player_id):
         data.get('fouls'),
         data.get('three_pt')
     ))
+    apply_stat_change(cursor, player_id, new_row=data)
     db.get_db().commit()
+    stats_cache.bump()
+    similarity_index.mark_dirty(player_id)
 
     return jsonify({'message': 'Stats added successfully'}), 201
 
@@ -157,6 +269,9 @@ def add_game_and_stats(player_id):
     logger.info(f'POST /players/{player_id}/game-and-stats route')
 
     data = request.json
+    error = stat_body_error(data)
+    if error:
+        return jsonify({'error': error}), 400
     cursor = db.get_db().cursor()
 
     try:
@@ -198,8 +313,13 @@ def add_game_and_stats(player_id):
             data['three_pt']
         ))
 
+        # Step 4: Fold the new stat line into the player rollups
+        apply_stat_change(cursor, player_id, new_row=data)
+
         # CRITICAL: Commit the changes!
         db.get_db().commit()
+        stats_cache.bump()
+        similarity_index.mark_dirty(player_id)
 
         logger.info(f'Successfully added game {new_game_id} and stats for player {player_id}')
 
@@ -225,6 +345,9 @@ def update_player_stats(player_id, game_id):
     logger.info(f'PUT /players/{player_id}/stats/{game_id} route')
 
     data = request.json
+    error = stat_body_error(data)
+    if error:
+        return jsonify({'error': error}), 400
 
     query = '''
         UPDATE Game_Stats 
@@ -234,6 +357,7 @@ def update_player_stats(player_id, game_id):
     '''
 
     cursor = db.get_db().cursor()
+    old_stats = fetch_stat_row(cursor, player_id, game_id)
     cursor.execute(query, (
         data.get('minutes'),
         data.get('points'),
@@ -247,7 +371,11 @@ def update_player_stats(player_id, game_id):
         player_id,
         game_id
     ))
+    if old_stats:
+        apply_stat_change(cursor, player_id, old_row=old_stats, new_row=data)
     db.get_db().commit()
+    stats_cache.bump()
+    similarity_index.mark_dirty(player_id)
 
     return jsonify({'message': 'Stats updated successfully'}), 200
 
@@ -261,9 +389,14 @@ def delete_fraudulent_stats(player_id, game_id):
     logger.info(f'DELETE /players/{player_id}/stats/{game_id} route')
 
     cursor = db.get_db().cursor()
+    old_stats = fetch_stat_row(cursor, player_id, game_id)
     query = 'DELETE FROM Game_Stats WHERE playerID = %s AND gameID = %s'
     cursor.execute(query, (player_id, game_id))
+    if old_stats:
+        apply_stat_change(cursor, player_id, old_row=old_stats)
     db.get_db().commit()
+    stats_cache.bump()
+    similarity_index.mark_dirty(player_id)
 
     return jsonify({'message': 'Fraudulent stats removed successfully'}), 200
 
@@ -348,48 +481,19 @@ def get_player_feedback(player_id):
 # [Sean-5]
 @players.route('/players/<int:player_id>/comparisons', methods=['GET'])
 def get_player_comparisons(player_id):
-    """Return comparison of this player's stats to similar players"""
+    """Return the players most similar to this one, closest first"""
     logger.info(f'GET /players/{player_id}/comparisons route')
 
-    # First get the target player's info
-    cursor = db.get_db().cursor()
-    cursor.execute('''
-        SELECT height, ps.position
-        FROM Players p
-        LEFT JOIN Playsin ps ON p.playerID = ps.playerID
-        WHERE p.playerID = %s
-    ''', (player_id,))
+    limit = request.args.get('limit', default=10, type=int)
+    if limit < 1:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
 
-    player_info = cursor.fetchone()
+    # Nearest neighbours on per-game averages, height, weight and position
+    similar_players = similarity_index.nearest(player_id, min(limit, 100))
 
-    if not player_info:
+    if similar_players is None:
         return jsonify({'error': 'Player not found'}), 404
 
-    # Get similar players with their stats
-    query = '''
-        SELECT p.playerID, p.firstName, p.lastName,
-               AVG(gs.points) as avg_points,
-               AVG(gs.rebounds) as avg_rebounds,
-               AVG(gs.assists) as avg_assists,
-               AVG(gs.steals) as avg_steals
-        FROM Players p
-        JOIN Playsin ps ON p.playerID = ps.playerID
-        JOIN Game_Stats gs ON p.playerID = gs.playerID
-        WHERE ps.position = %s 
-          AND p.height BETWEEN %s - 2 AND %s + 2
-          AND p.playerID != %s
-        GROUP BY p.playerID, p.firstName, p.lastName
-        LIMIT 10
-    '''
-
-    cursor.execute(query, (
-        player_info['position'],
-        player_info['height'],
-        player_info['height'],
-        player_id
-    ))
-    similar_players = cursor.fetchall()
-
     return jsonify(similar_players), 200
 
 
@@ -398,22 +502,17 @@ def get_player_comparisons(player_id):
 # [Sean-6]
 @players.route('/players/<int:player_id>/recruiting', methods=['GET'])
 def get_recruiting_schools(player_id):
-    """Return list of schools recruiting players with similar profiles"""
+    """Return schools recruiting players with profiles like this one, best match first"""
     logger.info(f'GET /players/{player_id}/recruiting route')
 
-    query = '''
-        SELECT DISTINCT s.schoolID, s.name, s.city, s.state,
-               COUNT(o.offerID) as total_offers
-        FROM School s
-        JOIN Offers o ON s.schoolID = o.schoolID
-        WHERE o.status = 'active'
-        GROUP BY s.schoolID, s.name, s.city, s.state
-        ORDER BY total_offers DESC
-    '''
+    limit = request.args.get('limit', default=10, type=int)
+    if limit < 1:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
 
-    cursor = db.get_db().cursor()
-    cursor.execute(query)
-    schools = cursor.fetchall()
+    schools = recruiting_matcher.match(player_id, min(limit, 100))
+
+    if schools is None:
+        return jsonify({'error': 'Player not found'}), 404
 
     return jsonify(schools), 200
 
@@ -426,16 +525,8 @@ def get_player_schedule(player_id):
     """Returns future games that the player will be playing in"""
     logger.info(f'GET /players/{player_id}/schedule route')
 
-    query = '''
-        SELECT g.gameID, g.date, g.startTime, g.opponent, g.venue, g.tournament
-        FROM Game g
-        JOIN PlayerSchedule ps ON g.gameID = ps.gameID
-        WHERE ps.playerID = %s AND g.date >= CURDATE()
-        ORDER BY g.date ASC
-    '''
-
     cursor = db.get_db().cursor()
-    cursor.execute(query, (player_id,))
+    cursor.execute(PLAYER_SCHEDULE_QUERY, (player_id,))
     schedule = cursor.fetchall()
 
     return jsonify(schedule), 200
@@ -448,29 +539,44 @@ def get_player_schedule(player_id):
 def get_aggregate_player_stats():
     """
     Return clean, standardized datasets for analysis.
-    Supports filtering by position, competition level, etc.
+    Supports filtering by position, minimum points, and height/weight ranges.
+    Send ?format=arrow|parquet (or the matching Accept type) for typed columns.
     """
     logger.info('GET /players/stats/aggregate route')
 
+    try:
+        fmt = requested_format()
+    except ColumnarError as e:
+        return e.response()
+
     # Get query parameters for filtering
     position = request.args.get('position')
     min_points = request.args.get('min_points', 0)
+    min_height = request.args.get('min_height', type=int)
+    max_height = request.args.get('max_height', type=int)
+    min_weight = request.args.get('min_weight', type=int)
+    max_weight = request.args.get('max_weight', type=int)
 
+    # Reads the Player_Totals rollup: one row per player instead of every game
     query = '''
-        SELECT 
+        SELECT DISTINCT
             p.playerID,
             p.firstName,
             p.lastName,
+            p.height,
+            p.weight,
             ps.position,
-            COUNT(DISTINCT gs.gameID) as games_played,
-            AVG(gs.points) as avg_points,
-            AVG(gs.rebounds) as avg_rebounds,
-            AVG(gs.assists) as avg_assists,
-            AVG(gs.steals) as avg_steals
+            t.team_name,
+            pt.gamesPlayed as games_played,
+            pt.points / pt.gamesPlayed as avg_points,
+            pt.rebounds / pt.gamesPlayed as avg_rebounds,
+            pt.assists / pt.gamesPlayed as avg_assists,
+            pt.steals / pt.gamesPlayed as avg_steals
         FROM Players p
         JOIN Playsin ps ON p.playerID = ps.playerID
-        JOIN Game_Stats gs ON p.playerID = gs.playerID
-        WHERE 1=1
+        LEFT JOIN Team t ON ps.team_id = t.team_id
+        JOIN Player_Totals pt ON p.playerID = pt.playerID
+        WHERE pt.gamesPlayed > 0
     '''
 
     params = []
@@ -479,15 +585,47 @@ def get_aggregate_player_stats():
         query += ' AND ps.position = %s'
         params.append(position)
 
+    if min_height is not None:
+        query += ' AND p.height >= %s'
+        params.append(min_height)
+
+    if max_height is not None:
+        query += ' AND p.height <= %s'
+        params.append(max_height)
+
+    if min_weight is not None:
+        query += ' AND p.weight >= %s'
+        params.append(min_weight)
+
+    if max_weight is not None:
+        query += ' AND p.weight <= %s'
+        params.append(max_weight)
+
     query += '''
-        GROUP BY p.playerID, p.firstName, p.lastName, ps.position
-        HAVING AVG(gs.points) >= %s
+          AND pt.points >= %s * pt.gamesPlayed
         ORDER BY avg_points DESC
     '''
     params.append(min_points)
 
-    cursor = db.get_db().cursor()
-    cursor.execute(query, params)
-    stats = cursor.fetchall()
-
-    return jsonify(stats), 200
\ No newline at end of file
+    def compute():
+        cursor = db.get_db().cursor()
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+    def compute_columnar():
+        cursor = db.get_db().cursor()
+        cursor.execute(query, params)
+        return encode_rows(fmt, cursor.fetchall(), cursor.description)
+
+    cache_key = ('players.aggregate', position, str(min_points),
+                 min_height, max_height, min_weight, max_weight)
+
+    if fmt is None:
+        response = cached_json_response(cache_key, compute)
+    else:
+        try:
+            response = cached_response(cache_key + (fmt,), compute_columnar, COLUMNAR_MIMETYPES[fmt])
+        except ColumnarError as e:
+            return e.response()
+    response.vary.add('Accept')
+    return response
\ No newline at end of file
@@ -0,0 +1,159 @@
+#------------------------------------------------------------
+# Personalized recruiting matches
+#------------------------------------------------------------
+# Every school gets a profile: the weighted mean feature vector (from the
+# similar-player index) of the players it has offered or shown interest
+# in. Scoring a player is one vectorized distance pass against all
+# school profiles. The profiles are cached per index snapshot, so a
+# request does not re-aggregate Offers and RecruitingInterest.
+import logging
+import threading
+import time
+
+import numpy as np
+
+from backend.db_connection import db
+from backend.players.similarity_index import similarity_index
+
+logger = logging.getLogger(__name__)
+
+# How much one link counts towards a school's profile
+OFFER_WEIGHTS = {'accepted': 1.0, 'active': 1.0, 'pending': 0.75, 'declined': 0.25}
+INTEREST_WEIGHTS = {'high': 1.0, 'medium': 0.6, 'low': 0.3}
+UNKNOWN_WEIGHT = 0.5
+
+# Added to the score of a school that already lists the player itself
+DIRECT_INTEREST_BONUS = 0.25
+
+RECRUITING_LINKS_QUERY = '''
+    SELECT o.schoolID, o.playerID, 'offer' AS source, o.status AS level
+    FROM Offers o
+    UNION ALL
+    SELECT ri.schoolID, ri.playerID, 'interest' AS source, ri.interestLevel AS level
+    FROM RecruitingInterest ri
+'''
+
+
+def link_weight(source, level):
+    weights = OFFER_WEIGHTS if source == 'offer' else INTEREST_WEIGHTS
+    return weights.get((level or '').lower(), UNKNOWN_WEIGHT)
+
+
+class _SchoolProfiles:
+    """Weighted feature sums per school, built against one index snapshot"""
+
+    def __init__(self, snapshot, schools, links):
+        self.snapshot = snapshot
+        self.schools = schools
+        self.built_at = time.monotonic()
+        row_of_school = {school['schoolID']: i for i, school in enumerate(schools)}
+
+        width = snapshot.matrix.shape[1]
+        self.sums = np.zeros((len(schools), width))
+        self.weights = np.zeros(len(schools))
+        self.total_offers = np.zeros(len(schools), dtype=np.int64)
+        # playerID -> [(school row, weight, source, level)] so a player's own
+        # contribution can be left out of the profiles they are scored against
+        self.player_links = {}
+
+        for link in links:
+            school_row = row_of_school.get(link['schoolID'])
+            if school_row is None:
+                continue
+            if link['source'] == 'offer':
+                self.total_offers[school_row] += 1
+
+            weight = link_weight(link['source'], link['level'])
+            player_row = snapshot.row_of.get(link['playerID'])
+            if player_row is not None:
+                self.sums[school_row] += weight * snapshot.matrix[player_row]
+                self.weights[school_row] += weight
+            else:
+                weight = 0.0
+            self.player_links.setdefault(link['playerID'], []).append(
+                (school_row, weight, link['source'], link['level']))
+
+
+class RecruitingMatcher:
+    def __init__(self, max_age=600):
+        self.max_age = max_age
+        self._profiles = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        app.config.setdefault('RECRUITING_PROFILE_MAX_AGE', self.max_age)
+        self.max_age = app.config['RECRUITING_PROFILE_MAX_AGE']
+
+    def invalidate(self):
+        """Drop the school profiles (call after changing Offers or RecruitingInterest)"""
+        with self._lock:
+            self._profiles = None
+
+    def profiles(self):
+        snapshot = similarity_index.snapshot()
+        with self._lock:
+            profiles = self._profiles
+            if (profiles is None or profiles.snapshot is not snapshot
+                    or time.monotonic() - profiles.built_at > self.max_age):
+                profiles = self._profiles = self._build(snapshot)
+            return profiles
+
+    def match(self, player_id, limit=10):
+        """
+        Schools ranked by how well the player fits the players they recruit,
+        best first. Returns None if the player does not exist.
+        """
+        profiles = self.profiles()
+        snapshot = profiles.snapshot
+        row = snapshot.row_of.get(player_id)
+        if row is None:
+            return None
+
+        vector = snapshot.matrix[row]
+        sums = profiles.sums.copy()
+        weights = profiles.weights.copy()
+        direct = {}
+
+        # leave the player's own offers and interest out of the profiles
+        for school_row, weight, source, level in profiles.player_links.get(player_id, []):
+            sums[school_row] -= weight * vector
+            weights[school_row] -= weight
+            direct.setdefault(school_row, {})[source] = level
+
+        has_profile = weights > 1e-9
+        centroids = sums[has_profile] / weights[has_profile, None]
+        similarity = np.zeros(len(weights))
+        similarity[has_profile] = 1.0 / (1.0 + np.sqrt(((centroids - vector) ** 2).sum(axis=1)))
+
+        score = similarity.copy()
+        for school_row, levels in direct.items():
+            score[school_row] += DIRECT_INTEREST_BONUS * max(
+                link_weight(source, level) for source, level in levels.items())
+
+        candidates = np.flatnonzero(has_profile | (score > 0))
+        ranked = candidates[np.argsort(-score[candidates], kind='stable')][:limit]
+
+        return [dict(profiles.schools[i],
+                     total_offers=int(profiles.total_offers[i]),
+                     profile_weight=round(float(weights[i]), 2),
+                     profile_similarity=round(float(similarity[i]), 4) if has_profile[i] else None,
+                     offer_status=direct.get(i, {}).get('offer'),
+                     interest_level=direct.get(i, {}).get('interest'),
+                     match_score=round(float(score[i]), 4))
+                for i in ranked]
+
+    def _build(self, snapshot):
+        started = time.perf_counter()
+        cursor = db.get_db().cursor()
+        cursor.execute('SELECT schoolID, name, city, state FROM School ORDER BY schoolID')
+        schools = cursor.fetchall()
+        cursor.execute(RECRUITING_LINKS_QUERY)
+        links = cursor.fetchall()
+
+        profiles = _SchoolProfiles(snapshot, schools, links)
+        logger.info(f'Built recruiting profiles: {len(schools)} schools, {len(links)} links in '
+                    f'{(time.perf_counter() - started) * 1000:.1f} ms')
+        return profiles
+
+
+recruiting_matcher = RecruitingMatcher()
@@ -0,0 +1,219 @@
+#------------------------------------------------------------
+# In-memory nearest-neighbour index of similar players
+#------------------------------------------------------------
+# Every player is a feature vector of per-game averages (from the
+# Player_Totals rollup), height and weight, standardized per column,
+# plus a one-hot block for the positions they play. The vectors live in
+# one NumPy matrix; a lookup is a single vectorized distance computation
+# against all rows. Stat and profile writes mark the player dirty and
+# only those rows are re-read before the next lookup.
+import logging
+import threading
+import time
+
+import numpy as np
+
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+AVERAGE_COLUMNS = ['points', 'rebounds', 'assists', 'steals', 'blocks',
+                   'turnovers', 'minutes', 'three_pt']
+BODY_COLUMNS = ['height', 'weight']
+
+# Scale of the position block relative to one standardized feature
+POSITION_WEIGHT = 1.5
+
+PLAYER_FEATURES_QUERY = f'''
+    SELECT p.playerID, p.firstName, p.lastName, p.height, p.weight,
+           COALESCE(pt.gamesPlayed, 0) AS gamesPlayed,
+           {', '.join(f'pt.{c}' for c in AVERAGE_COLUMNS)},
+           GROUP_CONCAT(DISTINCT ps.position ORDER BY ps.position) AS positions
+    FROM Players p
+    LEFT JOIN Player_Totals pt ON p.playerID = pt.playerID
+    LEFT JOIN Playsin ps ON p.playerID = ps.playerID
+'''
+PLAYER_FEATURES_GROUP = ' GROUP BY p.playerID'
+
+
+def feature_row(row):
+    """Raw (unstandardized) numeric features for one player; NaN when unknown"""
+    games = row['gamesPlayed']
+    averages = [float(row[c]) / games if games and row[c] is not None else np.nan
+                for c in AVERAGE_COLUMNS]
+    body = [float(row[c]) if row[c] is not None else np.nan for c in BODY_COLUMNS]
+    return averages + body
+
+
+def row_positions(row):
+    return row['positions'].split(',') if row['positions'] else []
+
+
+class _Snapshot:
+    """Immutable matrix and lookups that queries read without locking"""
+
+    def __init__(self, player_ids, raw, positions, info):
+        self.player_ids = np.asarray(player_ids, dtype=np.int64)
+        self.row_of = {player_id: i for i, player_id in enumerate(player_ids)}
+        self.raw = raw
+        self.positions = positions
+        self.info = info
+        self.vocabulary = sorted({p for player in positions for p in player})
+        self.has_games = np.array([info[i]['games_played'] > 0 for i in range(len(player_ids))], dtype=bool)
+        self.matrix = self._standardize()
+
+    def _standardize(self):
+        raw = self.raw
+        if not len(raw):
+            return np.zeros((0, raw.shape[1] + len(self.vocabulary)))
+
+        with np.errstate(invalid='ignore'):
+            mean = np.nanmean(raw, axis=0)
+            std = np.nanstd(raw, axis=0)
+        mean = np.where(np.isnan(mean), 0.0, mean)
+        std = np.where(np.isnan(std) | (std == 0), 1.0, std)
+
+        numeric = (raw - mean) / std
+        numeric[np.isnan(numeric)] = 0.0  # unknown features sit at the mean
+
+        column_of = {p: i for i, p in enumerate(self.vocabulary)}
+        one_hot = np.zeros((len(raw), len(self.vocabulary)))
+        for i, player_positions in enumerate(self.positions):
+            for position in player_positions:
+                one_hot[i, column_of[position]] = POSITION_WEIGHT / np.sqrt(len(player_positions))
+
+        return np.hstack([numeric, one_hot])
+
+
+class SimilarityIndex:
+    def __init__(self, max_age=600):
+        self.max_age = max_age
+        self._snapshot = None
+        self._built_at = 0.0
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self.counters = {'full_builds': 0, 'incremental_updates': 0}
+
+    def init_app(self, app):
+        app.config.setdefault('SIMILARITY_INDEX_MAX_AGE', self.max_age)
+        self.max_age = app.config['SIMILARITY_INDEX_MAX_AGE']
+
+    def mark_dirty(self, player_id):
+        """Re-read this player's row before the next lookup (call after committing)"""
+        with self._lock:
+            self._dirty.add(player_id)
+
+    def nearest(self, player_id, k=10):
+        """
+        The k players closest to player_id (only players with games count),
+        nearest first. Returns None if the player does not exist.
+        """
+        snapshot = self.snapshot()
+        row = snapshot.row_of.get(player_id)
+        if row is None:
+            return None
+
+        distances = np.sqrt(((snapshot.matrix - snapshot.matrix[row]) ** 2).sum(axis=1))
+        distances[row] = np.inf
+        distances[~snapshot.has_games] = np.inf
+
+        candidates = int(np.isfinite(distances).sum())
+        k = min(k, candidates)
+        if k <= 0:
+            return []
+
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest])]
+
+        return [dict(snapshot.info[i],
+                     distance=round(float(distances[i]), 4),
+                     similarity=round(float(1.0 / (1.0 + distances[i])), 4))
+                for i in nearest]
+
+    def stats(self):
+        snapshot = self._snapshot
+        return dict(self.counters,
+                    players=len(snapshot.player_ids) if snapshot else 0,
+                    features=snapshot.matrix.shape[1] if snapshot else 0,
+                    age=round(time.monotonic() - self._built_at, 1) if snapshot else None)
+
+    def snapshot(self):
+        """The current feature matrix, brought up to date first"""
+        with self._lock:
+            stale = self._snapshot is None or time.monotonic() - self._built_at > self.max_age
+            dirty = set() if stale else self._dirty
+            self._dirty = set()
+
+            if stale:
+                self._snapshot = self._build_full()
+                self._built_at = time.monotonic()
+            elif dirty:
+                self._snapshot = self._update(self._snapshot, dirty)
+            return self._snapshot
+
+    def _fetch(self, player_ids=None):
+        cursor = db.get_db().cursor()
+        if player_ids is None:
+            cursor.execute(PLAYER_FEATURES_QUERY + PLAYER_FEATURES_GROUP)
+        else:
+            ids = list(player_ids)
+            cursor.execute(PLAYER_FEATURES_QUERY
+                           + f" WHERE p.playerID IN ({', '.join(['%s'] * len(ids))})"
+                           + PLAYER_FEATURES_GROUP, ids)
+        return cursor.fetchall()
+
+    @staticmethod
+    def _info(row):
+        games = row['gamesPlayed']
+        average = (lambda c: float(row[c]) / games if games and row[c] is not None else None)
+        return {
+            'playerID': row['playerID'],
+            'firstName': row['firstName'],
+            'lastName': row['lastName'],
+            'positions': row_positions(row),
+            'height': row['height'],
+            'weight': row['weight'],
+            'games_played': games,
+            'avg_points': average('points'),
+            'avg_rebounds': average('rebounds'),
+            'avg_assists': average('assists'),
+            'avg_steals': average('steals'),
+        }
+
+    def _build_full(self):
+        started = time.perf_counter()
+        rows = self._fetch()
+        snapshot = _Snapshot(
+            [row['playerID'] for row in rows],
+            np.array([feature_row(row) for row in rows], dtype=float).reshape(len(rows), -1),
+            [row_positions(row) for row in rows],
+            [self._info(row) for row in rows],
+        )
+        self.counters['full_builds'] += 1
+        logger.info(f'Built similarity index: {len(rows)} players in '
+                    f'{(time.perf_counter() - started) * 1000:.1f} ms')
+        return snapshot
+
+    def _update(self, snapshot, dirty):
+        """Replace, add or drop the rows of the dirty players"""
+        fetched = {row['playerID']: row for row in self._fetch(dirty)}
+
+        keep = [i for i, player_id in enumerate(snapshot.player_ids) if player_id not in dirty]
+        player_ids = [int(snapshot.player_ids[i]) for i in keep]
+        raw = [snapshot.raw[i] for i in keep]
+        positions = [snapshot.positions[i] for i in keep]
+        info = [snapshot.info[i] for i in keep]
+
+        # deleted players are simply not re-added
+        for player_id, row in fetched.items():
+            player_ids.append(player_id)
+            raw.append(feature_row(row))
+            positions.append(row_positions(row))
+            info.append(self._info(row))
+
+        self.counters['incremental_updates'] += 1
+        width = len(AVERAGE_COLUMNS) + len(BODY_COLUMNS)
+        return _Snapshot(player_ids, np.array(raw, dtype=float).reshape(len(raw), width), positions, info)
+
+
+similarity_index = SimilarityIndex()
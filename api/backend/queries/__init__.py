@@ -0,0 +1,159 @@
+#------------------------------------------------------------
+# Named query registry with per-query timing
+#------------------------------------------------------------
+# Hot statements are registered once by name and run through
+# queries.execute(cursor, name, params), which times every call
+# (GET /admin/query-stats).
+#
+# With QUERY_PREPARE on, each statement is PREPAREd once per pooled
+# connection and then run with EXECUTE ... USING, so MySQL parses it once
+# per connection instead of on every call. PyMySQL has no binary
+# (COM_STMT_PREPARE) protocol, so this uses SQL-level PREPARE, and
+# binding the parameters costs one extra round trip (SET @q1 = ...).
+# Whether that pays off depends on the query and the network; measure
+# with `flask --app backend_app benchmark-queries` before turning it on.
+import logging
+import re
+import threading
+import time
+import weakref
+
+from pymysql.err import OperationalError
+
+logger = logging.getLogger(__name__)
+
+QUERY_NAME = re.compile(r'^[a-z_][a-z0-9_]*$')
+
+# MySQL error for EXECUTE of a statement the connection no longer has
+ER_UNKNOWN_STMT_HANDLER = 1243
+
+
+class Query:
+    def __init__(self, name, sql, prepare=True):
+        self.name = name
+        self.sql = sql
+        self.prepare = prepare
+        self.param_count = sql.count('%s')
+        # PREPARE takes ? placeholders and no %-escaping
+        self.prepared_sql = sql.replace('%s', '?').replace('%%', '%')
+        self.statement = f'q_{name}'
+
+
+class QueryRegistry:
+    """
+    Named SQL statements, shared by every route that runs them.
+
+    Tracks calls, total / max time and errors per query. Which statements
+    each connection has prepared is kept in a WeakKeyDictionary, so a
+    connection the pool closes takes its entry with it.
+    """
+
+    def __init__(self, prepare=False):
+        self.prepare = prepare
+        self._queries = {}
+        self._prepared = weakref.WeakKeyDictionary()  # connection -> {statement names}
+        self._lock = threading.Lock()
+        self._timings = {}
+
+    def init_app(self, app):
+        app.config.setdefault('QUERY_PREPARE', self.prepare)
+        self.prepare = app.config['QUERY_PREPARE']
+
+    def register(self, name, sql, prepare=True):
+        """Add a statement under name (prepare=False keeps it on plain text queries)"""
+        if not QUERY_NAME.match(name):
+            raise ValueError(f'Query name {name!r} must be lower_snake_case')
+        existing = self._queries.get(name)
+        if existing is not None and existing.sql != sql:
+            raise ValueError(f'Query {name!r} is already registered with different SQL')
+        self._queries[name] = Query(name, sql, prepare)
+        return name
+
+    def get(self, name):
+        return self._queries[name]
+
+    def names(self):
+        return list(self._queries)
+
+    def execute(self, cursor, name, params=()):
+        """Run the named query on cursor; rows are read with cursor.fetchone()/fetchall() as usual"""
+        query = self._queries[name]
+        started = time.perf_counter()
+        try:
+            if self.prepare and query.prepare:
+                result = self.execute_prepared(cursor, query, params)
+            else:
+                result = cursor.execute(query.sql, params)
+        except Exception:
+            self._record(name, time.perf_counter() - started, error=True)
+            raise
+        self._record(name, time.perf_counter() - started)
+        return result
+
+    def execute_prepared(self, cursor, query, params=()):
+        conn = cursor.connection
+        if query.statement not in self._prepared_on(conn):
+            self.prepare_on(cursor, query)
+
+        if query.param_count:
+            variables = ', '.join(f'@q{i}' for i in range(1, query.param_count + 1))
+            cursor.execute('SET ' + ', '.join(f'@q{i} = %s' for i in range(1, query.param_count + 1)),
+                           params)
+            statement = f'EXECUTE {query.statement} USING {variables}'
+        else:
+            statement = f'EXECUTE {query.statement}'
+
+        try:
+            return cursor.execute(statement)
+        except OperationalError as e:
+            # the server dropped the statement (e.g. after a reconnect)
+            if e.args[0] != ER_UNKNOWN_STMT_HANDLER:
+                raise
+            self.prepare_on(cursor, query)
+            return cursor.execute(statement)
+
+    def prepare_on(self, cursor, query):
+        cursor.execute(f'PREPARE {query.statement} FROM %s', (query.prepared_sql,))
+        with self._lock:
+            self._prepared.setdefault(cursor.connection, set()).add(query.statement)
+            self._timing(query.name)['prepares'] += 1
+
+    def _prepared_on(self, conn):
+        with self._lock:
+            return self._prepared.get(conn, ())
+
+    def _timing(self, name):
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = self._timings[name] = {'calls': 0, 'errors': 0, 'prepares': 0,
+                                            'total_ms': 0.0, 'max_ms': 0.0}
+        return timing
+
+    def _record(self, name, seconds, error=False):
+        ms = seconds * 1000
+        with self._lock:
+            timing = self._timing(name)
+            timing['calls'] += 1
+            timing['errors'] += error
+            timing['total_ms'] += ms
+            timing['max_ms'] = max(timing['max_ms'], ms)
+
+    def stats(self):
+        """Per-query calls, errors, prepares and total / average / max milliseconds"""
+        with self._lock:
+            stats = {}
+            for name in self._queries:
+                timing = dict(self._timing(name))
+                timing['avg_ms'] = round(timing['total_ms'] / timing['calls'], 3) if timing['calls'] else None
+                timing['total_ms'] = round(timing['total_ms'], 3)
+                timing['max_ms'] = round(timing['max_ms'], 3)
+                timing['prepared'] = self.prepare and self._queries[name].prepare
+                stats[name] = timing
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._timings.clear()
+
+
+queries = QueryRegistry()
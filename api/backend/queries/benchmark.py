@@ -0,0 +1,90 @@
+#------------------------------------------------------------
+# Micro-benchmark: text queries vs prepared statements
+#------------------------------------------------------------
+# `flask --app backend_app benchmark-queries` runs each registered query
+# on one pooled connection, first as a plain text query and then through
+# PREPARE / EXECUTE, and prints the mean time of each. The EXECUTE column
+# leaves out the SET @q... round trip that binds the parameters, so
+# text - EXECUTE is the parse / plan time the prepared statement saves
+# and SET is what binding costs with PyMySQL's text protocol.
+#
+# Every parameter is SAMPLE_ID unless the query has an entry in
+# SAMPLE_PARAMS. Run it against a seeded database.
+import time
+
+import click
+from flask.cli import with_appcontext
+
+from backend.db_connection import db
+from backend.queries import queries
+
+# Value used for every parameter; the seed data has ID 1 everywhere
+SAMPLE_ID = 1
+
+# Queries whose parameters are not all IDs
+SAMPLE_PARAMS = {
+    'game_annotations': (SAMPLE_ID, 0),
+}
+
+
+def sample_params(query):
+    return SAMPLE_PARAMS.get(query.name, (SAMPLE_ID,) * query.param_count)
+
+
+def mean_ms(run, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+def benchmark_query(cursor, query, iterations):
+    """(text ms, SET ms, EXECUTE ms) per call, averaged over iterations"""
+    params = sample_params(query)
+    variables = ', '.join(f'@q{i}' for i in range(1, query.param_count + 1))
+    bind = 'SET ' + ', '.join(f'@q{i} = %s' for i in range(1, query.param_count + 1))
+    execute = f'EXECUTE {query.statement}' + (f' USING {variables}' if variables else '')
+
+    def text():
+        cursor.execute(query.sql, params)
+        cursor.fetchall()
+
+    def set_variables():
+        if variables:
+            cursor.execute(bind, params)
+
+    def execute_prepared():
+        cursor.execute(execute)
+        cursor.fetchall()
+
+    queries.prepare_on(cursor, query)
+    set_variables()
+    for run in (text, execute_prepared):  # warm the buffer pool and caches
+        run()
+
+    return (mean_ms(text, iterations), mean_ms(set_variables, iterations),
+            mean_ms(execute_prepared, iterations))
+
+
+@click.command('benchmark-queries')
+@click.option('--iterations', default=500, show_default=True, help='Calls per query and mode.')
+@click.option('--query', 'names', multiple=True, help='Only benchmark this query. Repeatable.')
+@with_appcontext
+def benchmark_queries_command(iterations, names):
+    """Time each registered query as text and as a prepared statement"""
+    names = names or [name for name in queries.names() if queries.get(name).prepare]
+    unknown = [name for name in names if name not in queries.names()]
+    if unknown:
+        raise click.BadParameter(f"unknown queries: {', '.join(unknown)}", param_hint='--query')
+
+    iterations = max(1, iterations)
+    click.echo(f"{'query':<24}{'text ms':>10}{'SET ms':>10}{'EXECUTE ms':>12}{'saved ms':>10}{'net ms':>10}")
+    with db.connection() as conn:
+        cursor = conn.cursor()
+        for name in names:
+            text_ms, set_ms, execute_ms = benchmark_query(cursor, queries.get(name), iterations)
+            click.echo(f'{name:<24}{text_ms:>10.3f}{set_ms:>10.3f}{execute_ms:>12.3f}'
+                       f'{text_ms - execute_ms:>10.3f}{text_ms - execute_ms - set_ms:>10.3f}')
+
+    click.echo('saved = parse / plan time skipped by EXECUTE; '
+               'net = saved minus the SET round trip (positive: QUERY_PREPARE helps)')
@@ -4,10 +4,23 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 from backend.db_connection import db
+from backend.stats_cache import stats_cache
+from backend.rollups.rollup_engine import rebuild_rollups_command
+from backend.migrations.migrate import migrate_command
+from backend.migrations.query_plans import check_query_plans_command
+from backend.imports.delta_import import import_delta_command
+from backend.schema.sql_check import check_app_sql, check_schema_command
+from backend.queries import queries
+from backend.queries.benchmark import benchmark_queries_command
+from backend.exports.export_worker import export_worker
+from backend.analytics.metric_jobs import metric_job_runner
+from backend.players.similarity_index import similarity_index
+from backend.players.recruiting_matcher import recruiting_matcher
+from backend.scouts.annotation_broker import annotation_broker
 
 # Import your CourtVision blueprints
 from backend.players.player_routes import players
-from backend.scouts.scout_routes import scouts
+from backend.scouts.scout_routes import scouts, fetch_game_annotations
 from backend.analytics.analytics_routes import analytics
 from backend.admin.admin_routes import admin
 
@@ -30,10 +43,52 @@ def create_app():
     app.config["MYSQL_DATABASE_PORT"] = int(os.getenv("DB_PORT").strip())
     app.config["MYSQL_DATABASE_DB"] = os.getenv("DB_NAME").strip()
 
+    # Connection pool configuration
+    app.config["MYSQL_POOL_MIN_SIZE"] = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    app.config["MYSQL_POOL_MAX_SIZE"] = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    app.config["MYSQL_POOL_MAX_OVERFLOW"] = int(os.getenv("DB_POOL_MAX_OVERFLOW", "5"))
+    app.config["MYSQL_POOL_IDLE_TIMEOUT"] = int(os.getenv("DB_POOL_IDLE_TIMEOUT", "300"))
+    app.config["MYSQL_POOL_BORROW_TIMEOUT"] = int(os.getenv("DB_POOL_BORROW_TIMEOUT", "10"))
+    app.config["MYSQL_POOL_HEALTH_CHECK"] = os.getenv("DB_POOL_HEALTH_CHECK", "true").lower() == "true"
+
     # Initialize the database object
-    app.logger.info("Initializing database connection")
+    app.logger.info("Initializing database connection pool")
     db.init_app(app)
 
+    # Run registered hot queries as server-side prepared statements
+    # (measure first with `flask --app backend_app benchmark-queries`)
+    app.config["QUERY_PREPARE"] = os.getenv("QUERY_PREPARE", "false").lower() == "true"
+    queries.init_app(app)
+
+    # Cache for aggregate stats responses, invalidated on Game_Stats writes
+    app.config["STATS_CACHE_TTL"] = int(os.getenv("STATS_CACHE_TTL", "30"))
+    stats_cache.init_app(app)
+
+    # Background workers that write pending export requests to files
+    # (default: exports/ next to the backend package, created when the first job runs)
+    if os.getenv("EXPORT_DIR"):
+        app.config["EXPORT_DIR"] = os.getenv("EXPORT_DIR")
+    app.config["EXPORT_WORKERS"] = int(os.getenv("EXPORT_WORKERS", "2"))
+    app.config["EXPORT_AUTOSTART"] = os.getenv("EXPORT_AUTOSTART", "true").lower() == "true"
+    export_worker.init_app(app)
+
+    # Threads that run bulk metric materialization jobs
+    app.config["METRIC_JOB_WORKERS"] = int(os.getenv("METRIC_JOB_WORKERS", "2"))
+    app.config["METRIC_JOB_BATCH_SIZE"] = int(os.getenv("METRIC_JOB_BATCH_SIZE", "1000"))
+    metric_job_runner.init_app(app)
+
+    # Seconds before the similar-player index is rebuilt from scratch
+    # (writes made through another process only show up after a rebuild)
+    app.config["SIMILARITY_INDEX_MAX_AGE"] = int(os.getenv("SIMILARITY_INDEX_MAX_AGE", "600"))
+    similarity_index.init_app(app)
+    app.config["RECRUITING_PROFILE_MAX_AGE"] = int(os.getenv("RECRUITING_PROFILE_MAX_AGE", "600"))
+    recruiting_matcher.init_app(app)
+
+    # Seconds between the reads that pass other workers' live annotations
+    # to this process's annotation streams (0 = only this process's writes)
+    app.config["ANNOTATION_POLL_SECONDS"] = float(os.getenv("ANNOTATION_POLL_SECONDS", "2"))
+    annotation_broker.init_app(app, fetch_game_annotations)
+
     # Register CourtVision blueprints
     app.logger.info("Registering CourtVision blueprints")
 
@@ -51,6 +106,29 @@ def create_app():
 
     app.logger.info("All blueprints registered successfully")
 
+    # Fail fast if route SQL names a table or column the schema registry doesn't have
+    app.config["SCHEMA_CHECK_ON_STARTUP"] = os.getenv("SCHEMA_CHECK_ON_STARTUP", "true").lower() == "true"
+    if app.config["SCHEMA_CHECK_ON_STARTUP"]:
+        check_app_sql(app)
+
+    # CLI: flask --app backend_app rebuild-rollups [--check]
+    app.cli.add_command(rebuild_rollups_command)
+
+    # CLI: flask --app backend_app migrate [--status]
+    app.cli.add_command(migrate_command)
+
+    # CLI: flask --app backend_app check-query-plans [--verbose]
+    app.cli.add_command(check_query_plans_command)
+
+    # CLI: flask --app backend_app import-delta --games games.csv --stats stats.csv [--dry-run]
+    app.cli.add_command(import_delta_command)
+
+    # CLI: flask --app backend_app check-schema [--module backend.game_scouts.scout_routes] [--skip-db]
+    app.cli.add_command(check_schema_command)
+
+    # CLI: flask --app backend_app benchmark-queries [--iterations 500] [--query player_stats]
+    app.cli.add_command(benchmark_queries_command)
+
     # Return the app object
     return app
 
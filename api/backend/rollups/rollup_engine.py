@@ -0,0 +1,171 @@
+#------------------------------------------------------------
+# Incrementally maintained per-player stat rollups
+#------------------------------------------------------------
+# Player_Totals and Player_Level_Totals hold running sums and game counts
+# for every player (and every player/competition level). The stat write
+# routes in player_routes call apply_stat_change() inside the same
+# transaction as the Game_Stats write, so the analytics routes can read
+# one row per player instead of re-aggregating every game.
+import logging
+
+import click
+from flask.cli import with_appcontext
+
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+STAT_COLUMNS = ['minutes', 'points', 'rebounds', 'assists', 'steals',
+                'blocks', 'turnovers', 'fouls', 'three_pt']
+
+_column_list = ', '.join(STAT_COLUMNS)
+_placeholders = ', '.join(['%s'] * len(STAT_COLUMNS))
+
+UPSERT_PLAYER_TOTALS = f'''
+    INSERT INTO Player_Totals (playerID, gamesPlayed, {_column_list})
+    VALUES (%s, %s, {_placeholders}) AS d
+    ON DUPLICATE KEY UPDATE
+        gamesPlayed = Player_Totals.gamesPlayed + d.gamesPlayed,
+        {', '.join(f'{c} = Player_Totals.{c} + d.{c}' for c in STAT_COLUMNS)}
+'''
+
+# A player's games count once towards every distinct league they play in
+UPSERT_LEVEL_TOTALS = f'''
+    INSERT INTO Player_Level_Totals (playerID, competitionLevel, gamesPlayed, {_column_list})
+    SELECT * FROM (
+        SELECT DISTINCT pin.playerID, COALESCE(t.league, 'Unknown') AS competitionLevel,
+               %s AS gamesPlayed, {', '.join(f'%s AS {c}' for c in STAT_COLUMNS)}
+        FROM Playsin pin
+        JOIN Team t ON pin.team_id = t.team_id
+        WHERE pin.playerID = %s
+    ) AS d
+    ON DUPLICATE KEY UPDATE
+        gamesPlayed = Player_Level_Totals.gamesPlayed + d.gamesPlayed,
+        {', '.join(f'{c} = Player_Level_Totals.{c} + d.{c}' for c in STAT_COLUMNS)}
+'''
+
+SELECT_STAT_ROW = f'''
+    SELECT {_column_list}
+    FROM Game_Stats
+    WHERE playerID = %s AND gameID = %s
+    FOR UPDATE
+'''
+
+PLAYER_TOTALS_FROM_GAME_STATS = f'''
+    SELECT gs.playerID, COUNT(*) AS gamesPlayed,
+           {', '.join(f'COALESCE(SUM(gs.{c}), 0) AS {c}' for c in STAT_COLUMNS)}
+    FROM Game_Stats gs
+    GROUP BY gs.playerID
+'''
+
+LEVEL_TOTALS_FROM_GAME_STATS = f'''
+    SELECT gs.playerID, lv.competitionLevel, COUNT(*) AS gamesPlayed,
+           {', '.join(f'COALESCE(SUM(gs.{c}), 0) AS {c}' for c in STAT_COLUMNS)}
+    FROM Game_Stats gs
+    JOIN (
+        SELECT DISTINCT pin.playerID, COALESCE(t.league, 'Unknown') AS competitionLevel
+        FROM Playsin pin
+        JOIN Team t ON pin.team_id = t.team_id
+    ) lv ON lv.playerID = gs.playerID
+    GROUP BY gs.playerID, lv.competitionLevel
+'''
+
+ROLLUP_TABLES = [
+    ('Player_Totals', ['playerID'], PLAYER_TOTALS_FROM_GAME_STATS),
+    ('Player_Level_Totals', ['playerID', 'competitionLevel'], LEVEL_TOTALS_FROM_GAME_STATS),
+]
+
+
+def stat_values(row):
+    """Pull the stat columns out of a request body or DB row, treating missing as 0"""
+    if not row:
+        return [0] * len(STAT_COLUMNS)
+    return [int(row.get(c) or 0) for c in STAT_COLUMNS]
+
+
+def fetch_stat_row(cursor, player_id, game_id):
+    """Lock and return the current Game_Stats row (None if it does not exist)"""
+    cursor.execute(SELECT_STAT_ROW, (player_id, game_id))
+    return cursor.fetchone()
+
+
+def apply_stat_change(cursor, player_id, old_row=None, new_row=None):
+    """
+    Fold one Game_Stats change into the rollups.
+
+    Pass only new_row for an insert, only old_row for a delete and both
+    for an update. Must run in the same transaction as the Game_Stats write.
+    """
+    games_delta = (1 if new_row else 0) - (1 if old_row else 0)
+    deltas = [new - old for new, old in zip(stat_values(new_row), stat_values(old_row))]
+    apply_stat_deltas(cursor, player_id, games_delta, deltas)
+
+
+def apply_stat_deltas(cursor, player_id, games_delta, deltas):
+    """
+    Add already-summed changes (games played, then STAT_COLUMNS order) to
+    one player's rollups; bulk writers fold many rows into one call.
+    """
+    if games_delta == 0 and not any(deltas):
+        return
+
+    cursor.execute(UPSERT_PLAYER_TOTALS, (player_id, games_delta, *deltas))
+    cursor.execute(UPSERT_LEVEL_TOTALS, (games_delta, *deltas, player_id))
+
+
+def rebuild_rollups(cursor):
+    """Recompute both rollup tables from Game_Stats, returning rows written per table"""
+    counts = {}
+    for table, _, _ in reversed(ROLLUP_TABLES):
+        cursor.execute(f'DELETE FROM {table}')
+    for table, key_columns, source_query in ROLLUP_TABLES:
+        columns = ', '.join(key_columns + ['gamesPlayed'] + STAT_COLUMNS)
+        cursor.execute(f'INSERT INTO {table} ({columns}) {source_query}')
+        counts[table] = cursor.rowcount
+    return counts
+
+
+def find_rollup_drift(cursor):
+    """Compare the stored rollups against a from-scratch computation"""
+    drift = []
+    value_columns = ['gamesPlayed'] + STAT_COLUMNS
+
+    for table, key_columns, source_query in ROLLUP_TABLES:
+        cursor.execute(source_query)
+        expected = {tuple(row[k] for k in key_columns): [int(row[c]) for c in value_columns]
+                    for row in cursor.fetchall()}
+
+        # rows whose games were all deleted stay behind as zeros
+        cursor.execute(f'SELECT {", ".join(key_columns + value_columns)} FROM {table} WHERE gamesPlayed <> 0')
+        stored = {tuple(row[k] for k in key_columns): [int(row[c]) for c in value_columns]
+                  for row in cursor.fetchall()}
+
+        for key in set(expected) | set(stored):
+            if expected.get(key) != stored.get(key):
+                drift.append({'table': table, 'key': key,
+                              'expected': expected.get(key), 'stored': stored.get(key)})
+
+    return drift
+
+
+@click.command('rebuild-rollups')
+@click.option('--check', is_flag=True, help='Only report differences, do not rewrite the tables.')
+@with_appcontext
+def rebuild_rollups_command(check):
+    """Recompute Player_Totals and Player_Level_Totals from Game_Stats"""
+    with db.connection() as conn:
+        cursor = conn.cursor()
+
+        if check:
+            drift = find_rollup_drift(cursor)
+            for item in drift:
+                click.echo(f"{item['table']} {item['key']}: stored={item['stored']} expected={item['expected']}")
+            click.echo(f'{len(drift)} rollup rows differ from Game_Stats')
+            if drift:
+                raise SystemExit(1)
+            return
+
+        counts = rebuild_rollups(cursor)
+        conn.commit()
+        for table, rows in counts.items():
+            click.echo(f'Rebuilt {table}: {rows} rows')
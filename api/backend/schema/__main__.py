@@ -0,0 +1,58 @@
+#------------------------------------------------------------
+# python -m backend.schema [--write PATH] [--check PATH]
+#------------------------------------------------------------
+# Prints the CREATE TABLE statements rendered from the registry, or
+# replaces the generated block of a schema file with them. Run from api/:
+#   python -m backend.schema --write ../database-files/00_courtvision_schema.sql
+import argparse
+import sys
+
+from backend.schema.registry import render_schema
+
+BEGIN_MARKER = '-- BEGIN GENERATED TABLES (python -m backend.schema --write ...; edit api/backend/schema/registry.py)\n'
+END_MARKER = '-- END GENERATED TABLES\n'
+
+
+def replace_generated(text, generated):
+    start = text.find(BEGIN_MARKER)
+    end = text.find(END_MARKER)
+    if start == -1 or end < start:
+        raise ValueError('No generated tables block (BEGIN/END GENERATED TABLES markers) found')
+    return text[:start + len(BEGIN_MARKER)] + generated + text[end:]
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m backend.schema',
+                                     description='Render the courtvision CREATE TABLE statements from the registry.')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--write', metavar='PATH', help='replace the generated block of this schema file')
+    group.add_argument('--check', metavar='PATH', help='exit 1 if this schema file is out of date')
+    args = parser.parse_args()
+
+    generated = render_schema()
+    path = args.write or args.check
+    if path is None:
+        sys.stdout.write(generated)
+        return
+
+    with open(path, 'r', encoding='utf-8') as fh:
+        text = fh.read()
+    try:
+        updated = replace_generated(text, generated)
+    except ValueError as e:
+        raise SystemExit(f'{path}: {e}')
+
+    if args.check:
+        if updated != text:
+            raise SystemExit(f'{path} is out of date; run python -m backend.schema --write {path}')
+        print(f'{path} is up to date')
+    elif updated != text:
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(updated)
+        print(f'Rewrote the generated tables in {path}')
+    else:
+        print(f'{path} is already up to date')
+
+
+if __name__ == '__main__':
+    main()
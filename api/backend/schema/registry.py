@@ -0,0 +1,683 @@
+#------------------------------------------------------------
+# Schema registry: the one description of the courtvision tables
+#------------------------------------------------------------
+# TABLES lists every table in database-files/00_courtvision_schema.sql in
+# creation order. The CREATE TABLE block of that file is rendered from
+# here (`python -m backend.schema --write ...`), and at startup the
+# routes' SQL is checked against it (backend.schema.sql_check), so a
+# column or index is changed in this file and nowhere else. Schema
+# changes to an existing database still go through a migration in
+# backend/migrations/versions.
+#
+# Kept free of Flask imports so the generator runs without the app.
+from collections import namedtuple
+
+Column = namedtuple('Column', 'name type options', defaults=('',))
+ForeignKey = namedtuple('ForeignKey', 'name columns table references on_update on_delete',
+                        defaults=('CASCADE', 'CASCADE'))
+# kind is the keyword as written in the DDL: INDEX, UNIQUE INDEX or UNIQUE KEY
+Index = namedtuple('Index', 'name columns kind', defaults=('INDEX',))
+Table = namedtuple('Table', 'name comment columns primary_key foreign_keys indexes section',
+                   defaults=((), (), (), None))
+
+# Phase 2 table names (the legacy blueprints and the seed CSVs) and the
+# live tables that replaced them
+LEGACY_TABLE_NAMES = {
+    'Games': 'Game',
+    'GameStats': 'Game_Stats',
+    'Scouts': 'Scout',
+    'PlaysIn': 'Playsin',
+    'Teams': 'Team',
+    'Schools': 'School',
+    'ExportRequests': 'ExportRequest',
+    'PlayerSchedules': 'PlayerSchedule',
+    'ScoutActivity': 'Scout_Activity',
+    'RecruitingInterests': 'RecruitingInterest',
+    'SeasonStats': 'Season_Stats',
+    'PlayerStats': 'Player_Stats',
+    'MetricFormula': 'MetricsFormulas',
+    'MetricExports': 'Metric_Export',
+    'Verifications': 'Verification',
+    'Validations': 'Validation',
+}
+
+# Phase 2 column names of the seed CSVs that were renamed in the live
+# tables (names that only differ in case or underscores match anyway)
+LEGACY_COLUMN_NAMES = {
+    'Game_Stats': {'threePts': 'three_pt'},
+    'Offers': {'date': 'offerDate'},
+    'Season_Stats': {'seasonStatID': 'statID'},
+}
+
+TABLES = [
+    Table('SchemaMigrations',
+          comment=('SchemaMigrations - Versions from api/backend/migrations/versions already\n' 'applied; a fresh database built from this file includes all of them'),
+          columns=[
+              Column('version', 'VARCHAR(20)', 'PRIMARY KEY'),
+              Column('name', 'VARCHAR(100)'),
+              Column('appliedAt', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+          ]),
+    Table('Players',
+          section='INDEPENDENT',
+          comment='Players Table',
+          columns=[
+              Column('playerID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('firstName', 'VARCHAR(50)', 'NOT NULL'),
+              Column('lastName', 'VARCHAR(50)', 'NOT NULL'),
+              Column('email', 'VARCHAR(100)', 'UNIQUE NOT NULL'),
+              Column('phone_Number', 'VARCHAR(20)'),
+              Column('UserBio', 'TEXT'),
+              Column('DateofBirth', 'DATE'),
+              Column('height', 'INT'),
+              Column('weight', 'INT'),
+              Column('AcctStatus', 'VARCHAR(20)', "DEFAULT 'active'"),
+          ],
+          indexes=[
+              Index('idx_player_name', ['lastName', 'firstName']),
+              Index('idx_player_email', ['email']),
+              Index('idx_player_height_weight', ['height', 'weight']),
+          ]),
+    Table('Team',
+          comment='Team Table',
+          columns=[
+              Column('team_id', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('team_name', 'VARCHAR(100)', 'NOT NULL'),
+              Column('city', 'VARCHAR(50)'),
+              Column('team_abbrev', 'VARCHAR(10)'),
+              Column('league', 'VARCHAR(50)'),
+          ],
+          indexes=[
+              Index('idx_team_name', ['team_name']),
+          ]),
+    Table('School',
+          comment='School Table',
+          columns=[
+              Column('schoolID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('name', 'VARCHAR(100)', 'NOT NULL'),
+              Column('city', 'VARCHAR(50)'),
+              Column('state', 'VARCHAR(50)'),
+          ],
+          indexes=[
+              Index('idx_school_name', ['name']),
+          ]),
+    Table('Game',
+          comment='Game Table',
+          columns=[
+              Column('gameID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('date', 'DATE', 'NOT NULL'),
+              Column('startTime', 'TIME'),
+              Column('endTime', 'TIME'),
+              Column('opponent', 'VARCHAR(100)'),
+              Column('venue', 'VARCHAR(100)'),
+              Column('tournament', 'VARCHAR(100)'),
+              Column('score', 'VARCHAR(20)'),
+          ],
+          indexes=[
+              Index('idx_game_date', ['date']),
+          ]),
+    Table('Scout',
+          comment='Scout Table',
+          columns=[
+              Column('scoutID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('firstName', 'VARCHAR(50)', 'NOT NULL'),
+              Column('lastName', 'VARCHAR(50)', 'NOT NULL'),
+              Column('email', 'VARCHAR(100)', 'UNIQUE NOT NULL'),
+              Column('dateOfBirth', 'DATE'),
+              Column('age', 'INT'),
+              Column('phoneNum', 'VARCHAR(20)'),
+              Column('acctStatus', 'VARCHAR(20)', "DEFAULT 'active'"),
+              Column('role', 'VARCHAR(50)'),
+          ],
+          indexes=[
+              Index('idx_scout_name', ['lastName', 'firstName']),
+          ]),
+    Table('SystemAdmin',
+          comment='SystemAdmin Table',
+          columns=[
+              Column('adminID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('firstName', 'VARCHAR(50)', 'NOT NULL'),
+              Column('lastName', 'VARCHAR(50)', 'NOT NULL'),
+              Column('email', 'VARCHAR(100)', 'UNIQUE NOT NULL'),
+              Column('dept', 'VARCHAR(50)'),
+              Column('AcctStatus', 'VARCHAR(20)', "DEFAULT 'active'"),
+          ]),
+    Table('Dashboard',
+          comment='Dashboard Table',
+          columns=[
+              Column('dashboardID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('dashboardName', 'VARCHAR(100)'),
+              Column('metricDisplayed', 'VARCHAR(100)'),
+              Column('chartType', 'VARCHAR(50)'),
+              Column('lastUpdated', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+              Column('filterCriteria', 'TEXT'),
+          ],
+          indexes=[
+              Index('idx_dashboard_updated', ['lastUpdated']),
+          ]),
+    Table('MetricsFormulas',
+          comment='MetricsFormulas Table',
+          columns=[
+              Column('formulaID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('formulaName', 'VARCHAR(100)', 'NOT NULL'),
+              Column('expression', 'TEXT'),
+              Column('createdBy', 'TEXT'),
+              Column('dateCreated', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('lastModified', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+          ],
+          indexes=[
+              Index('idx_formula_name', ['formulaName']),
+              Index('idx_formula_created', ['dateCreated']),
+          ]),
+    Table('ExportRequest',
+          comment='ExportRequest Table',
+          columns=[
+              Column('exportID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('requestedBy', 'INT'),
+              Column('requestedUserType', 'VARCHAR(20)'),
+              Column('format', 'VARCHAR(20)'),
+              Column('dataType', 'VARCHAR(50)'),
+              Column('timestamp', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('status', 'VARCHAR(20)', "DEFAULT 'pending'"),
+              Column('completedAt', 'DATETIME'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_export_admin', ['requestedBy'], 'SystemAdmin', ['adminID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_exportrequest_status_time', ['status', 'timestamp']),
+              Index('idx_exportrequest_time', ['timestamp']),
+          ]),
+    Table('Playsin',
+          section='JUNCTION TABLES (M:N Relationships)',
+          comment='Playsin - Players to Teams (M:N)',
+          columns=[
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('team_id', 'INT', 'NOT NULL'),
+              Column('startDate', 'DATE'),
+              Column('endDate', 'DATE'),
+              Column('jerseyNumber', 'INT'),
+              Column('position', 'VARCHAR(20)'),
+          ],
+          primary_key=['playerID', 'team_id'],
+          foreign_keys=[
+              ForeignKey('fk_playsin_player', ['playerID'], 'Players', ['playerID']),
+              ForeignKey('fk_playsin_team', ['team_id'], 'Team', ['team_id']),
+          ],
+          indexes=[
+              Index('idx_playsin_position_player', ['position', 'playerID']),
+          ]),
+    Table('PlayerSchedule',
+          comment='PlayerSchedule - Players to Games (M:N)',
+          columns=[
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('gameID', 'INT', 'NOT NULL'),
+          ],
+          primary_key=['playerID', 'gameID'],
+          foreign_keys=[
+              ForeignKey('fk_playersched_player', ['playerID'], 'Players', ['playerID']),
+              ForeignKey('fk_playersched_game', ['gameID'], 'Game', ['gameID']),
+          ]),
+    Table('Scout_Activity',
+          comment='Scout_Activity - Scouts to Games (M:N)',
+          columns=[
+              Column('scoutID', 'INT', 'NOT NULL'),
+              Column('gameID', 'INT', 'NOT NULL'),
+              Column('gamesAttended', 'INT', 'DEFAULT 1'),
+              Column('notes', 'TEXT'),
+          ],
+          primary_key=['scoutID', 'gameID'],
+          foreign_keys=[
+              ForeignKey('fk_scoutactivity_scout', ['scoutID'], 'Scout', ['scoutID']),
+              ForeignKey('fk_scoutactivity_game', ['gameID'], 'Game', ['gameID']),
+          ]),
+    Table('ScheduledFor',
+          comment='ScheduledFor - Games to Teams (M:N)',
+          columns=[
+              Column('gameID', 'INT', 'NOT NULL'),
+              Column('team_id', 'INT', 'NOT NULL'),
+          ],
+          primary_key=['gameID', 'team_id'],
+          foreign_keys=[
+              ForeignKey('fk_scheduled_game', ['gameID'], 'Game', ['gameID']),
+              ForeignKey('fk_scheduled_team', ['team_id'], 'Team', ['team_id']),
+          ]),
+    Table('RecruitingInterest',
+          comment='RecruitingInterest - Players to Schools (M:N)',
+          columns=[
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('schoolID', 'INT', 'NOT NULL'),
+              Column('interestLevel', 'VARCHAR(20)'),
+              Column('dateAdded', 'DATE'),
+              Column('notes', 'TEXT'),
+          ],
+          primary_key=['playerID', 'schoolID'],
+          foreign_keys=[
+              ForeignKey('fk_recruiting_player', ['playerID'], 'Players', ['playerID']),
+              ForeignKey('fk_recruiting_school', ['schoolID'], 'School', ['schoolID']),
+          ]),
+    Table('Season_Stats',
+          section='DEPENDENT TABLES (Stats and Reports)',
+          comment='Season_Stats - Player season statistics',
+          columns=[
+              Column('statID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('season', 'VARCHAR(20)', 'NOT NULL'),
+              Column('gamesPlayed', 'INT'),
+              Column('totalMinsPlayed', 'INT'),
+              Column('avgPts', 'DECIMAL(5,2)'),
+              Column('ptsPerGame', 'DECIMAL(5,2)'),
+              Column('rebPerGame', 'DECIMAL(5,2)'),
+              Column('astPerGame', 'DECIMAL(5,2)'),
+              Column('avgRebounds', 'DECIMAL(5,2)'),
+              Column('avgAsts', 'DECIMAL(5,2)'),
+              Column('avgStls', 'DECIMAL(5,2)'),
+              Column('three_pointers', 'INT'),
+              Column('threePPercent', 'DECIMAL(5,2)'),
+              Column('fieldGoalPercent', 'DECIMAL(5,2)'),
+              Column('freeThrowPercent', 'DECIMAL(5,2)'),
+              Column('lastUpdated', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_season_player', ['playerID'], 'Players', ['playerID']),
+          ],
+          indexes=[
+              Index('idx_player_season', ['playerID', 'season'], kind='UNIQUE INDEX'),
+          ]),
+    Table('Player_Stats',
+          comment='Player_Stats - Player stats per team',
+          columns=[
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('team_id', 'INT', 'NOT NULL'),
+              Column('PtsPerGame', 'DECIMAL(5,2)'),
+              Column('rebounds', 'DECIMAL(5,2)'),
+              Column('assists', 'DECIMAL(5,2)'),
+              Column('steals', 'DECIMAL(5,2)'),
+              Column('blocks', 'DECIMAL(5,2)'),
+              Column('turnovers', 'DECIMAL(5,2)'),
+              Column('fouls', 'DECIMAL(5,2)'),
+              Column('three_pt_percentage', 'DECIMAL(5,2)'),
+          ],
+          primary_key=['playerID', 'team_id'],
+          foreign_keys=[
+              ForeignKey('fk_playerstats_player', ['playerID'], 'Players', ['playerID']),
+          ]),
+    Table('Game_Stats',
+          comment='Game_Stats - Player stats per game',
+          columns=[
+              Column('gameID', 'INT', 'NOT NULL'),
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('minutes', 'INT'),
+              Column('points', 'INT'),
+              Column('rebounds', 'INT'),
+              Column('assists', 'INT'),
+              Column('steals', 'INT'),
+              Column('blocks', 'INT'),
+              Column('turnovers', 'INT'),
+              Column('fouls', 'INT'),
+              Column('three_pt', 'INT'),
+              Column('lastUpdated', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+          ],
+          primary_key=['gameID', 'playerID'],
+          foreign_keys=[
+              ForeignKey('fk_gamestats_game', ['gameID'], 'Game', ['gameID']),
+              ForeignKey('fk_gamestats_player', ['playerID'], 'Players', ['playerID']),
+          ]),
+    Table('Player_Totals',
+          comment=('Player_Totals - Running per-player sums of Game_Stats, kept in step\n' 'by the API on every stat insert/update/delete'),
+          columns=[
+              Column('playerID', 'INT', 'PRIMARY KEY'),
+              Column('gamesPlayed', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('minutes', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('points', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('rebounds', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('assists', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('steals', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('blocks', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('turnovers', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('fouls', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('three_pt', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('lastUpdated', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_playertotals_player', ['playerID'], 'Players', ['playerID']),
+          ]),
+    Table('Player_Level_Totals',
+          comment='Player_Level_Totals - Same sums split by competition level (team league)',
+          columns=[
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('competitionLevel', 'VARCHAR(50)', 'NOT NULL'),
+              Column('gamesPlayed', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('minutes', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('points', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('rebounds', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('assists', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('steals', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('blocks', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('turnovers', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('fouls', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('three_pt', 'INT', 'NOT NULL DEFAULT 0'),
+              Column('lastUpdated', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+          ],
+          primary_key=['playerID', 'competitionLevel'],
+          foreign_keys=[
+              ForeignKey('fk_leveltotals_player', ['playerID'], 'Players', ['playerID']),
+          ],
+          indexes=[
+              Index('idx_leveltotals_level', ['competitionLevel']),
+          ]),
+    Table('PlayerReports',
+          comment='PlayerReports - Scout reports on players',
+          columns=[
+              Column('reportID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('scoutID', 'INT', 'NOT NULL'),
+              Column('summary', 'TEXT'),
+              Column('strengths', 'TEXT'),
+              Column('weaknesses', 'TEXT'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_playerreport_player', ['playerID'], 'Players', ['playerID']),
+              ForeignKey('fk_playerreport_scout', ['scoutID'], 'Scout', ['scoutID']),
+          ],
+          indexes=[
+              Index('idx_report_player', ['playerID']),
+              Index('idx_report_scout_player', ['scoutID', 'playerID']),
+          ]),
+    Table('Offers',
+          comment='Offers - School offers to players',
+          columns=[
+              Column('offerID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('schoolID', 'INT', 'NOT NULL'),
+              Column('status', 'VARCHAR(20)', "DEFAULT 'pending'"),
+              Column('offerDate', 'DATE'),
+              Column('responseDate', 'DATE'),
+              Column('scholarshipType', 'VARCHAR(50)'),
+              Column('scholarshipAmount', 'DECIMAL(10,2)'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_offers_player', ['playerID'], 'Players', ['playerID']),
+              ForeignKey('fk_offers_school', ['schoolID'], 'School', ['schoolID']),
+          ],
+          indexes=[
+              Index('idx_offer_status_school', ['status', 'schoolID']),
+              Index('idx_offer_date', ['offerDate']),
+          ]),
+    Table('Footage',
+          comment='Footage - Game footage/video',
+          columns=[
+              Column('footageID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('gameID', 'INT', 'NOT NULL'),
+              Column('playerID', 'INT'),
+              Column('URL', 'VARCHAR(255)', 'NOT NULL'),
+              Column('duration', 'INT'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_footage_game', ['gameID'], 'Game', ['gameID']),
+              ForeignKey('fk_footage_player', ['playerID'], 'Players', ['playerID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_footage_game', ['gameID']),
+              Index('idx_footage_player', ['playerID']),
+          ]),
+    Table('Annotations',
+          comment='Annotations - Notes/timestamps on footage',
+          columns=[
+              Column('annotationID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('reportID', 'INT'),
+              Column('gameID', 'INT'),
+              Column('footageID', 'INT'),
+              Column('annotatedBy', 'INT'),
+              Column('text', 'TEXT'),
+              Column('timestamp', 'TIME'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_annotations_report', ['reportID'], 'PlayerReports', ['reportID'], on_delete='SET NULL'),
+              ForeignKey('fk_annotations_game', ['gameID'], 'Game', ['gameID'], on_delete='SET NULL'),
+              ForeignKey('fk_annotations_footage', ['footageID'], 'Footage', ['footageID'], on_delete='SET NULL'),
+              ForeignKey('fk_annotations_scout', ['annotatedBy'], 'Scout', ['scoutID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_annotation_report_time', ['reportID', 'timestamp']),
+              Index('idx_annotation_game_time', ['gameID', 'timestamp']),
+          ]),
+    Table('CalculatedMetrics',
+          comment='CalculatedMetrics - Metrics calculated from formulas',
+          columns=[
+              Column('metricID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('gameID', 'INT', 'NOT NULL'),
+              Column('playerID', 'INT'),
+              Column('formulaID', 'INT', 'NOT NULL'),
+              Column('metricName', 'VARCHAR(100)'),
+              Column('metricValue', 'DOUBLE'),
+              Column('calcTimestamp', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_calcmetrics_game', ['gameID'], 'Game', ['gameID']),
+              ForeignKey('fk_calcmetrics_player', ['playerID'], 'Players', ['playerID'], on_delete='SET NULL'),
+              ForeignKey('fk_calcmetrics_formula', ['formulaID'], 'MetricsFormulas', ['formulaID']),
+          ],
+          indexes=[
+              Index('uq_metric_formula_game_player', ['formulaID', 'gameID', 'playerID'], kind='UNIQUE KEY'),
+              Index('idx_metric_game', ['gameID']),
+              Index('idx_metric_player', ['playerID']),
+              Index('idx_metric_calc_time', ['calcTimestamp']),
+          ]),
+    Table('DashboardSnapshots',
+          comment='DashboardSnapshots - Precomputed, gzip-compressed dashboard payloads',
+          columns=[
+              Column('dashboardID', 'INT', 'PRIMARY KEY'),
+              Column('payload', 'MEDIUMBLOB', 'NOT NULL'),
+              Column('payloadBytes', 'INT'),
+              Column('rawBytes', 'INT'),
+              Column('computeMs', 'INT'),
+              Column('computedAt', 'DATETIME(6)', 'NOT NULL'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_snapshots_dashboard', ['dashboardID'], 'Dashboard', ['dashboardID']),
+          ]),
+    Table('MetricJobs',
+          comment='MetricJobs - Background jobs that materialize a formula over many games',
+          columns=[
+              Column('jobID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('formulaID', 'INT', 'NOT NULL'),
+              Column('requestedBy', 'INT'),
+              Column('startDate', 'DATE'),
+              Column('endDate', 'DATE'),
+              Column('playerIDs', 'TEXT'),
+              Column('status', 'VARCHAR(20)', "DEFAULT 'pending'"),
+              Column('rowsTotal', 'INT', 'DEFAULT 0'),
+              Column('rowsDone', 'INT', 'DEFAULT 0'),
+              Column('rowsSkipped', 'INT', 'DEFAULT 0'),
+              Column('errorMessage', 'TEXT'),
+              Column('createdAt', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('startedAt', 'DATETIME'),
+              Column('completedAt', 'DATETIME'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_metricjobs_formula', ['formulaID'], 'MetricsFormulas', ['formulaID']),
+          ],
+          indexes=[
+              Index('idx_metricjobs_status', ['status']),
+          ]),
+    Table('DashboardMetrics',
+          comment='DashboardMetrics - Links dashboards to calculated metrics',
+          columns=[
+              Column('dashboardID', 'INT', 'NOT NULL'),
+              Column('metricID', 'INT', 'NOT NULL'),
+          ],
+          primary_key=['dashboardID', 'metricID'],
+          foreign_keys=[
+              ForeignKey('fk_dashmetrics_dashboard', ['dashboardID'], 'Dashboard', ['dashboardID']),
+              ForeignKey('fk_dashmetrics_metric', ['metricID'], 'CalculatedMetrics', ['metricID']),
+          ]),
+    Table('UserReported',
+          comment='UserReported - Tracking reported users/content',
+          columns=[
+              Column('reportID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('reportedBy', 'INT', 'NOT NULL'),
+              Column('reportedUserID', 'INT', 'NOT NULL'),
+              Column('reportedUserType', "ENUM('player', 'scout', 'admin')", 'NOT NULL'),
+              Column('reason', 'TEXT'),
+              Column('severity', 'VARCHAR(20)', "DEFAULT 'medium'"),
+              Column('status', 'VARCHAR(20)', "DEFAULT 'pending'"),
+              Column('reportDate', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('reviewedBy', 'INT'),
+              Column('reviewedDate', 'DATETIME'),
+              Column('resolution', 'TEXT'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_userreported_reporter', ['reportedBy'], 'SystemAdmin', ['adminID']),
+              ForeignKey('fk_userreported_reviewer', ['reviewedBy'], 'SystemAdmin', ['adminID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_userreported_status_severity', ['status', 'severity', 'reportDate']),
+              Index('idx_report_type', ['reportedUserType']),
+          ]),
+    Table('Verification',
+          comment='Verification - Player account verification',
+          columns=[
+              Column('validationID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('playerID', 'INT', 'NOT NULL'),
+              Column('verificationType', 'VARCHAR(50)'),
+              Column('documentType', 'VARCHAR(50)'),
+              Column('status', 'VARCHAR(20)', "DEFAULT 'pending'"),
+              Column('submittedDate', 'DATE'),
+              Column('verifiedBy', 'INT'),
+              Column('verifiedDate', 'DATE'),
+              Column('notes', 'TEXT'),
+              Column('timestamp', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_verification_player', ['playerID'], 'Players', ['playerID']),
+              ForeignKey('fk_verification_admin', ['verifiedBy'], 'SystemAdmin', ['adminID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_verification_player_date', ['playerID', 'submittedDate']),
+              Index('idx_verification_status_date', ['status', 'submittedDate']),
+          ]),
+    Table('Validation',
+          comment='Validation - Data validation records',
+          columns=[
+              Column('validationID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('entityType', 'VARCHAR(50)', 'NOT NULL'),
+              Column('entityID', 'INT', 'NOT NULL'),
+              Column('fieldName', 'VARCHAR(50)'),
+              Column('validationRule', 'TEXT'),
+              Column('isValid', 'BOOLEAN'),
+              Column('errorMessage', 'TEXT'),
+              Column('validatedDate', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('validatedBy', 'INT'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_validation_admin', ['validatedBy'], 'SystemAdmin', ['adminID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_validation_entity', ['entityType', 'entityID']),
+              Index('idx_validation_valid_date', ['isValid', 'validatedDate']),
+          ]),
+    Table('Reports',
+          comment='Reports - General system reports (different from PlayerReports)',
+          columns=[
+              Column('reportID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('reportName', 'VARCHAR(100)', 'NOT NULL'),
+              Column('reportType', 'VARCHAR(50)'),
+              Column('createdBy', 'INT'),
+              Column('createdDate', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('description', 'TEXT'),
+              Column('status', 'VARCHAR(20)', "DEFAULT 'active'"),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_reports_admin', ['createdBy'], 'SystemAdmin', ['adminID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_report_type', ['reportType']),
+              Index('idx_reports_created', ['createdDate']),
+          ]),
+    Table('Exports',
+          comment='Exports - Completed export files',
+          columns=[
+              Column('exportID', 'INT', 'AUTO_INCREMENT PRIMARY KEY'),
+              Column('exportRequestID', 'INT'),
+              Column('fileName', 'VARCHAR(255)'),
+              Column('filePath', 'VARCHAR(255)'),
+              Column('fileSize', 'INT'),
+              Column('exportType', 'VARCHAR(50)'),
+              Column('generatedDate', 'DATETIME', 'DEFAULT CURRENT_TIMESTAMP'),
+              Column('expirationDate', 'DATETIME'),
+              Column('downloadCount', 'INT', 'DEFAULT 0'),
+          ],
+          foreign_keys=[
+              ForeignKey('fk_exports_request', ['exportRequestID'], 'ExportRequest', ['exportID'], on_delete='SET NULL'),
+          ],
+          indexes=[
+              Index('idx_export_date', ['generatedDate']),
+          ]),
+    Table('Metric_Export',
+          comment='Metric_Export - Junction table linking MetricsFormulas to Exports',
+          columns=[
+              Column('formulaID', 'INT', 'NOT NULL'),
+              Column('exportID', 'INT', 'NOT NULL'),
+              Column('includeRawData', 'BOOLEAN', 'DEFAULT FALSE'),
+          ],
+          primary_key=['formulaID', 'exportID'],
+          foreign_keys=[
+              ForeignKey('fk_metricexport_formula', ['formulaID'], 'MetricsFormulas', ['formulaID']),
+              ForeignKey('fk_metricexport_export', ['exportID'], 'Exports', ['exportID']),
+          ]),
+]
+
+TABLES_BY_NAME = {table.name: table for table in TABLES}
+
+INDENT = ' ' * 3
+CONTINUATION = ' ' * 7
+
+
+def column_names(table_name):
+    return [column.name for column in TABLES_BY_NAME[table_name].columns]
+
+
+def required_columns(table_name):
+    """Columns an INSERT must give: NOT NULL, with no DEFAULT and no AUTO_INCREMENT"""
+    table = TABLES_BY_NAME[table_name]
+    return [column.name for column in table.columns
+            if ('NOT NULL' in column.options or column.name in table.primary_key)
+            and 'DEFAULT' not in column.options and 'AUTO_INCREMENT' not in column.options]
+
+
+def render_definitions(table):
+    """Column, primary key, foreign key and index lines of one CREATE TABLE"""
+    lines = [f"{column.name} {column.type}" + (f" {column.options}" if column.options else '')
+             for column in table.columns]
+    if table.primary_key:
+        lines.append(f"PRIMARY KEY ({', '.join(table.primary_key)})")
+    for fk in table.foreign_keys:
+        lines.append(f"CONSTRAINT {fk.name}\n"
+                     f"{CONTINUATION}FOREIGN KEY ({', '.join(fk.columns)}) "
+                     f"REFERENCES {fk.table}({', '.join(fk.references)})\n"
+                     f"{CONTINUATION}ON UPDATE {fk.on_update}\n"
+                     f"{CONTINUATION}ON DELETE {fk.on_delete}")
+    for index in table.indexes:
+        lines.append(f"{index.kind} {index.name} ({', '.join(index.columns)})")
+    return lines
+
+
+def render_table(table):
+    comment = ''.join(f"-- {line}\n" for line in table.comment.split('\n'))
+    body = ',\n'.join(INDENT + line for line in render_definitions(table))
+    return f"{comment}CREATE TABLE {table.name} (\n{body}\n);"
+
+
+def render_section(title):
+    if title == 'INDEPENDENT':
+        return f"-- {title}\n"
+    rule = '-- ' + '=' * 44
+    return f"{rule}\n-- {title}\n{rule}\n\n"
+
+
+def render_schema(tables=TABLES):
+    """The CREATE TABLE statements for tables, laid out as in the schema file"""
+    parts = []
+    for table in tables:
+        parts.append((render_section(table.section) + '\n' if table.section else '') + render_table(table))
+    return '\n\n\n'.join(parts) + '\n'
@@ -0,0 +1,254 @@
+#------------------------------------------------------------
+# Checks the SQL in the backend against the schema registry
+#------------------------------------------------------------
+# create_app reads the source of every loaded backend module and looks at
+# each string literal that starts with SELECT / INSERT / UPDATE / DELETE:
+# table names must be registry tables, `alias.column` references must
+# name a column of the aliased table, and INSERT / UPDATE ... SET column
+# lists must match the table. A mismatch raises SchemaError at startup
+# instead of a 500 the first time the route runs. Tables from the phase 2
+# schema are reported with the name that replaced them.
+#
+# `flask --app backend_app check-schema` also compares the registry with
+# the connected database, and can check modules that are not loaded
+# (--module backend.game_scouts.scout_routes).
+import ast
+import importlib.util
+import logging
+import os
+import re
+import sys
+
+import click
+from flask.cli import with_appcontext
+
+from backend.db_connection import db
+from backend.schema.registry import LEGACY_TABLE_NAMES, TABLES, TABLES_BY_NAME
+
+logger = logging.getLogger(__name__)
+
+# Literals treated as SQL (upper case, so docstrings are left alone)
+SQL_START = re.compile(r'^\s*(SELECT|INSERT|UPDATE|DELETE|WITH|REPLACE)\s')
+
+# Stands in for an f-string {expression}; never matches an identifier
+PLACEHOLDER = '{}'
+
+TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN)\s+`?([A-Za-z_][\w.]*)`?(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?')
+INSERT_TABLE = re.compile(r'\b(?:INSERT|REPLACE)\s+(?:IGNORE\s+)?INTO\s+`?(\w+)`?\s*(?:\(([^)]*)\))?')
+UPDATE_TABLE = re.compile(r'^\s*UPDATE\s+`?(\w+)`?(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?', re.MULTILINE)
+UPDATE_SET = re.compile(r'^\s*UPDATE\s+`?(\w+)`?\s+SET\s+(.*?)(?:\bWHERE\b|\Z)', re.DOTALL)
+SET_COLUMN = re.compile(r'(?:^|,)\s*`?(\w+)`?\s*=')
+CTE_NAME = re.compile(r'(?:\bWITH|,)\s*(\w+)\s+AS\s*\(')
+QUALIFIED_COLUMN = re.compile(r'(?<![\w.])([A-Za-z_]\w*)\.`?([A-Za-z_]\w*)`?')
+
+# Words that can follow a table name but are not an alias for it
+NOT_ALIASES = {
+    'WHERE', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS', 'NATURAL', 'STRAIGHT_JOIN',
+    'ON', 'USING', 'GROUP', 'ORDER', 'LIMIT', 'HAVING', 'SET', 'VALUES', 'VALUE', 'UNION',
+    'FOR', 'WINDOW', 'AND', 'OR', 'AS', 'FORCE', 'USE', 'IGNORE', 'LOCK', 'PARTITION', 'SELECT',
+}
+
+# Tables that are not in the registry but exist on every server
+BUILTIN_TABLES = {'DUAL'}
+
+
+class SchemaError(Exception):
+    """Raised at startup when backend SQL does not match the schema registry"""
+    pass
+
+
+def suggestion(table):
+    replacement = LEGACY_TABLE_NAMES.get(table)
+    if replacement is None:
+        replacement = next((name for name in TABLES_BY_NAME if name.lower() == table.lower()), None)
+    return f' (did you mean {replacement}?)' if replacement else ''
+
+
+def literal_text(node):
+    """Text of a str constant or f-string, with each {expression} as PLACEHOLDER"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return ''.join(part.value if isinstance(part, ast.Constant) else PLACEHOLDER
+                       for part in node.values)
+    return None
+
+
+def sql_literals(path):
+    """(line, text) for every SQL-looking string literal in a source file"""
+    with open(path, 'r', encoding='utf-8') as fh:
+        tree = ast.parse(fh.read(), filename=path)
+
+    inside_fstring = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.JoinedStr):
+            inside_fstring.update(id(part) for part in node.values)
+
+    for node in ast.walk(tree):
+        if id(node) in inside_fstring:
+            continue
+        text = literal_text(node)
+        if text and SQL_START.match(text):
+            yield node.lineno, text
+
+
+def columns_of(table):
+    return {column.name.lower() for column in TABLES_BY_NAME[table].columns}
+
+
+def check_statement(sql):
+    """Problems with one SQL string, as messages"""
+    problems = []
+    ctes = set(CTE_NAME.findall(sql))
+    aliases = {}
+
+    def check_table(table, alias=None):
+        if '.' in table or table in ctes or table.upper() in BUILTIN_TABLES:
+            return
+        if table not in TABLES_BY_NAME:
+            problems.append(f'unknown table {table}{suggestion(table)}')
+            return
+        aliases.setdefault(table, set()).add(table)
+        if alias and alias.upper() not in NOT_ALIASES:
+            aliases.setdefault(alias, set()).add(table)
+
+    for match in TABLE_REFERENCE.finditer(sql):
+        check_table(match.group(1), match.group(2))
+    for match in UPDATE_TABLE.finditer(sql):
+        check_table(match.group(1), match.group(2))
+
+    for match in INSERT_TABLE.finditer(sql):
+        table, column_list = match.groups()
+        check_table(table)
+        if table in TABLES_BY_NAME and column_list and PLACEHOLDER not in column_list:
+            known = columns_of(table)
+            for column in (c.strip().strip('`') for c in column_list.split(',')):
+                if column and column.lower() not in known:
+                    problems.append(f'{table} has no column {column}')
+
+    # unqualified SET columns of a single-table UPDATE
+    match = UPDATE_SET.match(sql)
+    if match and match.group(1) in TABLES_BY_NAME and not re.search(r'\bJOIN\b', sql):
+        table, assignments = match.groups()
+        known = columns_of(table)
+        for column in SET_COLUMN.findall(assignments):
+            if column.lower() not in known:
+                problems.append(f'{table} has no column {column}')
+
+    for alias, column in QUALIFIED_COLUMN.findall(sql):
+        tables = aliases.get(alias)
+        if tables and not any(column.lower() in columns_of(table) for table in tables):
+            problems.append(f"{alias}.{column}: {' / '.join(sorted(tables))} has no column {column}")
+
+    return problems
+
+
+def check_file(path, display_path=None):
+    """[(location, message)] for the SQL literals in one source file"""
+    display_path = display_path or path
+    return [(f'{display_path}:{line}', problem)
+            for line, sql in sql_literals(path)
+            for problem in dict.fromkeys(check_statement(sql))]
+
+
+def module_path(name):
+    """Source file of a module, without importing it"""
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.origin or not spec.origin.endswith('.py'):
+        raise click.BadParameter(f'no Python source found for {name}', param_hint='--module')
+    return spec.origin
+
+
+def loaded_backend_files():
+    """Source files of the backend modules imported so far (the schema package excepted)"""
+    files = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None)
+        if name.startswith('backend.') and not name.startswith('backend.schema') and path and path.endswith('.py'):
+            files[name] = path
+    return files
+
+
+def check_loaded_modules():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    problems = []
+    for name, path in sorted(loaded_backend_files().items()):
+        problems.extend(check_file(path, os.path.relpath(path, root)))
+    return problems
+
+
+def check_app_sql(app):
+    """Raise SchemaError if any loaded backend module's SQL does not match the registry"""
+    problems = check_loaded_modules()
+    if problems:
+        details = '\n'.join(f'  {location}: {message}' for location, message in problems)
+        raise SchemaError(f'Backend SQL does not match backend/schema/registry.py ({len(problems)} problems):\n{details}')
+    app.logger.info('Route SQL matches the schema registry')
+
+
+def database_differences(cursor):
+    """Differences between the registry and the connected database, as messages"""
+    cursor.execute('''
+        SELECT TABLE_NAME, COLUMN_NAME
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    ''')
+    live_columns = {}
+    for row in cursor.fetchall():
+        live_columns.setdefault(row['TABLE_NAME'], []).append(row['COLUMN_NAME'])
+
+    cursor.execute('''
+        SELECT DISTINCT TABLE_NAME, INDEX_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND INDEX_NAME <> 'PRIMARY'
+    ''')
+    live_indexes = {(row['TABLE_NAME'], row['INDEX_NAME']) for row in cursor.fetchall()}
+
+    differences = []
+    for table in TABLES:
+        if table.name not in live_columns:
+            differences.append(f'table {table.name} is missing from the database')
+            continue
+        registered = [column.name for column in table.columns]
+        for column in registered:
+            if column not in live_columns[table.name]:
+                differences.append(f'{table.name}.{column} is missing from the database')
+        for column in live_columns[table.name]:
+            if column not in registered:
+                differences.append(f'{table.name}.{column} is not in the registry')
+        for index in table.indexes:
+            if (table.name, index.name) not in live_indexes:
+                differences.append(f'index {index.name} on {table.name} is missing from the database')
+
+    for name in sorted(set(live_columns) - set(TABLES_BY_NAME)):
+        differences.append(f'table {name} is not in the registry{suggestion(name)}')
+    return differences
+
+
+@click.command('check-schema')
+@click.option('--module', 'modules', multiple=True,
+              help='Also check the SQL of this (possibly unregistered) module. Repeatable.')
+@click.option('--skip-db', is_flag=True, help='Only check the SQL; do not connect to the database.')
+@with_appcontext
+def check_schema_command(modules, skip_db):
+    """Check backend SQL and the connected database against the schema registry"""
+    problems = check_loaded_modules()
+    for name in modules:
+        problems.extend(check_file(module_path(name), name))
+
+    for location, message in problems:
+        click.echo(f'SQL {location}: {message}')
+
+    differences = []
+    if not skip_db:
+        with db.connection() as conn:
+            differences = database_differences(conn.cursor())
+        for message in differences:
+            click.echo(f'DATABASE {message}')
+
+    click.echo(f'{len(problems)} SQL problems, '
+               + ('database not checked' if skip_db else f'{len(differences)} database differences'))
+
+    if problems or differences:
+        raise SystemExit(1)
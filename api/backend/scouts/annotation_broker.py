@@ -0,0 +1,147 @@
+#------------------------------------------------------------
+# In-process fan-out of new live annotations
+#------------------------------------------------------------
+# The annotation write routes publish what they inserted; every open
+# /games/<id>/annotations/stream connection for that game has a queue
+# here and receives the rows as server-sent events straight away.
+#
+# A write only reaches streams in the same API process this way. For
+# tags written through the other gunicorn workers, one poller thread per
+# process reads the Annotations table every ANNOTATION_POLL_SECONDS, one
+# query per game that has open streams, and publishes what it finds here
+# like any other write. Streams only read their queues, so the query load
+# grows with the number of watched games, not viewers.
+import logging
+import os
+import queue
+import threading
+import time
+
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    def __init__(self, game_id, max_queued):
+        self.game_id = game_id
+        self.events = queue.Queue(maxsize=max_queued)
+        self.overflowed = False
+
+    def get(self, timeout):
+        """Next list of annotations, or None if nothing arrived in time"""
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AnnotationBroker:
+    def __init__(self, max_queued=256, poll_seconds=2):
+        self.max_queued = max_queued
+        self.poll_seconds = poll_seconds
+        self.app = None
+        self.fetch = None
+        self._subscribers = {}
+        self._polled = {}  # game_id -> highest annotationID read from the table
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def init_app(self, app, fetch):
+        """
+        fetch(cursor, game_id, since) returns a game's annotations after
+        annotationID since; the poller publishes them. 0 seconds turns
+        the poller off.
+        """
+        app.config.setdefault('ANNOTATION_POLL_SECONDS', self.poll_seconds)
+        self.app = app
+        self.fetch = fetch
+        self.poll_seconds = app.config['ANNOTATION_POLL_SECONDS']
+
+    def subscribe(self, game_id):
+        subscription = Subscription(game_id, self.max_queued)
+        with self._lock:
+            self._subscribers.setdefault(game_id, set()).add(subscription)
+        self._start_poller()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.game_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.game_id]
+                    self._polled.pop(subscription.game_id, None)
+
+    def caught_up(self, game_id, annotation_id):
+        """
+        A stream has read the game from the table up to annotation_id; the
+        poller picks up from the newest such ID.
+        """
+        with self._lock:
+            if game_id in self._subscribers:
+                self._polled[game_id] = max(self._polled.get(game_id, 0), annotation_id)
+
+    def publish(self, game_id, annotations):
+        """Hand newly committed annotations of one game to its subscribers"""
+        if not annotations:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers.get(game_id, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.events.put_nowait(annotations)
+            except queue.Full:
+                # a viewer that stopped reading is cut off; it catches up
+                # from the database when it reconnects
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+                logger.warning(f'Dropped a slow annotation stream for game {game_id}')
+
+    def _start_poller(self):
+        """One poller thread per process (again after a fork)"""
+        if self.app is None or self.fetch is None or self.poll_seconds <= 0:
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+        threading.Thread(target=self._poll_loop, name='annotation-poller', daemon=True).start()
+
+    def _poll_loop(self):
+        while True:
+            time.sleep(self.poll_seconds)
+            with self._lock:
+                games = dict(self._polled)
+            if not games:
+                continue
+            try:
+                with self.app.app_context(), db.connection() as conn:
+                    cursor = conn.cursor()
+                    for game_id, after_id in games.items():
+                        self._poll_game(cursor, game_id, after_id)
+            except Exception as e:
+                logger.error(f'Annotation poller error: {str(e)}')
+
+    def _poll_game(self, cursor, game_id, after_id):
+        annotations = self.fetch(cursor, game_id, after_id)
+        if not annotations:
+            return
+        with self._lock:
+            if game_id not in self._polled:  # its last stream closed meanwhile
+                return
+            # only rows read from the table move this on; rows pushed by
+            # this process don't, as another worker may commit lower IDs later
+            self._polled[game_id] = max([self._polled[game_id]] + [a['annotationID'] for a in annotations])
+        self.publish(game_id, annotations)
+
+    def subscriber_count(self, game_id=None):
+        with self._lock:
+            if game_id is not None:
+                return len(self._subscribers.get(game_id, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+annotation_broker = AnnotationBroker()
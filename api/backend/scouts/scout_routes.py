@@ -1,10 +1,145 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify
 from backend.db_connection import db
+from backend.queries import queries
+from backend.scouts.annotation_broker import annotation_broker
 import logging
 
 logger = logging.getLogger(__name__)
 scouts = Blueprint('scouts', __name__)
 
+# Most annotations one batch request may carry
+ANNOTATION_BATCH_MAX = 500
+
+# Live tags without a player are filed under player 1's report
+DEFAULT_ANNOTATION_PLAYER = 1
+
+# Seconds between keep-alive comments on an idle annotation stream
+STREAM_HEARTBEAT_SECONDS = 15
+
+ANNOTATION_SELECT = '''
+    SELECT a.annotationID, a.gameID, a.footageID, a.text,
+           CAST(a.timestamp AS CHAR) AS timestamp,
+           s.firstName as scout_first, s.lastName as scout_last,
+           pr.playerID, p.firstName as player_first, p.lastName as player_last
+    FROM Annotations a
+    LEFT JOIN Scout s ON a.annotatedBy = s.scoutID
+    LEFT JOIN PlayerReports pr ON a.reportID = pr.reportID
+    LEFT JOIN Players p ON pr.playerID = p.playerID
+'''
+
+
+# Shared with the async read app (backend/async_reads)
+GAME_ANNOTATIONS_QUERY = ANNOTATION_SELECT + '''
+    WHERE a.gameID = %s
+      AND a.annotationID > %s
+    ORDER BY a.timestamp ASC, a.annotationID ASC
+'''
+
+# The `count` annotations one scout just added, starting at first_id
+NEW_ANNOTATIONS_QUERY = ANNOTATION_SELECT + '''
+    WHERE a.annotationID >= %s
+      AND a.annotatedBy <=> %s
+    ORDER BY a.annotationID ASC
+    LIMIT %s
+'''
+
+queries.register('game_annotations', GAME_ANNOTATIONS_QUERY)
+queries.register('new_annotations', NEW_ANNOTATIONS_QUERY)
+
+
+def fetch_game_annotations(cursor, game_id, since=0):
+    """A game's annotations added after annotationID `since`, in game-clock order"""
+    queries.execute(cursor, 'game_annotations', (game_id, since))
+    return cursor.fetchall()
+
+
+def publish_annotations(cursor, first_id, count, annotated_by):
+    """Push just-committed annotations to the game's open streams"""
+    if not annotation_broker.subscriber_count():
+        return
+    queries.execute(cursor, 'new_annotations', (first_id, annotated_by, count))
+
+    by_game = {}
+    for annotation in cursor.fetchall():
+        by_game.setdefault(annotation['gameID'], []).append(annotation)
+    for game_id, annotations in by_game.items():
+        annotation_broker.publish(game_id, annotations)
+
+
+class AnnotationError(Exception):
+    """Raised for a live annotation that cannot be stored (bad or unknown player)"""
+    pass
+
+
+def annotation_player(tag):
+    """The tag's playerID as an int (DEFAULT_ANNOTATION_PLAYER when it has none)"""
+    player_id = tag.get('playerID')
+    if player_id is None or player_id == '':
+        return DEFAULT_ANNOTATION_PLAYER
+    if isinstance(player_id, bool):
+        raise AnnotationError(f'playerID must be an integer, got {player_id!r}')
+    if isinstance(player_id, int):
+        return player_id
+    if isinstance(player_id, str) and player_id.strip().isdigit():
+        return int(player_id)
+    raise AnnotationError(f'playerID must be an integer, got {player_id!r}')
+
+
+def insert_live_annotations(cursor, scout_id, tags):
+    """
+    Insert live annotations for one scout without committing. The
+    scout's report for each player is looked up (or a placeholder
+    created) once per batch, then every annotation goes in with one
+    multi-row INSERT. Returns (first annotationID, playerID -> reportID).
+    Raises AnnotationError before writing anything if a playerID is not
+    an integer or names no player.
+    """
+    tag_players = [annotation_player(t) for t in tags]
+    player_ids = list(dict.fromkeys(tag_players))
+    placeholders = ', '.join(['%s'] * len(player_ids))
+    report_query = f'''
+        SELECT playerID, MIN(reportID) AS reportID
+        FROM PlayerReports
+        WHERE scoutID = %s AND playerID IN ({placeholders})
+        GROUP BY playerID
+    '''
+
+    cursor.execute(report_query, [scout_id] + player_ids)
+    report_ids = {row['playerID']: row['reportID'] for row in cursor.fetchall()}
+
+    missing = [player_id for player_id in player_ids if player_id not in report_ids]
+    if missing:
+        cursor.execute(f"SELECT playerID FROM Players WHERE playerID IN ({', '.join(['%s'] * len(missing))})",
+                       missing)
+        known = {row['playerID'] for row in cursor.fetchall()}
+        unknown = [player_id for player_id in missing if player_id not in known]
+        if unknown:
+            raise AnnotationError(f"Unknown playerID: {', '.join(map(str, unknown))}")
+
+        # Create placeholder reports
+        cursor.execute(f'''
+            INSERT INTO PlayerReports (playerID, scoutID, summary, strengths, weaknesses)
+            VALUES {', '.join(["(%s, %s, 'Live scouting session', '', '')"] * len(missing))}
+        ''', [value for player_id in missing for value in (player_id, scout_id)])
+        cursor.execute(report_query, [scout_id] + player_ids)
+        report_ids = {row['playerID']: row['reportID'] for row in cursor.fetchall()}
+
+    params = []
+    for tag, player_id in zip(tags, tag_players):
+        params.extend((
+            report_ids[player_id],
+            tag.get('gameID'),
+            scout_id,
+            tag.get('text'),
+            tag.get('timestamp', '00:00:00')
+        ))
+    cursor.execute(f'''
+        INSERT INTO Annotations (reportID, gameID, annotatedBy, text, timestamp)
+        VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * len(tags))}
+    ''', params)
+
+    return cursor.lastrowid, report_ids
+
 
 # ------------------------------------------------------------
 # GET /scouts/<scout_id>/player_history - Get scouted players list
@@ -192,9 +327,12 @@ def add_footage_annotation(footage_id):
 
     data = request.json
 
+    # The game is resolved through the footage
     query = '''
-        INSERT INTO Annotations (reportID, annotatedBy, text, timestamp)
-        VALUES (%s, %s, %s, %s)
+        INSERT INTO Annotations (reportID, gameID, footageID, annotatedBy, text, timestamp)
+        SELECT %s, f.gameID, f.footageID, %s, %s, %s
+        FROM Footage f
+        WHERE f.footageID = %s
     '''
 
     cursor = db.get_db().cursor()
@@ -202,11 +340,16 @@ def add_footage_annotation(footage_id):
         data.get('reportID'),
         data.get('annotatedBy'),  # scout_id
         data.get('text'),
-        data.get('timestamp')
+        data.get('timestamp'),
+        footage_id
     ))
+    if cursor.rowcount == 0:
+        return jsonify({'error': 'Footage not found'}), 404
+    annotation_id = cursor.lastrowid
     db.get_db().commit()
+    publish_annotations(cursor, annotation_id, 1, data.get('annotatedBy'))
 
-    return jsonify({'message': 'Annotation added successfully'}), 201
+    return jsonify({'message': 'Annotation added successfully', 'annotationID': annotation_id}), 201
 
 
 # ------------------------------------------------------------
@@ -220,83 +363,157 @@ def add_live_annotation(scout_id):
     """
     logger.info(f'POST /scouts/{scout_id}/annotations route')
 
-    data = request.json
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
     cursor = db.get_db().cursor()
 
     try:
-        player_id = data.get('playerID') or 1  # Default to player 1 for general notes
-
-        # Check if report exists for this scout/player
-        cursor.execute('''
-            SELECT reportID 
-            FROM PlayerReports 
-            WHERE scoutID = %s AND playerID = %s
-            LIMIT 1
-        ''', (scout_id, player_id))
-
-        existing_report = cursor.fetchone()
-
-        if existing_report:
-            report_id = existing_report['reportID']
-        else:
-            # Create placeholder report
-            cursor.execute('''
-                INSERT INTO PlayerReports (playerID, scoutID, summary, strengths, weaknesses)
-                VALUES (%s, %s, 'Live scouting session', '', '')
-            ''', (player_id, scout_id))
-            report_id = cursor.lastrowid
-
-        # Insert annotation
-        cursor.execute('''
-            INSERT INTO Annotations (reportID, annotatedBy, text, timestamp)
-            VALUES (%s, %s, %s, %s)
-        ''', (
-            report_id,
-            scout_id,
-            data.get('text'),
-            data.get('timestamp', '00:00:00')
-        ))
-
+        annotation_id, report_ids = insert_live_annotations(cursor, scout_id, [data])
         db.get_db().commit()
+        publish_annotations(cursor, annotation_id, 1, scout_id)
 
         return jsonify({
             'message': 'Annotation added successfully',
-            'annotationID': cursor.lastrowid,
-            'reportID': report_id
+            'annotationID': annotation_id,
+            'reportID': next(iter(report_ids.values()))
         }), 201
 
+    except AnnotationError as e:
+        db.get_db().rollback()
+        return jsonify({'error': str(e)}), 400
+
     except Exception as e:
         logger.error(f'Error adding annotation: {str(e)}')
         db.get_db().rollback()
         return jsonify({'error': str(e)}), 500
 
 
+# ------------------------------------------------------------
+# POST /scouts/<scout_id>/annotations/batch - Add buffered live annotations
+# [Sara Chin - 2]
+@scouts.route('/scouts/<int:scout_id>/annotations/batch', methods=['POST'])
+def add_live_annotations_batch(scout_id):
+    """
+    Add a batch of live annotations (e.g. buffered quick tags) in one
+    transaction. Body: {"annotations": [{gameID, playerID, text, timestamp}, ...]}
+    """
+    logger.info(f'POST /scouts/{scout_id}/annotations/batch route')
+
+    tags = (request.get_json(silent=True) or {}).get('annotations')
+
+    if not isinstance(tags, list) or not tags or not all(isinstance(t, dict) for t in tags):
+        return jsonify({'error': 'annotations must be a non-empty list of objects'}), 400
+
+    if len(tags) > ANNOTATION_BATCH_MAX:
+        return jsonify({'error': f'At most {ANNOTATION_BATCH_MAX} annotations per request'}), 400
+
+    if not all(t.get('text') for t in tags):
+        return jsonify({'error': 'Every annotation needs text'}), 400
+
+    cursor = db.get_db().cursor()
+
+    try:
+        first_id, report_ids = insert_live_annotations(cursor, scout_id, tags)
+        db.get_db().commit()
+        publish_annotations(cursor, first_id, len(tags), scout_id)
+
+        return jsonify({
+            'message': f'{len(tags)} annotations added successfully',
+            'inserted': len(tags),
+            'firstAnnotationID': first_id,
+            'reportIDs': {str(player_id): report_id for player_id, report_id in report_ids.items()}
+        }), 201
+
+    except AnnotationError as e:
+        db.get_db().rollback()
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        logger.error(f'Error adding annotations: {str(e)}')
+        db.get_db().rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 # ------------------------------------------------------------
 # GET /games/<game_id>/annotations - Get all annotations for a game
 # [Sara Chin - 2]
 @scouts.route('/games/<int:game_id>/annotations', methods=['GET'])
 def get_game_annotations(game_id):
-    """Get all annotations made during a specific game"""
+    """
+    Get the annotations made during a specific game, in game-clock order.
+    ?since=<annotationID> returns only annotations added after that one,
+    so a live page can poll for new tags.
+    """
     logger.info(f'GET /games/{game_id}/annotations route')
 
-    query = '''
-        SELECT a.annotationID, a.text, a.timestamp,
-               s.firstName as scout_first, s.lastName as scout_last,
-               p.firstName as player_first, p.lastName as player_last
-        FROM Annotations a
-        JOIN Scout s ON a.annotatedBy = s.scoutID
-        JOIN PlayerReports pr ON a.reportID = pr.reportID
-        LEFT JOIN Players p ON pr.playerID = p.playerID
-        ORDER BY a.timestamp ASC
-    '''
+    since = request.args.get('since', default=0, type=int)
 
     cursor = db.get_db().cursor()
-    cursor.execute(query)
-    annotations = cursor.fetchall()
+    annotations = fetch_game_annotations(cursor, game_id, since)
 
     return jsonify(annotations), 200
 
 
+# ------------------------------------------------------------
+# GET /games/<game_id>/annotations/stream - Push new annotations as they are added
+# [Sara Chin - 2]
+@scouts.route('/games/<int:game_id>/annotations/stream', methods=['GET'])
+def stream_game_annotations(game_id):
+    """
+    Server-sent events: one "annotations" event (a JSON list) per write,
+    with the highest annotationID as the event id. A reconnecting client
+    sends Last-Event-ID (or ?since=) and first gets what it missed.
+    Writes through this process are pushed at once, writes through other
+    worker processes when the broker's poller next reads the table.
+    """
+    logger.info(f'GET /games/{game_id}/annotations/stream route')
+
+    since = request.headers.get('Last-Event-ID', type=int)
+    if since is None:
+        since = request.args.get('since', default=0, type=int)
+
+    # subscribe before catching up so nothing written in between is lost
+    subscription = annotation_broker.subscribe(game_id)
+    try:
+        backlog = fetch_game_annotations(db.get_db().cursor(), game_id, since)
+    except Exception:
+        annotation_broker.unsubscribe(subscription)
+        raise
+    dumps = current_app.json.dumps
+
+    def event(annotations):
+        last_id = max(a['annotationID'] for a in annotations)
+        return f'id: {last_id}\nevent: annotations\ndata: {dumps(annotations)}\n\n'
+
+    sent = {a['annotationID'] for a in backlog}
+    annotation_broker.caught_up(game_id, max(sent, default=since))
+
+    def events():
+        try:
+            yield 'retry: 3000\n\n'
+            if backlog:
+                yield event(backlog)
+            while not subscription.overflowed:
+                annotations = subscription.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                if annotations is None:
+                    yield ': keep-alive\n\n'
+                    continue
+                # the poller re-reads rows this process already pushed
+                annotations = [a for a in annotations if a['annotationID'] not in sent]
+                if annotations:
+                    sent.update(a['annotationID'] for a in annotations)
+                    yield event(annotations)
+        finally:
+            annotation_broker.unsubscribe(subscription)
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+
 # ------------------------------------------------------------
 # GET /players/<player_id>/schedule - Get player's future games
 # [Sara Chin - 5]
@@ -0,0 +1,123 @@
+#------------------------------------------------------------
+# Server-side cache for expensive stats responses
+#------------------------------------------------------------
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, request
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    def __init__(self, version, body, etag):
+        self.version = version
+        self.body = body
+        self.etag = etag
+        self.stored_at = time.monotonic()
+
+
+class StatsCache:
+    """
+    Caches serialized JSON responses keyed on the route and its filters.
+
+    Every entry is tagged with the data version it was computed under.
+    Routes that write to Game_Stats call bump() after committing, which
+    makes every cached entry stale at once. The TTL bounds how long a
+    worker process can serve data that another process has changed.
+    """
+
+    def __init__(self, ttl=30, max_entries=256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._version = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'not_modified': 0}
+
+    def init_app(self, app):
+        app.config.setdefault('STATS_CACHE_TTL', self.ttl)
+        app.config.setdefault('STATS_CACHE_MAX_ENTRIES', self.max_entries)
+        self.ttl = app.config['STATS_CACHE_TTL']
+        self.max_entries = app.config['STATS_CACHE_MAX_ENTRIES']
+
+    @property
+    def version(self):
+        return self._version
+
+    def bump(self):
+        """Mark every cached entry as stale (call after writing Game_Stats)"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            logger.info(f'Stats data version bumped to {self._version}')
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != self._version:
+                return None
+            if self.ttl and time.monotonic() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, version, body):
+        etag = hashlib.sha1(body).hexdigest()
+        entry = CacheEntry(version, body, etag)
+        with self._lock:
+            # a write may have landed while we were computing
+            if version != self._version:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats['version'] = self._version
+            stats['entries'] = len(self._entries)
+        return stats
+
+
+stats_cache = StatsCache()
+
+
+def cached_json_response(key, compute):
+    """
+    Return a JSON response for key, computing it with compute() on a miss.
+
+    The response carries an ETag of the body, so clients sending
+    If-None-Match get a 304 without the payload.
+    """
+    return cached_response(key, lambda: current_app.json.dumps(compute()).encode('utf-8'),
+                           'application/json')
+
+
+def cached_response(key, compute_body, mimetype):
+    """Like cached_json_response, for a compute_body() that returns the encoded body"""
+    entry = stats_cache.get(key)
+
+    if entry is None:
+        stats_cache.counters['misses'] += 1
+        version = stats_cache.version
+        entry = stats_cache.put(key, version, compute_body())
+    else:
+        stats_cache.counters['hits'] += 1
+
+    response = current_app.response_class(entry.body, mimetype=mimetype)
+    response.set_etag(entry.etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response = response.make_conditional(request)
+
+    if response.status_code == 304:
+        stats_cache.counters['not_modified'] += 1
+
+    return response
@@ -7,6 +7,7 @@
 from backend.rest_entry import create_app
 
 # create the app object
+# (gunicorn serves this object in production: see gunicorn.conf.py)
 app = create_app()
 
 if __name__ == '__main__':
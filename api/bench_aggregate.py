@@ -0,0 +1,99 @@
+###
+# Throughput benchmark for the aggregate stats endpoint
+###
+# Runs a closed loop of concurrent clients against a running API and
+# reports requests/sec and latency percentiles. Compare the development
+# server with gunicorn by running it once against each:
+#
+#   API_SERVER=dev      docker compose up -d api && python bench_aggregate.py
+#   API_SERVER=gunicorn docker compose up -d api && python bench_aggregate.py
+#
+# By default the filters change with every request, so the stats cache
+# does not turn the run into a cache benchmark (--same-query measures the
+# cached path instead).
+import argparse
+import itertools
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# 720 filter combinations, cycled in order: more than the stats cache
+# holds (STATS_CACHE_MAX_ENTRIES, 256), so every request is a cache miss
+POSITIONS = ['', 'PG', 'SG', 'SF', 'PF', 'C']
+MIN_HEIGHTS = ['', '66', '70', '74']
+MIN_POINTS = [''] + [str(points) for points in range(1, 30)]
+
+
+def query_strings(same_query):
+    if same_query:
+        return itertools.repeat('')
+    combos = [
+        '&'.join(f'{k}={v}' for k, v in (('position', p), ('min_height', h), ('min_points', m)) if v)
+        for p, h, m in itertools.product(POSITIONS, MIN_HEIGHTS, MIN_POINTS)
+    ]
+    return itertools.cycle(combos)
+
+
+def run(base_url, concurrency, duration, warmup, same_query):
+    url = f'{base_url.rstrip("/")}/players/stats/aggregate'
+    queries = query_strings(same_query)
+    queries_lock = threading.Lock()
+    latencies = []
+    errors = []
+    record_after = time.perf_counter() + warmup
+    stop_at = record_after + duration
+
+    def client():
+        while True:
+            started = time.perf_counter()
+            if started >= stop_at:
+                return
+            with queries_lock:
+                query = next(queries)
+            try:
+                with urllib.request.urlopen(f'{url}?{query}' if query else url, timeout=30) as response:
+                    response.read()
+                ok = True
+            except (urllib.error.URLError, OSError) as e:
+                ok = False
+                error = str(e)
+            finished = time.perf_counter()
+            if started >= record_after and finished <= stop_at:
+                if ok:
+                    latencies.append(finished - started)
+                else:
+                    errors.append(error)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://localhost:4000')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=20, help='measured seconds')
+    parser.add_argument('--warmup', type=float, default=3, help='unmeasured seconds first')
+    parser.add_argument('--same-query', action='store_true', help='repeat one (cacheable) request')
+    args = parser.parse_args()
+
+    latencies, errors = run(args.url, args.concurrency, args.duration, args.warmup, args.same_query)
+
+    print(f'{args.url}  concurrency={args.concurrency}  duration={args.duration:.0f}s')
+    print(f'requests/sec  {len(latencies) / args.duration:10.1f}')
+    if latencies:
+        ms = sorted(l * 1000 for l in latencies)
+        print(f'latency p50   {statistics.median(ms):10.1f} ms')
+        print(f'latency p95   {ms[int(len(ms) * 0.95) - 1]:10.1f} ms')
+        print(f'latency max   {ms[-1]:10.1f} ms')
+    print(f'errors        {len(errors):10d}' + (f'  (first: {errors[0]})' if errors else ''))
+
+
+if __name__ == '__main__':
+    main()
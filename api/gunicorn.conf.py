@@ -0,0 +1,47 @@
+###
+# Production server settings (gunicorn -c gunicorn.conf.py backend_app:app)
+###
+# Every setting can be overridden from the environment; the defaults suit
+# the single API container in docker-compose.yaml.
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('API_PORT', '4000')}"
+
+# Worker processes, each serving requests from a pool of threads. Most of
+# a request is spent waiting on MySQL, so threads are cheap concurrency.
+# Every worker has its own connection pool: threads should not exceed
+# DB_POOL_MAX_SIZE + DB_POOL_MAX_OVERFLOW, and workers times that has to
+# fit in MySQL's max_connections. An open annotation stream holds a
+# thread for as long as the viewer stays connected.
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+worker_class = 'gthread'
+
+# Seconds an idle client connection is kept open between requests
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+# A worker silent for `timeout` seconds is killed; on restart or SIGHUP
+# workers get `graceful_timeout` seconds to finish in-flight requests
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+
+# Recycle workers now and then (jittered so they do not restart together)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '5000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '500'))
+
+# Import the app once in the master so workers share its code pages.
+# Connection pools and worker threads are per process: the pool is
+# created lazily after the fork, and the export threads are started in
+# post_fork instead of in the master.
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+os.environ.setdefault('EXPORT_AUTOSTART', 'false' if preload_app else 'true')
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    from backend.exports.export_worker import export_worker
+    export_worker.start()
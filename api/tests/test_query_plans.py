@@ -0,0 +1,39 @@
+# Query-plan regression test: fails when a GET route's SQL reads a table
+# in full and that statement is not in FULL_SCANS_ALLOWED
+# (backend/migrations/query_plans.py). Needs the DB_* environment of the
+# API and a seeded, disposable database; skipped when there is none.
+import os
+
+import pytest
+
+REQUIRED_ENV = ['DB_USER', 'MYSQL_ROOT_PASSWORD', 'DB_HOST', 'DB_PORT', 'DB_NAME']
+
+
+@pytest.fixture(scope='module')
+def app():
+    missing = [name for name in REQUIRED_ENV if not os.getenv(name)]
+    if missing:
+        pytest.skip(f"no database configured ({', '.join(missing)} not set)")
+
+    os.environ.setdefault('EXPORT_AUTOSTART', 'false')
+    from backend.db_connection import db
+    from backend.rest_entry import create_app
+
+    app = create_app()
+    try:
+        with app.app_context(), db.connection() as conn:
+            conn.ping(reconnect=False)
+    except Exception as e:
+        pytest.skip(f'database not reachable: {e}')
+    return app
+
+
+def test_no_full_scans_outside_the_allowlist(app):
+    from backend.migrations.query_plans import check_query_plans, normalized
+
+    checked, failures, errors = check_query_plans(app)
+
+    assert checked, 'no GET route ran a SELECT'
+    assert not errors, f'routes failed: {errors}'
+    assert not failures, 'full table scans:\n' + '\n'.join(
+        f'  {rule}: {table} in {normalized(statement)}' for rule, table, statement in failures)
@@ -0,0 +1,168 @@
+import os
+import re
+import threading
+import time
+
+import pyarrow as pa
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# ------------------------ Shared API Client ------------------------
+# Every page talks to the API through these functions instead of calling
+# requests directly:
+#   - one pooled requests.Session for the whole Streamlit process
+#   - a timeout on every request
+#   - GET responses cached per endpoint for a few seconds; identical
+#     GETs made at the same time (or again within one render) share one
+#     request to the API
+#   - a successful POST/PUT/DELETE drops the cached GETs it can affect
+
+API_BASE = os.getenv('API_BASE_URL', 'http://web-api:4000')
+DEFAULT_TIMEOUT = 10
+
+# Seconds a successful GET stays cached, by path; the first match wins.
+# Endpoints a page polls for progress are never cached.
+CACHE_TTLS = [
+    (re.compile(r'^/players/stats/aggregate$'), 30),
+    (re.compile(r'^/admin/statistics$'), 30),
+    (re.compile(r'^/analytics/(metrics|datasets|calculated-metrics|dashboard-summary)$'), 30),
+    (re.compile(r'^/analytics/metric-jobs/'), 0),
+    (re.compile(r'^/analytics/export-requests/'), 0),
+    (re.compile(r'^/games/\d+/annotations'), 0),
+]
+# Long enough that a render asking for the same thing twice asks once
+DEFAULT_TTL = 5
+
+# A write under the first path segment invalidates cached GETs under
+# these segments too (e.g. new game stats change the admin statistics)
+ALSO_INVALIDATES = {
+    'players': ['admin', 'analytics'],
+    'scouts': ['admin', 'games'],
+    'admin': ['players', 'scouts'],
+    'analytics': ['reports'],
+    'reports': ['analytics'],
+}
+
+_session = None
+_session_lock = threading.Lock()
+_cache = {}
+_inflight = {}
+_cache_lock = threading.Lock()
+
+
+def session():
+    """The process-wide pooled session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+
+def cache_ttl(path):
+    for pattern, ttl in CACHE_TTLS:
+        if pattern.search(path):
+            return ttl
+    return DEFAULT_TTL
+
+
+def _segment(path):
+    return path.strip('/').split('/', 1)[0]
+
+
+def _cache_key(path, params):
+    items = sorted((params or {}).items()) if isinstance(params, dict) else params or ()
+    return path, tuple((k, str(v)) for k, v in items)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def get(path, params=None, ttl=None, timeout=DEFAULT_TIMEOUT, stream=False):
+    """
+    GET an API path (e.g. '/players/4'), cached for `ttl` seconds
+    (default: per endpoint). Streamed responses are never cached or shared.
+    """
+    if stream:
+        return session().get(f'{API_BASE}{path}', params=params, timeout=timeout, stream=True)
+
+    ttl = cache_ttl(path) if ttl is None else ttl
+    key = _cache_key(path, params)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.response
+
+    try:
+        response = session().get(f'{API_BASE}{path}', params=params, timeout=timeout)
+        flight.response = response
+        if ttl > 0 and response.status_code == 200:
+            with _cache_lock:
+                _cache[key] = (time.monotonic() + ttl, response)
+        return response
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _cache_lock:
+            del _inflight[key]
+        flight.done.set()
+
+
+def get_frame(path, params=None, ttl=None, timeout=DEFAULT_TIMEOUT):
+    """
+    GET a table endpoint as Arrow and return (response, DataFrame). The
+    DataFrame keeps the API's column types (no pd.to_numeric needed) and
+    is None unless the response is a 200.
+    """
+    response = get(path, params={**(params or {}), 'format': 'arrow'}, ttl=ttl, timeout=timeout)
+    if response.status_code != 200:
+        return response, None
+    return response, pa.ipc.open_stream(response.content).read_pandas()
+
+
+def invalidate(*prefixes):
+    """Drop cached GETs whose path starts with any prefix (all of them if none given)"""
+    with _cache_lock:
+        for key in list(_cache):
+            if not prefixes or key[0].startswith(prefixes):
+                del _cache[key]
+
+
+def _write(method, path, timeout, **kwargs):
+    response = session().request(method, f'{API_BASE}{path}', timeout=timeout, **kwargs)
+    if response.ok:
+        segment = _segment(path)
+        invalidate(*[f'/{s}' for s in [segment] + ALSO_INVALIDATES.get(segment, [])])
+    return response
+
+
+def post(path, json=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    return _write('POST', path, timeout, json=json, **kwargs)
+
+
+def put(path, json=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    return _write('PUT', path, timeout, json=json, **kwargs)
+
+
+def delete(path, timeout=DEFAULT_TIMEOUT, **kwargs):
+    return _write('DELETE', path, timeout, **kwargs)
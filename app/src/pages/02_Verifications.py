@@ -4,7 +4,7 @@ logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
 import pandas as pd
-import requests
+from modules import api_client
 
 st.set_page_config(layout='wide')
 SideBarLinks()
@@ -15,7 +15,7 @@ st.write("### Pending Verifications")
 
 try:
     # Get pending verifications from API
-    response = requests.get('http://web-api:4000/admin/pending-verifications')
+    response = api_client.get('/admin/pending-verifications')
 
     if response.status_code == 200:
         pending_data = response.json()
@@ -89,8 +89,8 @@ if pending is not None and len(pending) > 0:
                     verification_id = selected['Request_ID']
 
                     # Update verification status
-                    update_response = requests.put(
-                        f'http://web-api:4000/players/{player_id}/verifications/{verification_id}',
+                    update_response = api_client.put(
+                        f'/players/{player_id}/verifications/{verification_id}',
                         json={
                             'status': 'approved',
                             'verifiedBy': 1,  # Admin ID
@@ -117,8 +117,8 @@ if pending is not None and len(pending) > 0:
                     verification_id = selected['Request_ID']
 
                     # Update verification status
-                    update_response = requests.put(
-                        f'http://web-api:4000/players/{player_id}/verifications/{verification_id}',
+                    update_response = api_client.put(
+                        f'/players/{player_id}/verifications/{verification_id}',
                         json={
                             'status': 'rejected',
                             'verifiedBy': 1,  # Admin ID
@@ -143,7 +143,7 @@ st.write("### Verification Statistics")
 
 try:
     # Get system statistics from API
-    stats_response = requests.get('http://web-api:4000/admin/statistics')
+    stats_response = api_client.get('/admin/statistics')
 
     if stats_response.status_code == 200:
         stats = stats_response.json()
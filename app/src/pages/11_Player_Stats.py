@@ -4,7 +4,7 @@ logger = logging.getLogger(__name__)
 
 import streamlit as st
 from modules.nav import SideBarLinks
-import requests
+from modules import api_client
 import pandas as pd
 from datetime import date
 
@@ -23,7 +23,7 @@ st.write('### Season Statistics 2024-25')
 
 try:
     # Call the aggregate stats endpoint
-    response = requests.get('http://web-api:4000/players/stats/aggregate')
+    response = api_client.get('/players/stats/aggregate')
 
     if response.status_code == 200:
         all_stats = response.json()
@@ -131,8 +131,8 @@ with st.form("add_stats_form"):
                 }
 
                 # POST to NEW combined endpoint
-                response = requests.post(
-                    f'http://web-api:4000/players/{player_id}/game-and-stats',
+                response = api_client.post(
+                    f'/players/{player_id}/game-and-stats',
                     json=game_and_stats_data
                 )
 
@@ -153,7 +153,7 @@ st.write("---")
 st.write("### Recent Games")
 
 try:
-    games_response = requests.get(f'http://web-api:4000/players/{player_id}/stats')
+    games_response = api_client.get(f'/players/{player_id}/stats')
 
     if games_response.status_code == 200:
         games_data = games_response.json()
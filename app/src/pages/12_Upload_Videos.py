@@ -3,7 +3,7 @@ import logging
 logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
-import requests
+from modules import api_client
 import pandas as pd
 
 st.set_page_config(layout='wide')
@@ -31,8 +31,8 @@ with st.form("upload_video"):
                     'duration': int(duration)
                 }
 
-                response = requests.post(
-                    f'http://web-api:4000/players/{player_id}/videos',
+                response = api_client.post(
+                    f'/players/{player_id}/videos',
                     json=video_data
                 )
 
@@ -54,7 +54,7 @@ st.write("### My Highlight Videos")
 
 try:
     # Get videos from API
-    response = requests.get(f'http://web-api:4000/players/{player_id}/videos')
+    response = api_client.get(f'/players/{player_id}/videos')
 
     if response.status_code == 200:
         videos_data = response.json()
@@ -3,7 +3,7 @@ import logging
 logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
-import requests
+from modules import api_client
 import pandas as pd
 
 st.set_page_config(layout='wide')
@@ -17,7 +17,7 @@ st.write("### Feedback from Scouts")
 
 try:
     # Get feedback from API
-    response = requests.get(f'http://web-api:4000/players/{player_id}/feedback')
+    response = api_client.get(f'/players/{player_id}/feedback')
 
     if response.status_code == 200:
         feedback_list = response.json()
@@ -85,7 +85,7 @@ st.write("---")
 st.write("### Feedback Statistics")
 
 try:
-    response = requests.get(f'http://web-api:4000/players/{player_id}/feedback')
+    response = api_client.get(f'/players/{player_id}/feedback')
 
     if response.status_code == 200:
         feedback_list = response.json()
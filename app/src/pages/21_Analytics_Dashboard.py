@@ -6,7 +6,7 @@ from modules.nav import SideBarLinks
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import requests
+from modules import api_client
 
 st.set_page_config(layout='wide')
 SideBarLinks()
@@ -23,52 +23,37 @@ with col2:
 with col3:
     position = st.selectbox("Position", ["All", "PG", "SG", "SF", "PF", "C", "Guard", "Forward"])
 
-# Key metrics
-st.write("---")
-st.write("### League-Wide Statistics")
-
+# One request for every section below: averages, histograms, leaderboards
+# and the player list are all computed by the API
+summary = None
 try:
-    # Get aggregate stats from API
-    position_filter = "" if position == "All" else f"?position={position}"
-    response = requests.get(f'http://web-api:4000/players/stats/aggregate{position_filter}')
-
+    response = api_client.get('/analytics/dashboard-summary',
+                              params={'position': position, 'league': league})
     if response.status_code == 200:
-        stats_data = response.json()
-
-        if stats_data:
-            df = pd.DataFrame(stats_data)
-
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                # Convert to float to handle Decimal types
-                avg_points = pd.to_numeric(df['avg_points'], errors='coerce').mean()
-                st.metric("Avg Points/Game", f"{avg_points:.1f}")
-            with col2:
-                avg_assists = pd.to_numeric(df['avg_assists'], errors='coerce').mean()
-                st.metric("Avg Assists/Game", f"{avg_assists:.1f}")
-            with col3:
-                avg_rebounds = pd.to_numeric(df['avg_rebounds'], errors='coerce').mean()
-                st.metric("Avg Rebounds/Game", f"{avg_rebounds:.1f}")
-            with col4:
-                st.metric("Players Analyzed", len(stats_data))
-        else:
-            # Fallback metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Avg Points/Game", "18.7", "+2.3")
-            with col2:
-                st.metric("Avg Assists/Game", "5.4", "+0.8")
-            with col3:
-                st.metric("Avg Rebounds/Game", "7.2", "-0.3")
-            with col4:
-                st.metric("Players Analyzed", "0")
+        summary = response.json()
     else:
         st.error(f"Failed to load statistics: {response.status_code}")
-
 except Exception as e:
     st.error(f"Error loading statistics: {str(e)}")
-    col1, col2, col3, col4 = st.columns(4)
+
+# Key metrics
+st.write("---")
+st.write("### League-Wide Statistics")
+
+col1, col2, col3, col4 = st.columns(4)
+
+if summary and summary['league']['players']:
+    league_stats = summary['league']
+    with col1:
+        st.metric("Avg Points/Game", f"{league_stats['points']:.1f}")
+    with col2:
+        st.metric("Avg Assists/Game", f"{league_stats['assists']:.1f}")
+    with col3:
+        st.metric("Avg Rebounds/Game", f"{league_stats['rebounds']:.1f}")
+    with col4:
+        st.metric("Players Analyzed", league_stats['players'])
+else:
+    # Fallback metrics
     with col1:
         st.metric("Avg Points/Game", "18.7", "+2.3")
     with col2:
@@ -76,34 +61,27 @@ except Exception as e:
     with col3:
         st.metric("Avg Rebounds/Game", "7.2", "-0.3")
     with col4:
-        st.metric("Players Analyzed", "847")
+        st.metric("Players Analyzed", "0" if summary else "847")
 
 # Performance distribution
 st.write("---")
 st.write("### Points Per Game Distribution")
 
-try:
-    response = requests.get('http://web-api:4000/players/stats/aggregate')
-
-    if response.status_code == 200:
-        stats_data = response.json()
-
-        if stats_data:
-            ppg_df = pd.DataFrame(stats_data)
-            ppg_df['Points_Per_Game'] = pd.to_numeric(ppg_df['avg_points'], errors='coerce')
-
-            fig = px.histogram(ppg_df, x='Points_Per_Game',
-                               title='Distribution of Points Per Game',
-                               labels={'Points_Per_Game': 'Points Per Game'},
-                               nbins=15)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No data available for distribution")
-    else:
-        st.warning("Using sample distribution data")
-
-except Exception as e:
-    st.warning(f"Using sample distribution data: {str(e)}")
+if summary and summary['distributions']['points']['counts']:
+    histogram = summary['distributions']['points']
+    edges = histogram['edges']
+    fig = go.Figure(go.Bar(
+        x=[(low + high) / 2 for low, high in zip(edges, edges[1:])],
+        y=histogram['counts'],
+        width=[high - low for low, high in zip(edges, edges[1:])]
+    ))
+    fig.update_layout(title='Distribution of Points Per Game',
+                      xaxis_title='Points Per Game', yaxis_title='count', bargap=0)
+    st.plotly_chart(fig, use_container_width=True)
+elif summary:
+    st.info("No data available for distribution")
+else:
+    st.warning("Using sample distribution data")
     ppg_data = pd.DataFrame({
         'Points_Per_Game': [12, 15, 18, 21, 14, 16, 19, 22, 13, 17, 20, 23,
                             11, 14, 18, 21, 15, 19, 24, 16, 13, 17, 20, 25]
@@ -114,6 +92,14 @@ except Exception as e:
                        nbins=20)
     st.plotly_chart(fig, use_container_width=True)
 
+
+def leaderboard(stat, label):
+    """Leaderboard rows from the summary as a Player / label / Games table"""
+    rows = summary['leaderboards'][stat]
+    return pd.DataFrame([{'Player': name, label: value, 'Games': games}
+                         for _, name, value, games in rows])
+
+
 # Top performers
 st.write("---")
 
@@ -122,26 +108,11 @@ col1, col2 = st.columns(2)
 with col1:
     st.write("### Top Scorers")
 
-    try:
-        response = requests.get('http://web-api:4000/players/stats/aggregate?min_points=0')
-
-        if response.status_code == 200:
-            stats_data = response.json()
-
-            if stats_data:
-                df = pd.DataFrame(stats_data)
-                df['Player'] = df['firstName'] + ' ' + df['lastName']
-                df['PPG'] = pd.to_numeric(df['avg_points'], errors='coerce')
-                df['Games'] = df['games_played']
-
-                top_scorers = df.nlargest(5, 'PPG')[['Player', 'PPG', 'Games']]
-                st.dataframe(top_scorers, use_container_width=True)
-            else:
-                st.info("No data available")
-        else:
-            st.warning("Using sample data")
-
-    except Exception as e:
+    if summary and summary['leaderboards']['points']:
+        st.dataframe(leaderboard('points', 'PPG'), use_container_width=True)
+    elif summary:
+        st.info("No data available")
+    else:
         top_scorers = pd.DataFrame({
             'Player': ['Mike Johnson', 'David Lee', 'Chris Wilson', 'Tyler Brown', 'Sam Davis'],
             'PPG': [28.5, 26.3, 24.8, 23.1, 22.7],
@@ -152,26 +123,11 @@ with col1:
 with col2:
     st.write("### Top Assist Leaders")
 
-    try:
-        response = requests.get('http://web-api:4000/players/stats/aggregate')
-
-        if response.status_code == 200:
-            stats_data = response.json()
-
-            if stats_data:
-                df = pd.DataFrame(stats_data)
-                df['Player'] = df['firstName'] + ' ' + df['lastName']
-                df['APG'] = pd.to_numeric(df['avg_assists'], errors='coerce')
-                df['Games'] = df['games_played']
-
-                top_assists = df.nlargest(5, 'APG')[['Player', 'APG', 'Games']]
-                st.dataframe(top_assists, use_container_width=True)
-            else:
-                st.info("No data available")
-        else:
-            st.warning("Using sample data")
-
-    except Exception as e:
+    if summary and summary['leaderboards']['assists']:
+        st.dataframe(leaderboard('assists', 'APG'), use_container_width=True)
+    elif summary:
+        st.info("No data available")
+    else:
         top_assists = pd.DataFrame({
             'Player': ['Emma Clark', 'John Smith', 'Lisa Wang', 'Tom Harris', 'Jake Moore'],
             'APG': [9.2, 8.7, 8.3, 7.9, 7.5],
@@ -183,70 +139,53 @@ with col2:
 st.write("---")
 st.write("### Compare Players")
 
-try:
-    # Get list of players for comparison
-    response = requests.get('http://web-api:4000/players/stats/aggregate')
+if summary and summary['players']['rows']:
+    players_df = pd.DataFrame(summary['players']['rows'], columns=summary['players']['columns'])
+    player_names = players_df['name'].tolist()
 
-    if response.status_code == 200:
-        players_data = response.json()
-
-        if players_data:
-            players_df = pd.DataFrame(players_data)
-            players_df['name'] = players_df['firstName'] + ' ' + players_df['lastName']
-            player_names = players_df['name'].tolist()
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                player1_name = st.selectbox("Player 1", player_names, key="p1")
-            with col2:
-                player2_name = st.selectbox("Player 2", player_names, key="p2")
-
-            # Get stats for selected players
-            player1_data = players_df[players_df['name'] == player1_name].iloc[0]
-            player2_data = players_df[players_df['name'] == player2_name].iloc[0]
-
-            # Radar chart for comparison
-            categories = ['Points', 'Assists', 'Rebounds']
-            player1_stats = [
-                pd.to_numeric(player1_data['avg_points'], errors='coerce'),
-                pd.to_numeric(player1_data['avg_assists'], errors='coerce'),
-                pd.to_numeric(player1_data['avg_rebounds'], errors='coerce')
-            ]
-            player2_stats = [
-                pd.to_numeric(player2_data['avg_points'], errors='coerce'),
-                pd.to_numeric(player2_data['avg_assists'], errors='coerce'),
-                pd.to_numeric(player2_data['avg_rebounds'], errors='coerce')
-            ]
-
-            fig = go.Figure()
-
-            fig.add_trace(go.Scatterpolar(
-                r=player1_stats,
-                theta=categories,
-                fill='toself',
-                name=player1_name
-            ))
-
-            fig.add_trace(go.Scatterpolar(
-                r=player2_stats,
-                theta=categories,
-                fill='toself',
-                name=player2_name
-            ))
-
-            fig.update_layout(
-                polar=dict(radialaxis=dict(visible=True, range=[0, max(max(player1_stats), max(player2_stats)) + 5])),
-                showlegend=True,
-                title="Player Comparison"
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No players available for comparison")
+    col1, col2 = st.columns(2)
 
-except Exception as e:
-    st.warning(f"Using sample comparison data: {str(e)}")
+    with col1:
+        player1_name = st.selectbox("Player 1", player_names, key="p1")
+    with col2:
+        player2_name = st.selectbox("Player 2", player_names, key="p2")
+
+    # Get stats for selected players
+    player1_data = players_df[players_df['name'] == player1_name].iloc[0]
+    player2_data = players_df[players_df['name'] == player2_name].iloc[0]
+
+    # Radar chart for comparison
+    categories = ['Points', 'Assists', 'Rebounds']
+    player1_stats = [player1_data['points'], player1_data['assists'], player1_data['rebounds']]
+    player2_stats = [player2_data['points'], player2_data['assists'], player2_data['rebounds']]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=player1_stats,
+        theta=categories,
+        fill='toself',
+        name=player1_name
+    ))
+
+    fig.add_trace(go.Scatterpolar(
+        r=player2_stats,
+        theta=categories,
+        fill='toself',
+        name=player2_name
+    ))
+
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, max(max(player1_stats), max(player2_stats)) + 5])),
+        showlegend=True,
+        title="Player Comparison"
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+elif summary:
+    st.info("No players available for comparison")
+else:
+    st.warning("Using sample comparison data")
     col1, col2 = st.columns(2)
 
     with col1:
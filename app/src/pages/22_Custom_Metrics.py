@@ -4,7 +4,8 @@ logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
 import pandas as pd
-import requests
+from modules import api_client
+import time
 
 st.set_page_config(layout='wide')
 SideBarLinks()
@@ -18,15 +19,15 @@ st.write("#### Saved Formulas")
 
 try:
     # Get formulas from API
-    response = requests.get('http://web-api:4000/analytics/metrics')
+    response = api_client.get('/analytics/metrics')
 
     if response.status_code == 200:
         formulas_data = response.json()
 
         if formulas_data:
             formulas = pd.DataFrame(formulas_data)
-            display_df = formulas[['formulaID', 'formulaName', 'createdBy', 'dateCreated']].copy()
-            display_df.columns = ['ID', 'Formula Name', 'Created By', 'Date Created']
+            display_df = formulas[['formulaID', 'formulaName', 'expression', 'createdBy', 'dateCreated']].copy()
+            display_df.columns = ['ID', 'Formula Name', 'Formula', 'Created By', 'Date Created']
             st.dataframe(display_df, use_container_width=True)
         else:
             st.info("No formulas created yet")
@@ -62,11 +63,11 @@ with st.form("new_formula"):
 
     st.write("**Available Variables:**")
     st.code(
-        "PTS (points), AST (assists), REB (rebounds), STL (steals), BLK (blocks), TOV (turnovers), MIN (minutes), FGA (field goals attempted), FTA (free throws attempted)")
+        "PTS (points), AST (assists), REB (rebounds), STL (steals), BLK (blocks), TOV (turnovers), MIN (minutes), PF (fouls), TPM (three pointers made)")
 
     formula_description = st.text_area("Formula",
                                        placeholder="e.g., (STL + BLK) / MIN * 100",
-                                       help="Use standard mathematical operators: +, -, *, /, ()")
+                                       help="Use +, -, *, /, ** and (), plus abs(), sqrt(), min() and max()")
 
     description = st.text_area("Description (optional)")
 
@@ -76,8 +77,28 @@ with st.form("new_formula"):
 
     with col1:
         if st.form_submit_button("Test Formula", type="secondary"):
-            st.info("Testing formula with sample data...")
-            st.success("✅ Formula is valid! Sample result: 15.7")
+            try:
+                test_response = api_client.post(
+                    '/analytics/metrics/test',
+                    json={'expression': formula_description}
+                )
+                test_result = test_response.json()
+
+                if test_response.status_code == 200:
+                    samples = pd.DataFrame(test_result['samples'])
+                    if not samples.empty:
+                        samples['Player'] = samples['firstName'] + ' ' + samples['lastName']
+                        st.success(f"✅ Formula is valid! Mean over {len(samples)} recent games: "
+                                   f"{samples['value'].mean():.2f}")
+                        st.dataframe(samples[['Player', 'gameID', 'value']].head(10),
+                                     use_container_width=True)
+                    else:
+                        st.success("✅ Formula is valid (no game stats to test against)")
+                else:
+                    st.error(f"Invalid formula: {test_result.get('error')}")
+
+            except Exception as e:
+                st.error(f"Error testing formula: {str(e)}")
 
     with col2:
         if st.form_submit_button("Save Formula", type="primary"):
@@ -86,17 +107,20 @@ with st.form("new_formula"):
                     # Create formula via API
                     formula_data = {
                         'formulaName': formula_name,
+                        'expression': formula_description,
                         'createdBy': created_by
                     }
 
-                    create_response = requests.post(
-                        'http://web-api:4000/analytics/metrics',
+                    create_response = api_client.post(
+                        '/analytics/metrics',
                         json=formula_data
                     )
 
                     if create_response.status_code in [200, 201]:
                         st.success(f"✅ Formula '{formula_name}' saved successfully!")
                         st.rerun()
+                    elif create_response.status_code == 400:
+                        st.error(f"Invalid formula: {create_response.json().get('error')}")
                     else:
                         st.error(f"Failed to save formula: {create_response.status_code}")
 
@@ -110,7 +134,7 @@ st.write("---")
 st.write("### Manage Formulas")
 
 try:
-    response = requests.get('http://web-api:4000/analytics/metrics')
+    response = api_client.get('/analytics/metrics')
 
     if response.status_code == 200:
         formulas_data = response.json()
@@ -133,8 +157,8 @@ try:
                 st.write("")
                 if st.button("🗑️ Delete Formula", type="secondary"):
                     try:
-                        delete_response = requests.delete(
-                            f'http://web-api:4000/analytics/metrics/{selected_formula_id}'
+                        delete_response = api_client.delete(
+                            f'/analytics/metrics/{selected_formula_id}'
                         )
 
                         if delete_response.status_code == 200:
@@ -156,50 +180,110 @@ st.write("### Apply Formula to Dataset")
 col1, col2 = st.columns(2)
 
 with col1:
-    if formulas is not None and len(formulas) > 0:
-        if 'Formula_Name' in formulas.columns:
-            selected_formula = st.selectbox("Select Formula", formulas['Formula_Name'].tolist())
-        else:
-            selected_formula = st.selectbox("Select Formula", [f['formulaName'] for f in formulas_data])
+    if formulas is not None and 'formulaID' in formulas.columns:
+        formula_names = dict(zip(formulas['formulaID'], formulas['formulaName']))
+        selected_formula_id = st.selectbox("Select Formula", list(formula_names),
+                                           format_func=lambda x: formula_names[x])
     else:
-        selected_formula = st.text_input("Formula Name", value="Player Efficiency Rating")
+        st.info("Save a formula to apply it")
+        selected_formula_id = None
 
 with col2:
-    dataset = st.selectbox("Dataset", ["Current Season", "Last Season", "All Players"])
+    dataset = st.selectbox("Dataset", ["All Games", "Single Player"])
+    player_id = None
+    if dataset == "Single Player":
+        player_id = st.number_input("Player ID", min_value=1, step=1)
 
-if st.button("Calculate Metrics", type="primary"):
+if st.button("Calculate Metrics", type="primary", disabled=selected_formula_id is None):
     st.write("#### Results")
 
     try:
-        # Get player stats to calculate metrics on
-        response = requests.get('http://web-api:4000/players/stats/aggregate')
+        # Score every matching player-game on the server in one pass
+        calc_response = api_client.post(
+            f'/analytics/metrics/{selected_formula_id}/calculate',
+            json={'playerID': player_id}
+        )
+        calc_result = calc_response.json()
+
+        if calc_response.status_code == 201:
+            metrics_response, results_df = api_client.get_frame('/analytics/calculated-metrics')
+            if results_df is None:
+                results_df = pd.DataFrame()
+
+            if not results_df.empty:
+                results_df = results_df[results_df['formulaID'] == selected_formula_id]
+            if player_id is not None and not results_df.empty:
+                results_df = results_df[results_df['playerID'] == player_id]
+
+            if not results_df.empty:
+                results_df['Player'] = results_df['firstName'] + ' ' + results_df['lastName']
+                per_player = (results_df.groupby('Player')['metricValue']
+                              .agg(['mean', 'count'])
+                              .rename(columns={'mean': 'Calculated_Value', 'count': 'Games'})
+                              .sort_values('Calculated_Value', ascending=False)
+                              .reset_index())
+                per_player['Rank'] = range(1, len(per_player) + 1)
+
+                st.dataframe(per_player[['Player', 'Calculated_Value', 'Games', 'Rank']].head(10),
+                             use_container_width=True)
+
+            st.success(f"✅ Scored {calc_result['rowsScored']} player-games "
+                       f"in {calc_result['elapsedMs']} ms")
+        else:
+            st.error(f"Could not calculate metric: {calc_result.get('error')}")
 
-        if response.status_code == 200:
-            players_data = response.json()
+    except Exception as e:
+        st.error(f"Error calculating metrics: {str(e)}")
 
-            if players_data:
-                results_df = pd.DataFrame(players_data)
-                results_df['Player'] = results_df['firstName'] + ' ' + results_df['lastName']
+# Materialize a formula for a whole date range in the background
+st.write("---")
+st.write("### Bulk Materialize Formula")
+
+col1, col2, col3 = st.columns(3)
 
-                # Use points as a simple calculated value for demo
-                results_df['Calculated_Value'] = pd.to_numeric(results_df['avg_points'], errors='coerce')
-                results_df = results_df.sort_values('Calculated_Value', ascending=False)
-                results_df['Rank'] = range(1, len(results_df) + 1)
+with col1:
+    start_date = st.date_input("From", value=None)
+with col2:
+    end_date = st.date_input("To", value=None)
+with col3:
+    player_list = st.text_input("Player IDs (optional)", placeholder="e.g. 1, 2, 5")
 
-                display_results = results_df[['Player', 'Calculated_Value', 'Rank']].head(10)
-                st.dataframe(display_results, use_container_width=True)
-                st.success(f"✅ Metrics calculated for {len(players_data)} players")
+if st.button("Start Materialization", disabled=selected_formula_id is None):
+    try:
+        job_request = {
+            'startDate': start_date.isoformat() if start_date else None,
+            'endDate': end_date.isoformat() if end_date else None,
+            'playerIDs': [int(p) for p in player_list.split(',') if p.strip()] or None
+        }
+        job_response = api_client.post(
+            f'/analytics/metrics/{selected_formula_id}/materialize',
+            json=job_request
+        )
+
+        if job_response.status_code == 202:
+            job_id = job_response.json()['jobID']
+            progress = st.progress(0, text=f"Job #{job_id} queued")
+
+            job = {'status': 'pending'}
+            for _ in range(600):
+                job = api_client.get(f'/analytics/metric-jobs/{job_id}').json()
+                progress.progress(int(job['percentComplete']),
+                                  text=f"Job #{job_id}: {job['rowsDone']} / {job['rowsTotal']} player-games")
+                if job['status'] in ('completed', 'failed'):
+                    break
+                time.sleep(1)
+
+            if job['status'] == 'completed':
+                st.success(f"✅ Materialized {job['rowsDone']} player-games "
+                           f"({job['rowsSkipped']} already up to date)")
+            elif job['status'] == 'failed':
+                st.error(f"Materialization failed: {job['errorMessage']}")
             else:
-                st.info("No player data available")
+                st.info(f"Job #{job_id} is still running in the background")
         else:
-            st.warning("Using sample results")
+            st.error(f"Could not start job: {job_response.json().get('error')}")
 
+    except ValueError:
+        st.error("Player IDs must be comma-separated numbers")
     except Exception as e:
-        st.warning(f"Using sample results: {str(e)}")
-        results = pd.DataFrame({
-            'Player': ['Mike Johnson', 'David Lee', 'Chris Wilson', 'Tyler Brown'],
-            'Calculated_Value': [23.7, 21.4, 19.8, 18.6],
-            'Rank': [1, 2, 3, 4]
-        })
-        st.dataframe(results, use_container_width=True)
-        st.success("✅ Metrics calculated for 847 players")
+        st.error(f"Error starting materialization: {str(e)}")
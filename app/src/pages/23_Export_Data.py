@@ -4,14 +4,89 @@ logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
 import pandas as pd
-import requests
+from modules import api_client
 import json
+import io
+import csv
+import time
 
 st.set_page_config(layout='wide')
 SideBarLinks()
 
 st.title('📥 Export Data')
 
+
+def stream_dataset_csv(preview_rows=10):
+    """
+    Stream /analytics/datasets as NDJSON and write it straight to CSV text.
+    Returns (csv_text, row_count, preview_df), or (None, 0, None) on an API error.
+    """
+    response = api_client.get('/analytics/datasets',
+                              params={'stream': 'ndjson'}, stream=True, timeout=60)
+    if response.status_code != 200:
+        return None, 0, None
+
+    buffer = io.StringIO()
+    writer = None
+    preview = []
+    row_count = 0
+
+    for line in response.iter_lines():
+        if not line:
+            continue
+        row = json.loads(line)
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(row)
+        if row_count < preview_rows:
+            preview.append(row)
+        row_count += 1
+
+    return buffer.getvalue(), row_count, pd.DataFrame(preview)
+
+
+def run_server_export(data_type, format_type, timeout=30):
+    """
+    Queue an export job on the API and wait for the worker to finish it.
+    Returns (export_detail, file_bytes); file_bytes is None if the job
+    failed or is still running when the timeout expires.
+    """
+    response = api_client.post('/analytics/datasets/export', json={
+        'requestedBy': 1,
+        'requestedUserType': 'analyst',
+        'format': format_type,
+        'dataType': data_type
+    })
+    if response.status_code != 201:
+        return {'status': 'failed', 'error': response.text}, None
+
+    export_id = response.json()['exportID']
+    detail = {'exportID': export_id, 'status': 'pending'}
+    deadline = time.time() + timeout
+
+    while time.time() < deadline:
+        detail = api_client.get(f'/analytics/export-requests/{export_id}').json()
+        if detail.get('status') == 'completed':
+            file_response = api_client.get(f'/analytics/export-requests/{export_id}',
+                                           params={'download': 1}, timeout=60)
+            if file_response.status_code == 200:
+                return detail, file_response.content
+            return detail, None
+        if detail.get('status') == 'failed':
+            return detail, None
+        time.sleep(1)
+
+    return detail, None
+
+
+EXPORT_MIME_TYPES = {
+    'CSV': 'text/csv',
+    'JSON': 'application/json',
+    'Parquet': 'application/vnd.apache.parquet'
+}
+
+
 st.write("### Export Player and Game Data")
 
 # Export options
@@ -30,7 +105,7 @@ if export_type == "Player Statistics":
 
     with col2:
         min_games = st.number_input("Minimum Games Played", min_value=0, value=0)
-        format_type = st.selectbox("Export Format", ["CSV", "Excel", "JSON"])
+        format_type = st.selectbox("Export Format", ["CSV", "JSON", "Parquet"])
 
     include_fields = st.multiselect("Fields to Include",
                                     ["Player Info", "Season Stats", "Game-by-Game", "Advanced Metrics"],
@@ -38,62 +113,24 @@ if export_type == "Player Statistics":
 
     if st.button("Generate Export", type="primary"):
         try:
-            # Get player statistics from API
-            response = requests.get('http://web-api:4000/players/stats/aggregate')
-
-            if response.status_code == 200:
-                players_data = response.json()
-
-                if players_data:
-                    df = pd.DataFrame(players_data)
-
-                    # Format the data
-                    df['Player'] = df['firstName'] + ' ' + df['lastName']
-                    df['PPG'] = pd.to_numeric(df['avg_points'], errors='coerce')
-                    df['APG'] = pd.to_numeric(df['avg_assists'], errors='coerce')
-                    df['RPG'] = pd.to_numeric(df['avg_rebounds'], errors='coerce')
-                    df['Games'] = df['games_played']
-
-                    export_df = df[['Player', 'position', 'PPG', 'APG', 'RPG', 'Games']]
-                    export_df.columns = ['Player', 'Position', 'PPG', 'APG', 'RPG', 'Games']
-
-                    st.success(f"✅ Export generated: {len(export_df)} players")
-
-                    st.write("Preview:")
-                    st.dataframe(export_df.head(10), use_container_width=True)
-
-                    # Create export request in database
-                    export_request_data = {
-                        'requestedBy': 1,
-                        'requestedUserType': 'analyst',
-                        'format': format_type,
-                        'dataType': 'Player Stats',
-                        'status': 'completed'
-                    }
-
-                    requests.post('http://web-api:4000/analytics/datasets/export', json=export_request_data)
+            # The API writes the file in the background; we just wait for it
+            with st.spinner("Generating export on the server..."):
+                detail, file_data = run_server_export('Player Stats', format_type)
 
-                    # Generate download based on format
-                    if format_type == "CSV":
-                        data = export_df.to_csv(index=False)
-                        mime = "text/csv"
-                    elif format_type == "JSON":
-                        data = export_df.to_json(orient='records', indent=2)
-                        mime = "application/json"
-                    else:  # Excel
-                        data = export_df.to_csv(index=False)  # Simplified for demo
-                        mime = "text/csv"
+            if file_data is not None:
+                st.success(f"✅ Export #{detail['exportID']} generated ({detail.get('fileSize', 0):,} bytes)")
 
-                    st.download_button(
-                        label=f"📥 Download {format_type}",
-                        data=data,
-                        file_name=f"player_stats_{season}.{format_type.lower()}",
-                        mime=mime
-                    )
-                else:
-                    st.info("No player data available")
+                st.download_button(
+                    label=f"📥 Download {format_type}",
+                    data=file_data,
+                    file_name=detail.get('fileName') or f"player_stats_{season}.{format_type.lower()}",
+                    mime=EXPORT_MIME_TYPES[format_type]
+                )
+            elif detail.get('status') == 'failed':
+                st.error("Export failed on the server")
             else:
-                st.error(f"Failed to load data: {response.status_code}")
+                st.info(f"Export #{detail.get('exportID')} is still {detail.get('status')}. "
+                        "It will appear under Recent Exports when ready.")
 
         except Exception as e:
             st.error(f"Error generating export: {str(e)}")
@@ -113,18 +150,14 @@ elif export_type == "Game Data":
 
     if st.button("Generate Export", type="primary"):
         try:
-            # Get datasets from API
-            response = requests.get('http://web-api:4000/analytics/datasets')
-
-            if response.status_code == 200:
-                game_data = response.json()
-
-                if game_data:
-                    df = pd.DataFrame(game_data)
+            # Stream the dataset as NDJSON so it is never held as one JSON blob
+            csv_data, row_count, preview = stream_dataset_csv()
 
-                    st.success(f"✅ Game data export generated: {len(df)} records")
+            if csv_data is not None:
+                if row_count:
+                    st.success(f"✅ Game data export generated: {row_count} records")
                     st.write("Preview:")
-                    st.dataframe(df.head(10), use_container_width=True)
+                    st.dataframe(preview, use_container_width=True)
 
                     # Create export request
                     export_request_data = {
@@ -135,11 +168,11 @@ elif export_type == "Game Data":
                         'status': 'completed'
                     }
 
-                    requests.post('http://web-api:4000/analytics/datasets/export', json=export_request_data)
+                    api_client.post('/analytics/datasets/export', json=export_request_data)
 
                     st.download_button(
                         label="📥 Download",
-                        data=df.to_csv(index=False),
+                        data=csv_data,
                         file_name=f"game_data.{format_type.lower()}",
                         mime="text/csv"
                     )
@@ -183,7 +216,7 @@ elif export_type == "Scout Reports":
                 'status': 'completed'
             }
 
-            requests.post('http://web-api:4000/analytics/datasets/export', json=export_request_data)
+            api_client.post('/analytics/datasets/export', json=export_request_data)
 
         except Exception as e:
             st.warning(f"Could not log export: {str(e)}")
@@ -196,22 +229,22 @@ else:  # Custom Query
     dataset_type = st.selectbox("Dataset Type",
                                 ["Player Statistics", "Game Statistics", "Competition Context", "Calculated Metrics"])
 
-    format_type = st.selectbox("Export Format", ["CSV", "Excel", "JSON"])
+    format_type = st.selectbox("Export Format", ["CSV", "JSON", "Parquet"])
 
     col1, col2 = st.columns(2)
 
     with col1:
         if st.button("Preview Data", type="secondary"):
             try:
-                response = requests.get('http://web-api:4000/analytics/datasets')
+                # Only the first page is needed for a preview
+                response = api_client.get('/analytics/datasets', params={'limit': 10})
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = response.json()['data']
                     if data:
                         st.write("Preview:")
                         df = pd.DataFrame(data)
-                        st.dataframe(df.head(10), use_container_width=True)
-                        st.info(f"✅ Dataset contains {len(data)} records")
+                        st.dataframe(df, use_container_width=True)
                     else:
                         st.info("No data available")
                 else:
@@ -223,36 +256,22 @@ else:  # Custom Query
     with col2:
         if st.button("Execute & Export", type="primary"):
             try:
-                response = requests.get('http://web-api:4000/analytics/datasets')
-
-                if response.status_code == 200:
-                    data = response.json()
+                with st.spinner("Generating export on the server..."):
+                    detail, file_data = run_server_export(dataset_type, format_type)
 
-                    if data:
-                        df = pd.DataFrame(data)
-
-                        # Create export request
-                        export_request_data = {
-                            'requestedBy': 1,
-                            'requestedUserType': 'analyst',
-                            'format': format_type,
-                            'dataType': dataset_type,
-                            'status': 'completed'
-                        }
-
-                        requests.post('http://web-api:4000/analytics/datasets/export', json=export_request_data)
-
-                        st.success("✅ Export generated successfully")
-                        st.download_button(
-                            label="📥 Download Results",
-                            data=df.to_csv(index=False),
-                            file_name=f"custom_export.{format_type.lower()}",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.info("No data to export")
-                else:
+                if file_data is not None:
+                    st.success("✅ Export generated successfully")
+                    st.download_button(
+                        label="📥 Download Results",
+                        data=file_data,
+                        file_name=detail.get('fileName') or f"custom_export.{format_type.lower()}",
+                        mime=EXPORT_MIME_TYPES[format_type]
+                    )
+                elif detail.get('status') == 'failed':
                     st.error("Failed to generate export")
+                else:
+                    st.info(f"Export #{detail.get('exportID')} is still {detail.get('status')}. "
+                            "It will appear under Recent Exports when ready.")
 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
@@ -263,7 +282,7 @@ st.write("### Recent Exports")
 
 try:
     # Get export requests from API
-    response = requests.get('http://web-api:4000/analytics/export-requests')
+    response = api_client.get('/analytics/export-requests')
 
     if response.status_code == 200:
         exports_data = response.json()
@@ -273,6 +292,29 @@ try:
             display_history = history[['exportID', 'dataType', 'timestamp', 'format', 'status']].copy()
             display_history.columns = ['Export ID', 'Data Type', 'Date', 'Format', 'Status']
             st.dataframe(display_history, use_container_width=True)
+
+            completed_ids = history[history['status'] == 'completed']['exportID'].tolist()
+            if completed_ids:
+                col1, col2 = st.columns(2)
+                with col1:
+                    download_id = st.selectbox("Download a completed export", completed_ids)
+                with col2:
+                    st.write("")
+                    st.write("")
+                    if st.button("Prepare Download"):
+                        file_response = api_client.get(
+                            f'/analytics/export-requests/{download_id}',
+                            params={'download': 1},
+                            timeout=60
+                        )
+                        if file_response.status_code == 200:
+                            st.download_button(
+                                label="📥 Download File",
+                                data=file_response.content,
+                                file_name=f"export_{download_id}"
+                            )
+                        else:
+                            st.warning("That export's file is no longer available")
         else:
             st.info("No export history available")
     else:
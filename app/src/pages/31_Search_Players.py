@@ -3,7 +3,7 @@ import logging
 logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
-import requests
+from modules import api_client
 import pandas as pd
 
 st.set_page_config(layout='wide')
@@ -18,60 +18,54 @@ col1, col2, col3 = st.columns(3)
 with col1:
     position = st.selectbox("Position", ["All", "Guard", "Forward", "PG", "SG", "SF", "PF", "C"])
 with col2:
-    min_height = st.number_input("Min Height (inches)", min_value=60, max_value=90, value=70)
+    min_height = st.number_input("Min Height (inches)", min_value=60, max_value=90, value=60)
 with col3:
     min_points = st.number_input("Min PPG", min_value=0, max_value=50, value=0)
 
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    max_height = st.number_input("Max Height (inches)", min_value=60, max_value=90, value=90)
+with col2:
+    min_weight = st.number_input("Min Weight (lbs)", min_value=0, max_value=400, value=0)
+with col3:
+    max_weight = st.number_input("Max Weight (lbs)", min_value=0, max_value=400, value=400)
+
 if st.button("Search", type='primary'):
     try:
-        # Build query parameters
+        # All filters are applied by the API, so one request covers the search
         params = {'min_points': min_points}
         if position != "All":
             params['position'] = position
+        if min_height > 60:
+            params['min_height'] = min_height
+        if max_height < 90:
+            params['max_height'] = max_height
+        if min_weight > 0:
+            params['min_weight'] = min_weight
+        if max_weight < 400:
+            params['max_weight'] = max_weight
 
         # Get players from aggregate stats API
-        response = requests.get('http://web-api:4000/players/stats/aggregate', params=params)
+        response, df = api_client.get_frame('/players/stats/aggregate', params=params)
 
         if response.status_code == 200:
-            players = response.json()
-
-            if players:
-                df = pd.DataFrame(players)
-
+            if not df.empty:
                 # Format data for display
                 df['Player'] = df['firstName'] + ' ' + df['lastName']
                 df['Position'] = df.get('position', 'N/A')
                 df['Team'] = df.get('team_name', 'N/A')
-                df['PPG'] = pd.to_numeric(df['avg_points'], errors='coerce')
-                df['APG'] = pd.to_numeric(df['avg_assists'], errors='coerce')
-                df['RPG'] = pd.to_numeric(df['avg_rebounds'], errors='coerce')
+                df['Height'] = df.get('height', 'N/A')
+                df['PPG'] = df['avg_points']
+                df['APG'] = df['avg_assists']
+                df['RPG'] = df['avg_rebounds']
                 df['Games'] = df['games_played']
 
-                # Apply height filter if we need to get full player profiles
-                if min_height > 70:
-                    # Get detailed player info for height filtering
-                    filtered_players = []
-                    for player_id in df['playerID'].tolist():
-                        try:
-                            player_response = requests.get(f'http://web-api:4000/players/{player_id}')
-                            if player_response.status_code == 200:
-                                player_data = player_response.json()
-                                if player_data.get('height', 0) >= min_height:
-                                    filtered_players.append(player_id)
-                        except:
-                            pass
-
-                    if filtered_players:
-                        df = df[df['playerID'].isin(filtered_players)]
-                    else:
-                        st.info("No players found matching height criteria")
-                        df = pd.DataFrame()
-
                 if len(df) > 0:
                     st.success(f"Found {len(df)} players matching criteria")
 
                     # Display results
-                    display_df = df[['Player', 'Position', 'Team', 'PPG', 'APG', 'RPG', 'Games']].copy()
+                    display_df = df[['Player', 'Position', 'Team', 'Height', 'PPG', 'APG', 'RPG', 'Games']].copy()
                     st.dataframe(display_df, use_container_width=True)
 
                     # Show detailed view option
@@ -86,7 +80,7 @@ if st.button("Search", type='primary'):
 
                     if st.button("View Full Profile"):
                         try:
-                            profile_response = requests.get(f'http://web-api:4000/players/{selected_player}')
+                            profile_response = api_client.get(f'/players/{selected_player}')
 
                             if profile_response.status_code == 200:
                                 profile = profile_response.json()
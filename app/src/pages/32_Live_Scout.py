@@ -4,6 +4,7 @@ logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks
 import requests
+from modules import api_client
 import pandas as pd
 from datetime import datetime
 
@@ -15,12 +16,17 @@ st.write('Tag and annotate plays during live games')
 
 scout_id = st.session_state.get('user_id', 1)
 
+# Buffered quick tags go out every TAG_FLUSH_SECONDS, or sooner once
+# TAG_FLUSH_SIZE of them are waiting
+TAG_FLUSH_SECONDS = 5
+TAG_FLUSH_SIZE = 10
+
 # Game selection
 st.write("### Select Game to Scout")
 
 try:
     # Get scout's game history to show available games
-    response = requests.get(f'http://web-api:4000/scouts/{scout_id}/game_history')
+    response = api_client.get(f'/scouts/{scout_id}/game_history')
 
     if response.status_code == 200:
         games = response.json()
@@ -50,7 +56,7 @@ with col1:
 
     try:
         # Get game footage for this game
-        footage_response = requests.get(f'http://web-api:4000/players/1/videos')
+        footage_response = api_client.get(f'/players/1/videos')
 
         if footage_response.status_code == 200:
             footage_list = footage_response.json()
@@ -73,73 +79,59 @@ with col1:
 with col2:
     st.write("### Quick Tags")
 
-    # Quick tag buttons with automatic annotation
+    # Quick tags are buffered and sent in batches instead of one request per tap
+    pending_tags = st.session_state.setdefault('pending_tags', [])
+
+    def flush_tags():
+        """Send the buffered tags in one request; keep them if it fails"""
+        if not pending_tags:
+            return False
+        batch = list(pending_tags)
+        try:
+            response = api_client.post(
+                f'/scouts/{scout_id}/annotations/batch',
+                json={'annotations': batch},
+                timeout=5
+            )
+        except requests.RequestException:
+            return False
+        if response.status_code != 201:
+            return False
+        del pending_tags[:len(batch)]
+        return True
+
+    quick_tags = [
+        ("Fast Break", "Fast Break", "fast_break"),
+        ("Assist", "Great Assist", "assist"),
+        ("Rebound", "Strong Rebound", "rebound"),
+    ]
     tag_buttons = st.columns(3)
-    with tag_buttons[0]:
-        if st.button("Fast Break", use_container_width=True, key="fast_break"):
-            quick_annotation = {
-                'gameID': game_id,
-                'playerID': None,
-                'annotatedBy': scout_id,
-                'text': 'Fast Break',
-                'timestamp': datetime.now().strftime("%H:%M:%S")
-            }
-            try:
-                response = requests.post(
-                    f'http://web-api:4000/scouts/{scout_id}/annotations',
-                    json=quick_annotation
-                )
-                if response.status_code == 201:
-                    st.success("Tagged!")
-                    st.rerun()
-                else:
-                    st.error(f"Failed: {response.status_code}")
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
-
-    with tag_buttons[1]:
-        if st.button("Assist", use_container_width=True, key="assist"):
-            quick_annotation = {
-                'gameID': game_id,
-                'playerID': None,
-                'annotatedBy': scout_id,
-                'text': 'Great Assist',
-                'timestamp': datetime.now().strftime("%H:%M:%S")
-            }
-            try:
-                response = requests.post(
-                    f'http://web-api:4000/scouts/{scout_id}/annotations',
-                    json=quick_annotation
-                )
-                if response.status_code == 201:
-                    st.success("Tagged!")
-                    st.rerun()
-                else:
-                    st.error(f"Failed: {response.status_code}")
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
-
-    with tag_buttons[2]:
-        if st.button("Rebound", use_container_width=True, key="rebound"):
-            quick_annotation = {
-                'gameID': game_id,
-                'playerID': None,
-                'annotatedBy': scout_id,
-                'text': 'Strong Rebound',
-                'timestamp': datetime.now().strftime("%H:%M:%S")
-            }
-            try:
-                response = requests.post(
-                    f'http://web-api:4000/scouts/{scout_id}/annotations',
-                    json=quick_annotation
-                )
-                if response.status_code == 201:
-                    st.success("Tagged!")
-                    st.rerun()
-                else:
-                    st.error(f"Failed: {response.status_code}")
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
+    for column, (label, text, key) in zip(tag_buttons, quick_tags):
+        with column:
+            if st.button(label, use_container_width=True, key=key):
+                pending_tags.append({
+                    'gameID': game_id,
+                    'playerID': None,
+                    'text': text,
+                    'timestamp': datetime.now().strftime("%H:%M:%S")
+                })
+                if len(pending_tags) >= TAG_FLUSH_SIZE:
+                    flush_tags()
+
+    @st.fragment(run_every=TAG_FLUSH_SECONDS)
+    def tag_buffer_status():
+        # Runs on its own every few seconds; a full rerun after a flush
+        # pulls the new tags into the annotation list
+        if flush_tags():
+            st.rerun()
+        if pending_tags:
+            st.caption(f"{len(pending_tags)} tag(s) waiting to be sent")
+            # clicking reruns this fragment, which flushes first
+            st.button("Send now", key="flush_tags")
+        else:
+            st.caption("All tags sent")
+
+    tag_buffer_status()
 
 # Annotation form
 st.write("---")
@@ -176,8 +168,8 @@ with st.form("annotation_form"):
                     'timestamp': timestamp
                 }
 
-                response = requests.post(
-                    f'http://web-api:4000/scouts/{scout_id}/annotations',
+                response = api_client.post(
+                    f'/scouts/{scout_id}/annotations',
                     json=annotation_data
                 )
 
@@ -196,12 +188,20 @@ with st.form("annotation_form"):
 st.write("---")
 st.write(f"### Annotations for Game #{game_id}")
 
+# Annotations already pulled for each game; reruns only fetch newer ones
+game_annotations = st.session_state.setdefault('live_annotations', {}).setdefault(game_id, [])
+
 try:
-    # Fetch annotations for current game
-    annotations_response = requests.get(f'http://web-api:4000/games/{game_id}/annotations')
+    since = max((a['annotationID'] for a in game_annotations), default=0)
+    annotations_response = api_client.get(
+        f'/games/{game_id}/annotations',
+        params={'since': since}
+    )
 
     if annotations_response.status_code == 200:
-        annotations_data = annotations_response.json()
+        game_annotations.extend(annotations_response.json())
+        game_annotations.sort(key=lambda a: (a['timestamp'] or '', a['annotationID']))
+        annotations_data = game_annotations
 
         if annotations_data:
             df = pd.DataFrame(annotations_data)
@@ -225,7 +225,7 @@ st.write("---")
 st.write("### Scout Activity")
 
 try:
-    response = requests.get(f'http://web-api:4000/scouts/{scout_id}/game_history')
+    response = api_client.get(f'/scouts/{scout_id}/game_history')
 
     if response.status_code == 200:
         games_attended = response.json()
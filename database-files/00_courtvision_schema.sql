@@ -4,6 +4,10 @@ CREATE DATABASE courtvision;
 USE courtvision;
 
 
+DROP TABLE IF EXISTS Player_Level_Totals;
+DROP TABLE IF EXISTS Player_Totals;
+DROP TABLE IF EXISTS DashboardSnapshots;
+DROP TABLE IF EXISTS MetricJobs;
 DROP TABLE IF EXISTS CalculatedMetrics;
 DROP TABLE IF EXISTS Annotations;
 DROP TABLE IF EXISTS PlayerReports;
@@ -29,6 +33,17 @@ DROP TABLE IF EXISTS Game;
 DROP TABLE IF EXISTS School;
 DROP TABLE IF EXISTS Team;
 DROP TABLE IF EXISTS Players;
+DROP TABLE IF EXISTS SchemaMigrations;
+
+
+-- BEGIN GENERATED TABLES (python -m backend.schema --write ...; edit api/backend/schema/registry.py)
+-- SchemaMigrations - Versions from api/backend/migrations/versions already
+-- applied; a fresh database built from this file includes all of them
+CREATE TABLE SchemaMigrations (
+   version VARCHAR(20) PRIMARY KEY,
+   name VARCHAR(100),
+   appliedAt DATETIME DEFAULT CURRENT_TIMESTAMP
+);
 
 
 -- INDEPENDENT
@@ -46,7 +61,8 @@ CREATE TABLE Players (
    weight INT,
    AcctStatus VARCHAR(20) DEFAULT 'active',
    INDEX idx_player_name (lastName, firstName),
-   INDEX idx_player_email (email)
+   INDEX idx_player_email (email),
+   INDEX idx_player_height_weight (height, weight)
 );
 
 
@@ -118,7 +134,8 @@ CREATE TABLE Dashboard (
    metricDisplayed VARCHAR(100),
    chartType VARCHAR(50),
    lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-   filterCriteria TEXT
+   filterCriteria TEXT,
+   INDEX idx_dashboard_updated (lastUpdated)
 );
 
 
@@ -126,9 +143,12 @@ CREATE TABLE Dashboard (
 CREATE TABLE MetricsFormulas (
    formulaID INT AUTO_INCREMENT PRIMARY KEY,
    formulaName VARCHAR(100) NOT NULL,
+   expression TEXT,
    createdBy TEXT,
    dateCreated DATETIME DEFAULT CURRENT_TIMESTAMP,
-   INDEX idx_formula_name (formulaName)
+   lastModified DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+   INDEX idx_formula_name (formulaName),
+   INDEX idx_formula_created (dateCreated)
 );
 
 
@@ -146,7 +166,8 @@ CREATE TABLE ExportRequest (
        FOREIGN KEY (requestedBy) REFERENCES SystemAdmin(adminID)
        ON UPDATE CASCADE
        ON DELETE SET NULL,
-   INDEX idx_export_status (status)
+   INDEX idx_exportrequest_status_time (status, timestamp),
+   INDEX idx_exportrequest_time (timestamp)
 );
 
 
@@ -171,7 +192,8 @@ CREATE TABLE Playsin (
    CONSTRAINT fk_playsin_team
        FOREIGN KEY (team_id) REFERENCES Team(team_id)
        ON UPDATE CASCADE
-       ON DELETE CASCADE
+       ON DELETE CASCADE,
+   INDEX idx_playsin_position_player (position, playerID)
 );
 
 
@@ -179,8 +201,6 @@ CREATE TABLE Playsin (
 CREATE TABLE PlayerSchedule (
    playerID INT NOT NULL,
    gameID INT NOT NULL,
-
-
    PRIMARY KEY (playerID, gameID),
    CONSTRAINT fk_playersched_player
        FOREIGN KEY (playerID) REFERENCES Players(playerID)
@@ -311,6 +331,7 @@ CREATE TABLE Game_Stats (
    turnovers INT,
    fouls INT,
    three_pt INT,
+   lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
    PRIMARY KEY (gameID, playerID),
    CONSTRAINT fk_gamestats_game
        FOREIGN KEY (gameID) REFERENCES Game(gameID)
@@ -323,6 +344,52 @@ CREATE TABLE Game_Stats (
 );
 
 
+-- Player_Totals - Running per-player sums of Game_Stats, kept in step
+-- by the API on every stat insert/update/delete
+CREATE TABLE Player_Totals (
+   playerID INT PRIMARY KEY,
+   gamesPlayed INT NOT NULL DEFAULT 0,
+   minutes INT NOT NULL DEFAULT 0,
+   points INT NOT NULL DEFAULT 0,
+   rebounds INT NOT NULL DEFAULT 0,
+   assists INT NOT NULL DEFAULT 0,
+   steals INT NOT NULL DEFAULT 0,
+   blocks INT NOT NULL DEFAULT 0,
+   turnovers INT NOT NULL DEFAULT 0,
+   fouls INT NOT NULL DEFAULT 0,
+   three_pt INT NOT NULL DEFAULT 0,
+   lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+   CONSTRAINT fk_playertotals_player
+       FOREIGN KEY (playerID) REFERENCES Players(playerID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE
+);
+
+
+-- Player_Level_Totals - Same sums split by competition level (team league)
+CREATE TABLE Player_Level_Totals (
+   playerID INT NOT NULL,
+   competitionLevel VARCHAR(50) NOT NULL,
+   gamesPlayed INT NOT NULL DEFAULT 0,
+   minutes INT NOT NULL DEFAULT 0,
+   points INT NOT NULL DEFAULT 0,
+   rebounds INT NOT NULL DEFAULT 0,
+   assists INT NOT NULL DEFAULT 0,
+   steals INT NOT NULL DEFAULT 0,
+   blocks INT NOT NULL DEFAULT 0,
+   turnovers INT NOT NULL DEFAULT 0,
+   fouls INT NOT NULL DEFAULT 0,
+   three_pt INT NOT NULL DEFAULT 0,
+   lastUpdated DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+   PRIMARY KEY (playerID, competitionLevel),
+   CONSTRAINT fk_leveltotals_player
+       FOREIGN KEY (playerID) REFERENCES Players(playerID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE,
+   INDEX idx_leveltotals_level (competitionLevel)
+);
+
+
 -- PlayerReports - Scout reports on players
 CREATE TABLE PlayerReports (
    reportID INT AUTO_INCREMENT PRIMARY KEY,
@@ -339,7 +406,8 @@ CREATE TABLE PlayerReports (
        FOREIGN KEY (scoutID) REFERENCES Scout(scoutID)
        ON UPDATE CASCADE
        ON DELETE CASCADE,
-   INDEX idx_report_player (playerID)
+   INDEX idx_report_player (playerID),
+   INDEX idx_report_scout_player (scoutID, playerID)
 );
 
 
@@ -361,7 +429,7 @@ CREATE TABLE Offers (
        FOREIGN KEY (schoolID) REFERENCES School(schoolID)
        ON UPDATE CASCADE
        ON DELETE CASCADE,
-   INDEX idx_offer_status (status),
+   INDEX idx_offer_status_school (status, schoolID),
    INDEX idx_offer_date (offerDate)
 );
 
@@ -390,6 +458,8 @@ CREATE TABLE Footage (
 CREATE TABLE Annotations (
    annotationID INT AUTO_INCREMENT PRIMARY KEY,
    reportID INT,
+   gameID INT,
+   footageID INT,
    annotatedBy INT,
    text TEXT,
    timestamp TIME,
@@ -397,10 +467,20 @@ CREATE TABLE Annotations (
        FOREIGN KEY (reportID) REFERENCES PlayerReports(reportID)
        ON UPDATE CASCADE
        ON DELETE SET NULL,
+   CONSTRAINT fk_annotations_game
+       FOREIGN KEY (gameID) REFERENCES Game(gameID)
+       ON UPDATE CASCADE
+       ON DELETE SET NULL,
+   CONSTRAINT fk_annotations_footage
+       FOREIGN KEY (footageID) REFERENCES Footage(footageID)
+       ON UPDATE CASCADE
+       ON DELETE SET NULL,
    CONSTRAINT fk_annotations_scout
        FOREIGN KEY (annotatedBy) REFERENCES Scout(scoutID)
        ON UPDATE CASCADE
-       ON DELETE SET NULL
+       ON DELETE SET NULL,
+   INDEX idx_annotation_report_time (reportID, timestamp),
+   INDEX idx_annotation_game_time (gameID, timestamp)
 );
 
 
@@ -411,6 +491,7 @@ CREATE TABLE CalculatedMetrics (
    playerID INT,
    formulaID INT NOT NULL,
    metricName VARCHAR(100),
+   metricValue DOUBLE,
    calcTimestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
    CONSTRAINT fk_calcmetrics_game
        FOREIGN KEY (gameID) REFERENCES Game(gameID)
@@ -424,8 +505,49 @@ CREATE TABLE CalculatedMetrics (
        FOREIGN KEY (formulaID) REFERENCES MetricsFormulas(formulaID)
        ON UPDATE CASCADE
        ON DELETE CASCADE,
+   UNIQUE KEY uq_metric_formula_game_player (formulaID, gameID, playerID),
    INDEX idx_metric_game (gameID),
-   INDEX idx_metric_player (playerID)
+   INDEX idx_metric_player (playerID),
+   INDEX idx_metric_calc_time (calcTimestamp)
+);
+
+
+-- DashboardSnapshots - Precomputed, gzip-compressed dashboard payloads
+CREATE TABLE DashboardSnapshots (
+   dashboardID INT PRIMARY KEY,
+   payload MEDIUMBLOB NOT NULL,
+   payloadBytes INT,
+   rawBytes INT,
+   computeMs INT,
+   computedAt DATETIME(6) NOT NULL,
+   CONSTRAINT fk_snapshots_dashboard
+       FOREIGN KEY (dashboardID) REFERENCES Dashboard(dashboardID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE
+);
+
+
+-- MetricJobs - Background jobs that materialize a formula over many games
+CREATE TABLE MetricJobs (
+   jobID INT AUTO_INCREMENT PRIMARY KEY,
+   formulaID INT NOT NULL,
+   requestedBy INT,
+   startDate DATE,
+   endDate DATE,
+   playerIDs TEXT,
+   status VARCHAR(20) DEFAULT 'pending',
+   rowsTotal INT DEFAULT 0,
+   rowsDone INT DEFAULT 0,
+   rowsSkipped INT DEFAULT 0,
+   errorMessage TEXT,
+   createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+   startedAt DATETIME,
+   completedAt DATETIME,
+   CONSTRAINT fk_metricjobs_formula
+       FOREIGN KEY (formulaID) REFERENCES MetricsFormulas(formulaID)
+       ON UPDATE CASCADE
+       ON DELETE CASCADE,
+   INDEX idx_metricjobs_status (status)
 );
 
 
@@ -466,7 +588,7 @@ CREATE TABLE UserReported (
        FOREIGN KEY (reviewedBy) REFERENCES SystemAdmin(adminID)
        ON UPDATE CASCADE
        ON DELETE SET NULL,
-   INDEX idx_report_status (status),
+   INDEX idx_userreported_status_severity (status, severity, reportDate),
    INDEX idx_report_type (reportedUserType)
 );
 
@@ -491,7 +613,8 @@ CREATE TABLE Verification (
        FOREIGN KEY (verifiedBy) REFERENCES SystemAdmin(adminID)
        ON UPDATE CASCADE
        ON DELETE SET NULL,
-   INDEX idx_verification_status (status)
+   INDEX idx_verification_player_date (playerID, submittedDate),
+   INDEX idx_verification_status_date (status, submittedDate)
 );
 
 
@@ -510,7 +633,8 @@ CREATE TABLE Validation (
        FOREIGN KEY (validatedBy) REFERENCES SystemAdmin(adminID)
        ON UPDATE CASCADE
        ON DELETE SET NULL,
-   INDEX idx_validation_entity (entityType, entityID)
+   INDEX idx_validation_entity (entityType, entityID),
+   INDEX idx_validation_valid_date (isValid, validatedDate)
 );
 
 
@@ -527,7 +651,8 @@ CREATE TABLE Reports (
        FOREIGN KEY (createdBy) REFERENCES SystemAdmin(adminID)
        ON UPDATE CASCADE
        ON DELETE SET NULL,
-   INDEX idx_report_type (reportType)
+   INDEX idx_report_type (reportType),
+   INDEX idx_reports_created (createdDate)
 );
 
 
@@ -565,6 +690,12 @@ CREATE TABLE Metric_Export (
        ON UPDATE CASCADE
        ON DELETE CASCADE
 );
+-- END GENERATED TABLES
+
+INSERT INTO SchemaMigrations (version, name) VALUES
+('0001', 'route_indexes'),
+('0002', 'annotation_game'),
+('0003', 'catch_up_tables');
 
 
 -- Display all tables
@@ -581,11 +712,15 @@ TRUNCATE TABLE Metric_Export;
 TRUNCATE TABLE Exports;
 TRUNCATE TABLE UserReported;
 TRUNCATE TABLE DashboardMetrics;
+TRUNCATE TABLE DashboardSnapshots;
+TRUNCATE TABLE MetricJobs;
 TRUNCATE TABLE CalculatedMetrics;
 TRUNCATE TABLE Annotations;
 TRUNCATE TABLE Footage;
 TRUNCATE TABLE Offers;
 TRUNCATE TABLE PlayerReports;
+TRUNCATE TABLE Player_Level_Totals;
+TRUNCATE TABLE Player_Totals;
 TRUNCATE TABLE Game_Stats;
 TRUNCATE TABLE Player_Stats;
 TRUNCATE TABLE Season_Stats;
@@ -665,9 +800,9 @@ INSERT INTO Dashboard (dashboardName, metricDisplayed, chartType, filterCriteria
 
 
 -- Metric formulas
-INSERT INTO MetricsFormulas (formulaName, createdBy, dateCreated) VALUES
-('Player Efficiency Rating', 'System', '2024-01-15 10:00:00'),
-('True Shooting Percentage', 'System', '2024-01-15 10:30:00');
+INSERT INTO MetricsFormulas (formulaName, expression, createdBy, dateCreated) VALUES
+('Player Efficiency Rating', '(PTS + AST + REB - TOV) / MIN', 'System', '2024-01-15 10:00:00'),
+('True Shooting Percentage', NULL, 'System', '2024-01-15 10:30:00');
 
 
 -- Export requests
@@ -738,6 +873,31 @@ INSERT INTO Game_Stats (gameID, playerID, minutes, points, rebounds, assists, st
 (1, 3, 28, 19, 4, 6, 1, 0, 2, 3, 3);
 
 
+-- Player rollups (the API keeps these in step after this initial build;
+-- `flask --app backend_app rebuild-rollups` recomputes them)
+INSERT INTO Player_Totals (playerID, gamesPlayed, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, three_pt)
+SELECT gs.playerID, COUNT(*),
+       COALESCE(SUM(gs.minutes), 0), COALESCE(SUM(gs.points), 0), COALESCE(SUM(gs.rebounds), 0),
+       COALESCE(SUM(gs.assists), 0), COALESCE(SUM(gs.steals), 0), COALESCE(SUM(gs.blocks), 0),
+       COALESCE(SUM(gs.turnovers), 0), COALESCE(SUM(gs.fouls), 0), COALESCE(SUM(gs.three_pt), 0)
+FROM Game_Stats gs
+GROUP BY gs.playerID;
+
+
+INSERT INTO Player_Level_Totals (playerID, competitionLevel, gamesPlayed, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, three_pt)
+SELECT gs.playerID, lv.competitionLevel, COUNT(*),
+       COALESCE(SUM(gs.minutes), 0), COALESCE(SUM(gs.points), 0), COALESCE(SUM(gs.rebounds), 0),
+       COALESCE(SUM(gs.assists), 0), COALESCE(SUM(gs.steals), 0), COALESCE(SUM(gs.blocks), 0),
+       COALESCE(SUM(gs.turnovers), 0), COALESCE(SUM(gs.fouls), 0), COALESCE(SUM(gs.three_pt), 0)
+FROM Game_Stats gs
+JOIN (
+   SELECT DISTINCT pin.playerID, COALESCE(t.league, 'Unknown') AS competitionLevel
+   FROM Playsin pin
+   JOIN Team t ON pin.team_id = t.team_id
+) lv ON lv.playerID = gs.playerID
+GROUP BY gs.playerID, lv.competitionLevel;
+
+
 -- =========================
 -- Scouting / reports / offers
 -- =========================
@@ -775,15 +935,15 @@ INSERT INTO Footage (gameID, playerID, URL, duration) VALUES
 
 
 -- Annotations (only existing scouts)
-INSERT INTO Annotations (reportID, annotatedBy, text, timestamp) VALUES
-(1, 1, 'Excellent defensive possession', '00:05:23'),
-(1, 2, 'Great court vision on assist', '00:12:45');
+INSERT INTO Annotations (reportID, gameID, footageID, annotatedBy, text, timestamp) VALUES
+(1, 1, 1, 1, 'Excellent defensive possession', '00:05:23'),
+(1, 1, 1, 2, 'Great court vision on assist', '00:12:45');
 
 
 -- Calculated metrics
-INSERT INTO CalculatedMetrics (gameID, playerID, formulaID, metricName, calcTimestamp) VALUES
-(1, 1, 1, 'Player Efficiency Rating', '2024-11-15 22:00:00'),
-(1, 2, 1, 'Player Efficiency Rating', '2024-11-15 22:00:00');
+INSERT INTO CalculatedMetrics (gameID, playerID, formulaID, metricName, metricValue, calcTimestamp) VALUES
+(1, 1, 1, 'Player Efficiency Rating', 1.3143, '2024-11-15 22:00:00'),
+(1, 2, 1, 'Player Efficiency Rating', 1.0, '2024-11-15 22:00:00');
 
 
 -- Dashboard ↔ metrics
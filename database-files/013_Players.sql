@@ -1,40 +0,0 @@
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('1', 'Annabelle', 'Sibbs', 'asibbs0@devhub.com', '1/23/2025', '18', '595-255-1118', 'Passionate about technology and innovation. Enjoys hiking and photography.', '140.06', '282.5', 'inactive', 'Small Forward', '19');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('2', 'Rubie', 'Culwen', 'rculwen1@freewebs.com', '9/6/2025', '26', '525-952-1108', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '214.18', '224.37', 'pending', 'Shooting Guard', '14');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('3', 'Brandie', 'Mathieu', 'bmathieu2@google.fr', '11/3/2025', '18', '242-345-5111', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '149.27', '276.06', 'inactive', 'Power Forward', '11');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('4', 'Mauricio', 'Mantram', 'mmantram3@yelp.com', '6/5/2025', '26', '981-110-2169', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '211.86', '162.71', 'pending', 'Power Forward', '1');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('5', 'Georgina', 'Pepi', 'gpepi4@multiply.com', '1/8/2025', '16', '682-446-2580', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '204.59', '224.42', 'inactive', 'Shooting Guard', '7');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('6', 'Amabelle', 'M''Chirrie', 'amchirrie5@nasa.gov', '5/5/2025', '24', '752-476-0189', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '146.05', '105.23', 'pending', 'Small Forward', '12');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('7', 'Lorinda', 'Candish', 'lcandish6@list-manage.com', '8/26/2025', '38', '932-647-5978', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '193.13', '250.89', 'pending', 'Point Guard', '38');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('8', 'Almeta', 'Norgate', 'anorgate7@ebay.com', '1/16/2025', '21', '718-671-4413', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '219.08', '134.25', 'inactive', 'Power Forward', '17');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('9', 'Charisse', 'Dabnot', 'cdabnot8@bloomberg.com', '5/17/2025', '37', '875-797-6077', 'Passionate about technology and innovation. Enjoys hiking and photography.', '195.92', '256.49', 'active', 'Center', '25');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('10', 'Rance', 'Gerritsma', 'rgerritsma9@purevolume.com', '1/8/2025', '33', '957-608-6759', 'Passionate about technology and innovation. Enjoys hiking and photography.', '144.52', '162.86', 'active', 'Point Guard', '34');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('11', 'Webster', 'Duester', 'wduestera@ehow.com', '9/30/2025', '33', '357-900-1537', 'Passionate about technology and innovation. Enjoys hiking and photography.', '147.11', '202.0', 'active', 'Power Forward', '30');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('12', 'Gussie', 'Picott', 'gpicottb@nyu.edu', '11/6/2025', '24', '738-813-5856', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '193.67', '106.13', 'active', 'Shooting Guard', '18');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('13', 'Cristobal', 'Iacovino', 'ciacovinoc@chronoengine.com', '4/9/2025', '28', '491-521-7319', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '210.51', '130.61', 'active', 'Shooting Guard', '21');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('14', 'Trev', 'Jozsa', 'tjozsad@nsw.gov.au', '10/11/2025', '16', '839-171-8600', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '207.67', '170.16', 'active', 'Power Forward', '29');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('15', 'Leilah', 'Lyman', 'llymane@buzzfeed.com', '1/14/2025', '25', '184-731-8962', 'Passionate about technology and innovation. Enjoys hiking and photography.', '178.71', '122.32', 'active', 'Shooting Guard', '4');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('16', 'Valeda', 'Barkway', 'vbarkwayf@ovh.net', '2/18/2025', '39', '713-800-4088', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '151.04', '128.57', 'inactive', 'Small Forward', '3');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('17', 'Nils', 'Strewther', 'nstrewtherg@oaic.gov.au', '6/29/2025', '40', '919-361-8001', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '163.33', '270.05', 'pending', 'Point Guard', '28');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('18', 'Hermione', 'Ephgrave', 'hephgraveh@biglobe.ne.jp', '10/20/2025', '30', '281-381-4800', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '168.22', '207.8', 'active', 'Shooting Guard', '37');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('19', 'Willis', 'Casol', 'wcasoli@ebay.com', '3/16/2025', '24', '628-250-6302', 'Passionate about technology and innovation. Enjoys hiking and photography.', '146.92', '191.76', 'inactive', 'Center', '32');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('20', 'Ellsworth', 'Fattorini', 'efattorinij@washington.edu', '3/17/2025', '24', '871-815-5109', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '155.96', '117.04', 'pending', 'Power Forward', '35');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('21', 'Manda', 'McRobert', 'mmcrobertk@examiner.com', '2/23/2025', '34', '766-275-5195', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '185.69', '104.78', 'inactive', 'Small Forward', '24');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('22', 'Delano', 'MacAree', 'dmacareel@people.com.cn', '8/25/2025', '31', '804-669-0953', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '171.03', '143.47', 'active', 'Point Guard', '5');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('23', 'Kelly', 'Gemeau', 'kgemeaum@soundcloud.com', '8/7/2025', '17', '378-713-8495', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '157.74', '188.42', 'pending', 'Center', '33');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('24', 'Bethany', 'Storry', 'bstorryn@tmall.com', '11/12/2025', '37', '262-849-3845', 'Passionate about technology and innovation. Enjoys hiking and photography.', '152.2', '228.82', 'inactive', 'Center', '27');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('25', 'Quent', 'Partridge', 'qpartridgeo@merriam-webster.com', '6/2/2025', '29', '312-704-4695', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '165.69', '248.67', 'pending', 'Power Forward', '23');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('26', 'Martha', 'Skeel', 'mskeelp@dion.ne.jp', '1/30/2025', '22', '646-986-2300', 'Passionate about technology and innovation. Enjoys hiking and photography.', '213.16', '246.68', 'pending', 'Point Guard', '10');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('27', 'Selestina', 'Grieveson', 'sgrievesonq@typepad.com', '3/22/2025', '28', '511-759-8429', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '171.17', '171.01', 'active', 'Shooting Guard', '8');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('28', 'Sharleen', 'Polding', 'spoldingr@bluehost.com', '5/11/2025', '15', '964-423-2552', 'Passionate about technology and innovation. Enjoys hiking and photography.', '201.12', '295.25', 'active', 'Shooting Guard', '6');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('29', 'Dyanna', 'Tuftin', 'dtuftins@netscape.com', '3/20/2025', '17', '952-582-4029', 'Passionate about technology and innovation. Enjoys hiking and photography.', '183.89', '242.14', 'pending', 'Point Guard', '39');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('30', 'Caye', 'Vedyashkin', 'cvedyashkint@mtv.com', '11/27/2025', '28', '215-704-8506', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '170.73', '223.42', 'inactive', 'Center', '40');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('31', 'Dell', 'Crosgrove', 'dcrosgroveu@diigo.com', '9/8/2025', '14', '507-114-4054', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '205.59', '257.67', 'pending', 'Point Guard', '9');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('32', 'Catriona', 'Vasyagin', 'cvasyaginv@seesaa.net', '3/24/2025', '14', '403-457-7195', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '165.08', '118.13', 'pending', 'Power Forward', '22');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('33', 'Josefina', 'MacDermid', 'jmacdermidw@ow.ly', '3/6/2025', '25', '714-874-2684', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '193.86', '155.69', 'pending', 'Power Forward', '31');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('34', 'Rogers', 'Bailie', 'rbailiex@chronoengine.com', '3/5/2025', '14', '832-489-1221', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '213.61', '197.03', 'active', 'Shooting Guard', '36');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('35', 'Carlita', 'Rajchert', 'crajcherty@huffingtonpost.com', '5/4/2025', '14', '597-518-5657', 'Passionate about technology and innovation. Enjoys hiking and photography.', '214.0', '175.99', 'pending', 'Shooting Guard', '20');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('36', 'Merlina', 'Andrysek', 'mandrysekz@twitpic.com', '8/6/2025', '23', '894-892-1894', 'Passionate about technology and innovation. Enjoys hiking and photography.', '181.1', '132.44', 'active', 'Small Forward', '26');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('37', 'Row', 'Richten', 'rrichten10@live.com', '10/21/2025', '21', '770-202-4584', 'Passionate about technology and innovation. Enjoys hiking and photography.', '160.01', '253.01', 'inactive', 'Shooting Guard', '15');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('38', 'Hedda', 'Coleson', 'hcoleson11@twitter.com', '3/4/2025', '19', '998-342-8470', 'Loves cooking and trying out new recipes. Avid reader and movie buff.', '214.46', '207.25', 'pending', 'Small Forward', '13');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('39', 'Berenice', 'Hearnshaw', 'bhearnshaw12@fotki.com', '3/27/2025', '23', '436-680-5265', 'Travel enthusiast who enjoys exploring new cultures and cuisines. Animal lover and volunteer at local shelter.', '147.09', '269.94', 'inactive', 'Point Guard', '2');
-INSERT INTO Players (playerID, firstName, lastName, email, dateOfBirth, age, phoneNumber, userBio, height, weight, acctStatus, position, teamID) VALUES ('40', 'Timi', 'Penkman', 'tpenkman13@digg.com', '7/10/2025', '39', '800-375-1332', 'Passionate about technology and innovation. Enjoys hiking and photography.', '201.9', '221.25', 'pending', 'Small Forward', '16');
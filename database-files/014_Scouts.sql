@@ -1,40 +0,0 @@
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('1', 'Montague', 'Sollner', 'msollner0@printfriendly.com', '11/22/2025', '50', '816-242-2336', 'pending', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('2', 'Horacio', 'Mountlow', 'hmountlow1@ehow.com', '7/25/2025', '64', '690-825-5726', 'active', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('3', 'Josh', 'Hedditeh', 'jhedditeh2@com.com', '12/5/2025', '61', '607-494-2967', 'active', 'international scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('4', 'Idelle', 'Cuming', 'icuming3@meetup.com', '3/10/2025', '25', '700-142-6513', 'active', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('5', 'Gasparo', 'Jollie', 'gjollie4@opera.com', '1/1/2025', '76', '416-474-1067', 'pending', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('6', 'Sula', 'Wildblood', 'swildblood5@gizmodo.com', '1/16/2025', '33', '638-232-3986', 'pending', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('7', 'Lemar', 'MacNally', 'lmacnally6@mozilla.com', '1/4/2025', '22', '359-917-1929', 'inactive', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('8', 'Andie', 'Le Sieur', 'alesieur7@yahoo.com', '3/22/2025', '79', '955-791-0372', 'inactive', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('9', 'Esmaria', 'Dewire', 'edewire8@eventbrite.com', '3/18/2025', '30', '412-126-3067', 'pending', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('10', 'Celestina', 'Selbie', 'cselbie9@nasa.gov', '8/3/2025', '33', '937-371-5517', 'pending', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('11', 'Trudie', 'Ellingsworth', 'tellingswortha@google.cn', '9/12/2025', '66', '357-375-7731', 'pending', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('12', 'Camey', 'Lawlor', 'clawlorb@ameblo.jp', '2/15/2025', '17', '918-571-8114', 'pending', 'international scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('13', 'Decca', 'Wyles', 'dwylesc@pinterest.com', '10/4/2025', '55', '421-312-9189', 'inactive', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('14', 'Dorelle', 'Parysowna', 'dparysownad@yandex.ru', '6/28/2025', '32', '828-591-9975', 'pending', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('15', 'Brendis', 'Cardnell', 'bcardnelle@statcounter.com', '1/1/2025', '27', '393-605-7954', 'pending', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('16', 'Sabrina', 'Ogle', 'soglef@google.com', '3/6/2025', '54', '256-534-6880', 'active', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('17', 'Elnar', 'Maps', 'emapsg@jugem.jp', '8/23/2025', '74', '909-514-9852', 'pending', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('18', 'Brewer', 'Rosten', 'brostenh@google.it', '9/16/2025', '44', '203-186-3679', 'active', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('19', 'Kaila', 'Yeoland', 'kyeolandi@behance.net', '3/24/2025', '40', '790-686-5798', 'inactive', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('20', 'Storm', 'Pietasch', 'spietaschj@ocn.ne.jp', '3/31/2025', '31', '857-705-4862', 'active', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('21', 'Zsazsa', 'Gulliver', 'zgulliverk@com.com', '3/2/2025', '78', '182-761-3487', 'inactive', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('22', 'Marjy', 'Liver', 'mliverl@cbsnews.com', '2/7/2025', '72', '702-422-5686', 'inactive', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('23', 'Perl', 'Renzo', 'prenzom@wikipedia.org', '6/17/2025', '60', '957-447-2921', 'pending', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('24', 'Emalia', 'Arch', 'earchn@ovh.net', '3/29/2025', '24', '790-396-8143', 'active', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('25', 'Jonathan', 'Camilio', 'jcamilioo@opera.com', '7/20/2025', '70', '469-321-3871', 'pending', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('26', 'Bethanne', 'Paulson', 'bpaulsonp@google.cn', '3/1/2025', '42', '421-857-0523', 'inactive', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('27', 'Killie', 'Sweetmore', 'ksweetmoreq@usda.gov', '7/20/2025', '27', '293-126-4927', 'pending', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('28', 'Emlen', 'Woffenden', 'ewoffendenr@reverbnation.com', '5/7/2025', '23', '332-306-7666', 'active', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('29', 'Elspeth', 'Vannuchi', 'evannuchis@theglobeandmail.com', '1/19/2025', '33', '697-373-8473', 'inactive', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('30', 'Jessie', 'Manford', 'jmanfordt@bandcamp.com', '9/29/2025', '42', '788-860-8163', 'inactive', 'international scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('31', 'Devin', 'Wykey', 'dwykeyu@themeforest.net', '8/28/2025', '30', '267-452-7778', 'active', 'assistant scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('32', 'Mia', 'Colt', 'mcoltv@privacy.gov.au', '4/4/2025', '76', '930-384-6801', 'pending', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('33', 'Thomasina', 'Abrahams', 'tabrahamsw@harvard.edu', '6/5/2025', '17', '506-305-9816', 'inactive', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('34', 'Lee', 'Garaway', 'lgarawayx@walmart.com', '9/16/2025', '60', '273-720-4824', 'inactive', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('35', 'Donny', 'Notman', 'dnotmany@51.la', '7/4/2025', '67', '507-136-7552', 'active', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('36', 'Auberon', 'Pordal', 'apordalz@plala.or.jp', '9/5/2025', '22', '158-205-5075', 'pending', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('37', 'Parker', 'Thurling', 'pthurling10@google.fr', '4/6/2025', '33', '696-842-7481', 'active', 'chief scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('38', 'Sherlock', 'Floch', 'sfloch11@printfriendly.com', '11/13/2025', '50', '747-815-7151', 'inactive', 'regional scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('39', 'Natale', 'Smurthwaite', 'nsmurthwaite12@google.com.hk', '12/13/2024', '28', '919-654-9927', 'inactive', 'scout');
-INSERT INTO Scouts (scoutID, firstName, lastName, email, dateOfBirth, age, phoneNum, acctStatus, role) VALUES ('40', 'Fannie', 'Standbrook', 'fstandbrook13@kickstarter.com', '9/6/2025', '76', '206-103-6897', 'inactive', 'regional scout');
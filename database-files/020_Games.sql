@@ -1,40 +0,0 @@
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('1', '2/2/2025', '4:09 PM', '9:46 AM', 'clobetasol propionate', 'Autumn Leaf', 'CONVIVA MEDICAL CENTER MANAGEMENT LLC', '45-20');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('2', '7/29/2025', '8:23 PM', '6:46 AM', 'dexmethylphenidate hydrochloride', 'Laurel', 'SOUTH COAST GLOBAL MEDICAL CENTER, INC', '57-02');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('3', '5/16/2025', '2:43 AM', '6:39 PM', 'Amitriptyline Hydrochloride', 'Brentwood', 'MH MISSION HOSPITAL MCDOWELL, LLLP', '21-21');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('4', '1/24/2025', '9:55 AM', '5:29 AM', 'nifedipine', 'Arapahoe', 'HOSPITAL & SLEEP MEDICINE CONSULTANTS PC', '54-60');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('5', '4/27/2025', '7:10 AM', '1:51 PM', 'naproxen', 'Columbus', 'TRANSYLVANIA COMMUNITY HOSPITAL, INC', '24-34');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('6', '1/28/2025', '12:08 AM', '6:27 PM', 'Aluminum Zirconium Tetrachlorohydrex GLY', 'Oakridge', 'SANFORD MEDICAL CENTER FARGO', '71-66');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('7', '12/15/2024', '6:30 AM', '10:29 AM', 'ribavirin', 'Carey', 'OCEANVIEW CONVALESCENT HOSPITAL', '28-35');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('8', '9/11/2025', '9:30 PM', '8:23 AM', 'GABAPENTIN', 'Stephen', 'ST. JOHN HOSPITAL AND MEDICAL CENTER', '20-40');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('9', '11/30/2025', '3:32 AM', '12:10 PM', 'Diphenhydramine Hydrochloride', 'Sycamore', 'EDWARD W. SPARROW HOSPITAL ASSOCIATION', '21-54');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('10', '2/15/2025', '12:40 AM', '4:26 PM', 'panthenol', 'Killdeer', 'SPARKS REGIONAL MEDICAL CENTER', '99-23');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('11', '7/18/2025', '2:22 PM', '8:23 PM', 'Pravastatin Sodium', 'Hollow Ridge', 'SUMMIT MEDICAL CENTER LABORATORY', '84-87');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('12', '11/13/2025', '12:43 PM', '9:56 AM', 'ATORVASTATIN CALCIUM', 'Merchant', 'SOLARA HOSPITAL HARLINGEN', '11-59');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('13', '6/12/2025', '11:16 PM', '5:57 AM', 'fexofenadine hydrochloride', 'Dwight', 'ST LUKE''S JONES REGIONAL MEDICAL CENTER', '50-25');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('14', '12/12/2024', '8:31 AM', '8:03 AM', 'Betamethasone Dipropionate', 'Rutledge', 'PRINCE WILLIAM HOSPITAL', '47-43');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('15', '12/18/2024', '5:04 PM', '2:40 AM', 'Rizatriptan Benzoate', 'Londonderry', 'CUMBERLAND FAMILY MEDICAL CENTER, INC.', '45-39');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('16', '12/14/2024', '6:24 AM', '10:56 PM', 'Guaifenesin', 'Anniversary', 'THERAFIRST MEDICAL CENTERS, INC.', '43-95');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('17', '6/14/2025', '9:55 PM', '5:34 PM', 'FUROSEMIDE', 'Stang', 'MEMORIAL HOSPITAL INC', '14-03');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('18', '9/27/2025', '3:49 PM', '5:09 AM', 'Cucumber', 'Oriole', 'PALACIOS COMMUNITY MEDICAL CENTER', '28-49');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('19', '4/12/2025', '12:18 PM', '8:19 PM', 'Losartan Potassium', 'Mcguire', 'FRANKLIN SQUARE HOSPITAL CENTER INC', '77-18');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('20', '7/8/2025', '3:27 AM', '12:42 PM', 'Acetaminophen, Dextromethorphan Hydrobromide, Guaifenesin, Phenylephrine Hydrochloride', 'School', 'FMCG MEDICAL CENTER, INC', '05-58');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('21', '7/2/2025', '1:45 PM', '9:07 PM', 'Tretinoin', 'Di Loreto', 'BAPTIST MEMORIAL HOSPITAL-JONESBORO INC', '14-86');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('22', '12/16/2024', '9:08 PM', '5:26 PM', 'Dicyclomine Hydrochloride', 'Grayhawk', 'HOSPITAL TRANSITIONAL CARE', '45-50');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('23', '2/23/2025', '10:16 AM', '4:26 AM', 'tavaborole', 'Walton', 'CARL R DARNALL ARMY MEDICAL CENTER', '05-68');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('24', '7/14/2025', '8:13 AM', '12:42 PM', 'Thymus Mercurius', 'Talmadge', 'LOMA LINDA UNIVERSITY MEDICAL CENTER', '14-91');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('25', '2/28/2025', '4:57 AM', '3:27 PM', 'sumatriptan succinate', 'Merrick', 'SELECT SPECIALTY HOSPITAL - KANSAS CITY INC', '75-60');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('26', '9/25/2025', '11:13 PM', '4:20 AM', 'Cimetidine', 'Hoard', 'LANCASTER GENERAL HOSPITAL', '24-77');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('27', '1/21/2025', '12:47 PM', '9:33 PM', 'moxifloxacin hydrochloride', 'Farmco', 'CRIPPLED CHILDREN''S HOSPITAL', '71-42');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('28', '5/25/2025', '2:00 AM', '5:30 AM', 'Aspirin', 'Northland', 'MEDICAL CENTER OF NEWARK, L.L.C.', '13-05');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('29', '4/14/2025', '10:49 AM', '8:05 AM', 'Alendronate Sodium', 'Commercial', 'MARY GREELEY MEDICAL CENTER', '92-68');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('30', '10/26/2025', '7:05 PM', '4:00 AM', 'Rhodotorula mucilaginosa', 'Havey', 'FRAYSER MEDICAL CENTER INC.', '03-26');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('31', '2/4/2025', '6:47 AM', '5:01 PM', 'metronidazole', 'Dovetail', 'SHUAIB MEDICAL CENTER', '22-29');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('32', '3/31/2025', '4:48 PM', '5:32 PM', 'Oxazepam', '8th', 'WEST CENTURYMEDICAL CENTER', '99-34');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('33', '11/21/2025', '4:51 PM', '5:17 AM', 'Fluvoxamine Maleate', 'New Castle', 'BELLEVUE HOSPITAL CENTER', '19-40');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('34', '5/18/2025', '6:25 AM', '8:23 AM', 'Mineral Oil, Petrolatum, Phenylephrine Hydrochloride', 'Bay', 'ST JOHN HOSPITAL AND MEDICAL CENTER', '31-78');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('35', '3/3/2025', '1:52 AM', '8:46 PM', 'Magnesium Sulfate', 'Declaration', 'VIRGINIA MASON MEDICAL CENTER', '49-17');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('36', '1/17/2025', '3:19 PM', '3:14 AM', 'clobetasol propionate', 'Ruskin', 'EAST LIVERPOOL CITY HOSPITAL OUT-PATIENT PHARMACY', '54-88');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('37', '10/14/2025', '9:40 AM', '8:35 AM', 'COAGULATION FACTOR IX RECOMBINANT HUMAN', 'Fallview', 'MONTGOMERY HOSPITALISTS LLC', '74-26');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('38', '11/10/2025', '4:44 AM', '2:21 AM', 'hyoscyamine sulfate, methenamine, methylene blue, phenyl salicylate, and sodium phosphate, monobasic, monohydrate', 'Butternut', 'LAVACA HOSPITAL DISTRICT', '92-95');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('39', '5/21/2025', '12:23 AM', '11:53 PM', 'Sodium Fluoride', 'Pennsylvania', 'PAUL G CRAWFORD MD AND WILLIS-KNIGHTON MEDICAL CENTER', '05-57');
-INSERT INTO Games (gameID, date, startTime, endTime, opponent, venue, tournament, score) VALUES ('40', '8/15/2025', '9:54 AM', '6:33 AM', 'Cantaloupe', 'Springview', 'V.L MEDICAL CENTER CORP', '42-92');
@@ -1,75 +0,0 @@
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('13', '3');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('31', '31');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('39', '5');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('34', '3');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('18', '1');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('6', '33');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('35', '37');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('1', '13');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('8', '6');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('2', '24');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('14', '22');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('26', '3');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('14', '7');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('11', '21');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('16', '34');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('40', '14');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('7', '40');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('37', '20');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('34', '11');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('33', '36');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('12', '39');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('5', '9');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('20', '21');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('40', '5');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('7', '29');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('24', '20');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('4', '6');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('31', '4');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('16', '28');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('19', '18');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('9', '26');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('31', '39');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('26', '20');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('3', '2');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('19', '2');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('39', '9');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('7', '20');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('36', '33');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('19', '1');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('35', '8');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('38', '6');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('27', '30');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('39', '15');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('29', '14');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('13', '13');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('14', '5');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('1', '38');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('28', '4');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('28', '25');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('34', '35');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('22', '11');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('16', '8');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('9', '27');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('35', '5');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('17', '1');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('38', '26');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('38', '1');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('11', '28');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('16', '39');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('27', '2');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('14', '4');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('37', '28');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('10', '40');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('26', '35');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('29', '33');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('23', '7');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('39', '25');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('21', '31');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('4', '3');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('7', '26');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('36', '13');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('16', '15');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('18', '16');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('37', '37');
-INSERT INTO PlayerSchedules (playerID, gameID) VALUES ('5', '6');
@@ -1,120 +0,0 @@
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('14', '22');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('21', '8');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('25', '36');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('38', '16');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('12', '6');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('26', '8');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('38', '1');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('7', '33');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('27', '3');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('34', '19');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('36', '38');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('26', '2');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('17', '24');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('21', '9');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('28', '34');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('38', '33');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('11', '34');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('35', '27');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('15', '31');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('32', '11');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('31', '14');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('35', '1');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('23', '26');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('15', '18');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('11', '15');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('18', '22');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('12', '26');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('9', '21');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('25', '38');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('26', '27');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('31', '7');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('29', '15');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('26', '10');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('5', '18');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('6', '29');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('32', '30');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('35', '4');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('39', '33');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('16', '17');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('29', '33');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('39', '3');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('18', '1');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('3', '12');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('4', '35');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('38', '9');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('23', '35');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('1', '31');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('26', '34');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('9', '16');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('22', '20');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('12', '14');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('3', '22');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('15', '13');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('4', '4');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('13', '7');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('39', '23');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('14', '32');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('34', '29');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('15', '36');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('22', '5');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('29', '21');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('14', '12');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('27', '34');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('18', '5');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('16', '2');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('38', '30');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('32', '28');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('4', '29');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('12', '40');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('9', '9');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('7', '10');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('28', '26');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('17', '16');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('24', '6');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('2', '1');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('13', '20');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('10', '15');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('16', '35');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('36', '10');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('18', '7');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('21', '33');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('7', '25');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('27', '7');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('24', '17');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('19', '23');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('27', '31');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('37', '29');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('24', '7');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('15', '22');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('22', '18');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('10', '35');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('36', '27');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('33', '17');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('18', '23');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('12', '21');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('27', '24');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('31', '29');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('16', '34');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('30', '14');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('38', '8');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('32', '13');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('9', '11');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('28', '2');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('2', '33');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('4', '1');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('7', '4');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('26', '25');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('25', '19');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('14', '15');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('1', '28');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('6', '6');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('23', '30');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('17', '20');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('3', '10');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('39', '39');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('40', '32');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('29', '38');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('34', '36');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('24', '3');
-INSERT INTO ScheduledFor (gameID, teamID) VALUES ('13', '9');
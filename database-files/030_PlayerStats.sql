@@ -1,75 +0,0 @@
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('1', '64', '94', '19', '1');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('2', '91', '7', '86', '2');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('3', '87', '39', '78', '3');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('4', '38', '91', '44', '4');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('5', '17', '23', '83', '5');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('6', '61', '27', '44', '6');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('7', '95', '23', '17', '7');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('8', '23', '83', '64', '8');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('9', '40', '95', '69', '9');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('10', '30', '36', '97', '10');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('11', '12', '65', '62', '11');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('12', '10', '85', '54', '12');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('13', '53', '97', '37', '13');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('14', '69', '68', '67', '14');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('15', '84', '10', '85', '15');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('16', '62', '82', '7', '16');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('17', '28', '54', '84', '17');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('18', '75', '49', '73', '18');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('19', '8', '99', '51', '19');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('20', '38', '26', '77', '20');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('21', '37', '30', '10', '21');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('22', '43', '16', '72', '22');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('23', '17', '29', '55', '23');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('24', '18', '99', '20', '24');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('25', '57', '42', '88', '25');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('26', '61', '95', '38', '26');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('27', '3', '59', '65', '27');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('28', '74', '76', '36', '28');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('29', '28', '75', '88', '29');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('30', '4', '57', '86', '30');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('31', '25', '61', '62', '31');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('32', '51', '20', '21', '32');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('33', '34', '15', '28', '33');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('34', '20', '95', '26', '34');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('35', '34', '64', '40', '35');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('36', '96', '78', '7', '36');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('37', '37', '63', '67', '37');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('38', '70', '91', '71', '38');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('39', '14', '27', '51', '39');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('40', '29', '83', '77', '40');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('41', '7', '17', '45', '1');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('42', '31', '82', '16', '2');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('43', '86', '54', '55', '3');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('44', '82', '82', '23', '4');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('45', '10', '47', '3', '5');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('46', '1', '9', '53', '6');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('47', '26', '22', '60', '7');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('48', '85', '55', '2', '8');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('49', '89', '48', '64', '9');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('50', '100', '34', '37', '10');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('51', '12', '92', '76', '11');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('52', '6', '16', '4', '12');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('53', '46', '58', '16', '13');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('54', '83', '37', '59', '14');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('55', '71', '10', '24', '15');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('56', '39', '40', '17', '16');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('57', '51', '25', '67', '17');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('58', '36', '2', '38', '18');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('59', '4', '53', '43', '19');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('60', '20', '62', '87', '20');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('61', '14', '43', '63', '21');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('62', '92', '41', '5', '22');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('63', '14', '38', '51', '23');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('64', '52', '6', '14', '24');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('65', '17', '83', '56', '25');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('66', '10', '44', '65', '26');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('67', '24', '61', '84', '27');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('68', '88', '86', '65', '28');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('69', '83', '42', '33', '29');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('70', '75', '13', '57', '30');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('71', '48', '47', '9', '31');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('72', '51', '74', '82', '32');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('73', '90', '3', '24', '33');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('74', '10', '22', '30', '34');
-INSERT INTO PlayerStats (statsID, rebPerGame, ptsPerGame, astPerGame, playerID) VALUES ('75', '21', '94', '6', '35');
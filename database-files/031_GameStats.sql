@@ -1,75 +0,0 @@
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('1', '2', '23', '58', '17', '18', '2', '6', '11', '6', '12', '9');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('2', '1', '12', '13', '11', '7', '5', '10', '7', '5', '20', '5');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('3', '20', '27', '21', '20', '10', '7', '14', '8', '2', '8', '32');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('4', '2', '6', '36', '5', '1', '10', '14', '1', '5', '4', '3');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('5', '5', '19', '14', '3', '6', '5', '3', '5', '6', '20', '1');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('6', '39', '17', '31', '2', '10', '10', '2', '10', '2', '23', '23');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('7', '16', '29', '42', '19', '8', '10', '14', '6', '3', '12', '26');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('8', '30', '10', '12', '4', '14', '4', '5', '15', '2', '19', '13');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('9', '17', '3', '41', '2', '17', '10', '7', '3', '4', '5', '18');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('10', '26', '35', '45', '12', '14', '9', '8', '1', '5', '15', '4');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('11', '28', '5', '57', '11', '15', '3', '5', '9', '4', '18', '21');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('12', '37', '30', '49', '2', '3', '3', '3', '8', '1', '16', '31');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('13', '17', '27', '66', '3', '11', '4', '7', '9', '6', '23', '6');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('14', '27', '27', '42', '18', '11', '2', '6', '13', '1', '13', '20');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('15', '35', '13', '67', '5', '7', '7', '1', '12', '3', '18', '8');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('16', '10', '4', '36', '18', '8', '5', '4', '1', '1', '21', '37');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('17', '19', '24', '24', '3', '19', '2', '11', '9', '2', '18', '39');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('18', '11', '14', '9', '1', '3', '4', '8', '6', '6', '11', '25');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('19', '15', '16', '65', '3', '8', '8', '5', '3', '4', '2', '28');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('20', '8', '29', '68', '13', '20', '6', '14', '15', '2', '7', '24');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('21', '6', '8', '41', '8', '20', '6', '1', '12', '5', '8', '10');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('22', '27', '30', '12', '13', '11', '7', '2', '5', '5', '18', '26');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('23', '14', '44', '12', '19', '11', '1', '14', '3', '4', '19', '1');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('24', '39', '28', '54', '7', '7', '7', '10', '5', '4', '2', '5');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('25', '18', '21', '4', '11', '3', '5', '5', '7', '4', '12', '15');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('26', '38', '21', '19', '14', '10', '3', '15', '2', '2', '4', '1');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('27', '13', '39', '36', '11', '11', '1', '7', '1', '4', '1', '4');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('28', '7', '6', '29', '17', '3', '7', '14', '11', '5', '10', '20');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('29', '23', '22', '31', '15', '1', '4', '9', '13', '2', '23', '11');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('30', '3', '38', '43', '5', '11', '6', '12', '1', '5', '14', '9');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('31', '29', '3', '55', '1', '11', '2', '13', '12', '2', '8', '13');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('32', '25', '20', '36', '14', '6', '4', '11', '9', '2', '18', '32');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('33', '26', '17', '64', '8', '3', '5', '1', '12', '4', '4', '21');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('34', '15', '18', '64', '11', '20', '2', '8', '3', '2', '22', '35');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('35', '32', '21', '29', '1', '8', '7', '8', '14', '1', '19', '21');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('36', '19', '30', '39', '2', '8', '7', '14', '7', '6', '5', '22');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('37', '3', '8', '39', '17', '20', '9', '3', '15', '6', '1', '39');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('38', '23', '21', '40', '14', '14', '4', '14', '9', '1', '16', '23');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('39', '22', '18', '63', '15', '7', '9', '13', '13', '6', '2', '36');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('40', '2', '7', '46', '10', '13', '9', '4', '10', '3', '17', '12');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('41', '37', '35', '14', '1', '3', '6', '3', '15', '3', '12', '7');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('42', '28', '16', '18', '14', '6', '10', '7', '7', '1', '11', '4');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('43', '32', '34', '53', '4', '8', '4', '4', '11', '3', '15', '25');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('44', '34', '10', '59', '15', '3', '10', '10', '7', '5', '19', '11');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('45', '18', '37', '60', '14', '11', '2', '12', '11', '3', '5', '38');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('46', '4', '24', '23', '18', '8', '4', '1', '9', '4', '3', '19');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('47', '18', '6', '37', '8', '19', '4', '11', '15', '2', '4', '11');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('48', '5', '7', '58', '3', '3', '5', '3', '9', '6', '2', '27');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('49', '39', '46', '18', '13', '8', '8', '11', '14', '5', '6', '12');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('50', '3', '22', '28', '10', '4', '10', '13', '13', '6', '6', '17');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('51', '24', '1', '51', '16', '11', '5', '11', '9', '4', '16', '25');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('52', '34', '28', '5', '16', '12', '9', '10', '14', '2', '16', '37');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('53', '34', '46', '66', '1', '18', '2', '11', '2', '3', '19', '23');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('54', '23', '39', '41', '4', '12', '6', '4', '7', '2', '5', '11');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('55', '18', '12', '51', '19', '3', '2', '4', '7', '6', '7', '2');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('56', '23', '44', '18', '12', '6', '1', '4', '15', '6', '14', '27');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('57', '8', '13', '39', '18', '6', '2', '15', '15', '4', '19', '34');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('58', '3', '34', '36', '12', '5', '5', '7', '8', '4', '2', '33');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('59', '19', '13', '55', '6', '14', '5', '5', '5', '3', '24', '4');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('60', '7', '40', '39', '15', '1', '7', '11', '14', '5', '14', '7');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('61', '2', '33', '9', '4', '19', '3', '6', '5', '4', '17', '21');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('62', '28', '24', '70', '6', '2', '1', '12', '13', '5', '13', '36');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('63', '34', '26', '43', '9', '5', '9', '4', '11', '5', '21', '38');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('64', '6', '42', '39', '11', '18', '7', '15', '8', '3', '19', '22');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('65', '40', '26', '1', '1', '18', '8', '14', '9', '1', '13', '40');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('66', '26', '24', '22', '5', '17', '4', '3', '1', '5', '22', '32');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('67', '21', '40', '36', '12', '18', '5', '2', '6', '1', '2', '8');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('68', '8', '47', '25', '1', '15', '10', '10', '9', '2', '8', '15');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('69', '38', '47', '30', '16', '3', '1', '14', '7', '3', '14', '21');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('70', '32', '20', '37', '12', '20', '4', '3', '13', '4', '21', '1');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('71', '31', '2', '67', '17', '4', '6', '6', '10', '3', '24', '39');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('72', '7', '13', '44', '7', '14', '8', '3', '12', '6', '19', '5');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('73', '10', '1', '8', '17', '1', '6', '6', '2', '1', '4', '34');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('74', '13', '8', '20', '20', '5', '4', '15', '11', '2', '15', '13');
-INSERT INTO GameStats (gameStatID, playerID, minutes, points, rebounds, assists, steals, blocks, turnovers, fouls, threePts, gameID) VALUES ('75', '5', '33', '50', '1', '3', '8', '7', '15', '5', '25', '29');
@@ -1,75 +0,0 @@
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('1', '1', '2008', '57', '3534', '1', '17', '26', '14', '2', '22', '66.07', '35.39', '45.71', '95.92');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('2', '2', '2019', '1', '2787', '1', '33', '24', '12', '12', '2', '96.15', '49.48', '10.81', '20.87');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('3', '3', '2003', '78', '2257', '32', '26', '13', '18', '6', '7', '58.98', '36.01', '27.39', '30.98');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('4', '4', '2024', '5', '2405', '33', '20', '8', '15', '7', '16', '0.35', '17.48', '93.83', '77.88');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('5', '5', '2023', '41', '1775', '8', '26', '27', '18', '8', '15', '50.48', '73.89', '15.09', '96.6');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('6', '6', '2013', '63', '3205', '19', '35', '6', '10', '9', '11', '91.3', '62.68', '45.68', '86.38');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('7', '7', '2002', '55', '2939', '28', '31', '25', '19', '12', '17', '7.86', '67.7', '61.93', '20.47');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('8', '8', '2004', '37', '1574', '15', '19', '27', '11', '3', '16', '50.15', '93.6', '3.55', '50.16');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('9', '9', '2005', '61', '146', '22', '17', '10', '5', '1', '8', '75.83', '96.63', '67.92', '59.1');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('10', '10', '2004', '46', '1186', '11', '9', '4', '17', '4', '3', '1.44', '6.15', '17.4', '22.95');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('11', '11', '2015', '16', '2341', '36', '30', '12', '14', '3', '12', '71.17', '22.6', '8.97', '60.03');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('12', '12', '2012', '65', '2294', '15', '33', '10', '9', '12', '13', '19.53', '6.02', '81.94', '56.53');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('13', '13', '2006', '43', '2816', '18', '9', '5', '20', '11', '13', '91.32', '41.24', '56.33', '1.2');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('14', '14', '2004', '30', '3422', '21', '25', '14', '14', '12', '14', '76.9', '59.22', '78.56', '58.57');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('15', '15', '2021', '20', '2173', '35', '4', '12', '8', '4', '2', '20.6', '30.14', '22.81', '1.04');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('16', '16', '2019', '48', '617', '1', '4', '29', '13', '4', '20', '47.99', '8.63', '24.24', '92.4');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('17', '17', '2025', '65', '1840', '7', '4', '23', '1', '8', '3', '45.15', '1.53', '11.58', '22.24');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('18', '18', '2002', '13', '3060', '6', '15', '13', '17', '5', '8', '17.82', '62.91', '72.24', '23.83');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('19', '19', '2005', '28', '1054', '4', '12', '30', '16', '9', '3', '77.62', '37.99', '66.76', '54.32');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('20', '20', '2024', '58', '2622', '21', '4', '9', '3', '7', '4', '79.5', '89.44', '19.04', '20.95');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('21', '21', '2004', '26', '3159', '27', '24', '22', '13', '7', '1', '79.25', '21.26', '27.65', '11.76');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('22', '22', '2022', '62', '1261', '17', '36', '6', '20', '1', '8', '69.35', '60.99', '89.14', '62.92');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('23', '23', '2005', '56', '608', '8', '21', '2', '18', '5', '17', '82.44', '19.49', '26.92', '95.31');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('24', '24', '2019', '52', '2624', '5', '18', '19', '5', '4', '7', '2.52', '68.23', '86.99', '58.41');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('25', '25', '2017', '61', '2466', '31', '34', '9', '14', '9', '15', '68.01', '52.52', '83.62', '11.52');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('26', '26', '2005', '53', '1184', '14', '2', '16', '11', '5', '3', '57.46', '62.33', '49.14', '71.44');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('27', '27', '2022', '42', '3928', '36', '28', '13', '4', '9', '3', '17.0', '61.39', '32.49', '73.82');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('28', '28', '2025', '34', '3601', '10', '27', '28', '16', '5', '22', '61.38', '72.12', '11.27', '2.8');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('29', '29', '2014', '52', '410', '30', '26', '7', '11', '3', '18', '53.4', '25.81', '27.18', '85.59');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('30', '30', '2024', '56', '901', '27', '32', '10', '12', '6', '12', '65.0', '33.66', '42.53', '24.43');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('31', '31', '2022', '62', '3128', '22', '3', '14', '17', '11', '16', '91.22', '20.27', '74.6', '73.96');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('32', '32', '2023', '15', '888', '28', '2', '18', '1', '6', '21', '30.02', '1.29', '85.7', '46.59');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('33', '33', '2023', '46', '2926', '26', '8', '21', '3', '9', '7', '11.51', '43.7', '63.61', '31.22');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('34', '34', '2014', '54', '1425', '1', '2', '7', '13', '9', '8', '89.13', '71.43', '41.75', '34.11');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('35', '35', '2024', '43', '2577', '30', '36', '19', '11', '7', '3', '46.73', '50.17', '43.86', '92.22');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('36', '36', '2024', '10', '1558', '33', '26', '22', '10', '11', '9', '51.84', '89.64', '84.09', '19.98');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('37', '37', '2023', '78', '3629', '34', '15', '8', '5', '1', '11', '30.73', '46.05', '50.39', '39.7');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('38', '38', '2006', '27', '3477', '2', '36', '12', '13', '6', '19', '54.22', '40.16', '45.93', '71.53');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('39', '39', '2001', '1', '986', '2', '28', '26', '3', '2', '15', '93.22', '46.86', '54.38', '88.27');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('40', '40', '2014', '64', '3372', '27', '6', '19', '4', '10', '10', '35.23', '10.2', '49.94', '96.14');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('41', '1', '2020', '63', '1786', '35', '12', '27', '14', '8', '15', '67.05', '90.71', '20.49', '8.63');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('42', '2', '2009', '77', '1297', '15', '15', '25', '11', '12', '7', '33.62', '29.36', '20.37', '26.28');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('43', '3', '2021', '27', '2805', '13', '14', '25', '20', '10', '2', '81.39', '29.58', '60.51', '88.86');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('44', '4', '2024', '8', '3240', '34', '12', '24', '8', '3', '2', '90.59', '9.46', '40.61', '26.79');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('45', '5', '2024', '14', '363', '22', '4', '15', '11', '4', '13', '49.28', '71.24', '62.56', '83.46');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('46', '6', '2017', '49', '2832', '32', '23', '24', '9', '8', '3', '1.33', '89.16', '91.89', '52.47');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('47', '7', '2016', '9', '539', '25', '18', '3', '6', '9', '21', '71.43', '35.13', '81.19', '66.65');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('48', '8', '2022', '72', '1054', '18', '32', '11', '13', '2', '6', '23.48', '50.93', '68.55', '97.88');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('49', '9', '2020', '57', '1853', '24', '4', '23', '14', '7', '11', '94.42', '9.8', '32.28', '26.53');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('50', '10', '2004', '77', '137', '29', '20', '10', '10', '5', '6', '68.56', '29.68', '65.08', '23.26');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('51', '11', '2019', '36', '3483', '8', '16', '2', '18', '4', '11', '42.28', '4.0', '86.8', '79.09');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('52', '12', '2020', '61', '3857', '22', '25', '2', '12', '4', '6', '94.25', '4.72', '96.9', '7.43');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('53', '13', '2012', '72', '1244', '35', '21', '30', '11', '1', '4', '88.74', '14.07', '39.84', '61.15');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('54', '14', '2024', '29', '2982', '19', '5', '10', '10', '11', '8', '54.54', '47.37', '79.85', '27.67');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('55', '15', '2020', '74', '1881', '21', '14', '27', '20', '3', '4', '35.88', '48.8', '7.08', '65.08');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('56', '16', '2019', '63', '1356', '19', '2', '13', '14', '6', '10', '29.91', '22.01', '29.21', '25.98');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('57', '17', '2016', '55', '2100', '18', '18', '28', '2', '5', '7', '51.81', '87.16', '16.3', '9.87');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('58', '18', '2009', '57', '2216', '34', '8', '11', '15', '6', '19', '46.74', '53.77', '52.86', '61.93');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('59', '19', '2018', '68', '1126', '16', '36', '4', '17', '3', '7', '8.02', '56.55', '2.15', '97.34');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('60', '20', '2006', '71', '2818', '22', '9', '28', '1', '5', '20', '74.56', '67.21', '85.97', '95.11');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('61', '21', '2024', '19', '936', '16', '15', '14', '10', '1', '17', '74.42', '94.97', '79.37', '52.17');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('62', '22', '2024', '31', '1303', '28', '31', '22', '8', '9', '5', '34.96', '94.9', '54.52', '15.47');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('63', '23', '2014', '19', '1123', '25', '7', '28', '14', '6', '20', '13.14', '5.85', '57.0', '27.85');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('64', '24', '2001', '46', '1463', '22', '2', '23', '5', '5', '10', '73.69', '19.42', '35.24', '42.56');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('65', '25', '2007', '35', '3316', '27', '29', '15', '10', '7', '9', '95.59', '69.8', '87.21', '18.82');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('66', '26', '2015', '58', '1959', '15', '6', '10', '15', '1', '10', '26.35', '34.47', '40.08', '85.15');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('67', '27', '2011', '43', '556', '4', '14', '14', '6', '6', '11', '58.31', '45.37', '2.11', '20.25');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('68', '28', '2021', '25', '842', '26', '17', '13', '9', '2', '10', '9.74', '94.46', '78.42', '24.81');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('69', '29', '2001', '52', '2178', '5', '22', '10', '6', '4', '3', '30.33', '79.67', '53.26', '79.39');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('70', '30', '2015', '75', '1831', '22', '15', '1', '1', '6', '2', '97.18', '7.61', '9.01', '51.26');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('71', '31', '2024', '75', '1455', '23', '22', '1', '19', '12', '18', '95.33', '91.95', '13.86', '31.7');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('72', '32', '2003', '1', '2758', '23', '21', '9', '3', '3', '12', '62.88', '29.33', '36.34', '3.54');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('73', '33', '2009', '5', '3403', '31', '31', '16', '19', '12', '16', '35.08', '24.84', '72.25', '44.95');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('74', '34', '2002', '34', '2329', '30', '24', '19', '8', '6', '4', '57.42', '42.03', '10.03', '63.53');
-INSERT INTO SeasonStats (seasonStatID, playerID, season, gamesPlayed, totalMinsPlayed, avgPts, ptsPerGame, rebPerGame, astPerGame, avgRebounds, avgAsts, threePointers, threePPercent, fieldGoalPercent, freeThrowPercent) VALUES ('75', '35', '2025', '62', '900', '5', '35', '29', '10', '2', '15', '85.68', '32.51', '65.44', '40.07');
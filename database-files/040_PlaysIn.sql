@@ -1,118 +0,0 @@
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('20', '17');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('13', '22');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('21', '27');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('24', '8');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('35', '13');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('40', '28');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('8', '22');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('13', '37');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('3', '38');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('40', '9');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('9', '30');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('35', '33');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('19', '3');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('39', '5');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('8', '26');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('33', '13');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('22', '12');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('23', '12');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('9', '17');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('31', '13');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('40', '39');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('17', '33');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('27', '34');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('11', '10');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('39', '26');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('26', '31');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('5', '13');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('28', '39');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('6', '18');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('23', '5');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('15', '28');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('12', '19');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('9', '14');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('14', '10');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('19', '25');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('14', '11');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('3', '1');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('27', '33');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('9', '34');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('16', '30');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('29', '20');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('39', '28');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('14', '13');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('18', '18');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('36', '35');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('23', '33');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('26', '32');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('10', '26');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('13', '32');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('26', '35');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('13', '11');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('10', '21');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('3', '2');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('17', '3');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('25', '36');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('32', '34');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('4', '26');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('23', '7');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('28', '4');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('35', '4');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('19', '5');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('27', '24');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('1', '9');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('20', '29');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('29', '34');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('4', '6');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('5', '9');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('21', '22');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('19', '19');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('40', '11');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('39', '15');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('17', '21');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('15', '7');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('32', '29');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('24', '2');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('31', '5');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('37', '21');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('29', '25');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('28', '3');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('26', '4');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('32', '22');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('37', '34');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('31', '33');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('20', '7');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('6', '5');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('13', '7');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('23', '28');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('17', '19');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('16', '1');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('22', '33');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('11', '34');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('20', '21');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('35', '12');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('7', '16');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('25', '15');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('23', '38');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('9', '11');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('14', '9');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('18', '19');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('30', '2');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('10', '23');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('2', '20');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('27', '10');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('17', '32');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('31', '40');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('24', '31');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('4', '25');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('29', '6');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('26', '27');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('32', '5');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('3', '14');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('21', '3');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('38', '22');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('40', '17');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('33', '29');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('19', '39');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('8', '13');
-INSERT INTO PlaysIn (teamID, gameID) VALUES ('1', '36');
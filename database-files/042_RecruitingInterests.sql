@@ -1,118 +0,0 @@
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('36', '35');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('3', '38');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('4', '12');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('16', '2');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('2', '33');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('18', '14');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('25', '35');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('14', '11');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('21', '8');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('40', '19');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('33', '6');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('38', '10');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('2', '1');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('17', '14');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('31', '9');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('33', '29');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('15', '37');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('35', '7');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '33');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('36', '13');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('13', '12');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('2', '29');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('21', '31');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '25');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('14', '3');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('20', '18');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('24', '21');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('10', '10');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('12', '8');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('18', '30');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('25', '8');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('32', '2');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('18', '36');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('1', '2');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('19', '26');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('39', '38');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('37', '9');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('19', '10');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '4');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('17', '36');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '34');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('39', '36');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('22', '4');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('6', '33');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('9', '15');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('37', '40');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('7', '39');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('27', '28');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('10', '35');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('26', '34');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('40', '23');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('18', '24');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('3', '10');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('40', '37');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('11', '16');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('22', '2');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('6', '25');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('23', '20');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('40', '21');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('8', '12');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '35');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('27', '20');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('14', '31');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('12', '26');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('6', '39');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('11', '29');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('8', '25');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('7', '29');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '9');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('26', '23');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('16', '21');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('25', '37');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '10');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('16', '4');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('37', '39');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('21', '36');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('4', '4');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('6', '19');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('8', '34');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('32', '5');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('35', '37');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('22', '27');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('12', '14');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('20', '22');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('33', '7');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('7', '12');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('7', '38');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('34', '40');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('20', '2');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('2', '39');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('14', '30');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('37', '13');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('15', '4');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('30', '15');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('26', '28');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('23', '5');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('11', '36');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('1', '26');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('24', '8');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('36', '32');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('25', '22');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('12', '10');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('17', '21');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('27', '16');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('16', '35');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('28', '19');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('19', '31');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('4', '3');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('35', '25');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('9', '14');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('32', '9');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('29', '37');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('31', '6');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('22', '20');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('10', '33');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('18', '1');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('13', '11');
-INSERT INTO RecruitingInterests (playerID, schoolID) VALUES ('3', '23');
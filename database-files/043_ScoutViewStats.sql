@@ -1,124 +0,0 @@
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('25', '44');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('12', '47');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('1', '35');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('32', '52');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('7', '74');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('17', '21');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('24', '10');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('7', '63');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('4', '9');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('21', '6');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('24', '70');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('16', '38');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('33', '73');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('9', '42');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('6', '19');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('5', '71');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('7', '10');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('32', '49');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('37', '59');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('17', '12');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('35', '73');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('14', '14');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('40', '74');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('25', '48');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('14', '15');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('26', '6');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('5', '50');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('31', '65');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('11', '21');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('29', '68');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('35', '27');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('15', '54');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('38', '28');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('33', '35');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('18', '8');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('9', '17');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('7', '4');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('8', '58');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('19', '69');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('15', '2');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('21', '40');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('25', '41');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('28', '55');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('10', '65');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('23', '20');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('5', '63');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('37', '62');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('29', '8');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('38', '30');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('3', '67');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('23', '17');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('15', '73');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('20', '32');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('16', '63');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('40', '34');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('36', '46');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('30', '63');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('1', '21');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('8', '45');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('6', '5');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('34', '23');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('18', '48');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('14', '64');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('4', '58');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('35', '68');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('29', '2');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('36', '22');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('9', '66');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('30', '50');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('24', '59');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('18', '64');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('4', '28');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('39', '32');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('27', '67');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('36', '64');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('6', '56');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('31', '1');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('38', '64');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('24', '42');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('6', '20');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('5', '64');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('18', '13');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('9', '61');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('13', '38');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('36', '68');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('25', '51');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('8', '8');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('19', '36');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('4', '64');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('32', '47');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('33', '44');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('12', '10');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('23', '71');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('15', '34');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('35', '7');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('27', '74');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('11', '70');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('40', '30');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('12', '11');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('34', '68');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('10', '13');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('9', '9');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('25', '38');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('32', '42');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('16', '53');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('21', '43');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('14', '25');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('4', '2');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('36', '62');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('22', '59');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('13', '19');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('28', '56');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('1', '6');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('19', '4');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('5', '16');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('37', '75');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('17', '54');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('30', '14');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('2', '31');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('29', '26');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('7', '5');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('20', '39');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('31', '40');
-INSERT INTO ScoutViewStats (scoutID, statsID) VALUES ('26', '66');
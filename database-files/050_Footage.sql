@@ -1,40 +0,0 @@
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('1', '26', 'https://free.fr/luctus/et.json?nisi=velit&venenatis=vivamus&tristique=vel&fusce=nulla&congue=eget&diam=eros&id=elementum&ornare=pellentesque&imperdiet=quisque&sapien=porta&urna=volutpat&pretium=erat&nisl=quisque&ut=erat&volutpat=eros&sapien=viverra&arcu=eget&sed=congue&augue=eget&aliquam=semper&erat=rutrum&volutpat=nulla&in=nunc&congue=purus&etiam=phasellus&justo=in&etiam=felis&pretium=donec&iaculis=semper&justo=sapien&in=a&hac=libero&habitasse=nam&platea=dui&dictumst=proin&etiam=leo&faucibus=odio&cursus=porttitor&urna=id&ut=consequat&tellus=in&nulla=consequat&ut=ut&erat=nulla&id=sed&mauris=accumsan&vulputate=felis&elementum=ut&nullam=at&varius=dolor&nulla=quis&facilisi=odio&cras=consequat&non=varius&velit=integer&nec=ac', '43');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('2', '30', 'https://statcounter.com/dictumst/morbi/vestibulum/velit.html?dis=aenean&parturient=lectus&montes=pellentesque&nascetur=eget&ridiculus=nunc&mus=donec&etiam=quis&vel=orci&augue=eget&vestibulum=orci&rutrum=vehicula&rutrum=condimentum&neque=curabitur&aenean=in&auctor=libero&gravida=ut&sem=massa&praesent=volutpat&id=convallis&massa=morbi&id=odio&nisl=odio&venenatis=elementum&lacinia=eu&aenean=interdum&sit=eu&amet=tincidunt&justo=in&morbi=leo&ut=maecenas&odio=pulvinar&cras=lobortis&mi=est&pede=phasellus&malesuada=sit&in=amet&imperdiet=erat&et=nulla&commodo=tempus&vulputate=vivamus&justo=in&in=felis&blandit=eu&ultrices=sapien&enim=cursus&lorem=vestibulum&ipsum=proin&dolor=eu&sit=mi&amet=nulla&consectetuer=ac&adipiscing=enim&elit=in&proin=tempor&interdum=turpis&mauris=nec&non=euismod&ligula=scelerisque&pellentesque=quam&ultrices=turpis&phasellus=adipiscing&id=lorem&sapien=vitae&in=mattis&sapien=nibh&iaculis=ligula&congue=nec&vivamus=sem', '12');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('3', '16', 'https://youtube.com/rhoncus/sed.xml?nullam=sed&sit=tincidunt&amet=eu&turpis=felis&elementum=fusce&ligula=posuere&vehicula=felis&consequat=sed&morbi=lacus&a=morbi&ipsum=sem&integer=mauris&a=laoreet&nibh=ut&in=rhoncus&quis=aliquet&justo=pulvinar&maecenas=sed&rhoncus=nisl&aliquam=nunc&lacus=rhoncus&morbi=dui&quis=vel&tortor=sem&id=sed&nulla=sagittis&ultrices=nam&aliquet=congue&maecenas=risus&leo=semper&odio=porta&condimentum=volutpat&id=quam&luctus=pede&nec=lobortis&molestie=ligula&sed=sit&justo=amet&pellentesque=eleifend&viverra=pede&pede=libero&ac=quis&diam=orci&cras=nullam&pellentesque=molestie&volutpat=nibh&dui=in&maecenas=lectus&tristique=pellentesque&est=at&et=nulla&tempus=suspendisse&semper=potenti&est=cras&quam=in&pharetra=purus&magna=eu&ac=magna&consequat=vulputate&metus=luctus&sapien=cum&ut=sociis&nunc=natoque&vestibulum=penatibus&ante=et&ipsum=magnis&primis=dis&in=parturient&faucibus=montes&orci=nascetur&luctus=ridiculus', '5');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('4', '12', 'https://pbs.org/morbi/non/quam/nec/dui/luctus.json?vitae=nec&ipsum=euismod&aliquam=scelerisque&non=quam&mauris=turpis&morbi=adipiscing&non=lorem&lectus=vitae&aliquam=mattis&sit=nibh&amet=ligula&diam=nec&in=sem&magna=duis&bibendum=aliquam&imperdiet=convallis&nullam=nunc&orci=proin&pede=at&venenatis=turpis&non=a&sodales=pede&sed=posuere&tincidunt=nonummy&eu=integer&felis=non&fusce=velit&posuere=donec&felis=diam&sed=neque&lacus=vestibulum&morbi=eget&sem=vulputate&mauris=ut&laoreet=ultrices&ut=vel&rhoncus=augue&aliquet=vestibulum&pulvinar=ante&sed=ipsum&nisl=primis&nunc=in&rhoncus=faucibus&dui=orci&vel=luctus&sem=et&sed=ultrices&sagittis=posuere&nam=cubilia&congue=curae&risus=donec&semper=pharetra&porta=magna&volutpat=vestibulum&quam=aliquet&pede=ultrices&lobortis=erat&ligula=tortor&sit=sollicitudin&amet=mi&eleifend=sit&pede=amet&libero=lobortis&quis=sapien&orci=sapien&nullam=non&molestie=mi&nibh=integer&in=ac&lectus=neque&pellentesque=duis&at=bibendum&nulla=morbi&suspendisse=non&potenti=quam&cras=nec&in=dui&purus=luctus&eu=rutrum&magna=nulla&vulputate=tellus&luctus=in&cum=sagittis&sociis=dui&natoque=vel&penatibus=nisl&et=duis', '17');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('5', '33', 'https://thetimes.co.uk/tincidunt/eget/tempus/vel/pede/morbi/porttitor.jsp?consectetuer=id&adipiscing=mauris&elit=vulputate&proin=elementum&risus=nullam&praesent=varius&lectus=nulla&vestibulum=facilisi&quam=cras&sapien=non&varius=velit&ut=nec&blandit=nisi', '42');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('6', '14', 'http://europa.eu/velit/eu/est/congue/elementum.js?volutpat=cum&dui=sociis&maecenas=natoque&tristique=penatibus&est=et&et=magnis&tempus=dis&semper=parturient&est=montes&quam=nascetur&pharetra=ridiculus&magna=mus&ac=etiam&consequat=vel&metus=augue&sapien=vestibulum&ut=rutrum&nunc=rutrum&vestibulum=neque&ante=aenean&ipsum=auctor&primis=gravida&in=sem&faucibus=praesent&orci=id&luctus=massa', '3');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('7', '17', 'https://craigslist.org/est.jsp?nibh=adipiscing&in=molestie&quis=hendrerit&justo=at&maecenas=vulputate&rhoncus=vitae&aliquam=nisl&lacus=aenean&morbi=lectus&quis=pellentesque&tortor=eget&id=nunc&nulla=donec&ultrices=quis&aliquet=orci&maecenas=eget&leo=orci&odio=vehicula&condimentum=condimentum&id=curabitur', '45');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('8', '27', 'http://google.it/morbi/odio/odio/elementum/eu/interdum.json?nunc=amet&nisl=eros&duis=suspendisse&bibendum=accumsan&felis=tortor&sed=quis&interdum=turpis&venenatis=sed&turpis=ante&enim=vivamus&blandit=tortor&mi=duis&in=mattis&porttitor=egestas&pede=metus&justo=aenean&eu=fermentum&massa=donec&donec=ut&dapibus=mauris&duis=eget&at=massa&velit=tempor&eu=convallis&est=nulla&congue=neque&elementum=libero&in=convallis&hac=eget&habitasse=eleifend&platea=luctus&dictumst=ultricies&morbi=eu&vestibulum=nibh&velit=quisque&id=id&pretium=justo&iaculis=sit&diam=amet&erat=sapien&fermentum=dignissim&justo=vestibulum&nec=vestibulum&condimentum=ante&neque=ipsum&sapien=primis&placerat=in&ante=faucibus&nulla=orci&justo=luctus&aliquam=et&quis=ultrices&turpis=posuere&eget=cubilia&elit=curae', '44');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('9', '19', 'http://baidu.com/nibh/in.jsp?id=ipsum&pretium=praesent&iaculis=blandit&diam=lacinia&erat=erat&fermentum=vestibulum&justo=sed&nec=magna&condimentum=at&neque=nunc&sapien=commodo&placerat=placerat&ante=praesent&nulla=blandit&justo=nam&aliquam=nulla&quis=integer&turpis=pede&eget=justo&elit=lacinia&sodales=eget&scelerisque=tincidunt&mauris=eget&sit=tempus&amet=vel&eros=pede&suspendisse=morbi&accumsan=porttitor&tortor=lorem&quis=id&turpis=ligula&sed=suspendisse&ante=ornare&vivamus=consequat&tortor=lectus&duis=in&mattis=est&egestas=risus&metus=auctor&aenean=sed&fermentum=tristique&donec=in&ut=tempus&mauris=sit&eget=amet&massa=sem&tempor=fusce&convallis=consequat&nulla=nulla&neque=nisl&libero=nunc&convallis=nisl&eget=duis&eleifend=bibendum&luctus=felis&ultricies=sed&eu=interdum&nibh=venenatis&quisque=turpis&id=enim&justo=blandit&sit=mi&amet=in', '1');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('10', '11', 'https://ft.com/nulla/suscipit/ligula.xml?nunc=semper&proin=est&at=quam&turpis=pharetra&a=magna&pede=ac&posuere=consequat&nonummy=metus&integer=sapien&non=ut&velit=nunc&donec=vestibulum&diam=ante&neque=ipsum&vestibulum=primis&eget=in&vulputate=faucibus&ut=orci&ultrices=luctus&vel=et&augue=ultrices&vestibulum=posuere&ante=cubilia&ipsum=curae&primis=mauris&in=viverra&faucibus=diam&orci=vitae&luctus=quam&et=suspendisse&ultrices=potenti&posuere=nullam&cubilia=porttitor&curae=lacus&donec=at&pharetra=turpis&magna=donec&vestibulum=posuere&aliquet=metus&ultrices=vitae&erat=ipsum&tortor=aliquam', '32');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('11', '15', 'http://cdbaby.com/suspendisse/potenti/cras.jpg?justo=pede&nec=justo&condimentum=eu&neque=massa&sapien=donec&placerat=dapibus&ante=duis&nulla=at&justo=velit&aliquam=eu&quis=est&turpis=congue&eget=elementum&elit=in&sodales=hac&scelerisque=habitasse&mauris=platea&sit=dictumst&amet=morbi&eros=vestibulum&suspendisse=velit&accumsan=id&tortor=pretium&quis=iaculis&turpis=diam&sed=erat&ante=fermentum&vivamus=justo&tortor=nec&duis=condimentum&mattis=neque', '1');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('12', '39', 'http://mapquest.com/justo/pellentesque/viverra/pede/ac/diam.jpg?quam=nulla&suspendisse=eget&potenti=eros&nullam=elementum&porttitor=pellentesque&lacus=quisque&at=porta&turpis=volutpat&donec=erat&posuere=quisque&metus=erat&vitae=eros&ipsum=viverra&aliquam=eget&non=congue&mauris=eget&morbi=semper&non=rutrum&lectus=nulla&aliquam=nunc&sit=purus&amet=phasellus&diam=in&in=felis&magna=donec&bibendum=semper&imperdiet=sapien&nullam=a', '12');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('13', '5', 'https://digg.com/orci/luctus/et/ultrices.json?consequat=duis&morbi=bibendum&a=morbi&ipsum=non&integer=quam&a=nec&nibh=dui&in=luctus&quis=rutrum&justo=nulla&maecenas=tellus&rhoncus=in&aliquam=sagittis&lacus=dui&morbi=vel&quis=nisl&tortor=duis&id=ac&nulla=nibh&ultrices=fusce&aliquet=lacus', '27');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('14', '3', 'https://amazon.co.uk/nonummy/integer/non/velit.js?tristique=sagittis&in=sapien&tempus=cum&sit=sociis&amet=natoque&sem=penatibus&fusce=et&consequat=magnis&nulla=dis&nisl=parturient&nunc=montes&nisl=nascetur&duis=ridiculus&bibendum=mus&felis=etiam&sed=vel&interdum=augue&venenatis=vestibulum&turpis=rutrum&enim=rutrum&blandit=neque&mi=aenean&in=auctor&porttitor=gravida&pede=sem&justo=praesent&eu=id&massa=massa&donec=id&dapibus=nisl&duis=venenatis&at=lacinia&velit=aenean&eu=sit&est=amet&congue=justo&elementum=morbi&in=ut&hac=odio&habitasse=cras&platea=mi&dictumst=pede&morbi=malesuada&vestibulum=in&velit=imperdiet&id=et&pretium=commodo&iaculis=vulputate&diam=justo&erat=in&fermentum=blandit&justo=ultrices&nec=enim&condimentum=lorem&neque=ipsum&sapien=dolor&placerat=sit&ante=amet&nulla=consectetuer&justo=adipiscing&aliquam=elit&quis=proin&turpis=interdum&eget=mauris&elit=non&sodales=ligula&scelerisque=pellentesque&mauris=ultrices&sit=phasellus&amet=id&eros=sapien&suspendisse=in&accumsan=sapien&tortor=iaculis&quis=congue&turpis=vivamus&sed=metus&ante=arcu&vivamus=adipiscing&tortor=molestie&duis=hendrerit&mattis=at&egestas=vulputate', '8');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('15', '13', 'https://goodreads.com/vivamus.png?viverra=platea&eget=dictumst&congue=aliquam&eget=augue&semper=quam&rutrum=sollicitudin&nulla=vitae&nunc=consectetuer&purus=eget&phasellus=rutrum&in=at&felis=lorem&donec=integer&semper=tincidunt&sapien=ante&a=vel&libero=ipsum&nam=praesent&dui=blandit&proin=lacinia&leo=erat&odio=vestibulum&porttitor=sed&id=magna&consequat=at&in=nunc&consequat=commodo&ut=placerat&nulla=praesent&sed=blandit&accumsan=nam&felis=nulla&ut=integer&at=pede&dolor=justo&quis=lacinia&odio=eget&consequat=tincidunt&varius=eget&integer=tempus&ac=vel&leo=pede&pellentesque=morbi&ultrices=porttitor&mattis=lorem&odio=id&donec=ligula&vitae=suspendisse&nisi=ornare&nam=consequat&ultrices=lectus&libero=in&non=est&mattis=risus&pulvinar=auctor&nulla=sed&pede=tristique&ullamcorper=in&augue=tempus&a=sit&suscipit=amet&nulla=sem&elit=fusce&ac=consequat&nulla=nulla&sed=nisl&vel=nunc&enim=nisl&sit=duis&amet=bibendum&nunc=felis&viverra=sed&dapibus=interdum&nulla=venenatis&suscipit=turpis&ligula=enim&in=blandit&lacus=mi&curabitur=in&at=porttitor&ipsum=pede&ac=justo&tellus=eu&semper=massa&interdum=donec&mauris=dapibus&ullamcorper=duis&purus=at&sit=velit&amet=eu&nulla=est', '42');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('16', '29', 'http://paginegialle.it/eget/semper/rutrum/nulla/nunc/purus/phasellus.aspx?nisi=vestibulum&vulputate=quam&nonummy=sapien&maecenas=varius&tincidunt=ut&lacus=blandit&at=non&velit=interdum&vivamus=in&vel=ante', '6');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('17', '8', 'https://usda.gov/sociis/natoque/penatibus/et/magnis/dis/parturient.xml?ultrices=donec&libero=posuere&non=metus&mattis=vitae&pulvinar=ipsum&nulla=aliquam&pede=non&ullamcorper=mauris&augue=morbi&a=non&suscipit=lectus&nulla=aliquam&elit=sit&ac=amet&nulla=diam&sed=in&vel=magna&enim=bibendum&sit=imperdiet&amet=nullam&nunc=orci&viverra=pede&dapibus=venenatis&nulla=non&suscipit=sodales&ligula=sed&in=tincidunt&lacus=eu&curabitur=felis&at=fusce&ipsum=posuere&ac=felis&tellus=sed&semper=lacus&interdum=morbi&mauris=sem&ullamcorper=mauris&purus=laoreet&sit=ut&amet=rhoncus&nulla=aliquet&quisque=pulvinar&arcu=sed&libero=nisl&rutrum=nunc', '49');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('18', '24', 'https://multiply.com/ultrices/libero.png?vel=amet&enim=turpis&sit=elementum&amet=ligula&nunc=vehicula&viverra=consequat&dapibus=morbi&nulla=a&suscipit=ipsum&ligula=integer&in=a&lacus=nibh&curabitur=in&at=quis&ipsum=justo&ac=maecenas&tellus=rhoncus&semper=aliquam&interdum=lacus&mauris=morbi&ullamcorper=quis&purus=tortor&sit=id&amet=nulla&nulla=ultrices&quisque=aliquet', '24');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('19', '22', 'http://nih.gov/eget/tincidunt/eget.png?lacus=lectus&purus=suspendisse&aliquet=potenti&at=in&feugiat=eleifend&non=quam&pretium=a&quis=odio&lectus=in&suspendisse=hac&potenti=habitasse&in=platea&eleifend=dictumst&quam=maecenas&a=ut&odio=massa&in=quis&hac=augue&habitasse=luctus&platea=tincidunt&dictumst=nulla&maecenas=mollis&ut=molestie&massa=lorem&quis=quisque&augue=ut&luctus=erat&tincidunt=curabitur&nulla=gravida&mollis=nisi&molestie=at&lorem=nibh&quisque=in&ut=hac&erat=habitasse&curabitur=platea&gravida=dictumst&nisi=aliquam&at=augue&nibh=quam&in=sollicitudin', '31');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('20', '28', 'http://epa.gov/massa/tempor/convallis/nulla.html?mus=cursus&vivamus=vestibulum&vestibulum=proin&sagittis=eu&sapien=mi&cum=nulla&sociis=ac&natoque=enim&penatibus=in&et=tempor&magnis=turpis&dis=nec&parturient=euismod&montes=scelerisque&nascetur=quam&ridiculus=turpis&mus=adipiscing&etiam=lorem&vel=vitae&augue=mattis&vestibulum=nibh&rutrum=ligula&rutrum=nec&neque=sem&aenean=duis&auctor=aliquam&gravida=convallis&sem=nunc&praesent=proin&id=at&massa=turpis&id=a&nisl=pede&venenatis=posuere&lacinia=nonummy&aenean=integer&sit=non&amet=velit&justo=donec&morbi=diam&ut=neque&odio=vestibulum&cras=eget', '23');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('21', '18', 'https://infoseek.co.jp/tempor/turpis/nec/euismod/scelerisque/quam.png?in=ipsum&porttitor=dolor&pede=sit&justo=amet&eu=consectetuer&massa=adipiscing&donec=elit&dapibus=proin&duis=risus&at=praesent&velit=lectus&eu=vestibulum&est=quam&congue=sapien&elementum=varius&in=ut&hac=blandit&habitasse=non&platea=interdum&dictumst=in&morbi=ante&vestibulum=vestibulum', '32');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('22', '4', 'http://loc.gov/ac/consequat/metus/sapien/ut/nunc/vestibulum.js?dictumst=vulputate&morbi=elementum&vestibulum=nullam&velit=varius&id=nulla&pretium=facilisi&iaculis=cras&diam=non&erat=velit&fermentum=nec&justo=nisi&nec=vulputate&condimentum=nonummy&neque=maecenas&sapien=tincidunt&placerat=lacus&ante=at&nulla=velit', '16');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('23', '9', 'http://newsvine.com/odio/consequat/varius/integer/ac.html?nulla=imperdiet&sed=et&accumsan=commodo&felis=vulputate&ut=justo&at=in&dolor=blandit&quis=ultrices&odio=enim&consequat=lorem&varius=ipsum&integer=dolor&ac=sit&leo=amet&pellentesque=consectetuer&ultrices=adipiscing&mattis=elit&odio=proin&donec=interdum&vitae=mauris&nisi=non', '29');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('24', '20', 'http://princeton.edu/quam/nec/dui.jpg?commodo=lacus&vulputate=curabitur&justo=at&in=ipsum&blandit=ac&ultrices=tellus&enim=semper&lorem=interdum&ipsum=mauris&dolor=ullamcorper&sit=purus&amet=sit&consectetuer=amet', '9');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('25', '32', 'https://technorati.com/nisi/vulputate/nonummy/maecenas.xml?turpis=elementum&sed=pellentesque&ante=quisque&vivamus=porta&tortor=volutpat&duis=erat&mattis=quisque&egestas=erat&metus=eros&aenean=viverra&fermentum=eget&donec=congue&ut=eget&mauris=semper&eget=rutrum&massa=nulla&tempor=nunc&convallis=purus&nulla=phasellus&neque=in&libero=felis&convallis=donec&eget=semper&eleifend=sapien&luctus=a&ultricies=libero&eu=nam&nibh=dui&quisque=proin&id=leo&justo=odio&sit=porttitor&amet=id&sapien=consequat&dignissim=in&vestibulum=consequat&vestibulum=ut&ante=nulla&ipsum=sed&primis=accumsan&in=felis&faucibus=ut&orci=at&luctus=dolor&et=quis&ultrices=odio&posuere=consequat&cubilia=varius&curae=integer&nulla=ac&dapibus=leo&dolor=pellentesque&vel=ultrices&est=mattis&donec=odio&odio=donec&justo=vitae&sollicitudin=nisi&ut=nam&suscipit=ultrices&a=libero&feugiat=non&et=mattis&eros=pulvinar&vestibulum=nulla&ac=pede&est=ullamcorper&lacinia=augue', '19');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('26', '35', 'https://booking.com/sed.jsp?sit=turpis&amet=nec&cursus=euismod&id=scelerisque&turpis=quam&integer=turpis&aliquet=adipiscing&massa=lorem&id=vitae&lobortis=mattis&convallis=nibh&tortor=ligula&risus=nec&dapibus=sem&augue=duis&vel=aliquam&accumsan=convallis&tellus=nunc&nisi=proin&eu=at&orci=turpis&mauris=a&lacinia=pede', '2');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('27', '31', 'https://paginegialle.it/nunc/viverra/dapibus/nulla/suscipit.js?mauris=duis&sit=mattis&amet=egestas&eros=metus&suspendisse=aenean&accumsan=fermentum&tortor=donec&quis=ut&turpis=mauris&sed=eget&ante=massa&vivamus=tempor&tortor=convallis&duis=nulla&mattis=neque&egestas=libero&metus=convallis&aenean=eget&fermentum=eleifend&donec=luctus&ut=ultricies&mauris=eu&eget=nibh&massa=quisque&tempor=id&convallis=justo&nulla=sit&neque=amet&libero=sapien&convallis=dignissim&eget=vestibulum&eleifend=vestibulum&luctus=ante&ultricies=ipsum&eu=primis&nibh=in&quisque=faucibus&id=orci&justo=luctus&sit=et&amet=ultrices&sapien=posuere&dignissim=cubilia&vestibulum=curae&vestibulum=nulla&ante=dapibus&ipsum=dolor&primis=vel&in=est&faucibus=donec&orci=odio&luctus=justo&et=sollicitudin&ultrices=ut', '30');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('28', '36', 'https://example.com/morbi/ut/odio/cras/mi/pede.js?quis=sapien&lectus=iaculis&suspendisse=congue&potenti=vivamus&in=metus&eleifend=arcu&quam=adipiscing&a=molestie&odio=hendrerit&in=at&hac=vulputate&habitasse=vitae&platea=nisl&dictumst=aenean&maecenas=lectus&ut=pellentesque&massa=eget&quis=nunc&augue=donec&luctus=quis&tincidunt=orci&nulla=eget&mollis=orci&molestie=vehicula&lorem=condimentum', '41');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('29', '40', 'http://usa.gov/morbi/vestibulum/velit/id.html?dis=justo&parturient=aliquam&montes=quis&nascetur=turpis&ridiculus=eget&mus=elit&etiam=sodales&vel=scelerisque&augue=mauris&vestibulum=sit&rutrum=amet&rutrum=eros&neque=suspendisse&aenean=accumsan&auctor=tortor&gravida=quis&sem=turpis&praesent=sed&id=ante&massa=vivamus&id=tortor&nisl=duis&venenatis=mattis&lacinia=egestas&aenean=metus&sit=aenean&amet=fermentum&justo=donec&morbi=ut&ut=mauris&odio=eget&cras=massa&mi=tempor&pede=convallis&malesuada=nulla&in=neque&imperdiet=libero&et=convallis&commodo=eget&vulputate=eleifend&justo=luctus&in=ultricies&blandit=eu&ultrices=nibh&enim=quisque&lorem=id&ipsum=justo&dolor=sit&sit=amet&amet=sapien&consectetuer=dignissim&adipiscing=vestibulum&elit=vestibulum&proin=ante&interdum=ipsum&mauris=primis&non=in&ligula=faucibus&pellentesque=orci&ultrices=luctus&phasellus=et', '17');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('30', '2', 'https://yellowbook.com/massa.jpg?mi=leo&integer=maecenas&ac=pulvinar&neque=lobortis&duis=est&bibendum=phasellus&morbi=sit&non=amet&quam=erat&nec=nulla&dui=tempus&luctus=vivamus&rutrum=in&nulla=felis&tellus=eu&in=sapien&sagittis=cursus&dui=vestibulum&vel=proin&nisl=eu&duis=mi&ac=nulla&nibh=ac&fusce=enim&lacus=in&purus=tempor&aliquet=turpis&at=nec&feugiat=euismod&non=scelerisque&pretium=quam&quis=turpis&lectus=adipiscing&suspendisse=lorem&potenti=vitae&in=mattis&eleifend=nibh&quam=ligula&a=nec&odio=sem&in=duis&hac=aliquam&habitasse=convallis&platea=nunc&dictumst=proin&maecenas=at&ut=turpis&massa=a&quis=pede&augue=posuere&luctus=nonummy&tincidunt=integer&nulla=non&mollis=velit&molestie=donec&lorem=diam&quisque=neque&ut=vestibulum&erat=eget&curabitur=vulputate&gravida=ut&nisi=ultrices&at=vel&nibh=augue&in=vestibulum&hac=ante&habitasse=ipsum&platea=primis&dictumst=in&aliquam=faucibus&augue=orci&quam=luctus&sollicitudin=et&vitae=ultrices&consectetuer=posuere&eget=cubilia&rutrum=curae&at=donec&lorem=pharetra&integer=magna&tincidunt=vestibulum&ante=aliquet&vel=ultrices&ipsum=erat&praesent=tortor&blandit=sollicitudin&lacinia=mi&erat=sit&vestibulum=amet&sed=lobortis&magna=sapien&at=sapien&nunc=non', '13');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('31', '6', 'http://foxnews.com/non/pretium/quis/lectus/suspendisse/potenti/in.js?vel=ut&nulla=ultrices&eget=vel&eros=augue&elementum=vestibulum&pellentesque=ante&quisque=ipsum&porta=primis&volutpat=in&erat=faucibus&quisque=orci&erat=luctus&eros=et&viverra=ultrices&eget=posuere&congue=cubilia&eget=curae&semper=donec&rutrum=pharetra&nulla=magna&nunc=vestibulum&purus=aliquet&phasellus=ultrices&in=erat&felis=tortor&donec=sollicitudin&semper=mi&sapien=sit&a=amet&libero=lobortis&nam=sapien&dui=sapien&proin=non&leo=mi&odio=integer&porttitor=ac&id=neque&consequat=duis&in=bibendum&consequat=morbi&ut=non&nulla=quam&sed=nec&accumsan=dui&felis=luctus&ut=rutrum&at=nulla&dolor=tellus&quis=in&odio=sagittis&consequat=dui&varius=vel&integer=nisl&ac=duis&leo=ac&pellentesque=nibh&ultrices=fusce&mattis=lacus&odio=purus&donec=aliquet&vitae=at&nisi=feugiat&nam=non&ultrices=pretium&libero=quis&non=lectus&mattis=suspendisse&pulvinar=potenti&nulla=in&pede=eleifend&ullamcorper=quam&augue=a&a=odio&suscipit=in&nulla=hac&elit=habitasse&ac=platea&nulla=dictumst&sed=maecenas&vel=ut&enim=massa&sit=quis&amet=augue&nunc=luctus&viverra=tincidunt&dapibus=nulla&nulla=mollis&suscipit=molestie&ligula=lorem&in=quisque&lacus=ut', '42');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('32', '7', 'http://techcrunch.com/lobortis/sapien/sapien/non.json?mollis=vehicula&molestie=condimentum&lorem=curabitur&quisque=in&ut=libero&erat=ut&curabitur=massa&gravida=volutpat&nisi=convallis&at=morbi&nibh=odio&in=odio&hac=elementum', '36');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('33', '25', 'https://nsw.gov.au/in/hac/habitasse/platea/dictumst/etiam.png?ut=sem&volutpat=praesent&sapien=id&arcu=massa&sed=id&augue=nisl&aliquam=venenatis&erat=lacinia&volutpat=aenean&in=sit&congue=amet&etiam=justo&justo=morbi&etiam=ut&pretium=odio&iaculis=cras&justo=mi&in=pede&hac=malesuada&habitasse=in&platea=imperdiet&dictumst=et&etiam=commodo&faucibus=vulputate&cursus=justo&urna=in&ut=blandit&tellus=ultrices&nulla=enim&ut=lorem&erat=ipsum&id=dolor&mauris=sit&vulputate=amet&elementum=consectetuer&nullam=adipiscing&varius=elit&nulla=proin&facilisi=interdum&cras=mauris&non=non&velit=ligula&nec=pellentesque&nisi=ultrices&vulputate=phasellus&nonummy=id&maecenas=sapien&tincidunt=in&lacus=sapien&at=iaculis&velit=congue&vivamus=vivamus&vel=metus&nulla=arcu&eget=adipiscing&eros=molestie&elementum=hendrerit&pellentesque=at&quisque=vulputate&porta=vitae&volutpat=nisl&erat=aenean&quisque=lectus', '31');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('34', '23', 'https://youtu.be/mauris/sit.jpg?blandit=vulputate&mi=ut&in=ultrices&porttitor=vel&pede=augue&justo=vestibulum&eu=ante&massa=ipsum&donec=primis&dapibus=in&duis=faucibus&at=orci&velit=luctus&eu=et&est=ultrices&congue=posuere&elementum=cubilia&in=curae&hac=donec&habitasse=pharetra&platea=magna&dictumst=vestibulum', '21');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('35', '34', 'https://businesswire.com/tristique.json?turpis=vitae&donec=consectetuer&posuere=eget&metus=rutrum&vitae=at&ipsum=lorem&aliquam=integer&non=tincidunt&mauris=ante&morbi=vel&non=ipsum&lectus=praesent&aliquam=blandit&sit=lacinia&amet=erat&diam=vestibulum&in=sed&magna=magna&bibendum=at&imperdiet=nunc&nullam=commodo&orci=placerat&pede=praesent&venenatis=blandit&non=nam&sodales=nulla&sed=integer&tincidunt=pede&eu=justo&felis=lacinia&fusce=eget&posuere=tincidunt&felis=eget&sed=tempus&lacus=vel&morbi=pede&sem=morbi&mauris=porttitor&laoreet=lorem&ut=id&rhoncus=ligula&aliquet=suspendisse&pulvinar=ornare&sed=consequat&nisl=lectus&nunc=in&rhoncus=est&dui=risus', '49');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('36', '21', 'https://amazon.de/nisl/venenatis.json?turpis=sapien&nec=dignissim&euismod=vestibulum&scelerisque=vestibulum&quam=ante&turpis=ipsum&adipiscing=primis&lorem=in&vitae=faucibus&mattis=orci&nibh=luctus&ligula=et&nec=ultrices&sem=posuere&duis=cubilia&aliquam=curae&convallis=nulla&nunc=dapibus&proin=dolor&at=vel&turpis=est&a=donec&pede=odio&posuere=justo&nonummy=sollicitudin&integer=ut&non=suscipit&velit=a&donec=feugiat&diam=et&neque=eros&vestibulum=vestibulum&eget=ac&vulputate=est&ut=lacinia&ultrices=nisi&vel=venenatis&augue=tristique&vestibulum=fusce&ante=congue&ipsum=diam&primis=id&in=ornare&faucibus=imperdiet', '17');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('37', '1', 'https://fema.gov/luctus/nec/molestie/sed/justo/pellentesque/viverra.json?orci=eu&vehicula=magna&condimentum=vulputate&curabitur=luctus&in=cum&libero=sociis&ut=natoque&massa=penatibus&volutpat=et&convallis=magnis&morbi=dis&odio=parturient&odio=montes&elementum=nascetur&eu=ridiculus&interdum=mus&eu=vivamus&tincidunt=vestibulum&in=sagittis&leo=sapien&maecenas=cum&pulvinar=sociis&lobortis=natoque&est=penatibus&phasellus=et&sit=magnis&amet=dis&erat=parturient&nulla=montes&tempus=nascetur&vivamus=ridiculus&in=mus&felis=etiam&eu=vel', '36');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('38', '37', 'https://opera.com/turpis/adipiscing/lorem.jpg?molestie=sem&nibh=sed&in=sagittis&lectus=nam&pellentesque=congue&at=risus&nulla=semper&suspendisse=porta&potenti=volutpat&cras=quam&in=pede&purus=lobortis&eu=ligula&magna=sit&vulputate=amet&luctus=eleifend&cum=pede&sociis=libero&natoque=quis&penatibus=orci&et=nullam&magnis=molestie&dis=nibh&parturient=in&montes=lectus&nascetur=pellentesque', '21');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('39', '10', 'http://ameblo.jp/cras/in/purus/eu/magna/vulputate.json?aliquam=morbi&augue=sem&quam=mauris&sollicitudin=laoreet&vitae=ut&consectetuer=rhoncus&eget=aliquet&rutrum=pulvinar&at=sed&lorem=nisl&integer=nunc&tincidunt=rhoncus&ante=dui&vel=vel&ipsum=sem&praesent=sed&blandit=sagittis&lacinia=nam&erat=congue&vestibulum=risus&sed=semper&magna=porta&at=volutpat&nunc=quam&commodo=pede&placerat=lobortis&praesent=ligula&blandit=sit&nam=amet&nulla=eleifend&integer=pede&pede=libero&justo=quis&lacinia=orci&eget=nullam&tincidunt=molestie&eget=nibh&tempus=in&vel=lectus&pede=pellentesque&morbi=at&porttitor=nulla&lorem=suspendisse&id=potenti&ligula=cras&suspendisse=in&ornare=purus&consequat=eu&lectus=magna&in=vulputate&est=luctus&risus=cum&auctor=sociis&sed=natoque&tristique=penatibus&in=et&tempus=magnis&sit=dis&amet=parturient&sem=montes&fusce=nascetur&consequat=ridiculus&nulla=mus&nisl=vivamus&nunc=vestibulum&nisl=sagittis&duis=sapien&bibendum=cum&felis=sociis&sed=natoque&interdum=penatibus&venenatis=et&turpis=magnis&enim=dis&blandit=parturient&mi=montes&in=nascetur&porttitor=ridiculus&pede=mus&justo=etiam&eu=vel&massa=augue&donec=vestibulum&dapibus=rutrum&duis=rutrum&at=neque&velit=aenean&eu=auctor&est=gravida&congue=sem', '15');
-INSERT INTO Footage (footageID, gameID, URL, duration) VALUES ('40', '38', 'https://bigcartel.com/at/diam/nam/tristique/tortor/eu/pede.jsp?augue=odio&quam=donec&sollicitudin=vitae&vitae=nisi&consectetuer=nam&eget=ultrices&rutrum=libero&at=non&lorem=mattis&integer=pulvinar&tincidunt=nulla&ante=pede&vel=ullamcorper&ipsum=augue&praesent=a&blandit=suscipit&lacinia=nulla&erat=elit&vestibulum=ac&sed=nulla&magna=sed&at=vel&nunc=enim&commodo=sit&placerat=amet&praesent=nunc&blandit=viverra&nam=dapibus&nulla=nulla&integer=suscipit&pede=ligula&justo=in&lacinia=lacus&eget=curabitur&tincidunt=at&eget=ipsum&tempus=ac&vel=tellus&pede=semper&morbi=interdum&porttitor=mauris&lorem=ullamcorper&id=purus&ligula=sit&suspendisse=amet&ornare=nulla&consequat=quisque&lectus=arcu&in=libero&est=rutrum&risus=ac&auctor=lobortis&sed=vel&tristique=dapibus&in=at&tempus=diam&sit=nam&amet=tristique', '18');
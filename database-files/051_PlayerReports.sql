@@ -1,40 +0,0 @@
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('1', '12', 'Quisque id justo sit amet sapien dignissim vestibulum. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Nulla dapibus dolor vel est.', '7/22/2025', 'duis ac nibh fusce lacus purus aliquet at feugiat', 'id ligula suspendisse ornare consequat lectus in est', 'A');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('2', '25', 'Pellentesque viverra pede ac diam. Cras pellentesque volutpat dui.', '11/28/2025', 'justo in blandit ultrices enim', 'dapibus at diam nam tristique', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('3', '18', 'Aliquam augue quam, sollicitudin vitae, consectetuer eget, rutrum at, lorem. Integer tincidunt ante vel ipsum. Praesent blandit lacinia erat. Vestibulum sed magna at nunc commodo placerat. Praesent blandit.', '2/12/2025', 'sapien placerat ante nulla justo aliquam quis turpis', 'rutrum nulla tellus in sagittis dui vel nisl duis', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('4', '21', 'Morbi vel lectus in quam fringilla rhoncus. Mauris enim leo, rhoncus sed, vestibulum sit amet, cursus id, turpis. Integer aliquet, massa id lobortis convallis, tortor risus dapibus augue, vel accumsan tellus nisi eu orci.', '4/5/2025', 'in purus eu magna vulputate luctus cum sociis', 'et eros vestibulum ac est lacinia nisi', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('5', '1', 'Mauris lacinia sapien quis libero. Nullam sit amet turpis elementum ligula vehicula consequat. Morbi a ipsum. Integer a nibh.', '5/8/2025', 'vulputate justo in blandit ultrices enim', 'sociis natoque penatibus et magnis dis parturient', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('6', '16', 'In eleifend quam a odio.', '10/21/2025', 'ullamcorper purus sit amet nulla quisque arcu libero', 'sodales sed tincidunt eu felis fusce posuere', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('7', '8', 'Vestibulum rutrum rutrum neque. Aenean auctor gravida sem.', '5/22/2025', 'nisl duis ac nibh fusce lacus', 'ante vestibulum ante ipsum primis in faucibus orci luctus et', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('8', '35', 'Quisque erat eros, viverra eget, congue eget, semper rutrum, nulla. Nunc purus. Phasellus in felis. Donec semper sapien a libero.', '5/10/2025', 'mattis odio donec vitae nisi nam', 'id sapien in sapien iaculis congue vivamus metus arcu', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('9', '8', 'Phasellus sit amet erat.', '2/27/2025', 'tincidunt lacus at velit vivamus vel nulla', 'interdum eu tincidunt in leo maecenas pulvinar lobortis est', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('10', '31', 'Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Mauris viverra diam vitae quam. Suspendisse potenti.', '10/31/2025', 'elementum in hac habitasse platea dictumst', 'in felis eu sapien cursus vestibulum proin eu', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('11', '29', 'Proin risus. Praesent lectus. Vestibulum quam sapien, varius ut, blandit non, interdum in, ante. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Duis faucibus accumsan odio. Curabitur convallis.', '7/15/2025', 'vel augue vestibulum rutrum rutrum neque aenean auctor gravida', 'sapien a libero nam dui proin leo odio porttitor', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('12', '12', 'Nunc purus. Phasellus in felis. Donec semper sapien a libero.', '6/29/2025', 'dolor vel est donec odio justo sollicitudin', 'risus praesent lectus vestibulum quam sapien varius ut blandit non', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('13', '19', 'Suspendisse accumsan tortor quis turpis. Sed ante. Vivamus tortor.', '5/25/2025', 'lorem id ligula suspendisse ornare consequat lectus', 'nibh in hac habitasse platea', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('14', '34', 'Fusce consequat. Nulla nisl.', '6/2/2025', 'curabitur in libero ut massa volutpat convallis morbi', 'nibh ligula nec sem duis aliquam convallis nunc proin', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('15', '9', 'Donec ut dolor. Morbi vel lectus in quam fringilla rhoncus.', '1/9/2025', 'tempus vivamus in felis eu sapien cursus', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('16', '7', 'Etiam pretium iaculis justo. In hac habitasse platea dictumst. Etiam faucibus cursus urna. Ut tellus.', '11/25/2025', 'fusce congue diam id ornare imperdiet', 'elit proin risus praesent lectus vestibulum quam sapien', 'A');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('17', '16', 'Etiam pretium iaculis justo.', '10/11/2025', 'ligula sit amet eleifend pede libero quis orci', 'nunc vestibulum ante ipsum primis in faucibus orci luctus et', 'A');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('18', '35', 'Vestibulum quam sapien, varius ut, blandit non, interdum in, ante. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Duis faucibus accumsan odio.', '2/18/2025', 'mauris morbi non lectus aliquam sit amet', 'lobortis sapien sapien non mi integer ac', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('19', '22', 'Integer tincidunt ante vel ipsum. Praesent blandit lacinia erat. Vestibulum sed magna at nunc commodo placerat. Praesent blandit. Nam nulla.', '4/19/2025', 'aliquet ultrices erat tortor sollicitudin mi sit amet lobortis', 'vulputate ut ultrices vel augue vestibulum ante ipsum primis in', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('20', '18', 'Mauris sit amet eros. Suspendisse accumsan tortor quis turpis. Sed ante. Vivamus tortor.', '11/26/2025', 'quam sapien varius ut blandit', 'mauris enim leo rhoncus sed vestibulum sit', 'A');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('21', '4', 'In sagittis dui vel nisl.', '9/24/2025', 'tincidunt eget tempus vel pede', 'vitae quam suspendisse potenti nullam porttitor', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('22', '15', 'Maecenas tincidunt lacus at velit. Vivamus vel nulla eget eros elementum pellentesque.', '3/26/2025', 'nunc viverra dapibus nulla suscipit ligula in lacus curabitur', 'consectetuer adipiscing elit proin interdum mauris non ligula pellentesque', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('23', '14', 'In est risus, auctor sed, tristique in, tempus sit amet, sem. Fusce consequat. Nulla nisl. Nunc nisl.', '3/12/2025', 'eget vulputate ut ultrices vel augue vestibulum', 'viverra pede ac diam cras', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('24', '35', 'Quisque ut erat. Curabitur gravida nisi at nibh. In hac habitasse platea dictumst. Aliquam augue quam, sollicitudin vitae, consectetuer eget, rutrum at, lorem. Integer tincidunt ante vel ipsum.', '11/9/2025', 'ante vel ipsum praesent blandit lacinia erat vestibulum', 'mauris morbi non lectus aliquam sit amet diam', 'A');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('25', '38', 'Curabitur in libero ut massa volutpat convallis. Morbi odio odio, elementum eu, interdum eu, tincidunt in, leo. Maecenas pulvinar lobortis est. Phasellus sit amet erat. Nulla tempus.', '5/29/2025', 'porttitor pede justo eu massa donec dapibus duis', 'massa donec dapibus duis at velit eu est congue elementum', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('26', '35', 'Nam ultrices, libero non mattis pulvinar, nulla pede ullamcorper augue, a suscipit nulla elit ac nulla.', '3/26/2025', 'vel augue vestibulum rutrum rutrum neque', 'nulla tempus vivamus in felis eu sapien', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('27', '30', 'Nullam varius. Nulla facilisi.', '11/26/2025', 'non quam nec dui luctus', 'magna at nunc commodo placerat praesent blandit nam nulla integer', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('28', '7', 'Integer ac leo. Pellentesque ultrices mattis odio. Donec vitae nisi.', '5/14/2025', 'ipsum primis in faucibus orci luctus et', 'non mattis pulvinar nulla pede ullamcorper augue a', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('29', '10', 'Nam dui. Proin leo odio, porttitor id, consequat in, consequat ut, nulla. Sed accumsan felis.', '6/14/2025', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien', 'metus vitae ipsum aliquam non mauris morbi non lectus aliquam', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('30', '9', 'Suspendisse ornare consequat lectus.', '9/13/2025', 'leo rhoncus sed vestibulum sit amet cursus id turpis', 'diam vitae quam suspendisse potenti nullam porttitor lacus', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('31', '23', 'Nulla suscipit ligula in lacus.', '10/20/2025', 'neque duis bibendum morbi non quam nec dui luctus', 'nam congue risus semper porta volutpat quam pede lobortis', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('32', '17', 'Suspendisse accumsan tortor quis turpis. Sed ante.', '3/12/2025', 'morbi non quam nec dui luctus rutrum nulla', 'ipsum dolor sit amet consectetuer', 'B');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('33', '5', 'Suspendisse ornare consequat lectus. In est risus, auctor sed, tristique in, tempus sit amet, sem. Fusce consequat.', '2/7/2025', 'sed lacus morbi sem mauris laoreet ut rhoncus aliquet', 'non velit donec diam neque vestibulum eget vulputate ut ultrices', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('34', '27', 'Nulla mollis molestie lorem. Quisque ut erat.', '2/1/2025', 'eleifend quam a odio in hac habitasse platea dictumst', 'vulputate vitae nisl aenean lectus pellentesque eget', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('35', '9', 'Nunc rhoncus dui vel sem.', '5/29/2025', 'gravida nisi at nibh in hac', 'viverra pede ac diam cras pellentesque volutpat dui maecenas', 'C');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('36', '35', 'Fusce congue, diam id ornare imperdiet, sapien urna pretium nisl, ut volutpat sapien arcu sed augue.', '5/8/2025', 'sit amet nunc viverra dapibus nulla suscipit ligula in', 'pellentesque viverra pede ac diam', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('37', '28', 'Cras mi pede, malesuada in, imperdiet et, commodo vulputate, justo. In blandit ultrices enim.', '10/2/2025', 'semper interdum mauris ullamcorper purus sit amet nulla', 'nunc viverra dapibus nulla suscipit', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('38', '3', 'Donec ut mauris eget massa tempor convallis. Nulla neque libero, convallis eget, eleifend luctus, ultricies eu, nibh.', '8/14/2025', 'morbi a ipsum integer a', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 'F');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('39', '33', 'Fusce consequat. Nulla nisl. Nunc nisl. Duis bibendum, felis sed interdum venenatis, turpis enim blandit mi, in porttitor pede justo eu massa.', '9/14/2025', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit', 'aenean auctor gravida sem praesent', 'D');
-INSERT INTO PlayerReports (reportID, playerID, summary, date, strengths, weaknesses, grade) VALUES ('40', '23', 'Fusce congue, diam id ornare imperdiet, sapien urna pretium nisl, ut volutpat sapien arcu sed augue. Aliquam erat volutpat. In congue. Etiam justo.', '12/10/2024', 'sed justo pellentesque viverra pede ac', 'fusce posuere felis sed lacus morbi sem mauris', 'D');
@@ -1,122 +0,0 @@
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('33', '7');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('26', '23');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('38', '17');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('10', '38');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('20', '26');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('25', '2');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('15', '2');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('12', '21');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('6', '28');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('24', '30');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('6', '24');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('16', '3');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('25', '7');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('11', '21');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('30', '4');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('32', '19');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('37', '22');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('23', '2');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('13', '36');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('26', '32');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('2', '14');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('2', '18');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('38', '21');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('20', '11');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('36', '10');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('40', '15');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('26', '4');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('7', '29');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('9', '16');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('10', '21');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('23', '20');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('9', '30');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('19', '11');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('7', '24');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('27', '9');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('19', '33');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('4', '23');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('10', '11');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('11', '28');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('8', '16');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('34', '40');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('30', '3');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('28', '10');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('12', '19');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('3', '37');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('4', '8');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('12', '36');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('33', '23');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('22', '20');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('37', '6');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('13', '8');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('33', '4');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('14', '14');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('15', '38');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('7', '14');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('40', '26');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('37', '31');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('10', '16');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('22', '33');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('33', '8');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('40', '39');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('1', '27');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('3', '40');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('12', '10');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('8', '18');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('19', '3');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('26', '37');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('27', '4');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('28', '20');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('35', '36');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('1', '7');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('38', '23');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('21', '21');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('24', '19');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('2', '7');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('5', '22');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('28', '32');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('7', '9');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('12', '29');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('11', '16');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('23', '14');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('37', '4');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('16', '34');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('15', '29');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('11', '24');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('13', '26');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('25', '23');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('21', '13');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('20', '5');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('19', '22');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('21', '38');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('30', '18');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('10', '20');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('2', '2');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('12', '5');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('23', '22');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('25', '6');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('5', '36');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('7', '32');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('1', '13');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('20', '31');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('6', '17');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('34', '19');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('15', '21');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('24', '7');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('21', '10');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('35', '29');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('37', '28');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('18', '27');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('40', '35');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('22', '8');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('13', '38');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('14', '11');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('16', '26');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('27', '1');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('4', '24');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('33', '39');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('31', '16');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('3', '4');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('11', '40');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('38', '34');
-INSERT INTO ScoutActivity (gameID, scoutID) VALUES ('17', '30');
@@ -1,40 +0,0 @@
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('1', '1', '1', 'pending', '5/2/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('2', '2', '2', 'inactive', '7/5/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('3', '3', '3', 'inactive', '8/25/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('4', '4', '4', 'pending', '6/23/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('5', '5', '5', 'inactive', '8/6/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('6', '6', '6', 'pending', '11/26/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('7', '7', '7', 'active', '1/24/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('8', '8', '8', 'active', '6/23/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('9', '9', '9', 'pending', '11/23/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('10', '10', '10', 'pending', '3/29/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('11', '11', '11', 'active', '6/22/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('12', '12', '12', 'active', '11/9/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('13', '13', '13', 'active', '3/1/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('14', '14', '14', 'active', '5/28/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('15', '15', '15', 'pending', '1/14/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('16', '16', '16', 'active', '12/27/2024');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('17', '17', '17', 'active', '6/19/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('18', '18', '18', 'pending', '12/10/2024');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('19', '19', '19', 'active', '7/12/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('20', '20', '20', 'inactive', '4/9/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('21', '21', '21', 'pending', '7/5/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('22', '22', '22', 'active', '9/8/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('23', '23', '23', 'active', '1/6/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('24', '24', '24', 'inactive', '6/24/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('25', '25', '25', 'active', '6/10/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('26', '26', '26', 'pending', '9/17/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('27', '27', '27', 'pending', '3/25/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('28', '28', '28', 'pending', '4/5/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('29', '29', '29', 'inactive', '8/2/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('30', '30', '30', 'inactive', '12/4/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('31', '31', '31', 'inactive', '4/20/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('32', '32', '32', 'active', '4/17/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('33', '33', '33', 'active', '4/17/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('34', '34', '34', 'pending', '4/7/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('35', '35', '35', 'pending', '6/15/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('36', '36', '36', 'pending', '8/19/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('37', '37', '37', 'active', '6/4/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('38', '38', '38', 'pending', '8/18/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('39', '39', '39', 'pending', '6/21/2025');
-INSERT INTO Offers (offerID, playerID, schoolID, status, date) VALUES ('40', '40', '40', 'active', '8/7/2025');
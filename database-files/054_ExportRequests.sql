@@ -1,40 +0,0 @@
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('1', 'PDF', '5/7/2025', 'Mookie Betts');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('2', 'PNG', '3/4/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('3', 'JPEG', '6/12/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('4', 'PDF', '1/30/2025', 'Mike Trout');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('5', 'JPEG', '4/2/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('6', 'PNG', '12/23/2024', 'Mike Trout');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('7', 'XLSX', '3/1/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('8', 'XLSX', '7/23/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('9', 'JPEG', '12/27/2024', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('10', 'DOCX', '5/27/2025', 'Mookie Betts');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('11', 'JPEG', '3/10/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('12', 'DOCX', '7/31/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('13', 'DOCX', '1/7/2025', 'Mookie Betts');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('14', 'JPEG', '3/23/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('15', 'PNG', '12/14/2024', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('16', 'PDF', '9/4/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('17', 'JPEG', '6/21/2025', 'Mike Trout');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('18', 'PDF', '11/27/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('19', 'DOCX', '4/3/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('20', 'PDF', '6/30/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('21', 'PDF', '2/8/2025', 'Mike Trout');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('22', 'PNG', '8/26/2025', 'Mookie Betts');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('23', 'DOCX', '11/1/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('24', 'PNG', '10/11/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('25', 'PDF', '7/27/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('26', 'XLSX', '7/30/2025', 'Mike Trout');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('27', 'XLSX', '9/9/2025', 'Mookie Betts');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('28', 'JPEG', '7/21/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('29', 'JPEG', '8/8/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('30', 'XLSX', '10/21/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('31', 'JPEG', '8/5/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('32', 'DOCX', '8/25/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('33', 'PNG', '11/23/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('34', 'XLSX', '3/18/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('35', 'JPEG', '12/12/2024', 'Mike Trout');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('36', 'JPEG', '6/23/2025', 'Francisco Lindor');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('37', 'DOCX', '2/28/2025', 'Aaron Judge');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('38', 'XLSX', '7/7/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('39', 'JPEG', '8/15/2025', 'Bryce Harper');
-INSERT INTO ExportRequests (exportID, format, timestamp, player) VALUES ('40', 'PNG', '11/7/2025', 'Francisco Lindor');
@@ -1,112 +0,0 @@
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('1', '8', '11/15/2025', 'In sagittis dui vel nisl. Duis ac nibh. Fusce lacus purus, aliquet at, feugiat non, pretium quis, lectus.
-
-Suspendisse potenti. In eleifend quam a odio. In hac habitasse platea dictumst.
-
-Maecenas ut massa quis augue luctus tincidunt. Nulla mollis molestie lorem. Quisque ut erat.', '21');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('2', '11', '7/22/2025', 'Etiam vel augue. Vestibulum rutrum rutrum neque. Aenean auctor gravida sem.
-
-Praesent id massa id nisl venenatis lacinia. Aenean sit amet justo. Morbi ut odio.
-
-Cras mi pede, malesuada in, imperdiet et, commodo vulputate, justo. In blandit ultrices enim. Lorem ipsum dolor sit amet, consectetuer adipiscing elit.', '9');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('3', '14', '1/14/2025', 'Nullam porttitor lacus at turpis. Donec posuere metus vitae ipsum. Aliquam non mauris.
-
-Morbi non lectus. Aliquam sit amet diam in magna bibendum imperdiet. Nullam orci pede, venenatis non, sodales sed, tincidunt eu, felis.', '6');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('4', '32', '5/1/2025', 'Nullam sit amet turpis elementum ligula vehicula consequat. Morbi a ipsum. Integer a nibh.
-
-In quis justo. Maecenas rhoncus aliquam lacus. Morbi quis tortor id nulla ultrices aliquet.
-
-Maecenas leo odio, condimentum id, luctus nec, molestie sed, justo. Pellentesque viverra pede ac diam. Cras pellentesque volutpat dui.', '5');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('5', '19', '8/30/2025', 'Sed sagittis. Nam congue, risus semper porta volutpat, quam pede lobortis ligula, sit amet eleifend pede libero quis orci. Nullam molestie nibh in lectus.', '29');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('6', '30', '7/5/2025', 'Aliquam quis turpis eget elit sodales scelerisque. Mauris sit amet eros. Suspendisse accumsan tortor quis turpis.
-
-Sed ante. Vivamus tortor. Duis mattis egestas metus.', '29');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('7', '28', '11/7/2025', 'Vestibulum ac est lacinia nisi venenatis tristique. Fusce congue, diam id ornare imperdiet, sapien urna pretium nisl, ut volutpat sapien arcu sed augue. Aliquam erat volutpat.', '31');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('8', '38', '5/25/2025', 'Etiam vel augue. Vestibulum rutrum rutrum neque. Aenean auctor gravida sem.
-
-Praesent id massa id nisl venenatis lacinia. Aenean sit amet justo. Morbi ut odio.
-
-Cras mi pede, malesuada in, imperdiet et, commodo vulputate, justo. In blandit ultrices enim. Lorem ipsum dolor sit amet, consectetuer adipiscing elit.', '6');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('9', '12', '6/13/2025', 'In congue. Etiam justo. Etiam pretium iaculis justo.
-
-In hac habitasse platea dictumst. Etiam faucibus cursus urna. Ut tellus.', '28');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('10', '28', '8/19/2025', 'Sed sagittis. Nam congue, risus semper porta volutpat, quam pede lobortis ligula, sit amet eleifend pede libero quis orci. Nullam molestie nibh in lectus.', '37');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('11', '1', '4/7/2025', 'Vestibulum ac est lacinia nisi venenatis tristique. Fusce congue, diam id ornare imperdiet, sapien urna pretium nisl, ut volutpat sapien arcu sed augue. Aliquam erat volutpat.', '22');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('12', '21', '3/12/2025', 'Maecenas leo odio, condimentum id, luctus nec, molestie sed, justo. Pellentesque viverra pede ac diam. Cras pellentesque volutpat dui.
-
-Maecenas tristique, est et tempus semper, est quam pharetra magna, ac consequat metus sapien ut nunc. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Mauris viverra diam vitae quam. Suspendisse potenti.
-
-Nullam porttitor lacus at turpis. Donec posuere metus vitae ipsum. Aliquam non mauris.', '15');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('13', '16', '2/27/2025', 'Proin leo odio, porttitor id, consequat in, consequat ut, nulla. Sed accumsan felis. Ut at dolor quis odio consequat varius.', '34');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('14', '38', '5/22/2025', 'Nam ultrices, libero non mattis pulvinar, nulla pede ullamcorper augue, a suscipit nulla elit ac nulla. Sed vel enim sit amet nunc viverra dapibus. Nulla suscipit ligula in lacus.', '39');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('15', '38', '12/30/2024', 'Phasellus sit amet erat. Nulla tempus. Vivamus in felis eu sapien cursus vestibulum.', '13');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('16', '28', '7/14/2025', 'Fusce consequat. Nulla nisl. Nunc nisl.
-
-Duis bibendum, felis sed interdum venenatis, turpis enim blandit mi, in porttitor pede justo eu massa. Donec dapibus. Duis at velit eu est congue elementum.
-
-In hac habitasse platea dictumst. Morbi vestibulum, velit id pretium iaculis, diam erat fermentum justo, nec condimentum neque sapien placerat ante. Nulla justo.', '13');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('17', '8', '12/18/2024', 'Duis aliquam convallis nunc. Proin at turpis a pede posuere nonummy. Integer non velit.
-
-Donec diam neque, vestibulum eget, vulputate ut, ultrices vel, augue. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Donec pharetra, magna vestibulum aliquet ultrices, erat tortor sollicitudin mi, sit amet lobortis sapien sapien non mi. Integer ac neque.', '20');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('18', '30', '10/3/2025', 'Nullam porttitor lacus at turpis. Donec posuere metus vitae ipsum. Aliquam non mauris.
-
-Morbi non lectus. Aliquam sit amet diam in magna bibendum imperdiet. Nullam orci pede, venenatis non, sodales sed, tincidunt eu, felis.', '40');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('19', '32', '3/21/2025', 'Proin eu mi. Nulla ac enim. In tempor, turpis nec euismod scelerisque, quam turpis adipiscing lorem, vitae mattis nibh ligula nec sem.', '17');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('20', '1', '8/30/2025', 'Suspendisse potenti. In eleifend quam a odio. In hac habitasse platea dictumst.
-
-Maecenas ut massa quis augue luctus tincidunt. Nulla mollis molestie lorem. Quisque ut erat.', '34');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('21', '28', '4/12/2025', 'Vestibulum quam sapien, varius ut, blandit non, interdum in, ante. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Duis faucibus accumsan odio. Curabitur convallis.
-
-Duis consequat dui nec nisi volutpat eleifend. Donec ut dolor. Morbi vel lectus in quam fringilla rhoncus.
-
-Mauris enim leo, rhoncus sed, vestibulum sit amet, cursus id, turpis. Integer aliquet, massa id lobortis convallis, tortor risus dapibus augue, vel accumsan tellus nisi eu orci. Mauris lacinia sapien quis libero.', '5');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('22', '2', '2/17/2025', 'Etiam vel augue. Vestibulum rutrum rutrum neque. Aenean auctor gravida sem.
-
-Praesent id massa id nisl venenatis lacinia. Aenean sit amet justo. Morbi ut odio.
-
-Cras mi pede, malesuada in, imperdiet et, commodo vulputate, justo. In blandit ultrices enim. Lorem ipsum dolor sit amet, consectetuer adipiscing elit.', '16');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('23', '30', '10/1/2025', 'Phasellus in felis. Donec semper sapien a libero. Nam dui.
-
-Proin leo odio, porttitor id, consequat in, consequat ut, nulla. Sed accumsan felis. Ut at dolor quis odio consequat varius.
-
-Integer ac leo. Pellentesque ultrices mattis odio. Donec vitae nisi.', '32');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('24', '22', '1/14/2025', 'Proin leo odio, porttitor id, consequat in, consequat ut, nulla. Sed accumsan felis. Ut at dolor quis odio consequat varius.', '5');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('25', '38', '8/5/2025', 'Maecenas tristique, est et tempus semper, est quam pharetra magna, ac consequat metus sapien ut nunc. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Mauris viverra diam vitae quam. Suspendisse potenti.', '14');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('26', '14', '1/20/2025', 'Donec diam neque, vestibulum eget, vulputate ut, ultrices vel, augue. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Donec pharetra, magna vestibulum aliquet ultrices, erat tortor sollicitudin mi, sit amet lobortis sapien sapien non mi. Integer ac neque.
-
-Duis bibendum. Morbi non quam nec dui luctus rutrum. Nulla tellus.
-
-In sagittis dui vel nisl. Duis ac nibh. Fusce lacus purus, aliquet at, feugiat non, pretium quis, lectus.', '19');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('27', '1', '11/28/2025', 'In hac habitasse platea dictumst. Etiam faucibus cursus urna. Ut tellus.
-
-Nulla ut erat id mauris vulputate elementum. Nullam varius. Nulla facilisi.', '30');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('28', '35', '9/27/2025', 'Duis consequat dui nec nisi volutpat eleifend. Donec ut dolor. Morbi vel lectus in quam fringilla rhoncus.
-
-Mauris enim leo, rhoncus sed, vestibulum sit amet, cursus id, turpis. Integer aliquet, massa id lobortis convallis, tortor risus dapibus augue, vel accumsan tellus nisi eu orci. Mauris lacinia sapien quis libero.', '26');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('29', '14', '2/23/2025', 'Curabitur gravida nisi at nibh. In hac habitasse platea dictumst. Aliquam augue quam, sollicitudin vitae, consectetuer eget, rutrum at, lorem.
-
-Integer tincidunt ante vel ipsum. Praesent blandit lacinia erat. Vestibulum sed magna at nunc commodo placerat.', '40');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('30', '25', '12/7/2024', 'Duis bibendum. Morbi non quam nec dui luctus rutrum. Nulla tellus.
-
-In sagittis dui vel nisl. Duis ac nibh. Fusce lacus purus, aliquet at, feugiat non, pretium quis, lectus.
-
-Suspendisse potenti. In eleifend quam a odio. In hac habitasse platea dictumst.', '35');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('31', '23', '3/10/2025', 'Praesent blandit. Nam nulla. Integer pede justo, lacinia eget, tincidunt eget, tempus vel, pede.', '23');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('32', '10', '3/17/2025', 'Cras non velit nec nisi vulputate nonummy. Maecenas tincidunt lacus at velit. Vivamus vel nulla eget eros elementum pellentesque.
-
-Quisque porta volutpat erat. Quisque erat eros, viverra eget, congue eget, semper rutrum, nulla. Nunc purus.', '16');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('33', '15', '2/23/2025', 'Praesent id massa id nisl venenatis lacinia. Aenean sit amet justo. Morbi ut odio.
-
-Cras mi pede, malesuada in, imperdiet et, commodo vulputate, justo. In blandit ultrices enim. Lorem ipsum dolor sit amet, consectetuer adipiscing elit.
-
-Proin interdum mauris non ligula pellentesque ultrices. Phasellus id sapien in sapien iaculis congue. Vivamus metus arcu, adipiscing molestie, hendrerit at, vulputate vitae, nisl.', '11');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('34', '6', '11/3/2025', 'In quis justo. Maecenas rhoncus aliquam lacus. Morbi quis tortor id nulla ultrices aliquet.', '13');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('35', '34', '9/23/2025', 'In hac habitasse platea dictumst. Morbi vestibulum, velit id pretium iaculis, diam erat fermentum justo, nec condimentum neque sapien placerat ante. Nulla justo.', '31');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('36', '35', '10/3/2025', 'Duis consequat dui nec nisi volutpat eleifend. Donec ut dolor. Morbi vel lectus in quam fringilla rhoncus.
-
-Mauris enim leo, rhoncus sed, vestibulum sit amet, cursus id, turpis. Integer aliquet, massa id lobortis convallis, tortor risus dapibus augue, vel accumsan tellus nisi eu orci. Mauris lacinia sapien quis libero.', '23');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('37', '17', '2/24/2025', 'Morbi porttitor lorem id ligula. Suspendisse ornare consequat lectus. In est risus, auctor sed, tristique in, tempus sit amet, sem.', '29');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('38', '11', '12/4/2025', 'In hac habitasse platea dictumst. Morbi vestibulum, velit id pretium iaculis, diam erat fermentum justo, nec condimentum neque sapien placerat ante. Nulla justo.
-
-Aliquam quis turpis eget elit sodales scelerisque. Mauris sit amet eros. Suspendisse accumsan tortor quis turpis.', '35');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('39', '19', '11/17/2025', 'Praesent blandit. Nam nulla. Integer pede justo, lacinia eget, tincidunt eget, tempus vel, pede.', '4');
-INSERT INTO Annotations (annotationID, reportID, timestamp, text, footageID) VALUES ('40', '32', '1/9/2025', 'Maecenas tristique, est et tempus semper, est quam pharetra magna, ac consequat metus sapien ut nunc. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Mauris viverra diam vitae quam. Suspendisse potenti.', '37');
@@ -1,40 +0,0 @@
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('1', 'method4', 'Barnabe', '9/10/2025', '17');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('2', 'calculation1', 'Holt', '2/28/2025', '69');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('3', 'method4', 'Ricky', '2/20/2025', '73');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('4', 'calculation1', 'Hans', '11/2/2025', '53');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('5', 'equation3', 'Michelle', '11/23/2025', '13');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('6', 'algorithm5', 'Dimitri', '11/24/2025', '43');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('7', 'calculation1', 'Callida', '5/4/2025', '46');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('8', 'formula2', 'Eduard', '10/29/2025', '18');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('9', 'formula2', 'Raychel', '9/27/2025', '19');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('10', 'algorithm5', 'Miltie', '6/10/2025', '61');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('11', 'algorithm5', 'Alessandro', '12/31/2024', '43');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('12', 'equation3', 'Vin', '2/12/2025', '47');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('13', 'algorithm5', 'Cori', '3/31/2025', '8');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('14', 'calculation1', 'Kenyon', '9/15/2025', '48');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('15', 'algorithm5', 'Heath', '4/29/2025', '19');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('16', 'calculation1', 'Meghan', '7/17/2025', '24');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('17', 'equation3', 'Rudolfo', '6/22/2025', '49');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('18', 'calculation1', 'Ashlin', '12/4/2025', '46');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('19', 'algorithm5', 'Demetris', '3/1/2025', '31');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('20', 'equation3', 'Albrecht', '2/28/2025', '12');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('21', 'calculation1', 'Clarabelle', '2/27/2025', '61');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('22', 'calculation1', 'Gwenore', '6/16/2025', '24');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('23', 'equation3', 'Jen', '10/28/2025', '15');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('24', 'algorithm5', 'Moshe', '10/22/2025', '44');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('25', 'formula2', 'Guthry', '5/30/2025', '21');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('26', 'equation3', 'Osborn', '4/5/2025', '5');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('27', 'algorithm5', 'Juliane', '2/14/2025', '16');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('28', 'method4', 'Ogdan', '7/30/2025', '15');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('29', 'method4', 'Jon', '11/14/2025', '70');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('30', 'method4', 'Tilly', '8/26/2025', '59');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('31', 'formula2', 'Therine', '11/21/2025', '45');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('32', 'equation3', 'Maurits', '1/2/2025', '68');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('33', 'method4', 'Monica', '10/3/2025', '41');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('34', 'method4', 'Roanne', '10/18/2025', '26');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('35', 'calculation1', 'Hendrik', '10/7/2025', '64');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('36', 'algorithm5', 'Garret', '10/26/2025', '36');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('37', 'algorithm5', 'Vergil', '12/6/2025', '47');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('38', 'calculation1', 'Nixie', '10/27/2025', '16');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('39', 'algorithm5', 'Natasha', '1/12/2025', '73');
-INSERT INTO MetricFormula (formulaID, formulaName, createdBy, dateCreated, metricID) VALUES ('40', 'algorithm5', 'Margarete', '8/29/2025', '61');
@@ -1,40 +0,0 @@
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('1', 'Air Canada', 'points', 'area', '11/30/2025', 'price', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('2', 'Ethiopian Airlines', 'rebounds', 'line', '10/5/2025', 'brand', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('3', 'Emirates', 'steals', 'bar', '11/6/2025', 'price', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('4', 'Aeroméxico', 'blocks', 'scatter', '3/9/2025', 'weight', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('5', 'Air India', 'rebounds', 'pie', '12/2/2025', 'color', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('6', 'South African Airways', 'rebounds', 'scatter', '4/15/2025', 'weight', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('7', 'Air India', 'assists', 'area', '1/1/2025', 'rating', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('8', 'Alitalia', 'assists', 'bar', '3/8/2025', 'size', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('9', 'Korean Air', 'points', 'bar', '7/18/2025', 'color', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('10', 'South African Airways', 'rebounds', 'bar', '2/18/2025', 'brand', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('11', 'Ethiopian Airlines', 'steals', 'area', '1/25/2025', 'brand', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('12', 'British Airways', 'points', 'bar', '12/24/2024', 'brand', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('13', 'Qatar Airways', 'points', 'line', '1/23/2025', 'size', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('14', 'Air Canada', 'points', 'area', '7/23/2025', 'weight', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('15', 'Qantas', 'assists', 'area', '2/13/2025', 'rating', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('16', 'Avianca', 'assists', 'bar', '1/22/2025', 'size', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('17', 'All Nippon Airways', 'steals', 'pie', '1/26/2025', 'color', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('18', 'Avianca', 'steals', 'scatter', '9/8/2025', 'rating', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('19', 'Air India', 'assists', 'bar', '10/30/2025', 'color', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('20', 'South African Airways', 'rebounds', 'line', '6/24/2025', 'weight', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('21', 'All Nippon Airways', 'rebounds', 'scatter', '5/23/2025', 'rating', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('22', 'Air France', 'points', 'line', '4/16/2025', 'brand', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('23', 'Avianca', 'points', 'pie', '2/6/2025', 'weight', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('24', 'SAS Scandinavian', 'steals', 'area', '7/4/2025', 'rating', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('25', 'Emirates', 'rebounds', 'bar', '1/18/2025', 'weight', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('26', 'Singapore Airlines', 'points', 'bar', '11/17/2025', 'price', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('27', 'Singapore Airlines', 'rebounds', 'scatter', '12/12/2024', 'rating', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('28', 'Qantas', 'steals', 'area', '4/6/2025', 'color', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('29', 'Iberia', 'points', 'bar', '12/2/2025', 'weight', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('30', 'Korean Air', 'assists', 'pie', '9/22/2025', 'price', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('31', 'Korean Air', 'blocks', 'area', '1/12/2025', 'color', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('32', 'Ethiopian Airlines', 'steals', 'area', '11/19/2025', 'size', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('33', 'Lufthansa', 'steals', 'line', '8/12/2025', 'weight', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('34', 'British Airways', 'steals', 'pie', '7/15/2025', 'brand', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('35', 'United Airlines', 'blocks', 'bar', '8/2/2025', 'size', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('36', 'Korean Air', 'rebounds', 'line', '3/8/2025', 'weight', 'neutral');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('37', 'Singapore Airlines', 'assists', 'area', '2/10/2025', 'color', 'not recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('38', 'KLM Royal Dutch Airlines', 'blocks', 'line', '7/23/2025', 'price', 'highly recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('39', 'KLM Royal Dutch Airlines', 'points', 'line', '2/8/2025', 'rating', 'recommended');
-INSERT INTO Dashboard (dashboardID, dashboardName, metricDisplayed, chartType, lastUpdated, filterCriteria, recommendation) VALUES ('40', 'Qatar Airways', 'steals', 'line', '1/17/2025', 'color', 'recommended');
@@ -1,125 +0,0 @@
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('7', '41');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '75');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('20', '20');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('17', '43');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('24', '61');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('26', '45');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('31', '60');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('17', '63');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('14', '25');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('23', '48');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('15', '40');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('4', '13');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('6', '30');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '35');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('12', '70');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('35', '1');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('1', '54');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('20', '12');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '58');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('32', '42');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('9', '69');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '47');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('29', '25');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('4', '9');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('5', '7');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('28', '34');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('16', '72');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('30', '32');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('34', '47');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '43');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '70');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '26');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('37', '56');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('1', '11');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('12', '13');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('29', '6');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('16', '71');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '49');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('34', '61');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('23', '1');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('15', '33');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('27', '60');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('32', '22');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('2', '39');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('33', '15');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('40', '38');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('34', '34');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('25', '11');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('33', '21');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '70');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('24', '11');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '64');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('18', '13');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('14', '48');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('1', '67');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('22', '49');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('16', '35');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '11');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('7', '52');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('18', '23');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('18', '34');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('32', '43');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('31', '31');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('28', '63');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('33', '32');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('1', '22');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '67');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('19', '1');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('17', '19');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('15', '18');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('23', '54');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('27', '45');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('40', '16');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('38', '3');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('6', '42');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('6', '35');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('8', '36');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('30', '13');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('14', '74');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('7', '62');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('31', '7');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('17', '67');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('37', '49');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('19', '73');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('15', '48');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('3', '55');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('21', '10');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('26', '2');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '56');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('22', '42');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('1', '59');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('14', '5');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('15', '2');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('31', '61');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('5', '58');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('39', '27');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('6', '74');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('14', '53');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('21', '70');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('3', '16');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('11', '1');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('38', '33');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('36', '7');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('12', '65');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('27', '40');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('20', '8');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('15', '54');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('28', '64');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('29', '17');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('19', '50');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('24', '21');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('25', '30');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('33', '72');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('37', '9');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('17', '75');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('4', '20');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('32', '13');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('30', '15');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('13', '56');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('35', '51');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('10', '46');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('22', '73');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('26', '26');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('34', '41');
-INSERT INTO DashboardMetrics (dashboardID, metricID) VALUES ('18', '55');
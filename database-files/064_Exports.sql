@@ -1,121 +0,0 @@
-INSERT INTO Exports (playerID, exportID) VALUES ('34', '6');
-INSERT INTO Exports (playerID, exportID) VALUES ('19', '3');
-INSERT INTO Exports (playerID, exportID) VALUES ('23', '14');
-INSERT INTO Exports (playerID, exportID) VALUES ('29', '9');
-INSERT INTO Exports (playerID, exportID) VALUES ('20', '12');
-INSERT INTO Exports (playerID, exportID) VALUES ('7', '4');
-INSERT INTO Exports (playerID, exportID) VALUES ('18', '26');
-INSERT INTO Exports (playerID, exportID) VALUES ('27', '28');
-INSERT INTO Exports (playerID, exportID) VALUES ('12', '3');
-INSERT INTO Exports (playerID, exportID) VALUES ('17', '24');
-INSERT INTO Exports (playerID, exportID) VALUES ('30', '37');
-INSERT INTO Exports (playerID, exportID) VALUES ('21', '22');
-INSERT INTO Exports (playerID, exportID) VALUES ('9', '37');
-INSERT INTO Exports (playerID, exportID) VALUES ('37', '7');
-INSERT INTO Exports (playerID, exportID) VALUES ('5', '25');
-INSERT INTO Exports (playerID, exportID) VALUES ('40', '29');
-INSERT INTO Exports (playerID, exportID) VALUES ('8', '26');
-INSERT INTO Exports (playerID, exportID) VALUES ('37', '37');
-INSERT INTO Exports (playerID, exportID) VALUES ('38', '35');
-INSERT INTO Exports (playerID, exportID) VALUES ('3', '34');
-INSERT INTO Exports (playerID, exportID) VALUES ('30', '20');
-INSERT INTO Exports (playerID, exportID) VALUES ('2', '28');
-INSERT INTO Exports (playerID, exportID) VALUES ('26', '2');
-INSERT INTO Exports (playerID, exportID) VALUES ('4', '40');
-INSERT INTO Exports (playerID, exportID) VALUES ('14', '21');
-INSERT INTO Exports (playerID, exportID) VALUES ('25', '19');
-INSERT INTO Exports (playerID, exportID) VALUES ('19', '38');
-INSERT INTO Exports (playerID, exportID) VALUES ('23', '9');
-INSERT INTO Exports (playerID, exportID) VALUES ('33', '1');
-INSERT INTO Exports (playerID, exportID) VALUES ('31', '27');
-INSERT INTO Exports (playerID, exportID) VALUES ('29', '19');
-INSERT INTO Exports (playerID, exportID) VALUES ('34', '7');
-INSERT INTO Exports (playerID, exportID) VALUES ('36', '40');
-INSERT INTO Exports (playerID, exportID) VALUES ('14', '15');
-INSERT INTO Exports (playerID, exportID) VALUES ('15', '7');
-INSERT INTO Exports (playerID, exportID) VALUES ('35', '26');
-INSERT INTO Exports (playerID, exportID) VALUES ('32', '24');
-INSERT INTO Exports (playerID, exportID) VALUES ('26', '14');
-INSERT INTO Exports (playerID, exportID) VALUES ('16', '21');
-INSERT INTO Exports (playerID, exportID) VALUES ('29', '37');
-INSERT INTO Exports (playerID, exportID) VALUES ('27', '32');
-INSERT INTO Exports (playerID, exportID) VALUES ('2', '26');
-INSERT INTO Exports (playerID, exportID) VALUES ('37', '21');
-INSERT INTO Exports (playerID, exportID) VALUES ('2', '25');
-INSERT INTO Exports (playerID, exportID) VALUES ('20', '27');
-INSERT INTO Exports (playerID, exportID) VALUES ('15', '36');
-INSERT INTO Exports (playerID, exportID) VALUES ('28', '29');
-INSERT INTO Exports (playerID, exportID) VALUES ('29', '25');
-INSERT INTO Exports (playerID, exportID) VALUES ('15', '5');
-INSERT INTO Exports (playerID, exportID) VALUES ('32', '29');
-INSERT INTO Exports (playerID, exportID) VALUES ('8', '14');
-INSERT INTO Exports (playerID, exportID) VALUES ('25', '31');
-INSERT INTO Exports (playerID, exportID) VALUES ('36', '32');
-INSERT INTO Exports (playerID, exportID) VALUES ('22', '15');
-INSERT INTO Exports (playerID, exportID) VALUES ('30', '16');
-INSERT INTO Exports (playerID, exportID) VALUES ('24', '31');
-INSERT INTO Exports (playerID, exportID) VALUES ('7', '25');
-INSERT INTO Exports (playerID, exportID) VALUES ('9', '30');
-INSERT INTO Exports (playerID, exportID) VALUES ('36', '1');
-INSERT INTO Exports (playerID, exportID) VALUES ('5', '24');
-INSERT INTO Exports (playerID, exportID) VALUES ('6', '26');
-INSERT INTO Exports (playerID, exportID) VALUES ('32', '12');
-INSERT INTO Exports (playerID, exportID) VALUES ('6', '13');
-INSERT INTO Exports (playerID, exportID) VALUES ('13', '24');
-INSERT INTO Exports (playerID, exportID) VALUES ('16', '38');
-INSERT INTO Exports (playerID, exportID) VALUES ('22', '34');
-INSERT INTO Exports (playerID, exportID) VALUES ('4', '20');
-INSERT INTO Exports (playerID, exportID) VALUES ('38', '34');
-INSERT INTO Exports (playerID, exportID) VALUES ('33', '37');
-INSERT INTO Exports (playerID, exportID) VALUES ('14', '30');
-INSERT INTO Exports (playerID, exportID) VALUES ('18', '14');
-INSERT INTO Exports (playerID, exportID) VALUES ('27', '16');
-INSERT INTO Exports (playerID, exportID) VALUES ('8', '40');
-INSERT INTO Exports (playerID, exportID) VALUES ('35', '8');
-INSERT INTO Exports (playerID, exportID) VALUES ('7', '5');
-INSERT INTO Exports (playerID, exportID) VALUES ('15', '22');
-INSERT INTO Exports (playerID, exportID) VALUES ('36', '19');
-INSERT INTO Exports (playerID, exportID) VALUES ('7', '17');
-INSERT INTO Exports (playerID, exportID) VALUES ('35', '31');
-INSERT INTO Exports (playerID, exportID) VALUES ('5', '18');
-INSERT INTO Exports (playerID, exportID) VALUES ('36', '38');
-INSERT INTO Exports (playerID, exportID) VALUES ('38', '21');
-INSERT INTO Exports (playerID, exportID) VALUES ('36', '11');
-INSERT INTO Exports (playerID, exportID) VALUES ('8', '6');
-INSERT INTO Exports (playerID, exportID) VALUES ('14', '34');
-INSERT INTO Exports (playerID, exportID) VALUES ('38', '33');
-INSERT INTO Exports (playerID, exportID) VALUES ('27', '20');
-INSERT INTO Exports (playerID, exportID) VALUES ('4', '16');
-INSERT INTO Exports (playerID, exportID) VALUES ('29', '26');
-INSERT INTO Exports (playerID, exportID) VALUES ('30', '25');
-INSERT INTO Exports (playerID, exportID) VALUES ('28', '35');
-INSERT INTO Exports (playerID, exportID) VALUES ('16', '18');
-INSERT INTO Exports (playerID, exportID) VALUES ('17', '13');
-INSERT INTO Exports (playerID, exportID) VALUES ('21', '8');
-INSERT INTO Exports (playerID, exportID) VALUES ('30', '32');
-INSERT INTO Exports (playerID, exportID) VALUES ('2', '24');
-INSERT INTO Exports (playerID, exportID) VALUES ('31', '33');
-INSERT INTO Exports (playerID, exportID) VALUES ('5', '9');
-INSERT INTO Exports (playerID, exportID) VALUES ('40', '2');
-INSERT INTO Exports (playerID, exportID) VALUES ('12', '1');
-INSERT INTO Exports (playerID, exportID) VALUES ('27', '10');
-INSERT INTO Exports (playerID, exportID) VALUES ('3', '20');
-INSERT INTO Exports (playerID, exportID) VALUES ('18', '22');
-INSERT INTO Exports (playerID, exportID) VALUES ('13', '14');
-INSERT INTO Exports (playerID, exportID) VALUES ('22', '19');
-INSERT INTO Exports (playerID, exportID) VALUES ('20', '39');
-INSERT INTO Exports (playerID, exportID) VALUES ('23', '29');
-INSERT INTO Exports (playerID, exportID) VALUES ('24', '27');
-INSERT INTO Exports (playerID, exportID) VALUES ('9', '38');
-INSERT INTO Exports (playerID, exportID) VALUES ('32', '36');
-INSERT INTO Exports (playerID, exportID) VALUES ('33', '23');
-INSERT INTO Exports (playerID, exportID) VALUES ('6', '6');
-INSERT INTO Exports (playerID, exportID) VALUES ('19', '11');
-INSERT INTO Exports (playerID, exportID) VALUES ('1', '30');
-INSERT INTO Exports (playerID, exportID) VALUES ('37', '40');
-INSERT INTO Exports (playerID, exportID) VALUES ('11', '15');
-INSERT INTO Exports (playerID, exportID) VALUES ('35', '21');
-INSERT INTO Exports (playerID, exportID) VALUES ('7', '31');
-INSERT INTO Exports (playerID, exportID) VALUES ('29', '3');
-INSERT INTO Exports (playerID, exportID) VALUES ('39', '16');
-INSERT INTO Exports (playerID, exportID) VALUES ('25', '26');
@@ -1,122 +0,0 @@
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('9', '36');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('27', '2');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('29', '17');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('39', '21');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('18', '29');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('2', '35');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('15', '16');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('32', '19');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('33', '37');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('3', '19');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('17', '7');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('1', '15');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '8');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('33', '39');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('33', '21');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('1', '2');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('28', '14');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('20', '5');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('28', '3');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('7', '7');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('22', '35');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('3', '13');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('30', '21');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('23', '36');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('32', '1');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '33');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('6', '5');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '6');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('29', '13');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('38', '20');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('40', '1');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('27', '36');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('15', '23');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('28', '11');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('26', '33');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('21', '34');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('5', '3');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('8', '30');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('35', '23');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('18', '24');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('10', '36');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('15', '21');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('11', '23');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('33', '33');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('24', '4');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('35', '15');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('26', '26');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('35', '19');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('40', '7');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('20', '1');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('2', '20');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('38', '15');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('20', '23');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('36', '23');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '21');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('20', '39');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('8', '8');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('38', '6');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('20', '35');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('39', '9');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('16', '4');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('4', '30');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('25', '11');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('35', '24');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('1', '19');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('30', '15');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('9', '14');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('13', '40');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('19', '27');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('38', '14');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('40', '39');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('28', '18');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('40', '3');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('14', '11');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('25', '7');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('31', '9');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('5', '17');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('22', '19');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('14', '37');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('39', '13');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('35', '31');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('27', '5');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '16');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('22', '27');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('40', '5');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('27', '13');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('3', '37');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('33', '24');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('29', '35');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '11');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('6', '16');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('13', '19');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('4', '26');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('34', '38');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('39', '8');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('19', '30');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('26', '35');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('10', '13');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('5', '5');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('8', '33');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('33', '4');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('12', '2');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('25', '21');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('27', '14');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('17', '9');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('23', '29');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('35', '25');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('28', '12');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('20', '7');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('7', '32');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('30', '6');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('32', '24');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('38', '18');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('3', '3');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('40', '11');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('37', '27');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('1', '1');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('36', '15');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('22', '23');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('16', '17');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('29', '37');
-INSERT INTO MetricExports (exportID, formulaID) VALUES ('9', '20');
@@ -1,40 +0,0 @@
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('1', 'active', '2/28/2025', '10/9/2025', '7/30/2025', '1');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('2', 'active', '7/15/2025', '11/5/2025', '9/4/2025', '2');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('3', 'pending', '11/19/2025', '2/7/2025', '11/27/2025', '3');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('4', 'active', '7/31/2025', '10/27/2025', '10/20/2025', '4');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('5', 'inactive', '8/18/2025', '9/11/2025', '4/22/2025', '5');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('6', 'pending', '6/16/2025', '11/22/2025', '4/11/2025', '6');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('7', 'inactive', '8/21/2025', '10/15/2025', '10/23/2025', '7');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('8', 'pending', '1/11/2025', '6/23/2025', '6/18/2025', '8');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('9', 'active', '11/26/2025', '5/26/2025', '7/15/2025', '9');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('10', 'inactive', '1/4/2025', '5/8/2025', '4/18/2025', '10');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('11', 'pending', '1/2/2025', '10/8/2025', '7/6/2025', '11');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('12', 'pending', '5/27/2025', '7/6/2025', '6/29/2025', '12');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('13', 'inactive', '8/7/2025', '6/18/2025', '9/1/2025', '13');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('14', 'active', '1/31/2025', '1/31/2025', '5/11/2025', '14');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('15', 'inactive', '12/22/2024', '4/19/2025', '5/4/2025', '15');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('16', 'active', '3/14/2025', '2/14/2025', '3/25/2025', '16');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('17', 'inactive', '7/26/2025', '3/4/2025', '5/25/2025', '17');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('18', 'active', '4/22/2025', '12/23/2024', '5/30/2025', '18');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('19', 'pending', '1/1/2025', '7/13/2025', '4/27/2025', '19');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('20', 'active', '11/1/2025', '4/29/2025', '6/4/2025', '20');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('21', 'inactive', '1/5/2025', '9/10/2025', '5/30/2025', '21');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('22', 'active', '1/15/2025', '10/4/2025', '4/9/2025', '22');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('23', 'inactive', '5/12/2025', '11/20/2025', '2/25/2025', '23');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('24', 'active', '1/3/2025', '9/23/2025', '1/18/2025', '24');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('25', 'inactive', '10/6/2025', '5/17/2025', '8/14/2025', '25');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('26', 'inactive', '11/17/2025', '10/2/2025', '2/21/2025', '26');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('27', 'active', '4/1/2025', '1/5/2025', '11/11/2025', '27');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('28', 'active', '8/6/2025', '5/9/2025', '2/22/2025', '28');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('29', 'active', '2/25/2025', '7/30/2025', '4/4/2025', '29');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('30', 'inactive', '9/16/2025', '3/27/2025', '4/18/2025', '30');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('31', 'inactive', '11/25/2025', '4/20/2025', '7/18/2025', '31');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('32', 'pending', '3/23/2025', '10/6/2025', '12/4/2025', '32');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('33', 'inactive', '5/16/2025', '5/2/2025', '3/20/2025', '33');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('34', 'active', '7/16/2025', '10/7/2025', '5/10/2025', '34');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('35', 'pending', '11/8/2025', '12/1/2025', '11/15/2025', '35');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('36', 'pending', '4/21/2025', '2/18/2025', '6/12/2025', '36');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('37', 'pending', '2/5/2025', '7/28/2025', '12/22/2024', '37');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('38', 'pending', '12/14/2024', '5/11/2025', '7/28/2025', '38');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('39', 'pending', '8/6/2025', '2/6/2025', '7/17/2025', '39');
-INSERT INTO Validations (validationID, status, timestamp, reqDate, responseDate, gameStatID) VALUES ('40', 'inactive', '4/24/2025', '4/14/2025', '9/22/2025', '40');
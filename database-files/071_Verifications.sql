@@ -1,40 +0,0 @@
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('27', '1', '32');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('22', '2', '30');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('38', '3', '7');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('5', '4', '29');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('35', '5', '15');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('38', '6', '20');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('15', '7', '15');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('29', '8', '2');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('36', '9', '15');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('4', '10', '12');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('25', '11', '1');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('38', '12', '17');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('5', '13', '35');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('32', '14', '3');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('13', '15', '15');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('14', '16', '8');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('14', '17', '10');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('19', '18', '25');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('22', '19', '15');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('40', '20', '6');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('21', '21', '15');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('22', '22', '1');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('23', '23', '32');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('20', '24', '20');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('28', '25', '28');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('12', '26', '10');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('40', '27', '40');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('16', '28', '4');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('31', '29', '21');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('30', '30', '17');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('11', '31', '23');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('7', '32', '25');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('8', '33', '22');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('20', '34', '19');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('29', '35', '12');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('36', '36', '40');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('18', '37', '28');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('4', '38', '17');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('27', '39', '2');
-INSERT INTO Verifications (playerID, reqID, adminID) VALUES ('16', '40', '16');
@@ -1,40 +0,0 @@
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('1', '16', 'pending', 'mZz50', '11/30/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('2', '3', 'inactive', 'MvU17', '10/5/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('3', '3', 'pending', 'SYr20', '9/15/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('4', '3', 'inactive', 'kVb06', '3/28/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('5', '39', 'active', 'Cag38', '10/8/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('6', '32', 'pending', 'jzH01', '1/28/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('7', '6', 'pending', 'ChD09', '4/4/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('8', '36', 'inactive', 'rfv76', '11/4/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('9', '31', 'pending', 'vcM65', '6/20/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('10', '11', 'inactive', 'mjT90', '12/28/2024');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('11', '33', 'inactive', 'vWW14', '3/15/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('12', '40', 'inactive', 'eee82', '9/15/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('13', '21', 'inactive', 'zKH52', '5/22/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('14', '21', 'inactive', 'pye96', '2/7/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('15', '13', 'pending', 'Bqi07', '4/6/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('16', '38', 'pending', 'EBO23', '9/6/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('17', '10', 'inactive', 'flk67', '4/1/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('18', '34', 'inactive', 'OEe31', '6/23/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('19', '21', 'inactive', 'PPU19', '10/23/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('20', '31', 'active', 'ujF23', '9/26/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('21', '8', 'pending', 'Gxt81', '12/20/2024');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('22', '14', 'active', 'pPp91', '6/19/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('23', '14', 'inactive', 'qfv19', '9/10/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('24', '23', 'inactive', 'lZt49', '12/9/2024');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('25', '40', 'inactive', 'cOM27', '10/16/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('26', '34', 'inactive', 'hmn90', '11/17/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('27', '2', 'pending', 'iCZ56', '6/20/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('28', '27', 'active', 'yAb87', '12/4/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('29', '7', 'pending', 'OSi19', '6/13/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('30', '26', 'active', 'vCR47', '1/31/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('31', '9', 'pending', 'IhH71', '3/1/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('32', '20', 'inactive', 'Efo75', '1/17/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('33', '35', 'active', 'Syr47', '9/13/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('34', '16', 'pending', 'UeN14', '7/31/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('35', '10', 'pending', 'viW17', '10/12/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('36', '40', 'inactive', 'yMo96', '3/25/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('37', '11', 'active', 'EYi41', '7/4/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('38', '38', 'pending', 'FBr21', '3/14/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('39', '29', 'pending', 'ImC03', '5/29/2025');
-INSERT INTO Reports (reportID, adminID, repStatus, userReported, date) VALUES ('40', '23', 'inactive', 'qvR05', '5/23/2025');
@@ -1,43 +1,219 @@
+import argparse
 import csv
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from ddl_parser import BOOLEAN_TYPES, NUMERIC_TYPES, find_table, load_tables, map_columns, missing_columns
 
 # Folder containing your CSV files
 FOLDER = os.path.dirname(os.path.abspath(__file__))
 
-def convert_csv_to_sql(csv_path):
-    table_name = os.path.splitext(os.path.basename(csv_path))[0]  # filename becomes table name
-    sql_path = csv_path.replace(".csv", ".sql")
+# Schema the generated seed files load into (gives each column its type).
+# The CSVs keep their phase 2 names; ddl_parser maps them onto this schema.
+DDL_PATH = os.path.join(FOLDER, "00_courtvision_schema.sql")
+
+# Rows per INSERT statement; 1 gives the old one-statement-per-row output
+BATCH_SIZE = 500
+
+# Where the db container sees this folder (for LOAD DATA scripts)
+CONTAINER_FOLDER = "/docker-entrypoint-initdb.d"
+
+NUMBER = re.compile(r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+FALSE_VALUES = {"0", "false", "f", "no", "n"}
+
+# The CSVs write dates as 2/2/2025 and times as 4:09 PM; MySQL wants ISO
+DATE_TYPES = {"DATE", "DATETIME", "TIMESTAMP"}
+CSV_DATE_FORMAT = "%m/%d/%Y"
+CSV_TIME_FORMAT = "%I:%M %p"
+
+
+def quote(val):
+    # escape backslashes and single quotes
+    return "'" + val.replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def temporal_value(val, col_type):
+    """val in MySQL's format if it is a CSV-style date or time of a DATE / TIME column"""
+    formats = ((CSV_DATE_FORMAT, "%Y-%m-%d") if col_type in DATE_TYPES else
+               (CSV_TIME_FORMAT, "%H:%M:%S") if col_type == "TIME" else None)
+    if formats is None:
+        return val
+    try:
+        return datetime.strptime(val.strip(), formats[0]).strftime(formats[1])
+    except ValueError:
+        return val
+
+
+def load_data_value(variable, col_type):
+    """SQL expression for a LOAD DATA field, with CSV-style dates and times parsed"""
+    if col_type in DATE_TYPES:
+        return f"IF({variable} LIKE '%/%', STR_TO_DATE({variable}, '%m/%d/%Y'), {variable})"
+    if col_type == "TIME":
+        return f"IF({variable} LIKE '%M', STR_TO_DATE({variable}, '%h:%i %p'), {variable})"
+    return variable
+
+
+def sql_literal(val, col_type):
+    """SQL literal for one CSV value, typed by its DDL column type (None if unknown)"""
+    if val == "" or val.lower() == "null":
+        return "NULL"
+    if col_type in NUMERIC_TYPES and NUMBER.match(val):
+        return val
+    if col_type in BOOLEAN_TYPES and val.lower() in TRUE_VALUES | FALSE_VALUES:
+        return "TRUE" if val.lower() in TRUE_VALUES else "FALSE"
+    return quote(temporal_value(val, col_type))
+
+
+def table_for(csv_path, tables):
+    name = os.path.splitext(os.path.basename(csv_path))[0]  # filename becomes table name
+    return find_table(tables, name) or name
+
+
+def csv_targets(csv_path, table_name, types, header):
+    """
+    [(CSV field index, column)] to load; header fields the table does not
+    have are dropped with a message. Without a DDL every field is loaded
+    as named.
+    """
+    if not types:
+        return list(enumerate(header))
+    targets, skipped = map_columns(table_name, types, header)
+    if skipped:
+        print(f"  {os.path.basename(csv_path)}: ignoring CSV columns not in {table_name}: {', '.join(skipped)}")
+    return targets
+
+
+def unloadable(csv_path, tables, ddl_name):
+    """Why csv_path cannot go into the DDL's tables, or None if it can"""
+    table_name = find_table(tables, os.path.splitext(os.path.basename(csv_path))[0])
+    if table_name is None:
+        return f"no matching table in {ddl_name}"
+    with open(csv_path, "r", newline='', encoding="utf-8") as infile:
+        header = next(csv.reader(infile))
+    targets, _ = map_columns(table_name, tables[table_name], header)
+    missing = missing_columns(table_name, tables[table_name], targets)
+    if missing:
+        return f"{table_name} needs {', '.join(missing)}, which the CSV does not have"
+    return None
+
+
+def convert_csv_to_sql(csv_path, tables=None, batch_size=BATCH_SIZE, sql_path=None):
+    """
+    Write csv_path as multi-row INSERTs inside one transaction. Rows are
+    streamed: only the current batch is held in memory.
+    """
+    tables = tables if tables is not None else {}
+    table_name = table_for(csv_path, tables)
+    types = tables.get(table_name, {})
+    sql_path = sql_path or csv_path.replace(".csv", ".sql")
+    row_count = 0
 
     with open(csv_path, "r", newline='', encoding="utf-8") as infile:
-        reader = csv.DictReader(infile)
-        columns = reader.fieldnames
+        reader = csv.reader(infile)
+        targets = csv_targets(csv_path, table_name, types, next(reader))
+        col_types = [types.get(col) for _, col in targets]
+        insert = f"INSERT INTO {table_name} ({', '.join(f'`{col}`' for _, col in targets)}) VALUES\n"
 
         with open(sql_path, "w", encoding="utf-8") as outfile:
+            outfile.write("START TRANSACTION;\n")
+            batch = []
+
             for row in reader:
-                values = []
-                for col in columns:
-                    val = row[col]
-                    if val == "" or val.lower() == "null":
-                        values.append("NULL")
-                    else:
-                        # escape single quotes
-                        val = val.replace("'", "''")
-                        values.append(f"'{val}'")
+                values = ", ".join(sql_literal(row[i], col_type)
+                                   for (i, _), col_type in zip(targets, col_types))
+                batch.append(f"({values})")
+                row_count += 1
+
+                if len(batch) == batch_size:
+                    outfile.write(insert + ",\n".join(batch) + ";\n")
+                    batch = []
 
-                col_string = ", ".join(columns)
-                val_string = ", ".join(values)
+            if batch:
+                outfile.write(insert + ",\n".join(batch) + ";\n")
+            outfile.write("COMMIT;\n")
 
-                outfile.write(
-                    f"INSERT INTO {table_name} ({col_string}) VALUES ({val_string});\n"
-                )
+    return sql_path, row_count
 
-    print(f"Created: {sql_path}")
+
+def convert_csv_to_load_data(csv_path, tables=None, sql_path=None, container_folder=CONTAINER_FOLDER):
+    """
+    Write a LOAD DATA LOCAL INFILE script for csv_path. MySQL parses the
+    CSV itself; empty and 'null' fields become NULL. Needs local_infile
+    enabled on the server and the client (mysql --local-infile=1).
+    """
+    tables = tables if tables is not None else {}
+    table_name = table_for(csv_path, tables)
+    sql_path = sql_path or csv_path.replace(".csv", ".sql")
+
+    with open(csv_path, "r", newline='', encoding="utf-8") as infile:
+        header = next(csv.reader(infile))
+    targets = csv_targets(csv_path, table_name, tables.get(table_name, {}), header)
+
+    # every field is read into a variable; fields the table lacks are just not assigned
+    variables = ", ".join(f"@v{i}" for i in range(len(header)))
+    types = tables.get(table_name, {})
+    assignments = ",\n    ".join(f"`{col}` = IF(@v{i} = '' OR LOWER(@v{i}) = 'null', NULL, "
+                                 f"{load_data_value(f'@v{i}', types.get(col))})"
+                                 for i, col in targets)
+    infile_path = f"{container_folder}/{os.path.basename(csv_path)}"
+
+    with open(sql_path, "w", encoding="utf-8") as outfile:
+        outfile.write(
+            f"LOAD DATA LOCAL INFILE {quote(infile_path)}\n"
+            f"INTO TABLE {table_name}\n"
+            "CHARACTER SET utf8mb4\n"
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"'\n"
+            "LINES TERMINATED BY '\\n'\n"
+            "IGNORE 1 LINES\n"
+            f"({variables})\n"
+            f"SET {assignments};\n"
+        )
+
+    return sql_path, None
+
+
+def convert_file(job):
+    csv_path, tables, load_data, batch_size = job
+    if load_data:
+        return convert_csv_to_load_data(csv_path, tables)
+    return convert_csv_to_sql(csv_path, tables, batch_size)
 
 
 def main():
-    for filename in os.listdir(FOLDER):
-        if filename.lower().endswith(".csv"):
-            convert_csv_to_sql(os.path.join(FOLDER, filename))
+    parser = argparse.ArgumentParser(description="Turn the seed CSVs in this folder into SQL files.")
+    parser.add_argument("csv_files", nargs="*",
+                        help="CSV files to convert (default: every CSV in this folder)")
+    parser.add_argument("--ddl", default=DDL_PATH,
+                        help="DDL script that gives each column its type")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="rows per INSERT statement (1 = one INSERT per row)")
+    parser.add_argument("--load-data", action="store_true",
+                        help="write LOAD DATA LOCAL INFILE scripts instead of INSERTs")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="files converted in parallel")
+    args = parser.parse_args()
+
+    csv_files = args.csv_files or [os.path.join(FOLDER, filename)
+                                   for filename in sorted(os.listdir(FOLDER))
+                                   if filename.lower().endswith(".csv")]
+    tables = load_tables(args.ddl) if os.path.exists(args.ddl) else {}
+    if tables:
+        loadable = []
+        for path in csv_files:
+            reason = unloadable(path, tables, os.path.basename(args.ddl))
+            if reason:
+                print(f"Skipping {path}: {reason}")
+            else:
+                loadable.append(path)
+        csv_files = loadable
+    jobs = [(path, tables, args.load_data, max(1, args.batch_size)) for path in csv_files]
+
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for sql_path, row_count in pool.map(convert_file, jobs):
+            print(f"Created: {sql_path}" + (f" ({row_count} rows)" if row_count is not None else ""))
 
 
 if __name__ == "__main__":
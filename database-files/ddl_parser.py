@@ -0,0 +1,197 @@
+import importlib.util
+import os
+import re
+from functools import lru_cache
+
+# Reads column types and foreign keys out of CREATE TABLE statements so
+# the seed loaders can type their values instead of quoting every one,
+# and load tables in dependency order.
+#
+# The seed CSVs are named and laid out after the phase 2 tables. The
+# API's schema registry (api/backend/schema/registry.py) says which live
+# table and column each phase 2 name became, so the loaders can put the
+# CSVs into the live schema.
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             os.pardir, 'api', 'backend', 'schema', 'registry.py')
+
+CREATE_TABLE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?\s*\(', re.IGNORECASE)
+
+# Lines inside CREATE TABLE (...) that are not column definitions
+NON_COLUMN = re.compile(r'^(PRIMARY|FOREIGN|UNIQUE|INDEX|KEY|CONSTRAINT|CHECK|FULLTEXT)\b', re.IGNORECASE)
+
+REFERENCES = re.compile(r'\bREFERENCES\s+`?(\w+)`?', re.IGNORECASE)
+
+NUMERIC_TYPES = {'TINYINT', 'SMALLINT', 'MEDIUMINT', 'INT', 'INTEGER', 'BIGINT',
+                 'DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL'}
+BOOLEAN_TYPES = {'BOOL', 'BOOLEAN'}
+
+
+def strip_comments(sql):
+    sql = re.sub(r'/\*.*?\*/', ' ', sql, flags=re.DOTALL)
+    return re.sub(r'--[^\n]*', ' ', sql)
+
+
+def table_body(sql, start):
+    """Text between the opening parenthesis at `start` and its match"""
+    depth = 0
+    for i in range(start, len(sql)):
+        if sql[i] == '(':
+            depth += 1
+        elif sql[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return sql[start + 1:i]
+    raise ValueError('Unbalanced parentheses in CREATE TABLE')
+
+
+def split_definitions(body):
+    """Split a CREATE TABLE body on the commas that are not inside parentheses"""
+    parts, depth, current = [], 0, []
+    for ch in body:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def table_definitions(sql):
+    """(table name, [column / constraint definitions]) for each CREATE TABLE"""
+    sql = strip_comments(sql)
+    for match in CREATE_TABLE.finditer(sql):
+        yield match.group(1), split_definitions(table_body(sql, match.end() - 1))
+
+
+def parse_tables(sql):
+    """
+    Map each table in a DDL script to its columns, in order:
+    {'Players': {'playerID': 'INT', 'height': 'INT', 'email': 'VARCHAR', ...}}
+    Types are upper-cased base names without their length/precision.
+    """
+    tables = {}
+
+    for name, definitions in table_definitions(sql):
+        columns = {}
+        for definition in definitions:
+            if not definition or NON_COLUMN.match(definition):
+                continue
+            column = re.match(r'`?(\w+)`?\s+(\w+)', definition)
+            if column:
+                columns[column.group(1)] = column.group(2).upper()
+        tables[name] = columns
+
+    return tables
+
+
+def parse_foreign_keys(sql):
+    """Map each table to the set of other tables its FOREIGN KEYs reference"""
+    references = {}
+    for name, definitions in table_definitions(sql):
+        references[name] = {
+            match.group(1)
+            for definition in definitions
+            for match in REFERENCES.finditer(definition)
+            if match.group(1) != name
+        }
+    return references
+
+
+def read_ddl(path):
+    with open(path, 'r', encoding='utf-8') as fh:
+        return fh.read()
+
+
+def load_tables(path):
+    return parse_tables(read_ddl(path))
+
+
+def load_foreign_keys(path):
+    return parse_foreign_keys(read_ddl(path))
+
+
+@lru_cache(maxsize=None)
+def load_registry():
+    """The API's schema registry module, or None when the api folder is not next to this one"""
+    if not os.path.exists(REGISTRY_PATH):
+        return None
+    spec = importlib.util.spec_from_file_location('courtvision_schema_registry', REGISTRY_PATH)
+    registry = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(registry)
+    return registry
+
+
+def legacy_column_names(table):
+    """{phase 2 column: live column} for a live table"""
+    registry = load_registry()
+    return registry.LEGACY_COLUMN_NAMES.get(table, {}) if registry else {}
+
+
+def required_columns(table):
+    """Columns of a live table that an INSERT has to give a value ([] if the registry does not know it)"""
+    registry = load_registry()
+    if registry is None or table not in registry.TABLES_BY_NAME:
+        return []
+    return registry.required_columns(table)
+
+
+def find_table(tables, name):
+    """
+    Look a table up by name, ignoring case (CSV file names are not always
+    exact). Phase 2 names find the live table that replaced them.
+    """
+    registry = load_registry()
+    candidates = [name]
+    if registry is not None:
+        legacy = {old.lower(): new for old, new in registry.LEGACY_TABLE_NAMES.items()}
+        if name.lower() in legacy:
+            candidates.append(legacy[name.lower()])
+
+    lowered = {table.lower(): table for table in tables}
+    for candidate in candidates:
+        if candidate in tables:
+            return candidate
+        if candidate.lower() in lowered:
+            return lowered[candidate.lower()]
+    return None
+
+
+def find_column(columns, name, aliases=None):
+    """
+    Look a column up by name, ignoring case and underscores (last_name ->
+    lastName). aliases maps renamed columns ({'threePts': 'three_pt'}).
+    """
+    if name in columns:
+        return name
+    if aliases and aliases.get(name) in columns:
+        return aliases[name]
+    normalized = {column.replace('_', '').lower(): column for column in columns}
+    return normalized.get(name.replace('_', '').lower())
+
+
+def map_columns(table, columns, header):
+    """
+    [(CSV field index, table column)] for the header fields the table has,
+    and the header fields it does not have
+    """
+    aliases = legacy_column_names(table)
+    targets = [(i, find_column(columns, name, aliases)) for i, name in enumerate(header)]
+    return ([(i, column) for i, column in targets if column is not None],
+            [header[i] for i, column in targets if column is None])
+
+
+def missing_columns(table, columns, targets):
+    """
+    Required columns of table that the mapped CSV fields leave without a
+    value. Only columns the DDL has count, so a --ddl other than the live
+    schema is not held to the registry's columns.
+    """
+    filled = {column for _, column in targets}
+    return [column for column in required_columns(table) if column in columns and column not in filled]
@@ -0,0 +1,233 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from decimal import Decimal
+from graphlib import CycleError, TopologicalSorter
+
+import pymysql
+
+from convert_csv_to_sql import DDL_PATH, FALSE_VALUES, FOLDER, NUMBER, TRUE_VALUES, temporal_value, unloadable
+from ddl_parser import BOOLEAN_TYPES, NUMERIC_TYPES, find_table, load_foreign_keys, load_tables, map_columns
+
+# Loads the seed CSVs straight into a running MySQL database: tables go
+# in foreign-key order (parents before children, worked out from the
+# DDL), non-unique secondary indexes are dropped for the load and rebuilt
+# in one ALTER afterwards, and rows go in through executemany, which
+# PyMySQL sends as multi-row INSERTs. CSVs named after phase 2 tables
+# load into the live table that replaced them; a CSV that lacks a
+# required column of its table is skipped. Loading Game_Stats rebuilds
+# the stat rollups (Player_Totals, Player_Level_Totals) afterwards with
+# the API's own rollup_engine.
+
+# Rows per executemany call
+BATCH_SIZE = 5000
+
+# MySQL error when an index is still needed by a foreign key constraint
+ER_DROP_INDEX_FK = 1553
+
+API_FOLDER = os.path.join(FOLDER, os.pardir, "api")
+
+# Table the stat rollups are computed from
+ROLLUP_SOURCE = "Game_Stats"
+
+REBUILD_ROLLUPS_HINT = "docker compose exec api flask --app backend_app rebuild-rollups"
+
+
+def python_value(val, col_type):
+    """Typed Python value for one CSV field (None for empty / 'null')"""
+    if val == "" or val.lower() == "null":
+        return None
+    if col_type in NUMERIC_TYPES and NUMBER.match(val):
+        return int(val) if val.lstrip("+-").isdigit() else Decimal(val)
+    if col_type in BOOLEAN_TYPES and val.lower() in TRUE_VALUES | FALSE_VALUES:
+        return val.lower() in TRUE_VALUES
+    return temporal_value(val, col_type)
+
+
+def load_rollup_rebuild():
+    """rollup_engine.rebuild_rollups from the API (None if its packages are not installed here)"""
+    if os.path.abspath(API_FOLDER) not in sys.path:
+        sys.path.insert(0, os.path.abspath(API_FOLDER))
+    try:
+        from backend.rollups.rollup_engine import rebuild_rollups
+    except ImportError:
+        return None
+    return rebuild_rollups
+
+
+def load_order(csv_tables, foreign_keys):
+    """Tables with a CSV, each after every table it references"""
+    graph = {table: foreign_keys.get(table, set()) & set(csv_tables) for table in csv_tables}
+    return list(TopologicalSorter(graph).static_order())
+
+
+def drop_secondary_indexes(cursor, table):
+    """
+    Drop the table's non-unique secondary indexes and return their
+    definitions. Indexes a foreign key depends on cannot be dropped and
+    stay in place.
+    """
+    cursor.execute('''
+        SELECT INDEX_NAME, COLUMN_NAME, SUB_PART, INDEX_TYPE
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+          AND NON_UNIQUE = 1 AND INDEX_NAME <> 'PRIMARY'
+        ORDER BY INDEX_NAME, SEQ_IN_INDEX
+    ''', (table,))
+
+    indexes = {}
+    for row in cursor.fetchall():
+        index = indexes.setdefault(row['INDEX_NAME'], {'type': row['INDEX_TYPE'], 'parts': []})
+        if row['COLUMN_NAME'] is None:  # functional index: leave it alone
+            index['parts'] = None
+        elif index['parts'] is not None:
+            part = f"`{row['COLUMN_NAME']}`"
+            index['parts'].append(f"{part}({row['SUB_PART']})" if row['SUB_PART'] else part)
+
+    dropped = []
+    for name, index in indexes.items():
+        if index['parts'] is None:
+            continue
+        try:
+            cursor.execute(f'ALTER TABLE `{table}` DROP INDEX `{name}`')
+        except pymysql.err.OperationalError as e:
+            if e.args[0] != ER_DROP_INDEX_FK:
+                raise
+            continue
+        kind = 'FULLTEXT INDEX' if index['type'] == 'FULLTEXT' else 'INDEX'
+        dropped.append(f"ADD {kind} `{name}` ({', '.join(index['parts'])})")
+    return dropped
+
+
+def rebuild_indexes(cursor, table, definitions):
+    if definitions:
+        cursor.execute(f"ALTER TABLE `{table}` {', '.join(definitions)}")
+
+
+def import_table(conn, csv_path, table, columns, batch_size=BATCH_SIZE):
+    """Load one CSV into table; returns the number of rows inserted"""
+    row_count = 0
+
+    with open(csv_path, "r", newline='', encoding="utf-8") as infile:
+        reader = csv.reader(infile)
+        header = next(reader)
+
+        # CSV headers don't always match the DDL exactly (last_name vs lastName)
+        targets, skipped = map_columns(table, columns, header)
+        if skipped:
+            print(f"  {table}: ignoring CSV columns not in the table: {', '.join(skipped)}")
+
+        query = (f"INSERT INTO `{table}` ({', '.join(f'`{column}`' for _, column in targets)}) "
+                 f"VALUES ({', '.join(['%s'] * len(targets))})")
+
+        cursor = conn.cursor()
+        batch = []
+        for row in reader:
+            batch.append([python_value(row[i], columns[column]) for i, column in targets])
+            if len(batch) == batch_size:
+                row_count += cursor.executemany(query, batch)
+                batch = []
+        if batch:
+            row_count += cursor.executemany(query, batch)
+
+    return row_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the seed CSVs in this folder straight into MySQL.")
+    parser.add_argument("csv_files", nargs="*",
+                        help="CSV files to load (default: every CSV in this folder)")
+    parser.add_argument("--ddl", default=DDL_PATH,
+                        help="DDL script that gives column types and foreign keys")
+    parser.add_argument("--host", default=os.getenv("DB_HOST", "localhost"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("DB_PORT", "3306")))
+    parser.add_argument("--user", default=os.getenv("DB_USER", "root"))
+    parser.add_argument("--password", default=os.getenv("MYSQL_ROOT_PASSWORD", ""))
+    parser.add_argument("--database", default=os.getenv("DB_NAME", "courtvision"))
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="rows per executemany call")
+    parser.add_argument("--truncate", action="store_true",
+                        help="delete the existing rows of every loaded table first")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the load order and exit")
+    args = parser.parse_args()
+
+    csv_files = args.csv_files or [os.path.join(FOLDER, filename)
+                                   for filename in sorted(os.listdir(FOLDER))
+                                   if filename.lower().endswith(".csv")]
+    tables = load_tables(args.ddl)
+    foreign_keys = load_foreign_keys(args.ddl)
+
+    csv_for_table = {}
+    for path in csv_files:
+        reason = unloadable(path, tables, os.path.basename(args.ddl))
+        if reason:
+            print(f"Skipping {path}: {reason}")
+            continue
+        csv_for_table[find_table(tables, os.path.splitext(os.path.basename(path))[0])] = path
+
+    try:
+        order = load_order(csv_for_table, foreign_keys)
+    except CycleError as e:
+        raise SystemExit(f"Foreign keys form a cycle, no load order exists: {' -> '.join(e.args[1])}")
+
+    print("Load order: " + " -> ".join(order))
+    if args.dry_run:
+        return
+
+    conn = pymysql.connect(host=args.host, port=args.port, user=args.user, password=args.password,
+                           database=args.database, charset="utf8mb4",
+                           cursorclass=pymysql.cursors.DictCursor, autocommit=False)
+    total_rows = 0
+    rollups_stale = False
+    started = time.perf_counter()
+
+    try:
+        cursor = conn.cursor()
+        if args.truncate:
+            for table in reversed(order):
+                cursor.execute(f"DELETE FROM `{table}`")
+            conn.commit()
+
+        for table in order:
+            table_started = time.perf_counter()
+            dropped = drop_secondary_indexes(cursor, table)
+            try:
+                rows = import_table(conn, csv_for_table[table], table, tables[table],
+                                    max(1, args.batch_size))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                rebuild_indexes(cursor, table, dropped)
+
+            elapsed = time.perf_counter() - table_started
+            total_rows += rows
+            print(f"{table}: {rows} rows in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)"
+                  + (f", rebuilt {len(dropped)} indexes" if dropped else ""))
+
+        # the aggregate routes read the rollups, not Game_Stats
+        if ROLLUP_SOURCE in order:
+            rebuild_rollups = load_rollup_rebuild()
+            if rebuild_rollups is None:
+                rollups_stale = True
+            else:
+                for table, rows in rebuild_rollups(cursor).items():
+                    print(f"Rebuilt {table}: {rows} rows")
+                conn.commit()
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"Loaded {total_rows} rows into {len(order)} tables in {elapsed:.2f}s "
+          f"({total_rows / elapsed if elapsed else 0:,.0f} rows/s)")
+    if rollups_stale:
+        raise SystemExit(f"{ROLLUP_SOURCE} was loaded but the stat rollups were not rebuilt "
+                         f"(the API's packages are not installed here). Run:\n  {REBUILD_ROLLUPS_HINT}")
+
+
+if __name__ == "__main__":
+    main()